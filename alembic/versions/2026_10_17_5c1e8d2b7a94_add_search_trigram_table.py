@@ -0,0 +1,78 @@
+"""Add search trigram table
+
+Revision ID: 5c1e8d2b7a94
+Revises: 3874118753ff
+Create Date: 2026-10-17 09:12:41.218374
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1e8d2b7a94"
+down_revision = "3874118753ff"
+branch_labels = None
+depends_on = None
+
+TRIGRAM_LENGTH = 3
+BATCH_SIZE = 10_000
+SEARCH_ENTITIES = ("case", "sample")
+
+
+def get_trigrams(*values: str | None) -> set[str]:
+    trigrams: set[str] = set()
+    for value in values:
+        if not value:
+            continue
+        value = value.lower()
+        trigrams.update(
+            value[start : start + TRIGRAM_LENGTH]
+            for start in range(len(value) - TRIGRAM_LENGTH + 1)
+        )
+    return trigrams
+
+
+def upgrade():
+    search_trigram = op.create_table(
+        "search_trigram",
+        sa.Column("entity", sa.Enum(*SEARCH_ENTITIES), primary_key=True),
+        sa.Column(
+            "trigram",
+            sa.String(length=3).with_variant(mysql.VARCHAR(3, collation="utf8mb4_bin"), "mysql"),
+            primary_key=True,
+        ),
+        sa.Column("entity_id", sa.Integer(), primary_key=True, autoincrement=False),
+    )
+    op.create_index(
+        "ix_search_trigram_entity_id", "search_trigram", ["entity", "entity_id"], unique=False
+    )
+
+    bind = op.get_bind()
+    for entity in SEARCH_ENTITIES:
+        table = sa.table(entity, sa.column("id"), sa.column("internal_id"), sa.column("name"))
+        last_id = 0
+        while True:
+            entries = bind.execute(
+                sa.select(table.c.id, table.c.internal_id, table.c.name)
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not entries:
+                break
+            rows: list[dict] = [
+                {"entity": entity, "trigram": trigram, "entity_id": entry.id}
+                for entry in entries
+                for trigram in get_trigrams(entry.internal_id, entry.name)
+            ]
+            if rows:
+                bind.execute(search_trigram.insert(), rows)
+            last_id = entries[-1].id
+
+
+def downgrade():
+    op.drop_index("ix_search_trigram_entity_id", table_name="search_trigram")
+    op.drop_table("search_trigram")
@@ -1,8 +1,8 @@
 """
-    Module for interacting with crunchy to perform:
-        1. Compressing: FASTQ to SPRING
-        2. Decompressing: SPRING to FASTQ
-    along with the helper methods.
+Module for interacting with crunchy to perform:
+    1. Compressing: FASTQ to SPRING
+    2. Decompressing: SPRING to FASTQ
+along with the helper methods.
 """
 
 import logging
@@ -60,6 +60,7 @@ class CrunchyAPI:
         CrunchyAPI.create_pending_file(
             pending_path=compression_obj.pending_path, dry_run=self.dry_run
         )
+        compression_obj.invalidate_stat_cache()
         log_dir: Path = files.get_log_dir(compression_obj.spring_path)
         # Generate the error function
         error_function = FASTQ_TO_SPRING_ERROR.format(
@@ -108,6 +109,7 @@ class CrunchyAPI:
         CrunchyAPI.create_pending_file(
             pending_path=compression_obj.pending_path, dry_run=self.dry_run
         )
+        compression_obj.invalidate_stat_cache()
         # Fetch the metadata information from a spring metadata file
         crunchy_metadata: CrunchyMetadata = files.get_crunchy_metadata(
             compression_obj.spring_metadata_path
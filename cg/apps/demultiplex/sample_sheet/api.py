@@ -2,7 +2,9 @@ import logging
 from pathlib import Path
 
 import rich_click as click
+from pydantic import ValidationError
 
+from cg.apps.demultiplex.sample_sheet.index_analysis import LaneIndexReport, get_index_reports
 from cg.apps.demultiplex.sample_sheet.read_sample_sheet import get_samples_from_content
 from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
 from cg.apps.demultiplex.sample_sheet.sample_sheet_creator import SampleSheetCreator
@@ -282,7 +284,8 @@ class IlluminaSampleSheetService:
         self._create_sample_sheet_file(flow_cell)
 
     def get_or_create_all_sample_sheets(self):
-        """Ensure that a valid sample sheet is present in all flow cell directories."""
+        """Ensure that a valid sample sheet is present in all flow cell directories and warn about
+        index collisions in them."""
         for flow_cell_dir in get_directories_in_path(self.flow_cell_runs_dir):
             LOG.info(f"Getting a valid sample sheet for flow cell {flow_cell_dir.name}")
             try:
@@ -290,3 +293,41 @@ class IlluminaSampleSheetService:
             except Exception as error:
                 LOG.error(f"Could not create sample sheet for {flow_cell_dir.name}: {error}")
                 continue
+            if not self.dry_run:
+                self.log_index_collisions(flow_cell_dir.name)
+
+    def analyse_indexes(self, flow_cell_name: str) -> list[LaneIndexReport]:
+        """
+        Return the reports of the distances between the indexes of the samples in each lane of the
+        sample sheet in the flow cell directory.
+        Raises:
+            FlowCellError: If the flow cell directory or its run parameters are not valid.
+            MissingFilesError: If the sample sheet does not exist.
+            SampleSheetFormatError: If the sample sheet has no samples.
+            ValidationError: If the samples of the sample sheet are not in BCLConvert format.
+        """
+        flow_cell: IlluminaRunDirectoryData = self._get_flow_cell(flow_cell_name)
+        if not flow_cell.sample_sheet_exists():
+            message: str = f"Sample sheet for flow cell {flow_cell.full_name} does not exist"
+            LOG.warning(message)
+            raise MissingFilesError(message)
+        sample_sheet_content: list[list[str]] = ReadFile.get_content_from_file(
+            file_format=FileFormat.CSV, file_path=flow_cell.sample_sheet_path
+        )
+        samples: list[IlluminaSampleIndexSetting] = get_samples_from_content(sample_sheet_content)
+        return get_index_reports(samples=samples, run_parameters=flow_cell.run_parameters)
+
+    def log_index_collisions(self, flow_cell_name: str) -> None:
+        """Warn about the lanes of the sample sheet with samples with colliding indexes."""
+        try:
+            reports: list[LaneIndexReport] = self.analyse_indexes(flow_cell_name)
+        except (CgError, ValidationError) as error:
+            LOG.debug(f"Could not analyse the indexes of {flow_cell_name}: {error}")
+            return
+        for report in reports:
+            if report.has_collisions:
+                LOG.warning(
+                    f"Lane {report.lane} of {flow_cell_name} has colliding indexes: "
+                    f"{len(report.index_1.collisions)} index 1 pairs, "
+                    f"{len(report.index_2.collisions) if report.index_2 else 0} index 2 pairs"
+                )
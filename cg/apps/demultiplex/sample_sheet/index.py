@@ -2,7 +2,7 @@
 
 import logging
 
-from cg.utils.utils import get_hamming_distance
+import numpy as np
 
 LOG = logging.getLogger(__name__)
 DNA_COMPLEMENTS: dict[str, str] = {"A": "T", "C": "G", "G": "C", "T": "A"}
@@ -21,34 +21,55 @@ def get_reverse_complement_dna_seq(dna: str) -> str:
     return "".join(DNA_COMPLEMENTS[base] for base in reversed(dna))
 
 
-def get_hamming_distance_index_1(sequence_1: str, sequence_2: str) -> int:
+def get_index_matrix(indexes: list[str], align_end: bool = False) -> tuple[np.ndarray, np.ndarray]:
     """
-    Get the hamming distance between two index 1 sequences.
-    In the case that one sequence is longer than the other, the distance is calculated between
-    the shortest sequence and the first segment of equal length of the longest sequence.
+    Return the indexes encoded as the rows of a byte matrix, aligned at their start or at their
+    end, and a mask of the positions of the matrix holding a base of the index.
     """
-    shortest_index_length: int = min(len(sequence_1), len(sequence_2))
-    return get_hamming_distance(
-        str_1=sequence_1[:shortest_index_length], str_2=sequence_2[:shortest_index_length]
+    lengths: np.ndarray = np.array([len(index) for index in indexes], dtype=np.int64)
+    width: int = int(lengths.max(initial=0))
+    matrix: np.ndarray = np.zeros((len(indexes), width), dtype=np.uint8)
+    for row, index in enumerate(indexes):
+        bases: np.ndarray = np.frombuffer(index.encode(), dtype=np.uint8)
+        start: int = width - len(bases) if align_end else 0
+        matrix[row, start : start + len(bases)] = bases
+    positions: np.ndarray = np.arange(width)
+    mask: np.ndarray = (
+        positions >= (width - lengths)[:, np.newaxis]
+        if align_end
+        else positions < lengths[:, np.newaxis]
     )
+    return matrix, mask
 
 
-def get_hamming_distance_index_2(
-    sequence_1: str, sequence_2: str, is_reverse_complement: bool
-) -> int:
+def get_pairwise_hamming_distances(indexes: list[str], align_end: bool = False) -> np.ndarray:
     """
-    Get the hamming distance between two index 2 sequences.
-    In the case that one sequence is longer than the other, the distance is calculated between
-    the shortest sequence and the last segment of equal length of the longest sequence.
-    If it does not require reverse complement, the calculation is the same as for index 1.
+    Return the Hamming distances between all pairs of indexes as a square matrix.
+    Like for a single pair, the distance is calculated between the shortest index and the
+    segment of equal length of the longest index, taken from the start or, if align_end, from the
+    end of the index. The distances are accumulated one position at a time for all pairs at once.
     """
-    shortest_index_length: int = min(len(sequence_1), len(sequence_2))
-    return (
-        get_hamming_distance(
-            str_1=sequence_1[-shortest_index_length:], str_2=sequence_2[-shortest_index_length:]
+    matrix, mask = get_index_matrix(indexes=indexes, align_end=align_end)
+    distances: np.ndarray = np.zeros((len(indexes), len(indexes)), dtype=np.uint16)
+    for position in range(matrix.shape[1]):
+        bases: np.ndarray = matrix[:, position]
+        present: np.ndarray = mask[:, position]
+        distances += (
+            (bases[:, np.newaxis] != bases[np.newaxis, :])
+            & present[:, np.newaxis]
+            & present[np.newaxis, :]
         )
-        if is_reverse_complement
-        else get_hamming_distance(
-            str_1=sequence_1[:shortest_index_length], str_2=sequence_2[:shortest_index_length]
-        )
-    )
+    return distances
+
+
+def get_colliding_indexes(
+    indexes: list[str], sample_ids: list[str], align_end: bool = False
+) -> np.ndarray:
+    """
+    Return whether each index is closer than the minimum Hamming distance to the index of any
+    other sample.
+    """
+    distances: np.ndarray = get_pairwise_hamming_distances(indexes=indexes, align_end=align_end)
+    sample_codes: np.ndarray = np.unique(np.array(sample_ids), return_inverse=True)[1]
+    other_sample: np.ndarray = sample_codes[:, np.newaxis] != sample_codes[np.newaxis, :]
+    return ((distances < MINIMUM_HAMMING_DISTANCE) & other_sample).any(axis=1)
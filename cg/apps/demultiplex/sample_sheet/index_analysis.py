@@ -0,0 +1,152 @@
+"""Analysis of the distances between the indexes of the samples in each lane of a sample sheet."""
+
+import logging
+
+import numpy as np
+from pydantic import BaseModel
+
+from cg.apps.demultiplex.sample_sheet.index import (
+    MINIMUM_HAMMING_DISTANCE,
+    get_pairwise_hamming_distances,
+)
+from cg.apps.demultiplex.sample_sheet.read_sample_sheet import get_samples_by_lane
+from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.models.demultiplex.run_parameters import RunParameters
+
+LOG = logging.getLogger(__name__)
+
+MAXIMUM_BARCODE_MISMATCHES: int = 2
+
+
+class IndexCollision(BaseModel):
+    """Two samples of a lane with indexes closer than the minimum Hamming distance."""
+
+    sample_id_1: str
+    sample_id_2: str
+    sequence_1: str
+    sequence_2: str
+    distance: int
+
+
+class IndexDistanceSummary(BaseModel):
+    """
+    Summary of the pairwise Hamming distances between the indexes of the samples of a lane.
+    Attributes:
+        minimum_distance: The smallest distance between the indexes of two different samples.
+        median_nearest_distance: The median of the distances of each index to its closest index.
+        collisions: The pairs of samples with indexes closer than the minimum Hamming distance.
+        recommended_barcode_mismatches: The largest number of mismatches that still assigns
+            every read to a single index of the lane.
+    """
+
+    minimum_distance: int | None = None
+    median_nearest_distance: float | None = None
+    collisions: list[IndexCollision] = []
+    recommended_barcode_mismatches: int = MAXIMUM_BARCODE_MISMATCHES
+
+
+class LaneIndexReport(BaseModel):
+    """Distances between the indexes of the samples of a lane, for index 1 and index 2."""
+
+    lane: int
+    sample_count: int
+    index_1: IndexDistanceSummary
+    index_2: IndexDistanceSummary | None = None
+
+    @property
+    def has_collisions(self) -> bool:
+        return bool(self.index_1.collisions or (self.index_2 and self.index_2.collisions))
+
+
+def get_recommended_barcode_mismatches(minimum_distance: int | None) -> int:
+    """Return the largest number of mismatches for which any read is within reach of at most one
+    index, that is half the minimum distance rounded down, excluding the distance itself."""
+    if minimum_distance is None:
+        return MAXIMUM_BARCODE_MISMATCHES
+    return max(0, min(MAXIMUM_BARCODE_MISMATCHES, (minimum_distance - 1) // 2))
+
+
+def get_index_distance_summary(
+    indexes: list[str], sample_ids: list[str], align_end: bool = False
+) -> IndexDistanceSummary:
+    """
+    Return the summary of the pairwise Hamming distances between the indexes of different samples.
+    The distances are calculated for all pairs at once, as for the barcode mismatches of the
+    sample sheet.
+    """
+    distances: np.ndarray = get_pairwise_hamming_distances(indexes=indexes, align_end=align_end)
+    sample_codes: np.ndarray = np.unique(np.array(sample_ids), return_inverse=True)[1]
+    other_sample: np.ndarray = sample_codes[:, np.newaxis] != sample_codes[np.newaxis, :]
+    has_other_sample: np.ndarray = other_sample.any(axis=1)
+    if not has_other_sample.any():
+        return IndexDistanceSummary()
+    nearest_distances: np.ndarray = np.where(
+        other_sample, distances, np.iinfo(distances.dtype).max
+    ).min(axis=1)[has_other_sample]
+    minimum_distance = int(nearest_distances.min())
+    colliding_pairs: np.ndarray = np.argwhere(
+        np.triu((distances < MINIMUM_HAMMING_DISTANCE) & other_sample, k=1)
+    )
+    collisions: list[IndexCollision] = [
+        IndexCollision(
+            sample_id_1=sample_ids[first],
+            sample_id_2=sample_ids[second],
+            sequence_1=indexes[first],
+            sequence_2=indexes[second],
+            distance=int(distances[first, second]),
+        )
+        for first, second in colliding_pairs
+    ]
+    return IndexDistanceSummary(
+        minimum_distance=minimum_distance,
+        median_nearest_distance=float(np.median(nearest_distances)),
+        collisions=collisions,
+        recommended_barcode_mismatches=get_recommended_barcode_mismatches(minimum_distance),
+    )
+
+
+def get_lane_index_report(
+    lane: int,
+    samples: list[IlluminaSampleIndexSetting],
+    is_run_single_index: bool,
+    is_reverse_complement: bool,
+) -> LaneIndexReport:
+    """Return the report of the distances between the indexes of the samples of a lane."""
+    sample_ids: list[str] = [sample.sample_id for sample in samples]
+    index_2_summary: IndexDistanceSummary | None = None
+    if not is_run_single_index:
+        index_2_summary = get_index_distance_summary(
+            indexes=[sample.index2 for sample in samples],
+            sample_ids=sample_ids,
+            align_end=is_reverse_complement,
+        )
+    return LaneIndexReport(
+        lane=lane,
+        sample_count=len(samples),
+        index_1=get_index_distance_summary(
+            indexes=[sample.index for sample in samples], sample_ids=sample_ids
+        ),
+        index_2=index_2_summary,
+    )
+
+
+def get_index_reports(
+    samples: list[IlluminaSampleIndexSetting], run_parameters: RunParameters
+) -> list[LaneIndexReport]:
+    """Return the reports of the distances between the indexes of the samples of every lane,
+    for samples with indexes processed as in the sample sheet."""
+    is_reverse_complement: bool = (
+        run_parameters.index_settings.are_i5_override_cycles_reverse_complemented
+    )
+    reports: list[LaneIndexReport] = []
+    for lane, samples_in_lane in sorted(get_samples_by_lane(samples).items()):
+        LOG.debug(f"Analysing the indexes of the samples in lane {lane}")
+        reports.append(
+            get_lane_index_report(
+                lane=lane,
+                samples=samples_in_lane,
+                is_run_single_index=run_parameters.is_single_index,
+                is_reverse_complement=is_reverse_complement,
+            )
+        )
+    return reports
@@ -1,11 +1,10 @@
 import logging
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from cg.apps.demultiplex.sample_sheet.index import (
-    MINIMUM_HAMMING_DISTANCE,
-    get_hamming_distance_index_1,
-    get_hamming_distance_index_2,
+    get_colliding_indexes,
     get_reverse_complement_dna_seq,
     is_dual_index,
 )
@@ -80,49 +79,6 @@ class IlluminaSampleIndexSetting(BaseModel):
         )
         self.override_cycles = read1_cycles + index1_cycles + index2_cycles + read2_cycles
 
-    def _update_barcode_mismatches_1(
-        self, samples_to_compare: list["IlluminaSampleIndexSetting"]
-    ) -> None:
-        """Assign zero to barcode_mismatches_1 if the hamming distance between self.index
-        and the index1 of any sample in the lane is below the minimum threshold."""
-        for sample in samples_to_compare:
-            if self.sample_id == sample.sample_id:
-                continue
-            if (
-                get_hamming_distance_index_1(sequence_1=self.index, sequence_2=sample.index)
-                < MINIMUM_HAMMING_DISTANCE
-            ):
-                LOG.debug(f"Turning barcode mismatch for index 1 to 0 for sample {self.sample_id}")
-                self.barcode_mismatches_1 = 0
-                break
-
-    def _update_barcode_mismatches_2(
-        self,
-        samples_to_compare: list["IlluminaSampleIndexSetting"],
-        is_reverse_complement: bool,
-    ) -> None:
-        """Assign zero to barcode_mismatches_2 if the hamming distance between self.index2
-        and the index2 of any sample in the lane is below the minimum threshold.
-        If the sample is single-indexed, assign 'na'."""
-        if self.index2 == EMPTY_STRING and "-" not in self.index:
-            LOG.debug(f"Turning barcode mismatch for index 2 to 'na' for sample {self.sample_id}")
-            self.barcode_mismatches_2 = "na"
-            return
-        for sample in samples_to_compare:
-            if self.sample_id == sample.sample_id:
-                continue
-            if (
-                get_hamming_distance_index_2(
-                    sequence_1=self.index2,
-                    sequence_2=sample.index2,
-                    is_reverse_complement=is_reverse_complement,
-                )
-                < MINIMUM_HAMMING_DISTANCE
-            ):
-                LOG.debug(f"Turning barcode mismatch for index 2 to 0 for sample {self.sample_id}")
-                self.barcode_mismatches_2 = 0
-                break
-
     def process_indexes(self, run_parameters: RunParameters):
         """Parse and reverse complement the indexes and updates override cycles."""
         self.separate_indexes(is_run_single_index=run_parameters.is_single_index)
@@ -130,17 +86,34 @@ class IlluminaSampleIndexSetting(BaseModel):
             self.index2 = get_reverse_complement_dna_seq(self.index2)
         self.update_override_cycles(run_parameters=run_parameters)
 
-    def update_barcode_mismatches(
-        self,
-        samples_to_compare: list["IlluminaSampleIndexSetting"],
-        is_run_single_index: bool,
-        is_reverse_complement: bool,
-    ) -> None:
-        """Update barcode mismatch attributes comparing to the rest of the samples in the lane."""
-        self._update_barcode_mismatches_1(samples_to_compare=samples_to_compare)
-        if is_run_single_index:
-            LOG.debug("Run is single-indexed, skipping barcode mismatch update for index 2")
-            return
-        self._update_barcode_mismatches_2(
-            samples_to_compare=samples_to_compare, is_reverse_complement=is_reverse_complement
-        )
+
+def update_barcode_mismatches_in_lane(
+    samples: list[IlluminaSampleIndexSetting],
+    is_run_single_index: bool,
+    is_reverse_complement: bool,
+) -> None:
+    """Update the barcode mismatch attributes of the samples of a lane, comparing the indexes of
+    all samples in the lane at once instead of each sample to every other sample."""
+    sample_ids: list[str] = [sample.sample_id for sample in samples]
+    colliding_indexes_1: np.ndarray = get_colliding_indexes(
+        indexes=[sample.index for sample in samples], sample_ids=sample_ids
+    )
+    for sample, is_colliding in zip(samples, colliding_indexes_1):
+        if is_colliding:
+            LOG.debug(f"Turning barcode mismatch for index 1 to 0 for sample {sample.sample_id}")
+            sample.barcode_mismatches_1 = 0
+    if is_run_single_index:
+        LOG.debug("Run is single-indexed, skipping barcode mismatch update for index 2")
+        return
+    colliding_indexes_2: np.ndarray = get_colliding_indexes(
+        indexes=[sample.index2 for sample in samples],
+        sample_ids=sample_ids,
+        align_end=is_reverse_complement,
+    )
+    for sample, is_colliding in zip(samples, colliding_indexes_2):
+        if sample.index2 == EMPTY_STRING and "-" not in sample.index:
+            LOG.debug(f"Turning barcode mismatch for index 2 to 'na' for sample {sample.sample_id}")
+            sample.barcode_mismatches_2 = "na"
+        elif is_colliding:
+            LOG.debug(f"Turning barcode mismatch for index 2 to 0 for sample {sample.sample_id}")
+            sample.barcode_mismatches_2 = 0
@@ -1,9 +1,12 @@
-""" Create a sample sheet for NovaSeq flow cells."""
+"""Create a sample sheet for NovaSeq flow cells."""
 
 import logging
 
 from cg.apps.demultiplex.sample_sheet.read_sample_sheet import get_samples_by_lane
-from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.apps.demultiplex.sample_sheet.sample_models import (
+    IlluminaSampleIndexSetting,
+    update_barcode_mismatches_in_lane,
+)
 from cg.constants.demultiplexing import IndexSettings, SampleSheetBCLConvertSections
 from cg.models.demultiplex.run_parameters import RunParameters
 from cg.models.run_devices.illumina_run_directory_data import IlluminaRunDirectoryData
@@ -120,12 +123,11 @@ class SampleSheetCreator:
         )
         for lane, samples_in_lane in get_samples_by_lane(self.samples).items():
             LOG.info(f"Updating barcode mismatch values for samples in lane {lane}")
-            for sample in samples_in_lane:
-                sample.update_barcode_mismatches(
-                    samples_to_compare=samples_in_lane,
-                    is_run_single_index=self.run_parameters.is_single_index,
-                    is_reverse_complement=is_reverse_complement,
-                )
+            update_barcode_mismatches_in_lane(
+                samples=samples_in_lane,
+                is_run_single_index=self.run_parameters.is_single_index,
+                is_reverse_complement=is_reverse_complement,
+            )
 
     def construct_sample_sheet(self) -> list[list[str]]:
         """Construct and validate the sample sheet."""
@@ -0,0 +1,91 @@
+"""Index of the files of Housekeeper versions by tag and by path."""
+
+import logging
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from housekeeper.store.models import File, Version
+from sqlalchemy import event
+
+LOG = logging.getLogger(__name__)
+
+
+class VersionFileIndex:
+    """The files of a version indexed by tag name and by path.
+
+    Looking up files by tags only visits the files having the tags, instead of every file of the
+    version and all of their tags. Files are returned in the order of the version files.
+    """
+
+    def __init__(self, version: Version):
+        self.files: list[File] = list(version.files)
+        self.positions: dict[int, int] = {}
+        self.files_by_tag: dict[str, list[File]] = {}
+        self.files_by_path: dict[str, File] = {}
+        for position, file in enumerate(self.files):
+            self.positions[id(file)] = position
+            self.files_by_path[file.path] = file
+            for tag in file.tags:
+                self.files_by_tag.setdefault(tag.name, []).append(file)
+
+    def get_files_with_all_tags(self, tags: set[str]) -> list[File]:
+        """Return the files having all the tags."""
+        if not tags:
+            return list(self.files)
+        tagged_files: list[list[File]] = sorted(
+            (self.files_by_tag.get(tag, []) for tag in tags), key=len
+        )
+        files: list[File] = tagged_files[0]
+        for other_files in tagged_files[1:]:
+            other_file_ids: set[int] = {id(file) for file in other_files}
+            files = [file for file in files if id(file) in other_file_ids]
+        return files
+
+    def get_files_with_any_tag(self, tags: set[str]) -> list[File]:
+        """Return the files having at least one of the tags."""
+        files: dict[int, File] = {
+            id(file): file for tag in tags for file in self.files_by_tag.get(tag, [])
+        }
+        return sorted(files.values(), key=lambda file: self.positions[id(file)])
+
+    def contains_path(self, path: Path) -> bool:
+        """Return whether a file of the version has the path, or a relative path that the path
+        ends with."""
+        parts: tuple[str, ...] = path.parts
+        return any(
+            Path(*parts[start:]).as_posix() in self.files_by_path for start in range(len(parts))
+        )
+
+
+_indexes: WeakKeyDictionary[Version, tuple[int, VersionFileIndex]] = WeakKeyDictionary()
+
+
+def get_version_file_index(version: Version) -> VersionFileIndex:
+    """Return the file index of the version, built on first use and kept while the version object
+    is alive. The index is rebuilt when files are added to or removed from the version, or when
+    the tags or path of one of its files change."""
+    file_count: int = len(version.files)
+    cached: tuple[int, VersionFileIndex] | None = _indexes.get(version)
+    if cached and cached[0] == file_count:
+        return cached[1]
+    LOG.debug(f"Indexing {file_count} files of version {version.id}")
+    index = VersionFileIndex(version)
+    _indexes[version] = (file_count, index)
+    return index
+
+
+def invalidate_version_file_index(version: Version | None) -> None:
+    """Forget the file index of the version, after the tags or paths of its files changed."""
+    if version is not None:
+        _indexes.pop(version, None)
+
+
+def _invalidate_file_version_index(file: File, *_) -> None:
+    """Forget the file index of the version of a file whose tags or path changed."""
+    if _indexes:
+        invalidate_version_file_index(file.version)
+
+
+event.listen(File.tags, "append", _invalidate_file_version_index)
+event.listen(File.tags, "remove", _invalidate_file_version_index)
+event.listen(File.path, "set", _invalidate_file_version_index)
@@ -1,4 +1,4 @@
-""" Module to decouple cg code from Housekeeper code """
+"""Module to decouple cg code from Housekeeper code"""
 
 import logging
 import os
@@ -8,10 +8,17 @@ from pathlib import Path
 from housekeeper.include import checksum as hk_checksum
 from housekeeper.include import include_version
 from housekeeper.store.database import create_all_tables, drop_all_tables, initialize_database
+from housekeeper.store.filters.file_filters import FileFilter, apply_file_filter
 from housekeeper.store.models import Archive, Bundle, File, Tag, Version
 from housekeeper.store.store import Store
-from sqlalchemy.orm import Query
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Query, contains_eager, joinedload, selectinload
 
+from cg.apps.housekeeper.file_index import (
+    VersionFileIndex,
+    get_version_file_index,
+    invalidate_version_file_index,
+)
 from cg.constants import SequencingFileTag
 from cg.exc import (
     HousekeeperArchiveMissingError,
@@ -21,6 +28,8 @@ from cg.exc import (
 
 LOG = logging.getLogger(__name__)
 
+IDENTIFIERS_PER_QUERY: int = 1000
+
 
 class HousekeeperAPI:
     """API to decouple cg code from Housekeeper."""
@@ -90,6 +99,7 @@ class HousekeeperAPI:
             Path(file_obj.full_path).unlink()
 
         LOG.info(f"Deleting file {file_id} from housekeeper")
+        invalidate_version_file_index(file_obj.version)
         self._store.session.delete(file_obj)
         self.commit()
 
@@ -112,6 +122,7 @@ class HousekeeperAPI:
         )
 
         new_file.version = version_obj
+        invalidate_version_file_index(version_obj)
         self._store.session.add(new_file)
         return new_file
 
@@ -138,16 +149,17 @@ class HousekeeperAPI:
                 file = self.files(path=f"{self.root_dir}/{path}").first()
         return file
 
+    @staticmethod
+    def get_version_file_index(version: Version) -> VersionFileIndex:
+        """Return the files of the version indexed by tag and by path. The index is built once per
+        version object and reused by the following lookups."""
+        return get_version_file_index(version)
+
     @staticmethod
     def get_files_from_version(version: Version, tags: set[str]) -> list[File]:
         """Return a list of files associated with the given version and tags."""
         LOG.debug(f"Getting files from version with tags {tags}")
-        files: list[File] = []
-        for file in list(version.files):
-            file_tags = {tag.name for tag in file.tags}
-            if tags.issubset(file_tags):
-                LOG.debug(f"Found file {file}")
-                files.append(file)
+        files: list[File] = get_version_file_index(version).get_files_with_all_tags(tags)
         if not files:
             LOG.warning(f"Could not find any files matching the tags {tags}")
         return files
@@ -239,11 +251,13 @@ class HousekeeperAPI:
             LOG.warning(
                 f"Another file with identical included file path: {new_path} already exist. Skip linking of: {file_obj.path}"
             )
+            invalidate_version_file_index(file_obj.version)
             file_obj.path = str(new_path).replace(f"{global_root_dir}/", "", 1)
             return file_obj
         # hardlink file to the internal structure
         os.link(file_obj.path, new_path)
         LOG.info(f"Linked file: {file_obj.path} -> {new_path}")
+        invalidate_version_file_index(file_obj.version)
         file_obj.path = str(new_path).replace(f"{global_root_dir}/", "", 1)
         return file_obj
 
@@ -284,6 +298,39 @@ class HousekeeperAPI:
         LOG.debug(f"Found Housekeeper version object for {bundle_name}: {repr(last_version)}")
         return last_version
 
+    def get_latest_bundle_versions(self, bundle_names: list[str]) -> dict[str, Version]:
+        """Return the latest versions of the bundles by bundle name, with their files and file tags
+        loaded, in one query per chunk of bundle names. Bundles without versions are left out."""
+        versions: list[Version] = []
+        unique_bundle_names: list[str] = list(dict.fromkeys(bundle_names))
+        for start in range(0, len(unique_bundle_names), IDENTIFIERS_PER_QUERY):
+            chunk: list[str] = unique_bundle_names[start : start + IDENTIFIERS_PER_QUERY]
+            latest_created_at = (
+                select(Version.bundle_id, func.max(Version.created_at).label("created_at"))
+                .join(Version.bundle)
+                .where(Bundle.name.in_(chunk))
+                .group_by(Version.bundle_id)
+                .subquery()
+            )
+            versions.extend(
+                self._store._get_query(table=Version)
+                .join(
+                    latest_created_at,
+                    and_(
+                        Version.bundle_id == latest_created_at.c.bundle_id,
+                        Version.created_at == latest_created_at.c.created_at,
+                    ),
+                )
+                .options(
+                    joinedload(Version.bundle),
+                    selectinload(Version.files).selectinload(File.tags),
+                )
+                .order_by(Version.id)
+                .all()
+            )
+        LOG.debug(f"Found {len(versions)} latest versions of {len(unique_bundle_names)} bundles")
+        return {version.bundle.name: version for version in versions}
+
     def get_or_create_version(self, bundle_name: str) -> Version:
         """Returns the latest version of a bundle if it exists. If not creates a bundle and
         returns its version."""
@@ -323,6 +370,7 @@ class HousekeeperAPI:
     def include(self, version_obj: Version):
         """Call the include version function to import related assets."""
         include_version(self.get_root_dir(), version_obj)
+        invalidate_version_file_index(version_obj)
         version_obj.included_at = datetime.now()
 
     def add_commit(self, obj):
@@ -420,6 +468,51 @@ class HousekeeperAPI:
         LOG.debug(f"Getting archived files for bundle {bundle_name}")
         return self._store.get_archived_files_for_bundle(bundle_name=bundle_name, tags=tags or [])
 
+    def get_archived_files_for_bundles(
+        self, bundle_names: list[str], tags: list | None = None
+    ) -> dict[str, list[File]]:
+        """Returns the archived files of the bundles tagged with the given tags, by bundle name,
+        in one query per chunk of bundle names."""
+        LOG.debug(f"Getting archived files for {len(bundle_names)} bundles")
+        files_by_bundle: dict[str, list[File]] = {bundle_name: [] for bundle_name in bundle_names}
+        unique_bundle_names: list[str] = list(files_by_bundle)
+        for start in range(0, len(unique_bundle_names), IDENTIFIERS_PER_QUERY):
+            chunk: list[str] = unique_bundle_names[start : start + IDENTIFIERS_PER_QUERY]
+            archived_files: Query = apply_file_filter(
+                files=self._store._get_join_file_tags_archive_query().filter(
+                    Bundle.name.in_(chunk)
+                ),
+                filter_functions=[FileFilter.FILES_BY_TAGS, FileFilter.FILES_BY_IS_ARCHIVED],
+                is_archived=True,
+                tag_names=tags or [],
+            )
+            for file, bundle_name in (
+                archived_files.add_columns(Bundle.name)
+                .group_by(Bundle.name)
+                .options(contains_eager(File.archive))
+                .order_by(File.id)
+            ):
+                files_by_bundle[bundle_name].append(file)
+        return files_by_bundle
+
+    def get_files_for_versions(self, version_ids: list[int]) -> dict[int, list[File]]:
+        """Return the files of the versions, with their tags loaded, by version id, in one query
+        per chunk of version ids."""
+        LOG.debug(f"Getting files for {len(version_ids)} versions")
+        files_by_version: dict[int, list[File]] = {version_id: [] for version_id in version_ids}
+        unique_version_ids: list[int] = list(files_by_version)
+        for start in range(0, len(unique_version_ids), IDENTIFIERS_PER_QUERY):
+            chunk: list[int] = unique_version_ids[start : start + IDENTIFIERS_PER_QUERY]
+            files: Query = (
+                self._store._get_query(table=File)
+                .filter(File.version_id.in_(chunk))
+                .options(selectinload(File.tags))
+                .order_by(File.id)
+            )
+            for file in files:
+                files_by_version[file.version_id].append(file)
+        return files_by_version
+
     def get_archived_files_not_being_retrieved_for_bundle(
         self, bundle_name: str, tags: list | None = None
     ) -> list[File]:
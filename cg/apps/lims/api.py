@@ -2,7 +2,7 @@
 
 import logging
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Mapping
 
 from dateutil.parser import parse as parse_date
 from genologics.entities import Artifact, Process, Researcher, Sample
@@ -21,6 +21,7 @@ from cg.constants.priority import Priority
 from cg.exc import LimsDataError
 
 from .order import OrderHandler
+from .sample_cache import SampleUdfCache
 
 SEX_MAP = {"F": "female", "M": "male", "Unknown": "unknown", "unknown": "unknown"}
 REV_SEX_MAP = {value: key for key, value in SEX_MAP.items()}
@@ -40,6 +41,7 @@ AM_METHODS = {
     "1830": "NovaSeq 6000 Sequencing method",
     "2234": "Method - Illumina Stranded mRNA Library Preparation",
 }
+SAMPLES_PER_BATCH: int = 500
 METHOD_INDEX, METHOD_DOCUMENT_INDEX, METHOD_VERSION_INDEX, METHOD_TYPE_INDEX = 0, 1, 2, 3
 
 LOG = logging.getLogger(__name__)
@@ -51,6 +53,7 @@ class LimsAPI(Lims, OrderHandler):
     def __init__(self, config):
         lconf = config["lims"]
         super(LimsAPI, self).__init__(lconf["host"], lconf["username"], lconf["password"])
+        self.sample_udf_cache = SampleUdfCache()
 
     @property
     def user(self) -> Researcher:
@@ -66,6 +69,30 @@ class LimsAPI(Lims, OrderHandler):
             LOG.warning(f"Sample {lims_id} not found in LIMS: {error}")
         return lims_sample
 
+    def samples(self, lims_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Return samples by ID from the LIMS database, fetched with batch requests.
+        Samples not found in LIMS are returned as empty dicts."""
+        lims_samples: list[Sample] = [
+            Sample(self, id=lims_id) for lims_id in dict.fromkeys(lims_ids)
+        ]
+        for start in range(0, len(lims_samples), SAMPLES_PER_BATCH):
+            try:
+                self.get_batch(lims_samples[start : start + SAMPLES_PER_BATCH])
+            except HTTPError as error:
+                LOG.warning(f"Could not fetch samples in batch, fetching them one by one: {error}")
+        return {lims_id: self.sample(lims_id) for lims_id in lims_ids}
+
+    def get_sample_udfs(self, lims_id: str) -> Mapping[str, Any]:
+        """Return the UDFs of a sample, parsed once and kept in the sample UDF cache.
+        Raises:
+            HTTPError: If the sample cannot be fetched from LIMS.
+        """
+        udfs: Mapping[str, Any] | None = self.sample_udf_cache.get(lims_id)
+        if udfs is None:
+            udfs = Sample(self, id=lims_id).udf
+            self.sample_udf_cache.set(lims_id=lims_id, udfs=udfs)
+        return udfs
+
     def samples_in_pools(self, pool_name, projectname):
         """Fetch all samples from a pool"""
         return self.get_samples(udf={"pool name": str(pool_name)}, projectname=projectname)
@@ -88,7 +115,7 @@ class LimsAPI(Lims, OrderHandler):
 
     def _export_sample(self, lims_sample):
         """Get data from a LIMS sample."""
-        udfs = lims_sample.udf
+        udfs: Mapping[str, Any] = self.get_sample_udfs(lims_sample.id)
         return {
             "id": lims_sample.id,
             "name": lims_sample.name,
@@ -116,29 +143,26 @@ class LimsAPI(Lims, OrderHandler):
 
     def get_received_date(self, lims_id: str) -> date:
         """Get the date when a sample was received."""
-        sample = Sample(self, id=lims_id)
         date = None
         try:
-            date = sample.udf.get("Received at")
+            date = self.get_sample_udfs(lims_id).get("Received at")
         except HTTPError as error:
             LOG.warning(f"Sample {lims_id} not found in LIMS: {error}")
         return date
 
     def get_prepared_date(self, lims_id: str) -> date:
         """Get the date when a sample was prepared in the lab."""
-        sample = Sample(self, id=lims_id)
         date = None
         try:
-            date = sample.udf.get("Library Prep Finished")
+            date = self.get_sample_udfs(lims_id).get("Library Prep Finished")
         except HTTPError as error:
             LOG.warning(f"Sample {lims_id} not found in LIMS: {error}")
         return date
 
     def get_delivery_date(self, lims_id: str) -> date:
         """Get delivery date for a sample."""
-        sample = Sample(self, id=lims_id)
         try:
-            date = sample.udf.get("Delivered at")
+            date = self.get_sample_udfs(lims_id).get("Delivered at")
         except HTTPError as error:
             LOG.warning(f"Sample {lims_id} not found in LIMS: {error}")
             date = None
@@ -149,8 +173,7 @@ class LimsAPI(Lims, OrderHandler):
         step_names_udfs = MASTER_STEPS_UDFS["capture_kit_step"]
         capture_kits = set()
         try:
-            lims_sample = Sample(self, id=lims_id)
-            capture_kit: str | None = lims_sample.udf.get("Bait Set")
+            capture_kit: str | None = self.get_sample_udfs(lims_id).get("Bait Set")
             if capture_kit and capture_kit != "NA":
                 return capture_kit
             for process_type in step_names_udfs:
@@ -163,7 +186,7 @@ class LimsAPI(Lims, OrderHandler):
                     or self._find_twist_capture_kits(artifacts=artifacts, udf_key=udf_key)
                 )
             if len(capture_kits) > 1:
-                message = f"Capture kit error: {lims_sample.id} | {capture_kits}"
+                message = f"Capture kit error: {lims_id} | {capture_kits}"
                 raise LimsDataError(message)
             if len(capture_kits) == 1:
                 return capture_kits.pop()
@@ -244,16 +267,15 @@ class LimsAPI(Lims, OrderHandler):
             lims_sample.udf[PROP2UDF[key]] = value
 
         lims_sample.put()
+        self.sample_udf_cache.invalidate(lims_id)
 
     def get_sample_attribute(self, lims_id: str, key: str) -> str:
         """Get data from a sample."""
-
-        sample = Sample(self, id=lims_id)
         if not PROP2UDF.get(key):
             raise LimsDataError(
                 f"Unknown how to get {key} from LIMS since it is not defined in " f"{PROP2UDF}"
             )
-        return sample.udf[PROP2UDF[key]]
+        return self.get_sample_udfs(lims_id)[PROP2UDF[key]]
 
     def get_prep_method(self, lims_id: str) -> str | None:
         """Return the library preparation method of a LIMS sample."""
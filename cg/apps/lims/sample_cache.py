@@ -0,0 +1,39 @@
+"""Bounded cache of the parsed UDFs of LIMS samples."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Mapping
+
+SAMPLE_UDF_CACHE_SIZE: int = 10_000
+
+
+class SampleUdfCache:
+    """The UDFs of the most recently used LIMS samples by sample id.
+
+    The UDFs of a sample are parsed from its XML on every access through the sample entity, so
+    getters reading single attributes of the same sample read them from here instead. The least
+    recently used samples are evicted once the cache holds the maximum number of samples."""
+
+    def __init__(self, max_size: int = SAMPLE_UDF_CACHE_SIZE):
+        self.max_size = max_size
+        self._udfs: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, lims_id: str) -> Mapping[str, Any] | None:
+        with self._lock:
+            udfs: Mapping[str, Any] | None = self._udfs.get(lims_id)
+            if udfs is not None:
+                self._udfs.move_to_end(lims_id)
+            return udfs
+
+    def set(self, lims_id: str, udfs: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._udfs[lims_id] = udfs
+            self._udfs.move_to_end(lims_id)
+            while len(self._udfs) > self.max_size:
+                self._udfs.popitem(last=False)
+
+    def invalidate(self, lims_id: str) -> None:
+        """Forget the UDFs of a sample, after they were updated."""
+        with self._lock:
+            self._udfs.pop(lims_id, None)
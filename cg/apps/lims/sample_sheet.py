@@ -31,6 +31,19 @@ def get_non_pooled_artifacts(artifact: Artifact) -> list[Artifact]:
     return artifacts
 
 
+def retrieve_non_pooled_artifacts(lims: Lims, artifacts: list[Artifact]) -> None:
+    """Retrieve the artifacts and their input artifacts down to the non-pooled artifacts, with one
+    batch request per pooling level instead of one request per artifact."""
+    while artifacts:
+        lims.get_batch(artifacts)
+        artifacts = [
+            input_artifact
+            for artifact in artifacts
+            if len(artifact.samples) != 1
+            for input_artifact in artifact.input_artifact_list()
+        ]
+
+
 def get_reagent_label(artifact) -> str | None:
     """Get the first and only reagent label from an artifact."""
     labels: list[str] = artifact.reagent_labels
@@ -77,6 +90,8 @@ def get_flow_cell_samples(
         return []
     container: Container = containers[-1]  # only take the last one. See ÖA#217.
     raw_lanes: list[str] = sorted(container.placements.keys())
+    retrieve_non_pooled_artifacts(lims=lims, artifacts=list(container.placements.values()))
+    index_by_label: dict[str | None, str] = {}
     for raw_lane in raw_lanes:
         lane: int = get_placement_lane(raw_lane)
         placement_artifact: Artifact = container.placements[raw_lane]
@@ -84,9 +99,10 @@ def get_flow_cell_samples(
         for artifact in non_pooled_artifacts:
             sample: Sample = artifact.samples[0]  # we are assured it only has one sample
             label: str | None = get_reagent_label(artifact)
-            index = get_index(lims=lims, label=label)
+            if label not in index_by_label:
+                index_by_label[label] = get_index(lims=lims, label=label)
             yield IlluminaSampleIndexSetting(
                 lane=lane,
                 sample_id=sample.id,
-                index=index,
+                index=index_by_label[label],
             )
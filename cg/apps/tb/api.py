@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timezone
+from http import HTTPStatus
 from typing import Any
 
 from google.auth.transport.requests import Request
@@ -19,6 +20,9 @@ from cg.io.controller import APIRequest, ReadStream
 
 LOG = logging.getLogger(__name__)
 
+LATEST_ANALYSES_CHUNK_SIZE: int = 200
+MISSING_ENDPOINT_STATUSES: tuple[int, ...] = (HTTPStatus.NOT_FOUND, HTTPStatus.METHOD_NOT_ALLOWED)
+
 
 class TrailblazerAPI:
     """Interface to Trailblazer for `cg`."""
@@ -35,6 +39,7 @@ class TrailblazerAPI:
         self.service_account_auth_file = config["trailblazer"]["service_account_auth_file"]
         self.host = config["trailblazer"]["host"]
         self._credentials: IDTokenCredentials | None = None
+        self._has_latest_analyses_endpoint: bool = True
 
     def _are_credentials_expired(self) -> bool:
         """Return True when there are no cached credentials or the token has expired."""
@@ -82,20 +87,31 @@ class TrailblazerAPI:
         return {"Authorization": f"Bearer {self._credentials.token}"}
 
     def query_trailblazer(
-        self, command: str, request_body: dict, method: str = APIMethods.POST
+        self,
+        command: str,
+        request_body: dict,
+        method: str = APIMethods.POST,
+        idempotent: bool = False,
     ) -> Any:
+        """Send a command to Trailblazer. Idempotent commands, such as queries sent as POST, are
+        retried on temporary failures whatever their method."""
         url = f"{self.host}/{command}"
         LOG.debug(f"REQUEST HEADER {self.auth_header}")
         LOG.debug(f"{method}: URL={url}; JSON={request_body}")
 
         response = APIRequest.api_request_from_content(
-            api_method=method, url=url, headers=self.auth_header, json=request_body
+            api_method=method,
+            url=url,
+            headers=self.auth_header,
+            json=request_body,
+            idempotent=idempotent,
         )
 
         LOG.debug(f"RESPONSE STATUS CODE {response.status_code}")
         if not response.ok:
             raise TrailblazerAPIHTTPError(
-                f"Request {command} failed with status code {response.status_code}: {response.text}"
+                f"Request {command} failed with status code {response.status_code}: {response.text}",
+                status_code=response.status_code,
             )
         LOG.debug(f"RESPONSE BODY {response.text}")
         return ReadStream.get_content_from_stream(file_format=FileFormat.JSON, stream=response.text)
@@ -112,10 +128,55 @@ class TrailblazerAPI:
         request_body = {
             "case_id": case_id,
         }
-        response = self.query_trailblazer(command="get-latest-analysis", request_body=request_body)
+        response = self.query_trailblazer(
+            command="get-latest-analysis", request_body=request_body, idempotent=True
+        )
         if response:
             return TrailblazerAnalysis.model_validate(response)
 
+    def get_latest_analyses(self, case_ids: list[str]) -> dict[str, TrailblazerAnalysis]:
+        """Return the latest analysis of the cases that have one, by case id. The analyses are
+        requested in chunks of cases, or one case at a time from a Trailblazer without the
+        get-latest-analyses endpoint, which is then no longer requested.
+        Raises:
+            TrailblazerAPIHTTPError: If the request for a chunk fails for another reason.
+        """
+        if not self._has_latest_analyses_endpoint:
+            return self._get_latest_analyses_per_case(case_ids)
+        latest_analyses: dict[str, TrailblazerAnalysis] = {}
+        for start in range(0, len(case_ids), LATEST_ANALYSES_CHUNK_SIZE):
+            request_body = {"case_ids": case_ids[start : start + LATEST_ANALYSES_CHUNK_SIZE]}
+            try:
+                response = self.query_trailblazer(
+                    command="get-latest-analyses", request_body=request_body, idempotent=True
+                )
+            except TrailblazerAPIHTTPError as error:
+                if error.status_code not in MISSING_ENDPOINT_STATUSES:
+                    raise
+                LOG.warning(f"Requesting the latest analyses one case at a time: {error}")
+                self._has_latest_analyses_endpoint = False
+                return latest_analyses | self._get_latest_analyses_per_case(case_ids[start:])
+            for analysis in AnalysesResponse.model_validate(response).analyses:
+                latest_analyses[analysis.case_id] = analysis
+        return latest_analyses
+
+    def _get_latest_analyses_per_case(self, case_ids: list[str]) -> dict[str, TrailblazerAnalysis]:
+        latest_analyses: dict[str, TrailblazerAnalysis] = {}
+        for case_id in case_ids:
+            if analysis := self.get_latest_analysis(case_id):
+                latest_analyses[case_id] = analysis
+        return latest_analyses
+
+    def get_case_ids_with_latest_analysis_status(
+        self, case_ids: list[str], statuses: list[str]
+    ) -> set[str]:
+        """Return the ids of the cases whose latest analysis has any of the statuses."""
+        return {
+            case_id
+            for case_id, analysis in self.get_latest_analyses(case_ids).items()
+            if analysis.status in statuses
+        }
+
     def get_latest_analysis_status(self, case_id: str) -> str | None:
         latest_analysis = self.get_latest_analysis(case_id=case_id)
         if latest_analysis:
@@ -3,60 +3,73 @@
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import coloredlogs
 import rich_click as click
-from sqlalchemy.orm import scoped_session
 
 import cg
-from cg.cli.add import add as add_cmd
-from cg.cli.archive import archive
-from cg.cli.backup import backup
-from cg.cli.clean import clean
-from cg.cli.compress.base import compress, decompress
-from cg.cli.delete.base import delete
-from cg.cli.deliver.base import deliver as deliver_cmd
-from cg.cli.demultiplex.base import demultiplex_cmd_group as demultiplex_cmd
-from cg.cli.downsample import downsample
-from cg.cli.generate.base import generate as generate_cmd
-from cg.cli.get import get
-from cg.cli.post_process.post_process import post_process_group as post_processing
-from cg.cli.sequencing_qc.sequencing_qc import sequencing_qc
-from cg.cli.set.base import set_cmd
-from cg.cli.store.base import store as store_cmd
-from cg.cli.transfer import transfer_group
-from cg.cli.upload.base import upload
-from cg.cli.utils import CLICK_CONTEXT_SETTINGS
-from cg.cli.workflow.base import workflow as workflow_cmd
+from cg.cli.utils import CLICK_CONTEXT_SETTINGS, LazyGroup
 from cg.constants.cli_options import FORCE
 from cg.constants.constants import FileFormat
-from cg.io.controller import ReadFile
-from cg.models.cg_config import CGConfig
-from cg.store.database import (
-    create_all_tables,
-    drop_all_tables,
-    get_scoped_session_registry,
-    get_tables,
-)
+
+if TYPE_CHECKING:
+    from cg.models.cg_config import CGConfig
 
 LOG = logging.getLogger(__name__)
 LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 
+# The subcommands are imported when used, since importing all of them takes seconds.
+LAZY_SUBCOMMANDS: dict[str, str] = {
+    "add": "cg.cli.add:add",
+    "archive": "cg.cli.archive:archive",
+    "backup": "cg.cli.backup:backup",
+    "clean": "cg.cli.clean:clean",
+    "compress": "cg.cli.compress.base:compress",
+    "decompress": "cg.cli.compress.base:decompress",
+    "delete": "cg.cli.delete.base:delete",
+    "deliver": "cg.cli.deliver.base:deliver",
+    "demultiplex": "cg.cli.demultiplex.base:demultiplex_cmd_group",
+    "downsample": "cg.cli.downsample:downsample",
+    "generate": "cg.cli.generate.base:generate",
+    "get": "cg.cli.get:get",
+    "post-process": "cg.cli.post_process.post_process:post_process_group",
+    "sequencing-qc": "cg.cli.sequencing_qc.sequencing_qc:sequencing_qc",
+    "set": "cg.cli.set.base:set_cmd",
+    "store": "cg.cli.store.base:store",
+    "transfer": "cg.cli.transfer:transfer_group",
+    "upload": "cg.cli.upload.base:upload",
+    "workflow": "cg.cli.workflow.base:workflow",
+}
+
 
 def teardown_session():
     """Ensure that the session is closed and all resources are released to the connection pool."""
-    registry: scoped_session | None = get_scoped_session_registry()
+    from cg.io.api import log_request_statistics
+    from cg.store.database import get_scoped_session_registry
+    from cg.store.instrumentation import log_query_statistics, stop_recording
+
+    log_query_statistics(stop_recording())
+    log_request_statistics()
+    registry = get_scoped_session_registry()
     if registry:
         registry.remove()
 
 
-@click.group(context_settings=CLICK_CONTEXT_SETTINGS)
+@click.group(
+    cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, context_settings=CLICK_CONTEXT_SETTINGS
+)
 @click.option("-c", "--config", type=click.Path(exists=True), help="path to config file")
 @click.option("-d", "--database", help="path/URI of the SQL database")
 @click.option(
     "-l", "--log-level", type=click.Choice(LEVELS), default="INFO", help="lowest level to log at"
 )
 @click.option("--verbose", is_flag=True, help="Show full log information, time stamp etc")
+@click.option(
+    "--log-queries",
+    is_flag=True,
+    help="Log the number, total time and slowest of the status db queries on exit",
+)
 @click.version_option(cg.__version__, prog_name=cg.__title__)
 @click.pass_context
 def base(
@@ -65,8 +78,15 @@ def base(
     database: str | None,
     log_level: str,
     verbose: bool,
+    log_queries: bool,
 ):
     """cg - interface between tools at Clinical Genomics."""
+    from cg.io.api import configure_transport
+    from cg.io.controller import ReadFile
+    from cg.models.cg_config import CGConfig
+    from cg.store.instrumentation import start_recording
+    from cg.utils.checksum.cache import configure_checksum_cache
+
     if verbose:
         log_format = "%(asctime)s %(hostname)s %(name)s[%(process)d] %(levelname)s %(message)s"
     else:
@@ -79,6 +99,13 @@ def base(
         else {"database": database}
     )
     context.obj = CGConfig(**raw_config)
+    if context.obj.checksum_cache:
+        configure_checksum_cache(context.obj.checksum_cache)
+    if context.obj.http_transport:
+        configure_transport(context.obj.http_transport)
+    if log_queries:
+        context.obj.instrument_queries = True
+        start_recording()
     context.call_on_close(teardown_session)
 
 
@@ -86,8 +113,10 @@ def base(
 @click.option("--reset", is_flag=True, help="Reset database before setting up tables")
 @FORCE
 @click.pass_obj
-def init(context: CGConfig, reset: bool, force: bool):
+def init(context: "CGConfig", reset: bool, force: bool):
     """Setup the database."""
+    from cg.store.database import create_all_tables, drop_all_tables, get_tables
+
     existing_tables: list[str] = get_tables()
     if force or reset:
         if existing_tables and not force:
@@ -107,8 +136,10 @@ def find_commands(group, query: str) -> list[str]:
     Args:
         query the command or pattern you want to look for. Does not support fuzzy searches.
     """
+    context = click.Context(group)
     commands: list[str] = []
-    for cmd_name, cmd in group.commands.items():
+    for cmd_name in group.list_commands(context):
+        cmd = group.get_command(context, cmd_name)
         if query.lower() in cmd_name.lower():
             commands.append(cmd_name)
         if isinstance(cmd, click.Group):
@@ -132,24 +163,3 @@ def search(query):
             click.echo(f"  {cmd}")
     else:
         click.echo("No matching commands found.")
-
-
-base.add_command(add_cmd)
-base.add_command(archive)
-base.add_command(backup)
-base.add_command(clean)
-base.add_command(compress)
-base.add_command(decompress)
-base.add_command(delete)
-base.add_command(get)
-base.add_command(set_cmd)
-base.add_command(transfer_group)
-base.add_command(upload)
-base.add_command(workflow_cmd)
-base.add_command(store_cmd)
-base.add_command(deliver_cmd)
-base.add_command(demultiplex_cmd)
-base.add_command(generate_cmd)
-base.add_command(downsample)
-base.add_command(post_processing)
-base.add_command(sequencing_qc)
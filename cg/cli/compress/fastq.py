@@ -35,6 +35,13 @@ LOG = logging.getLogger(__name__)
 @click.option("-m", "--mem", type=int, help="Memory for slurm job")
 @click.option("-t", "--ntasks", type=int, help="Number of tasks for slurm job")
 @click.option("-n", "--number-of-conversions", default=5, type=int, show_default=True)
+@click.option(
+    "--max-concurrent-discovery",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of samples to check for FASTQ files ready for compression concurrently",
+)
 @DRY_RUN
 @click.pass_obj
 def fastq_cmd(
@@ -46,6 +53,7 @@ def fastq_cmd(
     mem: int | None,
     ntasks: int | None,
     number_of_conversions: int,
+    max_concurrent_discovery: int,
 ):
     """Compress old FASTQ files into SPRING."""
     LOG.info("Running compress FASTQ")
@@ -63,6 +71,7 @@ def fastq_cmd(
         hours=hours,
         mem=mem,
         ntasks=ntasks,
+        max_concurrent_discovery=max_concurrent_discovery,
     )
 
 
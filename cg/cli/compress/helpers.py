@@ -3,6 +3,8 @@
 import datetime as dt
 import logging
 import os
+import time
+from contextlib import closing
 from math import ceil
 from pathlib import Path
 from typing import Iterator
@@ -14,6 +16,7 @@ from cg.constants.compression import CRUNCHY_MIN_GB_PER_PROCESS, MAX_READS_PER_G
 from cg.constants.slurm import SlurmProcessing
 from cg.meta.compress import CompressAPI
 from cg.meta.compress.files import get_spring_paths
+from cg.models.compression_data import SampleFastqCompressions
 from cg.store.models import Case
 from cg.store.store import Store
 from cg.utils.date import get_date_days_ago
@@ -120,41 +123,67 @@ def compress_sample_fastqs_in_cases(
     hours: int = None,
     mem: int = None,
     ntasks: int = None,
+    max_concurrent_discovery: int = 1,
 ) -> None:
-    """Compress sample FASTQs for samples in cases."""
+    """Compress sample FASTQs for samples in cases.
+    The FASTQ files ready for compression are discovered for several samples at a time and each
+    sample is submitted for compression as soon as its files have been discovered."""
+    cases = [case for case in cases if case.links]
+    sample_ids: list[str] = list(
+        dict.fromkeys(case_link.sample.internal_id for case in cases for case_link in case.links)
+    )
+    sample_compressions: Iterator[SampleFastqCompressions] = (
+        compress_api.get_fastq_compressions_for_samples(
+            sample_ids=sample_ids, max_concurrent_discovery=max_concurrent_discovery
+        )
+    )
+    discovered: dict[str, SampleFastqCompressions] = {}
+    submitted_sample_ids: set[str] = set()
+    submission_time: float = 0
     case_conversion_count: int = 0
     individuals_conversion_count: int = 0
-    for case in cases:
-        case_converted = True
-        if case_conversion_count >= number_of_conversions:
-            break
-
-        LOG.debug(f"Searching for FASTQ files in case {case.internal_id}")
-        if not case.links:
-            continue
-        for case_link in case.links:
-            sample_process_mem: int | None = set_memory_according_to_reads(
-                sample_process_mem=mem,
-                sample_id=case_link.sample.internal_id,
-                sample_reads=case_link.sample.reads,
-            )
-            update_compress_api(
-                compress_api=compress_api,
-                dry_run=dry_run,
-                hours=hours,
-                mem=sample_process_mem,
-                ntasks=ntasks,
-            )
-            case_converted: bool = compress_api.compress_fastq(
-                sample_id=case_link.sample.internal_id
-            )
-            if not case_converted:
-                LOG.debug(f"skipping individual {case_link.sample.internal_id}")
-                continue
-            individuals_conversion_count += 1
-        if case_converted:
-            case_conversion_count += 1
-            LOG.info(f"Considering case {case.internal_id} converted")
+    with closing(sample_compressions):
+        for case in cases:
+            case_converted = True
+            if case_conversion_count >= number_of_conversions:
+                break
+
+            LOG.debug(f"Searching for FASTQ files in case {case.internal_id}")
+            for case_link in case.links:
+                sample_id: str = case_link.sample.internal_id
+                while sample_id not in discovered:
+                    sample_compression: SampleFastqCompressions = next(sample_compressions)
+                    discovered[sample_compression.sample_id] = sample_compression
+                if sample_id in submitted_sample_ids:
+                    LOG.debug(f"Compression of individual {sample_id} already submitted")
+                    case_converted = False
+                    continue
+                sample_process_mem: int | None = set_memory_according_to_reads(
+                    sample_process_mem=mem,
+                    sample_id=sample_id,
+                    sample_reads=case_link.sample.reads,
+                )
+                update_compress_api(
+                    compress_api=compress_api,
+                    dry_run=dry_run,
+                    hours=hours,
+                    mem=sample_process_mem,
+                    ntasks=ntasks,
+                )
+                start_time: float = time.perf_counter()
+                case_converted: bool = compress_api.submit_fastq_compressions(discovered[sample_id])
+                submission_time += time.perf_counter() - start_time
+                submitted_sample_ids.add(sample_id)
+                if not case_converted:
+                    LOG.debug(f"skipping individual {sample_id}")
+                    continue
+                individuals_conversion_count += 1
+            if case_converted:
+                case_conversion_count += 1
+                LOG.info(f"Considering case {case.internal_id} converted")
+    LOG.info(
+        f"Submitted FASTQ compressions of {len(submitted_sample_ids)} samples in {submission_time:.1f} s"
+    )
     LOG.info(
         f"{individuals_conversion_count} individuals in {case_conversion_count} (completed) cases where compressed"
     )
@@ -5,6 +5,7 @@ import rich_click as click
 from pydantic import ValidationError
 
 from cg.apps.demultiplex.sample_sheet.api import IlluminaSampleSheetService
+from cg.apps.demultiplex.sample_sheet.index_analysis import IndexDistanceSummary, LaneIndexReport
 from cg.cli.utils import CLICK_CONTEXT_SETTINGS
 from cg.constants.cli_options import DRY_RUN, FORCE
 from cg.exc import CgError
@@ -83,3 +84,44 @@ def create_all_sheets(context: CGConfig, dry_run: bool):
     sample_sheet_api.set_dry_run(dry_run)
     sample_sheet_api.set_force(force=False)
     sample_sheet_api.get_or_create_all_sample_sheets()
+
+
+def echo_index_distance_summary(name: str, summary: IndexDistanceSummary) -> None:
+    """Echo the distances between the indexes of a lane and the colliding sample pairs."""
+    click.echo(
+        f"  {name}: minimum distance {summary.minimum_distance}, "
+        f"median nearest distance {summary.median_nearest_distance}, "
+        f"recommended barcode mismatches {summary.recommended_barcode_mismatches}"
+    )
+    for collision in summary.collisions:
+        click.echo(
+            f"    {collision.sample_id_1} ({collision.sequence_1}) and "
+            f"{collision.sample_id_2} ({collision.sequence_2}) are at distance "
+            f"{collision.distance}"
+        )
+
+
+@sample_sheet_commands.command(name="analyse-indexes")
+@click.argument("flow-cell-name")
+@click.pass_obj
+def analyse_indexes(context: CGConfig, flow_cell_name: str):
+    """Report the distances between the indexes of the samples in each lane of a sample sheet.
+
+    'flow-cell-name' is the flow cell run directory name, e.g. '181005_D00410_0735_BHM2LNBCX2'
+    with a BCLConvert sample sheet in it.
+
+    For each lane, report the minimum pairwise Hamming distance, the pairs of samples with
+    colliding indexes and the recommended number of barcode mismatches, for index 1 and index 2.
+    """
+    LOG.info(f"Analysing the indexes of the sample sheet of flow cell {flow_cell_name}")
+    sample_sheet_api: IlluminaSampleSheetService = context.sample_sheet_api
+    try:
+        reports: list[LaneIndexReport] = sample_sheet_api.analyse_indexes(flow_cell_name)
+    except (CgError, ValidationError) as error:
+        LOG.error(f"Could not analyse the indexes of {flow_cell_name}: {error}")
+        raise click.Abort from error
+    for report in reports:
+        click.echo(f"Lane {report.lane}: {report.sample_count} samples")
+        echo_index_distance_summary(name="Index 1", summary=report.index_1)
+        if report.index_2:
+            echo_index_distance_summary(name="Index 2", summary=report.index_2)
@@ -1,15 +1,9 @@
+import importlib
 import re
 import shutil
 
 import rich_click as click
 
-from cg.constants import Workflow
-from cg.meta.workflow.nallo import NalloAnalysisAPI
-from cg.meta.workflow.raredisease import RarediseaseAnalysisAPI
-from cg.meta.workflow.rnafusion import RnafusionAnalysisAPI
-from cg.meta.workflow.taxprofiler import TaxprofilerAnalysisAPI
-from cg.meta.workflow.tomte import TomteAnalysisAPI
-
 
 def echo_lines(lines: list[str]) -> None:
     for line in lines:
@@ -27,10 +21,28 @@ CLICK_CONTEXT_SETTINGS: dict[str, int] = {
 }
 
 
-TOWER_WORKFLOW_TO_ANALYSIS_API_MAP: dict = {
-    Workflow.NALLO: NalloAnalysisAPI,
-    Workflow.RAREDISEASE: RarediseaseAnalysisAPI,
-    Workflow.RNAFUSION: RnafusionAnalysisAPI,
-    Workflow.TAXPROFILER: TaxprofilerAnalysisAPI,
-    Workflow.TOMTE: TomteAnalysisAPI,
-}
+class LazyGroup(click.RichGroup):
+    """Group importing the modules of its subcommands only when a subcommand is used.
+
+    The lazy subcommands are given as a mapping of command name to "module:attribute", so that
+    running one command does not import the modules of all the others.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, context: click.Context) -> list[str]:
+        return sorted({*super().list_commands(context), *self.lazy_subcommands})
+
+    def get_command(self, context: click.Context, command_name: str) -> click.Command | None:
+        if command_name in self.lazy_subcommands and command_name not in self.commands:
+            self.add_command(self._load_command(command_name), name=command_name)
+        return super().get_command(context, command_name)
+
+    def _load_command(self, command_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[command_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand {command_name} is not a command: {command!r}")
+        return command
@@ -12,7 +12,7 @@ from cg.cli.workflow.balsamic.options import OPTION_PANEL_BED, OPTION_WORKFLOW_P
 from cg.cli.workflow.commands import ARGUMENT_CASE_ID, resolve_compression
 from cg.cli.workflow.utils import validate_force_store_option
 from cg.constants import Workflow
-from cg.constants.cli_options import COMMENT, DRY_RUN, FORCE
+from cg.constants.cli_options import COMMENT, DRY_RUN, FORCE, WORKERS
 from cg.exc import CgError
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.balsamic import BalsamicAnalysisAPI
@@ -175,12 +175,13 @@ def start(
 
 
 @balsamic.command("start-available")
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig):
+def start_available(cg_config: CGConfig, workers: int):
     """Starts all available raredisease cases."""
     LOG.info("Starting Balsamic workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter = factory.get_analysis_starter_for_workflow(Workflow.BALSAMIC)
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(workers=workers)
     if not succeeded:
         raise click.Abort
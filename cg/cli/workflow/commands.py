@@ -7,10 +7,9 @@ import rich_click as click
 from dateutil.parser import parse as parse_date
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
-from cg.cli.utils import TOWER_WORKFLOW_TO_ANALYSIS_API_MAP
 from cg.cli.workflow.utils import validate_force_store_option
 from cg.constants import EXIT_FAIL, EXIT_SUCCESS, Workflow
-from cg.constants.cli_options import COMMENT, DRY_RUN, FORCE, SKIP_CONFIRMATION
+from cg.constants.cli_options import COMMENT, DRY_RUN, FORCE, SKIP_CONFIRMATION, WORKERS
 from cg.constants.observations import LOQUSDB_SUPPORTED_WORKFLOWS
 from cg.exc import IlluminaRunsNeededError
 from cg.meta.workflow.analysis import AnalysisAPI
@@ -22,11 +21,16 @@ from cg.meta.workflow.microsalt import MicrosaltAnalysisAPI
 from cg.meta.workflow.mip_dna import MipDNAAnalysisAPI
 from cg.meta.workflow.mip_rna import MipRNAAnalysisAPI
 from cg.meta.workflow.mutant import MutantAnalysisAPI
+from cg.meta.workflow.nallo import NalloAnalysisAPI
 from cg.meta.workflow.nf_analysis import NfAnalysisAPI
+from cg.meta.workflow.raredisease import RarediseaseAnalysisAPI
 from cg.meta.workflow.rnafusion import RnafusionAnalysisAPI
+from cg.meta.workflow.taxprofiler import TaxprofilerAnalysisAPI
+from cg.meta.workflow.tomte import TomteAnalysisAPI
 from cg.models.cg_config import CGConfig
 from cg.services.deliver_files.rsync.service import DeliveryRsyncService
 from cg.store.store import Store
+from cg.utils.concurrency import run_concurrently
 
 ARGUMENT_BEFORE_STR = click.argument("before_str", type=str)
 ARGUMENT_CASE_ID = click.argument("case_id", required=True)
@@ -42,6 +46,14 @@ OPTION_LOQUSDB_SUPPORTED_WORKFLOW = click.option(
 
 LOG = logging.getLogger(__name__)
 
+TOWER_WORKFLOW_TO_ANALYSIS_API_MAP: dict = {
+    Workflow.NALLO: NalloAnalysisAPI,
+    Workflow.RAREDISEASE: RarediseaseAnalysisAPI,
+    Workflow.RNAFUSION: RnafusionAnalysisAPI,
+    Workflow.TAXPROFILER: TaxprofilerAnalysisAPI,
+    Workflow.TOMTE: TomteAnalysisAPI,
+}
+
 
 @click.command("ensure-illumina-runs-on-disk")
 @ARGUMENT_CASE_ID
@@ -135,20 +147,24 @@ def store(context: CGConfig, case_id: str, comment: str | None, dry_run: bool, f
 
 @click.command("store-available")
 @DRY_RUN
+@WORKERS
 @click.pass_context
-def store_available(context: click.Context, dry_run: bool) -> None:
+def store_available(context: click.Context, dry_run: bool, workers: int) -> None:
     """Store bundles for all finished analyses in Housekeeper."""
 
     analysis_api: AnalysisAPI = context.obj.meta_apis["analysis_api"]
 
-    was_successful: bool = True
-    for case_obj in analysis_api.get_cases_to_store():
-        LOG.info(f"Storing deliverables for {case_obj.internal_id}")
+    def store_case(case_id: str) -> bool:
+        LOG.info(f"Storing deliverables for {case_id}")
         try:
-            context.invoke(store, case_id=case_obj.internal_id, dry_run=dry_run)
+            context.invoke(store, case_id=case_id, dry_run=dry_run)
         except Exception as exception_object:
-            LOG.error(f"Error storing {case_obj.internal_id}: {exception_object}")
-            was_successful = False
+            LOG.error(f"Error storing {case_id}: {exception_object}")
+            return False
+        return True
+
+    case_ids: list[str] = [case.internal_id for case in analysis_api.get_cases_to_store()]
+    was_successful: bool = run_concurrently(function=store_case, items=case_ids, workers=workers)
     if not was_successful:
         raise click.Abort()
 
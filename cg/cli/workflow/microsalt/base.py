@@ -8,6 +8,7 @@ import rich_click as click
 
 from cg.cli.utils import CLICK_CONTEXT_SETTINGS
 from cg.cli.workflow.commands import ARGUMENT_CASE_ID, resolve_compression, store, store_available
+from cg.constants.cli_options import WORKERS
 from cg.constants.constants import Workflow
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.microsalt import MicrosaltAnalysisAPI
@@ -87,15 +88,16 @@ def start(cg_config: CGConfig, case_id: str) -> None:
 
 
 @microsalt.command("start-available")
+@WORKERS
 @click.pass_obj
-def start_available(cg_config: CGConfig) -> None:
+def start_available(cg_config: CGConfig, workers: int) -> None:
     """Starts all available microSALT cases."""
     LOG.info("Starting microSALT workflow for all available cases.")
     factory = AnalysisStarterFactory(cg_config)
     analysis_starter: AnalysisStarter = factory.get_analysis_starter_for_workflow(
         Workflow.MICROSALT
     )
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(workers=workers)
     if not succeeded:
         raise click.Abort
 
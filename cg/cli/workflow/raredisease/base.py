@@ -20,7 +20,7 @@ from cg.cli.workflow.nf_analysis import (
     store_available,
     store_housekeeper,
 )
-from cg.constants.cli_options import DRY_RUN
+from cg.constants.cli_options import DRY_RUN, WORKERS
 from cg.constants.constants import MetaApis, Workflow
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.raredisease import RarediseaseAnalysisAPI
@@ -91,14 +91,15 @@ def dev_start(cg_config: CGConfig, case_id: str, revision: str | None):
 
 
 @raredisease.command()
+@WORKERS
 @click.pass_obj
-def dev_start_available(cg_config: CGConfig) -> None:
+def dev_start_available(cg_config: CGConfig, workers: int) -> None:
     """Starts all available raredisease cases."""
     LOG.info("Starting raredisease workflow for all available cases.")
     analysis_starter = AnalysisStarterFactory(cg_config).get_analysis_starter_for_workflow(
         Workflow.RAREDISEASE
     )
-    succeeded: bool = analysis_starter.start_available()
+    succeeded: bool = analysis_starter.start_available(workers=workers)
     if not succeeded:
         raise click.Abort
 
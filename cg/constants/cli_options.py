@@ -35,3 +35,11 @@ LIMIT = click.option(
     type=int,
     help="Maximum number of cases to start",
 )
+
+WORKERS = click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of cases to process concurrently",
+)
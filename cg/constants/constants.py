@@ -50,6 +50,11 @@ class CaseActions(StrEnum):
 CONTAINER_OPTIONS = ("Tube", "96 well plate", "No container")
 
 
+class SearchEntity(StrEnum):
+    CASE = "case"
+    SAMPLE = "sample"
+
+
 class ControlOptions(StrEnum):
     NEGATIVE: str = "negative"
     POSITIVE: str = "positive"
@@ -245,6 +245,10 @@ class TicketCreationError(CgError):
 class TrailblazerAPIHTTPError(CgError):
     """Raised when Trailblazer REST API response code is not 200."""
 
+    def __init__(self, message: str = "", status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class TrailblazerAnalysisNotFound(CgError):
     """Raised when a Trailblazer analysis is not found."""
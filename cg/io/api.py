@@ -1,29 +1,238 @@
-"""Module to create API requests."""
+"""Module to create API requests.
+
+Requests are sent through a shared transport keeping one session per host, so that connections
+are reused between requests to the same host. Failed connections and responses with a temporary
+server error status are retried with backoff, and the number and duration of the requests are
+counted per host. The timeouts and retries can be configured with configure_transport, by default a
+request fails when the server has not answered within READ_TIMEOUT seconds."""
+
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
 
 import requests
+from pydantic import BaseModel
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from cg.constants.constants import APIMethods
+
+LOG = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT: float = 10
+READ_TIMEOUT: float = 300
+MAX_RETRIES: int = 3
+RETRY_BACKOFF_FACTOR: float = 0.5
+RETRY_STATUSES: tuple[int, ...] = (502, 503, 504)
+MAX_CONNECTIONS_PER_HOST: int = 10
+
+
+class HTTPTransportSettings(BaseModel):
+    """Timeouts in seconds and retries of the requests. A read timeout of None waits for the
+    server indefinitely."""
+
+    connect_timeout: float = CONNECT_TIMEOUT
+    read_timeout: float | None = READ_TIMEOUT
+    max_retries: int = MAX_RETRIES
+    backoff_factor: float = RETRY_BACKOFF_FACTOR
+    max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST
+
+
+class HostStatistics(BaseModel):
+    """Statistics of the requests sent to a host."""
+
+    request_count: int = 0
+    failed_count: int = 0
+    total_duration: float = 0
+
+    def add_request(self, duration: float, failed: bool) -> None:
+        self.request_count += 1
+        self.failed_count += failed
+        self.total_duration += duration
+
+
+class HTTPTransport:
+    """Send requests through pooled sessions, one per host, with timeouts and bounded retries.
+    Only requests with idempotent methods, or marked as idempotent by the caller such as queries
+    sent as POST, are retried after the server has received them."""
+
+    def __init__(
+        self,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float | None = READ_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+    ):
+        self.timeout: tuple[float, float | None] = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_connections_per_host = max_connections_per_host
+        self.sessions: dict[tuple[str, bool], requests.Session] = {}
+        self.statistics: dict[str, HostStatistics] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self, idempotent: bool) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None if idempotent else Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=1,
+            pool_maxsize=self.max_connections_per_host,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self, host: str, idempotent: bool = False) -> requests.Session:
+        """Return the session of a host, created on its first request. Sessions for idempotent
+        requests retry all methods."""
+        with self._lock:
+            if (host, idempotent) not in self.sessions:
+                self.sessions[(host, idempotent)] = self._create_session(idempotent)
+                self.statistics.setdefault(host, HostStatistics())
+            return self.sessions[(host, idempotent)]
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        json: dict,
+        verify: bool = True,
+        timeout: tuple[float, float | None] | None = None,
+        idempotent: bool = False,
+    ) -> Response:
+        """Send a request to the url through the session of its host. An idempotent request is
+        retried whatever its method."""
+        host: str = urlsplit(url).netloc
+        session: requests.Session = self.get_session(host=host, idempotent=idempotent)
+        start_time: float = time.perf_counter()
+        failed: bool = True
+        try:
+            response: Response = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                verify=verify,
+                timeout=timeout or self.timeout,
+            )
+            failed = not response.ok
+            return response
+        finally:
+            with self._lock:
+                self.statistics[host].add_request(
+                    duration=time.perf_counter() - start_time, failed=failed
+                )
+
+    def get_summary(self) -> str:
+        """Return the number and duration of the requests sent to each host."""
+        with self._lock:
+            return "\n".join(
+                f"{host}: {statistics.request_count} requests, {statistics.failed_count} failed, "
+                f"{statistics.total_duration:.3f} s"
+                for host, statistics in self.statistics.items()
+            )
+
+    def close(self) -> None:
+        """Close the connections of all sessions."""
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+transport = HTTPTransport()
+
+
+def configure_transport(settings: HTTPTransportSettings) -> None:
+    """Send the following requests through a transport with the settings."""
+    global transport
+    transport.close()
+    transport = HTTPTransport(**settings.model_dump())
+
+
+def log_request_statistics() -> None:
+    """Log the number and duration of the requests sent to each host, and close the connections."""
+    if summary := transport.get_summary():
+        LOG.info(f"Sent requests:\n{summary}")
+    transport.close()
 
 
-def put(url: str, headers: dict, json: dict, verify: bool = True) -> Response:
+def put(
+    url: str, headers: dict, json: dict, verify: bool = True, idempotent: bool = False
+) -> Response:
     """Create PUT request."""
-    return requests.put(url=url, headers=headers, json=json, verify=verify)
+    return transport.request(
+        method=APIMethods.PUT,
+        url=url,
+        headers=headers,
+        json=json,
+        verify=verify,
+        idempotent=idempotent,
+    )
 
 
-def post(url: str, headers: dict, json: dict, verify: bool = True) -> Response:
+def post(
+    url: str, headers: dict, json: dict, verify: bool = True, idempotent: bool = False
+) -> Response:
     """Create POST request."""
-    return requests.post(url=url, headers=headers, json=json, verify=verify)
+    return transport.request(
+        method=APIMethods.POST,
+        url=url,
+        headers=headers,
+        json=json,
+        verify=verify,
+        idempotent=idempotent,
+    )
 
 
-def delete(url: str, headers: dict, json: dict, verify: bool = True) -> Response:
+def delete(
+    url: str, headers: dict, json: dict, verify: bool = True, idempotent: bool = False
+) -> Response:
     """Create DELETE request."""
-    return requests.delete(url=url, headers=headers, json=json, verify=verify)
+    return transport.request(
+        method=APIMethods.DELETE,
+        url=url,
+        headers=headers,
+        json=json,
+        verify=verify,
+        idempotent=idempotent,
+    )
 
 
-def get(url: str, headers: dict, json: dict, verify: bool = True) -> Response:
+def get(
+    url: str, headers: dict, json: dict, verify: bool = True, idempotent: bool = False
+) -> Response:
     """Create GET request."""
-    return requests.get(url=url, headers=headers, json=json, verify=verify)
+    return transport.request(
+        method=APIMethods.GET,
+        url=url,
+        headers=headers,
+        json=json,
+        verify=verify,
+        idempotent=idempotent,
+    )
 
 
-def patch(url: str, headers: dict, json: dict, verify: bool = True) -> Response:
+def patch(
+    url: str, headers: dict, json: dict, verify: bool = True, idempotent: bool = False
+) -> Response:
     """Create PATCH request."""
-    return requests.patch(url=url, headers=headers, json=json, verify=verify)
+    return transport.request(
+        method=APIMethods.PATCH,
+        url=url,
+        headers=headers,
+        json=json,
+        verify=verify,
+        idempotent=idempotent,
+    )
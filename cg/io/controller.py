@@ -91,6 +91,15 @@ class APIRequest:
 
     @classmethod
     def api_request_from_content(
-        cls, api_method: str, url: str, headers: dict, json: dict, verify: bool = True
+        cls,
+        api_method: str,
+        url: str,
+        headers: dict,
+        json: dict,
+        verify: bool = True,
+        idempotent: bool = False,
     ) -> Response:
-        return cls.api_request[api_method](url=url, headers=headers, json=json, verify=verify)
+        """Send a request, retrying it on failure whatever its method if idempotent."""
+        return cls.api_request[api_method](
+            url=url, headers=headers, json=json, verify=verify, idempotent=idempotent
+        )
@@ -20,7 +20,9 @@ class CleanAPI:
         self.housekeeper_api = housekeeper_api
 
     def get_bundle_files(self, before: datetime, workflow: Workflow) -> Iterator[list[File]]:
-        """Get any bundle files for a specific version."""
+        """Get any bundle files for a specific version.
+        The files of all versions are fetched in one query, while analyses without a version get
+        the files of all versions of their bundle."""
 
         completed_analyses_for_workflow: list[Analysis] = (
             self.status_db.get_completed_analyses_for_workflow_started_at_before(
@@ -30,6 +32,13 @@ class CleanAPI:
         LOG.debug(
             f"number of {workflow} analyses before: {before} : {len(completed_analyses_for_workflow)}"
         )
+        files_by_version: dict[int, list[File]] = self.housekeeper_api.get_files_for_versions(
+            version_ids=[
+                analysis.housekeeper_version_id
+                for analysis in completed_analyses_for_workflow
+                if analysis.housekeeper_version_id
+            ]
+        )
         for analysis in completed_analyses_for_workflow:
             bundle_name = analysis.case.internal_id
             LOG.info(
@@ -37,9 +46,10 @@ class CleanAPI:
                 f"bundle:{bundle_name}; "
                 f"workflow: {workflow}; "
             )
-            yield self.housekeeper_api.get_files(
-                bundle=bundle_name, version=analysis.housekeeper_version_id
-            ).all()
+            if analysis.housekeeper_version_id:
+                yield files_by_version[analysis.housekeeper_version_id]
+            else:
+                yield self.housekeeper_api.get_files(bundle=bundle_name).all()
 
     @staticmethod
     def has_protected_tags(file: File, protected_tags_lists: list[list[str]]) -> bool:
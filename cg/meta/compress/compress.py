@@ -3,8 +3,11 @@ API for compressing files. Functionality to compress FASTQ, decompress SPRING an
 """
 
 import logging
+import time
+from contextlib import closing
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterator
 
 from housekeeper.store.models import File, Version
 
@@ -16,8 +19,15 @@ from cg.constants.constants import PIPELINES_USING_PARTIAL_ANALYSES
 from cg.exc import DecompressionCouldNotStartError
 from cg.meta.backup.backup import SpringBackupAPI
 from cg.meta.compress import files
-from cg.models.compression_data import CaseCompressionData, CompressionData, SampleCompressionData
+from cg.models.compression_data import (
+    CaseCompressionData,
+    CompressionData,
+    SampleCompressionData,
+    SampleFastqCompressions,
+)
 from cg.store.models import Case, Sample
+from cg.utils.concurrency import map_concurrently
+from cg.utils.stat_cache import DirectoryStatCache
 
 LOG = logging.getLogger(__name__)
 
@@ -38,6 +48,7 @@ class CompressAPI:
         self.backup_api: SpringBackupAPI = backup_api
         self.demux_root: Path = Path(demux_root)
         self.dry_run: bool = dry_run
+        self.stat_cache = DirectoryStatCache()
 
     def set_dry_run(self, dry_run: bool):
         """Update dry run."""
@@ -47,37 +58,100 @@ class CompressAPI:
         if self.backup_api:
             self.backup_api.dry_run = self.dry_run
 
-    def compress_fastq(self, sample_id: str) -> bool:
-        """Compress the FASTQ files for an individual."""
+    def get_fastq_compressions(
+        self, sample_id: str, fastq_paths: list[Path] | None = None
+    ) -> SampleFastqCompressions:
+        """Return the runs of a sample with FASTQ files ready to be compressed.
+        The FASTQ files are fetched from the latest version of the sample bundle in Housekeeper
+        unless given."""
         LOG.debug(f"Check if FASTQ compression is possible for {sample_id}")
-        version: Version = self.hk_api.get_latest_bundle_version(bundle_name=sample_id)
-        if not version:
-            return False
+        if fastq_paths is None:
+            version: Version | None = self.hk_api.get_latest_bundle_version(bundle_name=sample_id)
+            if not version:
+                return SampleFastqCompressions(
+                    sample_id=sample_id, compressions=[], all_possible=False
+                )
+            fastq_paths = files.get_fastq_paths(version)
 
-        sample_fastq: dict[str, dict] = files.get_fastq_files(
-            sample_id=sample_id, version_obj=version
+        run_compressions: list[CompressionData] = files.get_fastq_compression_data(
+            sample_id=sample_id, fastq_paths=fastq_paths, stat_cache=self.stat_cache
         )
-        if not sample_fastq:
-            return False
+        if not run_compressions:
+            return SampleFastqCompressions(sample_id=sample_id, compressions=[], all_possible=False)
 
-        all_ok: bool = True
-        for run_name in sample_fastq:
+        compressions: list[CompressionData] = []
+        all_possible: bool = True
+        for compression in run_compressions:
+            run_name: str = compression.run_name
             LOG.info(f"Check if compression possible for run {run_name}")
-            compression: CompressionData = sample_fastq[run_name]["compression_data"]
             is_compression_possible: bool = self._is_fastq_compression_possible(
                 compression=compression,
                 sample_id=sample_id,
             )
             if not is_compression_possible:
                 LOG.warning(f"FASTQ to SPRING not possible for {sample_id}, run {run_name}")
-                all_ok = False
+                all_possible = False
                 continue
+            compressions.append(compression)
+        return SampleFastqCompressions(
+            sample_id=sample_id, compressions=compressions, all_possible=all_possible
+        )
 
+    def get_fastq_paths_for_samples(self, sample_ids: list[str]) -> dict[str, list[Path]]:
+        """Return the paths of the FASTQ files in the latest bundle version of each sample found
+        in Housekeeper, fetched in bulk."""
+        start_time: float = time.perf_counter()
+        versions: dict[str, Version] = self.hk_api.get_latest_bundle_versions(sample_ids)
+        LOG.info(
+            f"Fetched {len(versions)} Housekeeper versions for {len(sample_ids)} samples in "
+            f"{time.perf_counter() - start_time:.1f} s"
+        )
+        return {
+            sample_id: files.get_fastq_paths(version) for sample_id, version in versions.items()
+        }
+
+    def get_fastq_compressions_for_samples(
+        self, sample_ids: list[str], max_concurrent_discovery: int = 1
+    ) -> Iterator[SampleFastqCompressions]:
+        """Yield the runs ready to be compressed of each sample, in the order of the samples.
+        The FASTQ files of the samples are fetched from Housekeeper in bulk by the calling thread,
+        so that only their paths are passed to the worker threads probing the file systems for
+        several samples at a time."""
+        fastq_paths_by_sample: dict[str, list[Path]] = self.get_fastq_paths_for_samples(sample_ids)
+
+        def get_sample_fastq_compressions(sample_id: str) -> SampleFastqCompressions:
+            fastq_paths: list[Path] | None = fastq_paths_by_sample.get(sample_id)
+            if fastq_paths is None:
+                LOG.debug(f"No bundle found for {sample_id} in Housekeeper")
+                return SampleFastqCompressions(
+                    sample_id=sample_id, compressions=[], all_possible=False
+                )
+            return self.get_fastq_compressions(sample_id=sample_id, fastq_paths=fastq_paths)
+
+        start_time: float = time.perf_counter()
+        with closing(
+            map_concurrently(
+                function=get_sample_fastq_compressions,
+                items=sample_ids,
+                workers=max_concurrent_discovery,
+            )
+        ) as sample_compressions:
+            yield from sample_compressions
+        LOG.info(
+            f"Discovered FASTQ files of {len(sample_ids)} samples in "
+            f"{time.perf_counter() - start_time:.1f} s"
+        )
+
+    def submit_fastq_compressions(self, sample_compressions: SampleFastqCompressions) -> bool:
+        """Submit the compression of the FASTQ files of a sample and return whether all runs of
+        the sample could be compressed."""
+        sample_id: str = sample_compressions.sample_id
+        for compression in sample_compressions.compressions:
             LOG.info(
                 f"Compressing {compression.fastq_first} and {compression.fastq_second} for sample {sample_id} into SPRING format"
             )
             self.crunchy_api.fastq_to_spring(compression_obj=compression, sample_id=sample_id)
-        return all_ok
+        return sample_compressions.all_possible
 
     def _is_fastq_compression_possible(self, compression: CompressionData, sample_id: str) -> bool:
         if self._is_spring_archived(compression):
@@ -117,7 +191,9 @@ class CompressAPI:
         if not version:
             return False
 
-        compressions: list[CompressionData] = files.get_spring_paths(version_obj=version)
+        compressions: list[CompressionData] = files.get_spring_paths(
+            version_obj=version, stat_cache=self.stat_cache
+        )
         for compression in compressions:
             if not compression.is_spring_decompression_possible:
                 LOG.info(f"SPRING to FASTQ decompression not possible for {sample_id}")
@@ -135,6 +211,7 @@ class CompressAPI:
                 self.backup_api.retrieve_and_decrypt_spring_file(
                     spring_file_path=Path(compression.spring_path)
                 )
+                compression.invalidate_stat_cache()
 
             LOG.info(
                 f"Decompressing {compression.spring_path} to FASTQ format for sample {sample_id}"
@@ -192,7 +269,7 @@ class CompressAPI:
             return False
 
         sample_fastq: dict[str, dict] = files.get_fastq_files(
-            sample_id=sample_id, version_obj=version
+            sample_id=sample_id, version_obj=version, stat_cache=self.stat_cache
         )
         if not sample_fastq:
             return False
@@ -248,7 +325,9 @@ class CompressAPI:
         if not version:
             return False
 
-        spring_paths: list[CompressionData] = files.get_spring_paths(version_obj=version)
+        spring_paths: list[CompressionData] = files.get_spring_paths(
+            version_obj=version, stat_cache=self.stat_cache
+        )
         if not spring_paths:
             LOG.warning(f"Could not find any spring paths for {sample.internal_id}")
         for compression in spring_paths:
@@ -384,6 +463,7 @@ class CompressAPI:
         for fastq_file in [fastq_first, fastq_second]:
             if fastq_file.exists():
                 fastq_file.unlink()
+                self.stat_cache.invalidate(fastq_file)
                 LOG.debug(f"FASTQ file {fastq_file} removed")
 
     def get_case_compression_data(self, case: Case) -> CaseCompressionData:
@@ -404,7 +484,9 @@ class CompressAPI:
     def get_sample_compression_data(self, sample_id: str) -> SampleCompressionData:
         compression_objects: list[CompressionData] = []
         version: Version = self.hk_api.get_latest_bundle_version(sample_id)
-        compression_objects.extend(files.get_spring_paths(version))
+        compression_objects.extend(
+            files.get_spring_paths(version_obj=version, stat_cache=self.stat_cache)
+        )
         return SampleCompressionData(sample_id=sample_id, compression_objects=compression_objects)
 
     @staticmethod
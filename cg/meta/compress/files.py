@@ -6,6 +6,8 @@ from pathlib import Path
 
 from housekeeper.store.models import File, Version
 
+from cg.apps.housekeeper.file_index import VersionFileIndex
+from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import HK_FASTQ_TAGS, SequencingFileTag
 from cg.constants.compression import (
     FASTQ_DATETIME_DELTA,
@@ -13,6 +15,7 @@ from cg.constants.compression import (
     FASTQ_SECOND_READ_SUFFIX,
 )
 from cg.models.compression_data import CompressionData
+from cg.utils.stat_cache import DirectoryStatCache
 
 LOG = logging.getLogger(__name__)
 
@@ -22,11 +25,8 @@ LOG = logging.getLogger(__name__)
 def get_hk_files_dict(tags: list[str], version_obj: Version) -> dict[Path, File]:
     """Fetch files from a version in Housekeeper."""
     hk_file: dict[Path, File] = {}
-    tags: set = set(tags)
-    for version_file in version_obj.files:
-        file_tags: set[str] = {tag.name for tag in version_file.tags}
-        if not file_tags.intersection(tags):
-            continue
+    file_index: VersionFileIndex = HousekeeperAPI.get_version_file_index(version_obj)
+    for version_file in file_index.get_files_with_any_tag(set(tags)):
         LOG.debug(f"Found file {version_file.path}")
         path_obj: Path = Path(version_file.full_path)
         hk_file[path_obj] = version_file
@@ -35,13 +35,15 @@ def get_hk_files_dict(tags: list[str], version_obj: Version) -> dict[Path, File]
 
 def is_file_in_version(version_obj: Version, path: Path) -> bool:
     """Check if a file is in a certain version considering relative path in the database."""
-    return any(version_file.path in path.as_posix() for version_file in version_obj.files)
+    return HousekeeperAPI.get_version_file_index(version_obj).contains_path(path)
 
 
 # Functions to get FASTQ like files
 
 
-def get_spring_paths(version_obj: Version) -> list[CompressionData]:
+def get_spring_paths(
+    version_obj: Version, stat_cache: DirectoryStatCache | None = None
+) -> list[CompressionData]:
     """Get all SPRING paths for a sample."""
     hk_files_dict: dict[Path, File] = get_hk_files_dict(
         tags=[SequencingFileTag.SPRING], version_obj=version_obj
@@ -51,7 +53,10 @@ def get_spring_paths(version_obj: Version) -> list[CompressionData]:
     if hk_files_dict is None:
         return spring_paths
 
-    spring_paths.extend(CompressionData(file_path.with_suffix("")) for file_path in hk_files_dict)
+    spring_paths.extend(
+        CompressionData(file_path.with_suffix(""), stat_cache=stat_cache)
+        for file_path in hk_files_dict
+    )
     return spring_paths
 
 
@@ -70,7 +75,9 @@ def get_fastq_stub(fastq_path: Path) -> Path:
     return None
 
 
-def get_compression_data(fastq_files: list[Path]) -> list[CompressionData]:
+def get_compression_data(
+    fastq_files: list[Path], stat_cache: DirectoryStatCache | None = None
+) -> list[CompressionData]:
     """Return a list of compression data objects.
 
     Each object has information about a pair of FASTQ files from the same run.
@@ -86,26 +93,52 @@ def get_compression_data(fastq_files: list[Path]) -> list[CompressionData]:
         run_name: str = str(file_prefix)
         if run_name not in fastq_runs:
             fastq_runs.add(run_name)
-            compressions.append(CompressionData(file_prefix))
+            compressions.append(CompressionData(file_prefix, stat_cache=stat_cache))
     return compressions
 
 
-def get_fastq_files(sample_id: str, version_obj: Version) -> dict[str, dict]:
-    """Get FASTQ files for sample."""
-    hk_files_dict = get_hk_files_dict(tags=HK_FASTQ_TAGS, version_obj=version_obj)
-    if hk_files_dict is None:
-        return None
+def get_fastq_paths(version_obj: Version) -> list[Path]:
+    """Return the paths of the FASTQ files of a version in Housekeeper."""
+    return list(get_hk_files_dict(tags=HK_FASTQ_TAGS, version_obj=version_obj))
 
-    fastq_dict = {}
-    compression_objects: list[CompressionData] = get_compression_data(list(hk_files_dict.keys()))
+
+def get_fastq_compression_data(
+    sample_id: str, fastq_paths: list[Path], stat_cache: DirectoryStatCache | None = None
+) -> list[CompressionData]:
+    """Return the compression data of the runs of the FASTQ files that have the correct status,
+    looked up in the stat cache if given."""
+    compression_objects: list[CompressionData] = get_compression_data(
+        fastq_files=fastq_paths, stat_cache=stat_cache
+    )
     if not compression_objects:
         LOG.info(f"Could not find FASTQ files for {sample_id}")
-        return None
+        return []
 
+    checked_compression_objects: list[CompressionData] = []
     for compression_obj in compression_objects:
         if not check_fastqs(compression_obj):
             LOG.info(f"Skipping run {compression_obj.run_name}")
             continue
+        checked_compression_objects.append(compression_obj)
+    return checked_compression_objects
+
+
+def get_fastq_files(
+    sample_id: str, version_obj: Version, stat_cache: DirectoryStatCache | None = None
+) -> dict[str, dict]:
+    """Get FASTQ files for sample, looked up in the stat cache if given."""
+    hk_files_dict = get_hk_files_dict(tags=HK_FASTQ_TAGS, version_obj=version_obj)
+    if hk_files_dict is None:
+        return None
+
+    compression_objects: list[CompressionData] = get_fastq_compression_data(
+        sample_id=sample_id, fastq_paths=list(hk_files_dict.keys()), stat_cache=stat_cache
+    )
+    if not compression_objects:
+        return None
+
+    fastq_dict = {}
+    for compression_obj in compression_objects:
         fastq_dict[compression_obj.run_name] = {
             "compression_data": compression_obj,
             "hk_first": hk_files_dict[compression_obj.fastq_first],
@@ -135,7 +168,9 @@ def check_fastqs(compression_obj: CompressionData) -> bool:
     if not compression_obj.pair_exists():
         return False
 
-    date_changed = compression_obj.get_change_date(compression_obj.fastq_first)
+    date_changed = compression_obj.get_change_date(
+        compression_obj.fastq_first, stat_cache=compression_obj.stat_cache
+    )
     today = datetime.datetime.now()
 
     # Check if date is older than FASTQ_DELTA
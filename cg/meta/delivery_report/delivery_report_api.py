@@ -248,9 +248,12 @@ class DeliveryReportAPI:
         case_samples: list[CaseSample] = self.status_db.get_case_samples_by_case_id(
             case_internal_id=case.internal_id
         )
+        lims_samples: dict[str, dict[str, Any]] = self.lims_api.samples(
+            [case_sample.sample.internal_id for case_sample in case_samples]
+        )
         for case_sample in case_samples:
             sample: Sample = case_sample.sample
-            lims_sample: dict[str, Any] = self.lims_api.sample(sample.internal_id)
+            lims_sample: dict[str, Any] = lims_samples[sample.internal_id]
             delivered_files: list[DeliveryFile] | None = (
                 self.delivery_api.get_analysis_sample_delivery_files_by_sample(
                     case=case, sample=sample
@@ -10,7 +10,8 @@ from cg.constants import FileExtensions
 from cg.constants.encryption import EncryptionUserID, GPGParameters
 from cg.exc import ChecksumFailedError
 from cg.utils import Process
-from cg.utils.checksum.checksum import sha512_checksum
+from cg.utils.checksum.cache import ChecksumAlgorithm, FileChecksums
+from cg.utils.checksum.checksum import get_checksums_for_files
 
 LOG = logging.getLogger(__name__)
 LIMIT_PIGZ_TASK: int = 3
@@ -225,8 +226,13 @@ class SpringEncryptionAPI(EncryptionAPI):
             spring_file_path=spring_file_path,
             output_file=self.decrypted_spring_file_checksum(spring_file_path),
         )
-        is_checksum_equal = sha512_checksum(spring_file_path) == sha512_checksum(
-            self.decrypted_spring_file_checksum(spring_file_path)
+        decrypted_spring_file_path: Path = self.decrypted_spring_file_checksum(spring_file_path)
+        checksums: dict[Path, FileChecksums] = get_checksums_for_files(
+            file_paths=[spring_file_path, decrypted_spring_file_path],
+            algorithms={ChecksumAlgorithm.SHA512},
+        )
+        is_checksum_equal: bool = (
+            checksums[spring_file_path].sha512 == checksums[decrypted_spring_file_path].sha512
         )
         if not is_checksum_equal:
             raise ChecksumFailedError("Checksum comparison failed!")
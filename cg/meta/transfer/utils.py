@@ -1,16 +1,28 @@
 import logging
 from pathlib import Path
 
-from cg.utils.checksum.checksum import is_md5sum_correct
+from cg.constants import FileExtensions
+from cg.utils.checksum.cache import ChecksumAlgorithm, FileChecksums
+from cg.utils.checksum.checksum import extract_md5sum, get_checksums_for_files
 
 LOG = logging.getLogger(__name__)
 
 
 def are_all_fastq_valid(fastq_paths: list[Path]) -> bool:
-    """Return True if all fastq files of a given sample pass md5 checksum."""
+    """Return True if all fastq files of a given sample have an md5sum file that they match."""
     are_all_valid: bool = True
+    md5sum_files: dict[Path, Path] = {
+        path: Path(str(path) + FileExtensions.MD5) for path in fastq_paths
+    }
+    checksums: dict[Path, FileChecksums] = get_checksums_for_files(
+        file_paths=[path for path in fastq_paths if md5sum_files[path].exists()],
+        algorithms={ChecksumAlgorithm.MD5},
+    )
     for path in fastq_paths:
-        if not is_md5sum_correct(path):
+        if (
+            path not in checksums
+            or extract_md5sum(md5sum_file=md5sum_files[path]) != checksums[path].md5
+        ):
             are_all_valid = False
             LOG.warning(f"Sample {path} did not match the given md5sum")
     return are_all_valid
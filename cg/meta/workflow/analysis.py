@@ -7,7 +7,7 @@ from subprocess import CalledProcessError
 from typing import Iterator
 
 import rich_click as click
-from housekeeper.store.models import Bundle, Version
+from housekeeper.store.models import Bundle, File, Version
 
 from cg.apps.environ import environ_email
 from cg.apps.scout.scoutapi import ScoutAPI
@@ -25,7 +25,7 @@ from cg.constants.gene_panel import GenePanelCombo, GenePanelMasterList
 from cg.constants.priority import TrailblazerPriority
 from cg.constants.scout import HGNC_ID, ScoutExportFileName
 from cg.constants.sequencing import SeqLibraryPrepCategory
-from cg.constants.tb import AnalysisType
+from cg.constants.tb import AnalysisStatus, AnalysisType
 from cg.exc import (
     AnalysisAlreadyStoredError,
     AnalysisNotReadyError,
@@ -387,11 +387,16 @@ class AnalysisAPI(MetaAPI):
     def get_cases_to_store(self) -> list[Case]:
         """Return cases where analysis finished successfully,
         and is ready to be stored in Housekeeper."""
-        return [
-            case
-            for case in self.status_db.get_running_cases_in_workflow(workflow=self.workflow)
-            if self.trailblazer_api.is_latest_analysis_completed(case_id=case.internal_id)
-        ]
+        return self.get_running_cases_with_latest_analysis_status([AnalysisStatus.COMPLETED])
+
+    def get_running_cases_with_latest_analysis_status(self, statuses: list[str]) -> list[Case]:
+        """Return the running cases of the workflow whose latest analysis in Trailblazer has any of
+        the statuses. The analyses of all cases are fetched together."""
+        cases: list[Case] = self.status_db.get_running_cases_in_workflow(workflow=self.workflow)
+        case_ids: set[str] = self.trailblazer_api.get_case_ids_with_latest_analysis_status(
+            case_ids=[case.internal_id for case in cases], statuses=statuses
+        )
+        return [case for case in cases if case.internal_id in case_ids]
 
     def get_sample_fastq_destination_dir(self, case: Case, sample: Sample) -> Path:
         """Return the path to the FASTQ destination directory."""
@@ -454,8 +459,10 @@ class AnalysisAPI(MetaAPI):
             return
 
         LOG.info(f"Concatenation in progress for sample: {sample.internal_id}")
-        for read, value in linked_reads_paths.items():
-            self.fastq_handler.concatenate(linked_reads_paths[read], concatenated_paths[read])
+        self.fastq_handler.concatenate_read_directions(
+            files_by_direction=linked_reads_paths, concat_file_by_direction=concatenated_paths
+        )
+        for value in linked_reads_paths.values():
             self.fastq_handler.remove_files(value)
 
     def get_target_bed_from_lims(self, case_id: str) -> str | None:
@@ -672,14 +679,11 @@ class AnalysisAPI(MetaAPI):
     def are_all_spring_files_present(self, case_id: str) -> bool:
         """Return True if no Spring files for the case are archived in the data location used by the customer."""
         case: Case = self.status_db.get_case_by_internal_id(case_id)
-        for sample in [link.sample for link in case.links]:
-            if (
-                files := self.housekeeper_api.get_archived_files_for_bundle(
-                    bundle_name=sample.internal_id, tags=[SequencingFileTag.SPRING]
-                )
-            ) and not all(file.archive.retrieved_at for file in files):
-                return False
-        return True
+        archived_files: dict[str, list[File]] = self.housekeeper_api.get_archived_files_for_bundles(
+            bundle_names=[link.sample.internal_id for link in case.links],
+            tags=[SequencingFileTag.SPRING],
+        )
+        return all(file.archive.retrieved_at for files in archived_files.values() for file in files)
 
     @staticmethod
     def _write_managed_variants(out_dir: Path, content: list[str]) -> None:
@@ -9,9 +9,8 @@ Classes:
 import datetime as dt
 import gzip
 import logging
-import os
 import re
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -21,6 +20,7 @@ from cg.io.gzip import read_gzip_first_line
 from cg.models.fastq import FastqFileMeta, GetFastqFileMeta
 from cg.store.models import Case, Sample
 from cg.store.store import Store
+from cg.utils.files import concatenate_files
 
 LOG = logging.getLogger(__name__)
 
@@ -92,13 +92,9 @@ class FastqHandler:
         """Concatenates a list of fastq files"""
         LOG.info(FastqHandler.display_files(files, concat_file))
 
-        with open(concat_file, "wb") as write_file_obj:
-            for filename in files:
-                with open(filename, "rb") as file_descriptor:
-                    shutil.copyfileobj(file_descriptor, write_file_obj)
-
-        size_before = FastqHandler.size_before(files)
-        size_after = FastqHandler.size_after(concat_file)
+        size_before, size_after = concatenate_files(
+            input_files=[Path(file) for file in files], output_file=Path(concat_file)
+        )
 
         try:
             FastqHandler.assert_file_sizes(size_before, size_after)
@@ -106,16 +102,19 @@ class FastqHandler:
             LOG.warning(error)
 
     @staticmethod
-    def size_before(files) -> int:
-        """Returns the total size of the linked fastq files before concatenation"""
-
-        return sum(os.stat(f).st_size for f in files)
-
-    @staticmethod
-    def size_after(concat_file: str) -> int:
-        """returns the size of the concatenated fastq files"""
-
-        return os.stat(concat_file).st_size
+    def concatenate_read_directions(
+        files_by_direction: dict[int, list], concat_file_by_direction: dict[int, str]
+    ) -> None:
+        """Concatenate the fastq files of each read direction, the directions concurrently."""
+        with ThreadPoolExecutor(max_workers=max(len(files_by_direction), 1)) as executor:
+            concatenations = [
+                executor.submit(
+                    FastqHandler.concatenate, files, concat_file_by_direction[direction]
+                )
+                for direction, files in files_by_direction.items()
+            ]
+            for concatenation in concatenations:
+                concatenation.result()
 
     @staticmethod
     def assert_file_sizes(size_before: int, size_after: int) -> None:
@@ -159,11 +159,7 @@ class MicrosaltAnalysisAPI(AnalysisAPI):
 
     def get_completed_cases(self) -> list[Case]:
         """Return cases that are completed in trailblazer."""
-        return [
-            case
-            for case in self.status_db.get_running_cases_in_workflow(self.workflow)
-            if self.trailblazer_api.is_latest_analysis_completed(case.internal_id)
-        ]
+        return self.get_running_cases_with_latest_analysis_status([AnalysisStatus.COMPLETED])
 
     def get_metrics_file_path(self, case_id: str) -> Path:
         """Return path to metrics file for a case."""
@@ -205,9 +205,10 @@ class MutantAnalysisAPI(AnalysisAPI):
         """Return cases for which the analysis is complete on Traiblazer and a QC report has been generated."""
         cases_to_store: list[Case] = [
             case
-            for case in self.status_db.get_running_cases_in_workflow(self.workflow)
-            if self.trailblazer_api.is_latest_analysis_completed(case.internal_id)
-            and self.get_case_qc_report_path(case_id=case.internal_id).exists()
+            for case in self.get_running_cases_with_latest_analysis_status(
+                [AnalysisStatus.COMPLETED]
+            )
+            if self.get_case_qc_report_path(case_id=case.internal_id).exists()
         ]
         return cases_to_store
 
@@ -215,9 +216,10 @@ class MutantAnalysisAPI(AnalysisAPI):
         """Return cases with a completed analysis that are not yet stored."""
         cases_to_perform_qc_on: list[Case] = [
             case
-            for case in self.status_db.get_running_cases_in_workflow(self.workflow)
-            if self.trailblazer_api.is_latest_analysis_completed(case.internal_id)
-            and not self.get_case_qc_report_path(case_id=case.internal_id).exists()
+            for case in self.get_running_cases_with_latest_analysis_status(
+                [AnalysisStatus.COMPLETED]
+            )
+            if not self.get_case_qc_report_path(case_id=case.internal_id).exists()
         ]
         return cases_to_perform_qc_on
 
@@ -902,12 +902,9 @@ class NfAnalysisAPI(AnalysisAPI):
     def get_cases_to_store(self) -> list[Case]:
         """Return cases where analysis finished successfully,
         and is ready to be stored in Housekeeper."""
-        return [
-            case
-            for case in self.status_db.get_running_cases_in_workflow(workflow=self.workflow)
-            if self.trailblazer_api.is_latest_analysis_completed(case_id=case.internal_id)
-            or self.trailblazer_api.is_latest_analysis_qc(case_id=case.internal_id)
-        ]
+        return self.get_running_cases_with_latest_analysis_status(
+            [AnalysisStatus.COMPLETED, AnalysisStatus.QC]
+        )
 
     def get_genome_build(self, case_id: str) -> GenomeVersion:
         raise NotImplementedError
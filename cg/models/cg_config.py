@@ -1,66 +1,47 @@
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing_extensions import Literal
 
-from cg.apps.coverage import ChanjoAPI
-from cg.apps.crunchy import CrunchyAPI
-from cg.apps.demultiplex.demultiplex_api import DemultiplexingAPI
-from cg.apps.demultiplex.sample_sheet.api import IlluminaSampleSheetService
-from cg.apps.gens import GensAPI
-from cg.apps.gt import GenotypeAPI
-from cg.apps.hermes.hermes_api import HermesApi
-from cg.apps.housekeeper.hk import HousekeeperAPI
-from cg.apps.lims import LimsAPI
-from cg.apps.loqus import LoqusdbAPI
-from cg.apps.madeline.api import MadelineAPI
-from cg.apps.mutacc_auto import MutaccAutoAPI
-from cg.apps.scout.scoutapi import ScoutAPI
-from cg.apps.tb import TrailblazerAPI
-from cg.clients.arnold.api import ArnoldAPIClient
-from cg.clients.chanjo2.client import Chanjo2APIClient
-from cg.clients.janus.api import JanusAPIClient
 from cg.constants.observations import BalsamicObservationPanel, LoqusdbInstance
 from cg.constants.priority import SlurmQos
-from cg.meta.delivery.delivery import DeliveryAPI
-from cg.services.analysis_service.analysis_service import AnalysisService
-from cg.services.decompression_service.decompressor import Decompressor
-from cg.services.deliver_files.factory import DeliveryServiceFactory
-from cg.services.deliver_files.rsync.models import RsyncDeliveryConfig
-from cg.services.deliver_files.rsync.service import DeliveryRsyncService
-from cg.services.fastq_concatenation_service.fastq_concatenation_service import (
-    FastqConcatenationService,
-)
-from cg.services.pdc_service.pdc_service import PdcService
-from cg.services.run_devices.pacbio.data_storage_service.pacbio_store_service import (
-    PacBioStoreService,
-)
-from cg.services.run_devices.pacbio.data_transfer_service.data_transfer_service import (
-    PacBioDataTransferService,
-)
-from cg.services.run_devices.pacbio.housekeeper_service.pacbio_houskeeper_service import (
-    PacBioHousekeeperService,
-)
-from cg.services.run_devices.pacbio.metrics_parser.metrics_parser import PacBioMetricsParser
-from cg.services.run_devices.pacbio.post_processing_service import PacBioPostProcessingService
-from cg.services.run_devices.pacbio.run_data_generator.pacbio_run_data_generator import (
-    PacBioRunDataGenerator,
-)
-from cg.services.run_devices.pacbio.run_file_manager.run_file_manager import PacBioRunFileManager
-from cg.services.run_devices.pacbio.run_validator.pacbio_run_validator import PacBioRunValidator
-from cg.services.run_devices.run_names.pacbio import PacbioRunNamesService
-from cg.services.sequencing_qc_service.sequencing_qc_service import SequencingQCService
-from cg.services.slurm_service.slurm_cli_service import SlurmCLIService
-from cg.services.slurm_service.slurm_service import SlurmService
-from cg.services.slurm_upload_service.slurm_upload_config import SlurmUploadConfig
-from cg.services.slurm_upload_service.slurm_upload_service import SlurmUploadService
-from cg.services.validate_file_transfer_service.validate_file_transfer_service import (
-    ValidateFileTransferService,
-)
-from cg.store.database import initialize_database
-from cg.store.store import Store
+from cg.io.api import HTTPTransportSettings
+from cg.store.database import DatabasePoolSettings, initialize_database
+
+if TYPE_CHECKING:
+    from cg.apps.coverage import ChanjoAPI
+    from cg.apps.crunchy import CrunchyAPI
+    from cg.apps.demultiplex.demultiplex_api import DemultiplexingAPI
+    from cg.apps.demultiplex.sample_sheet.api import IlluminaSampleSheetService
+    from cg.apps.gens import GensAPI
+    from cg.apps.gt import GenotypeAPI
+    from cg.apps.hermes.hermes_api import HermesApi
+    from cg.apps.housekeeper.hk import HousekeeperAPI
+    from cg.apps.lims import LimsAPI
+    from cg.apps.loqus import LoqusdbAPI
+    from cg.apps.madeline.api import MadelineAPI
+    from cg.apps.mutacc_auto import MutaccAutoAPI
+    from cg.apps.scout.scoutapi import ScoutAPI
+    from cg.apps.tb import TrailblazerAPI
+    from cg.clients.arnold.api import ArnoldAPIClient
+    from cg.clients.chanjo2.client import Chanjo2APIClient
+    from cg.clients.janus.api import JanusAPIClient
+    from cg.meta.delivery.delivery import DeliveryAPI
+    from cg.services.analysis_service.analysis_service import AnalysisService
+    from cg.services.deliver_files.factory import DeliveryServiceFactory
+    from cg.services.deliver_files.rsync.service import DeliveryRsyncService
+    from cg.services.fastq_concatenation_service.fastq_concatenation_service import (
+        FastqConcatenationService,
+    )
+    from cg.services.pdc_service.pdc_service import PdcService
+    from cg.services.run_devices.pacbio.post_processing_service import PacBioPostProcessingService
+    from cg.services.sequencing_qc_service.sequencing_qc_service import SequencingQCService
+    from cg.services.slurm_service.slurm_service import SlurmService
+    from cg.services.slurm_upload_service.slurm_upload_service import SlurmUploadService
+    from cg.store.store import Store
+
 
 LOG = logging.getLogger(__name__)
 
@@ -412,18 +393,22 @@ class RunInstruments(BaseModel):
 
 
 class RunNamesServices(BaseModel):
-    pacbio: PacbioRunNamesService
+    pacbio: Any
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class PostProcessingServices(BaseModel):
-    pacbio: PacBioPostProcessingService
+    pacbio: Any
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class CGConfig(BaseModel):
     data_input: DataInput | None = None
     database: str
+    database_pool: DatabasePoolSettings = DatabasePoolSettings()
+    checksum_cache: Path | None = None
+    http_transport: HTTPTransportSettings | None = None
+    instrument_queries: bool = False
     delivery_path: str
     downsample: DownsampleConfig
     email_base_settings: EmailBaseSettings
@@ -434,42 +419,45 @@ class CGConfig(BaseModel):
     run_instruments: RunInstruments
     tower_binary_path: str
 
+    # The APIs are instantiated on first use by the properties typing them, so that their modules
+    # are only imported by the commands using them.
+
     # Base APIs that always should exist
     housekeeper: HousekeeperConfig
-    housekeeper_api_: HousekeeperAPI = None
-    status_db_: Store | None = None
+    housekeeper_api_: Any = None
+    status_db_: Any = None
 
     # App APIs that can be instantiated in CGConfig
     arnold: ArnoldConfig | None = None
-    arnold_api_: ArnoldAPIClient | None = None
+    arnold_api_: Any = None
     illumina_backup_service: IlluminaBackupConfig | None = None
     chanjo: CommonAppConfig = None
-    chanjo_api_: ChanjoAPI = None
+    chanjo_api_: Any = None
     chanjo2: ClientConfig | None = None
-    chanjo2_api_: Chanjo2APIClient | None = None
+    chanjo2_api_: Any = None
     crunchy: CrunchyConfig = None
-    crunchy_api_: CrunchyAPI = None
+    crunchy_api_: Any = None
     data_delivery: DataDeliveryConfig = Field(None, alias="data-delivery")
     data_flow: DataFlowConfig | None = None
-    delivery_api_: DeliveryAPI | None = None
-    delivery_rsync_service_: DeliveryRsyncService | None = None
-    delivery_service_factory_: DeliveryServiceFactory | None = None
+    delivery_api_: Any = None
+    delivery_rsync_service_: Any = None
+    delivery_service_factory_: Any = None
     demultiplex: DemultiplexConfig = None
-    demultiplex_api_: DemultiplexingAPI = None
+    demultiplex_api_: Any = None
     encryption: Encryption | None = None
     external: ExternalConfig = None
     genotype: CommonAppConfig = None
-    genotype_api_: GenotypeAPI = None
+    genotype_api_: Any = None
     gens: CommonAppConfig = None
-    gens_api_: GensAPI = None
+    gens_api_: Any = None
     hermes: HermesConfig = None
-    hermes_api_: HermesApi = None
+    hermes_api_: Any = None
     janus: ClientConfig | None = None
-    janus_api_: JanusAPIClient | None = None
+    janus_api_: Any = None
     lims: LimsConfig = None
-    lims_api_: LimsAPI = None
+    lims_api_: Any = None
     loqusdb: CommonAppConfig = Field(None, alias=LoqusdbInstance.WGS.value)
-    loqusdb_api_: LoqusdbAPI = None
+    loqusdb_api_: Any = None
     loqusdb_rd_lwp: CommonAppConfig = Field(None, alias=LoqusdbInstance.LWP.value)
     loqusdb_somatic: CommonAppConfig = Field(None, alias=LoqusdbInstance.SOMATIC.value)
     loqusdb_tumor: CommonAppConfig = Field(None, alias=LoqusdbInstance.TUMOR.value)
@@ -481,23 +469,23 @@ class CGConfig(BaseModel):
         None, alias=LoqusdbInstance.SOMATIC_MYELOID.value
     )
     loqusdb_somatic_exome: CommonAppConfig = Field(None, alias=LoqusdbInstance.SOMATIC_EXOME.value)
-    madeline_api_: MadelineAPI = None
+    madeline_api_: Any = None
     mutacc_auto: MutaccAutoConfig = Field(None, alias="mutacc-auto")
-    mutacc_auto_api_: MutaccAutoAPI = None
+    mutacc_auto_api_: Any = None
     pdc: CommonAppConfig | None = None
-    pdc_service_: PdcService | None = None
+    pdc_service_: Any = None
     post_processing_services_: PostProcessingServices | None = None
     pigz: CommonAppConfig | None = None
     run_names_services_: RunNamesServices | None = None
-    sample_sheet_api_: IlluminaSampleSheetService | None = None
+    sample_sheet_api_: Any = None
     seqera_platform: SeqeraPlatformConfig | None = None
     scout: CommonAppConfig = None
     scout_38: CommonAppConfig = None
-    scout_api_37_: ScoutAPI = None
-    scout_api_38_: ScoutAPI = None
+    scout_api_37_: Any = None
+    scout_api_38_: Any = None
     tar: CommonAppConfig | None = None
     trailblazer: TrailblazerConfig = None
-    trailblazer_api_: TrailblazerAPI = None
+    trailblazer_api_: Any = None
 
     # Meta APIs that will use the apps from CGConfig
     balsamic: BalsamicConfig | None = None
@@ -521,7 +509,9 @@ class CGConfig(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @property
-    def arnold_api(self) -> ArnoldAPIClient:
+    def arnold_api(self) -> "ArnoldAPIClient":
+        from cg.clients.arnold.api import ArnoldAPIClient
+
         api = self.__dict__.get("arnold_api_")
         if api is None:
             LOG.debug("Instantiating arnold api")
@@ -530,7 +520,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def chanjo_api(self) -> ChanjoAPI:
+    def chanjo_api(self) -> "ChanjoAPI":
+        from cg.apps.coverage import ChanjoAPI
+
         api = self.__dict__.get("chanjo_api_")
         if api is None:
             LOG.debug("Instantiating chanjo api")
@@ -539,7 +531,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def chanjo2_api(self) -> Chanjo2APIClient:
+    def chanjo2_api(self) -> "Chanjo2APIClient":
+        from cg.clients.chanjo2.client import Chanjo2APIClient
+
         chanjo2_api = self.__dict__.get("chanjo2_api_")
         if chanjo2_api is None:
             LOG.debug("Instantiating Chanjo2 API")
@@ -549,7 +543,9 @@ class CGConfig(BaseModel):
         return chanjo2_api
 
     @property
-    def crunchy_api(self) -> CrunchyAPI:
+    def crunchy_api(self) -> "CrunchyAPI":
+        from cg.apps.crunchy import CrunchyAPI
+
         api = self.__dict__.get("crunchy_api_")
         if api is None:
             LOG.debug("Instantiating crunchy api")
@@ -558,7 +554,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def demultiplex_api(self) -> DemultiplexingAPI:
+    def demultiplex_api(self) -> "DemultiplexingAPI":
+        from cg.apps.demultiplex.demultiplex_api import DemultiplexingAPI
+
         demultiplex_api = self.__dict__.get("demultiplex_api_")
         if demultiplex_api is None:
             LOG.debug("Instantiating demultiplexing api")
@@ -569,7 +567,9 @@ class CGConfig(BaseModel):
         return demultiplex_api
 
     @property
-    def genotype_api(self) -> GenotypeAPI:
+    def genotype_api(self) -> "GenotypeAPI":
+        from cg.apps.gt import GenotypeAPI
+
         api = self.__dict__.get("genotype_api_")
         if api is None:
             LOG.debug("Instantiating genotype api")
@@ -578,8 +578,10 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def gens_api(self) -> GensAPI:
+    def gens_api(self) -> "GensAPI":
         """Returns Gens API after making sure it has been instantiated."""
+        from cg.apps.gens import GensAPI
+
         api = self.__dict__.get("gens_api_")
         if api is None:
             LOG.debug("Instantiating gens api")
@@ -588,7 +590,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def hermes_api(self) -> HermesApi:
+    def hermes_api(self) -> "HermesApi":
+        from cg.apps.hermes.hermes_api import HermesApi
+
         hermes_api = self.__dict__.get("hermes_api_")
         if hermes_api is None:
             LOG.debug("Instantiating hermes api")
@@ -597,7 +601,9 @@ class CGConfig(BaseModel):
         return hermes_api
 
     @property
-    def housekeeper_api(self) -> HousekeeperAPI:
+    def housekeeper_api(self) -> "HousekeeperAPI":
+        from cg.apps.housekeeper.hk import HousekeeperAPI
+
         housekeeper_api = self.__dict__.get("housekeeper_api_")
         if housekeeper_api is None:
             LOG.debug("Instantiating housekeeper api")
@@ -606,7 +612,9 @@ class CGConfig(BaseModel):
         return housekeeper_api
 
     @property
-    def janus_api(self) -> JanusAPIClient:
+    def janus_api(self) -> "JanusAPIClient":
+        from cg.clients.janus.api import JanusAPIClient
+
         janus_api = self.__dict__.get("janus_api_")
         if janus_api is None:
             LOG.debug("Instantiating janus api")
@@ -615,7 +623,9 @@ class CGConfig(BaseModel):
         return janus_api
 
     @property
-    def lims_api(self) -> LimsAPI:
+    def lims_api(self) -> "LimsAPI":
+        from cg.apps.lims import LimsAPI
+
         api = self.__dict__.get("lims_api_")
         if api is None:
             LOG.debug("Instantiating lims api")
@@ -624,7 +634,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def loqusdb_api(self) -> LoqusdbAPI:
+    def loqusdb_api(self) -> "LoqusdbAPI":
+        from cg.apps.loqus import LoqusdbAPI
+
         api = self.__dict__.get("loqusdb_api_")
         if api is None:
             LOG.debug("Instantiating loqusdb api")
@@ -635,7 +647,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def madeline_api(self) -> MadelineAPI:
+    def madeline_api(self) -> "MadelineAPI":
+        from cg.apps.madeline.api import MadelineAPI
+
         api = self.__dict__.get("madeline_api_")
         if api is None:
             LOG.debug("Instantiating madeline api")
@@ -644,7 +658,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def mutacc_auto_api(self) -> MutaccAutoAPI:
+    def mutacc_auto_api(self) -> "MutaccAutoAPI":
+        from cg.apps.mutacc_auto import MutaccAutoAPI
+
         api = self.__dict__.get("mutacc_auto_api_")
         if api is None:
             LOG.debug("Instantiating mutacc_auto api")
@@ -663,7 +679,34 @@ class CGConfig(BaseModel):
             self.post_processing_services_ = services
         return services
 
-    def get_pacbio_post_processing_service(self) -> PacBioPostProcessingService:
+    def get_pacbio_post_processing_service(self) -> "PacBioPostProcessingService":
+        from cg.services.decompression_service.decompressor import Decompressor
+        from cg.services.run_devices.pacbio.data_storage_service.pacbio_store_service import (
+            PacBioStoreService,
+        )
+        from cg.services.run_devices.pacbio.data_transfer_service.data_transfer_service import (
+            PacBioDataTransferService,
+        )
+        from cg.services.run_devices.pacbio.housekeeper_service.pacbio_houskeeper_service import (
+            PacBioHousekeeperService,
+        )
+        from cg.services.run_devices.pacbio.metrics_parser.metrics_parser import PacBioMetricsParser
+        from cg.services.run_devices.pacbio.post_processing_service import (
+            PacBioPostProcessingService,
+        )
+        from cg.services.run_devices.pacbio.run_data_generator.pacbio_run_data_generator import (
+            PacBioRunDataGenerator,
+        )
+        from cg.services.run_devices.pacbio.run_file_manager.run_file_manager import (
+            PacBioRunFileManager,
+        )
+        from cg.services.run_devices.pacbio.run_validator.pacbio_run_validator import (
+            PacBioRunValidator,
+        )
+        from cg.services.validate_file_transfer_service.validate_file_transfer_service import (
+            ValidateFileTransferService,
+        )
+
         LOG.debug("Instantiating PacBio post-processing service")
         run_data_generator = PacBioRunDataGenerator()
         file_manager = PacBioRunFileManager()
@@ -691,7 +734,9 @@ class CGConfig(BaseModel):
         )
 
     @property
-    def pdc_service(self) -> PdcService:
+    def pdc_service(self) -> "PdcService":
+        from cg.services.pdc_service.pdc_service import PdcService
+
         service = self.__dict__.get("pdc_service_")
         if service is None:
             LOG.debug("Instantiating PDC service")
@@ -701,6 +746,8 @@ class CGConfig(BaseModel):
 
     @property
     def run_names_services(self) -> RunNamesServices:
+        from cg.services.run_devices.run_names.pacbio import PacbioRunNamesService
+
         services = self.run_names_services_
         if services is None:
             LOG.debug("Instantiating run directory names services")
@@ -711,7 +758,9 @@ class CGConfig(BaseModel):
         return services
 
     @property
-    def sample_sheet_api(self) -> IlluminaSampleSheetService:
+    def sample_sheet_api(self) -> "IlluminaSampleSheetService":
+        from cg.apps.demultiplex.sample_sheet.api import IlluminaSampleSheetService
+
         sample_sheet_api = self.__dict__.get("sample_sheet_api_")
         if sample_sheet_api is None:
             LOG.debug("Instantiating sample sheet API")
@@ -724,11 +773,16 @@ class CGConfig(BaseModel):
         return sample_sheet_api
 
     @property
-    def slurm_service(self) -> SlurmService:
+    def slurm_service(self) -> "SlurmService":
+        from cg.services.slurm_service.slurm_cli_service import SlurmCLIService
+
         return SlurmCLIService()
 
     @property
-    def slurm_upload_service(self) -> SlurmUploadService:
+    def slurm_upload_service(self) -> "SlurmUploadService":
+        from cg.services.slurm_upload_service.slurm_upload_config import SlurmUploadConfig
+        from cg.services.slurm_upload_service.slurm_upload_service import SlurmUploadService
+
         slurm_upload_config = SlurmUploadConfig(
             email=self.data_delivery.mail_user,
             account=self.data_delivery.account,
@@ -741,11 +795,15 @@ class CGConfig(BaseModel):
         )
 
     @property
-    def analysis_service(self) -> AnalysisService:
+    def analysis_service(self) -> "AnalysisService":
+        from cg.services.analysis_service.analysis_service import AnalysisService
+
         return AnalysisService(analysis_client=self.trailblazer_api, status_db=self.status_db)
 
     @property
-    def scout_api_37(self) -> ScoutAPI:
+    def scout_api_37(self) -> "ScoutAPI":
+        from cg.apps.scout.scoutapi import ScoutAPI
+
         api = self.scout_api_37_
         if not api:
             LOG.debug("Instantiating scout api, genome build 37")
@@ -754,7 +812,9 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def scout_api_38(self) -> ScoutAPI:
+    def scout_api_38(self) -> "ScoutAPI":
+        from cg.apps.scout.scoutapi import ScoutAPI
+
         api = self.scout_api_38_
         if api is None:
             LOG.debug("Instantiating scout api, genome build 38")
@@ -765,17 +825,25 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def status_db(self) -> Store:
+    def status_db(self) -> "Store":
+        from cg.store.store import Store
+
         status_db = self.__dict__.get("status_db_")
         if status_db is None:
             LOG.debug("Instantiating status db")
-            initialize_database(self.database)
+            initialize_database(
+                self.database,
+                instrument_queries=self.instrument_queries,
+                pool_settings=self.database_pool,
+            )
             status_db = Store()
             self.status_db_ = status_db
         return status_db
 
     @property
-    def trailblazer_api(self) -> TrailblazerAPI:
+    def trailblazer_api(self) -> "TrailblazerAPI":
+        from cg.apps.tb import TrailblazerAPI
+
         api = self.__dict__.get("trailblazer_api_")
         if api is None:
             LOG.debug("Instantiating trailblazer api")
@@ -784,11 +852,17 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def fastq_concatenation_service(self) -> FastqConcatenationService:
+    def fastq_concatenation_service(self) -> "FastqConcatenationService":
+        from cg.services.fastq_concatenation_service.fastq_concatenation_service import (
+            FastqConcatenationService,
+        )
+
         return FastqConcatenationService()
 
     @property
-    def delivery_api(self) -> DeliveryAPI:
+    def delivery_api(self) -> "DeliveryAPI":
+        from cg.meta.delivery.delivery import DeliveryAPI
+
         api = self.__dict__.get("delivery_api_")
         if api is None:
             LOG.debug("Instantiating delivery api")
@@ -802,11 +876,16 @@ class CGConfig(BaseModel):
         return api
 
     @property
-    def sequencing_qc_service(self) -> SequencingQCService:
+    def sequencing_qc_service(self) -> "SequencingQCService":
+        from cg.services.sequencing_qc_service.sequencing_qc_service import SequencingQCService
+
         return SequencingQCService(self.status_db)
 
     @property
-    def delivery_rsync_service(self) -> DeliveryRsyncService:
+    def delivery_rsync_service(self) -> "DeliveryRsyncService":
+        from cg.services.deliver_files.rsync.models import RsyncDeliveryConfig
+        from cg.services.deliver_files.rsync.service import DeliveryRsyncService
+
         service = self.delivery_rsync_service_
         if service is None:
             LOG.debug("Instantiating delivery rsync service")
@@ -820,7 +899,9 @@ class CGConfig(BaseModel):
         return service
 
     @property
-    def delivery_service_factory(self) -> DeliveryServiceFactory:
+    def delivery_service_factory(self) -> "DeliveryServiceFactory":
+        from cg.services.deliver_files.factory import DeliveryServiceFactory
+
         factory = self.delivery_service_factory_
         if not factory:
             LOG.debug("Instantiating delivery service factory")
@@ -9,6 +9,7 @@ from cg.apps.crunchy.files import check_if_update_spring, get_crunchy_metadata,
 from cg.apps.crunchy.models import CrunchyMetadata
 from cg.constants import FASTQ_FIRST_READ_SUFFIX, FASTQ_SECOND_READ_SUFFIX, FileExtensions
 from cg.constants.compression import PENDING_PATH_SUFFIX
+from cg.utils.stat_cache import DirectoryStatCache
 
 LOG = logging.getLogger(__name__)
 
@@ -16,13 +17,15 @@ LOG = logging.getLogger(__name__)
 class CompressionData:
     """Holds information about compression data"""
 
-    def __init__(self, stub: Path = None):
+    def __init__(self, stub: Path = None, stat_cache: DirectoryStatCache | None = None):
         """Initialise a compression data object
 
-        The stub is first part of the file name
+        The stub is first part of the file name. With a stat cache the files are looked up in
+        cached listings of their directories instead of being probed one by one.
         """
         self.stub = stub
         self.stub_string = str(self.stub)
+        self.stat_cache: DirectoryStatCache | None = stat_cache
 
     @property
     def pending_path(self) -> Path:
@@ -62,9 +65,11 @@ class CompressionData:
     def pair_exists(self) -> bool:
         """Check that both files in FASTQ pair exists"""
         LOG.info("Check if FASTQ pair exists")
-        if not self.file_exists_and_is_accessible(self.fastq_first):
+        if not self.file_exists_and_is_accessible(self.fastq_first, stat_cache=self.stat_cache):
             return False
-        return bool(self.file_exists_and_is_accessible(self.fastq_second))
+        return bool(
+            self.file_exists_and_is_accessible(self.fastq_second, stat_cache=self.stat_cache)
+        )
 
     @staticmethod
     def is_absolute(file_path: Path) -> bool:
@@ -75,10 +80,13 @@ class CompressionData:
         return True
 
     @staticmethod
-    def file_exists_and_is_accessible(file_path: Path) -> bool:
+    def file_exists_and_is_accessible(
+        file_path: Path, stat_cache: DirectoryStatCache | None = None
+    ) -> bool:
         """Check if file exists and is accesible"""
         try:
-            if not file_path.exists():
+            exists: bool = stat_cache.exists(file_path) if stat_cache else file_path.exists()
+            if not exists:
                 LOG.info("%s does not exist", file_path)
                 return False
         except PermissionError:
@@ -93,26 +101,34 @@ class CompressionData:
         return os.path.islink(file_path)
 
     @staticmethod
-    def get_change_date(file_path: Path) -> datetime:
+    def get_change_date(file_path: Path, stat_cache: DirectoryStatCache | None = None) -> datetime:
         """Return the time when this file was changed"""
-        changed_date = datetime.fromtimestamp(file_path.stat().st_mtime)
+        file_stat: os.stat_result = stat_cache.stat(file_path) if stat_cache else file_path.stat()
+        changed_date = datetime.fromtimestamp(file_stat.st_mtime)
         LOG.info("File %s was changed %s", file_path, changed_date)
         return changed_date
 
     def spring_exists(self) -> bool:
         """Check if the SPRING file exists"""
         LOG.info("Check if SPRING archive file exists")
-        return self.file_exists_and_is_accessible(self.spring_path)
+        return self.file_exists_and_is_accessible(self.spring_path, stat_cache=self.stat_cache)
 
     def metadata_exists(self) -> bool:
         """Check if the SPRING metadata file exists"""
         LOG.info("Check if SPRING metadata file exists")
-        return self.file_exists_and_is_accessible(self.spring_metadata_path)
+        return self.file_exists_and_is_accessible(
+            self.spring_metadata_path, stat_cache=self.stat_cache
+        )
 
     def pending_exists(self) -> bool:
         """Check if the SPRING pending flag file exists"""
         LOG.info("Check if pending compression file exists")
-        return self.file_exists_and_is_accessible(self.pending_path)
+        return self.file_exists_and_is_accessible(self.pending_path, stat_cache=self.stat_cache)
+
+    def invalidate_stat_cache(self) -> None:
+        """Forget the cached files of the run, after files of the run were created or removed."""
+        if self.stat_cache:
+            self.stat_cache.invalidate(self.stub)
 
     @property
     def is_compression_pending(self) -> bool:
@@ -248,7 +264,8 @@ class CompressionData:
         crunchy_metadata: CrunchyMetadata = get_crunchy_metadata(spring_metadata_path)
 
         for file_info in crunchy_metadata.files:
-            if not Path(file_info.path).exists():
+            file_path = Path(file_info.path)
+            if not (self.stat_cache.exists(file_path) if self.stat_cache else file_path.exists()):
                 LOG.info(f"File {file_info.path} does not exist")
                 return False
             if not file_info.updated:
@@ -295,6 +312,15 @@ class SampleCompressionData:
         )
 
 
+class SampleFastqCompressions:
+    """The runs of a sample with FASTQ files ready to be compressed."""
+
+    def __init__(self, sample_id: str, compressions: list[CompressionData], all_possible: bool):
+        self.sample_id = sample_id
+        self.compressions = compressions
+        self.all_possible = all_possible
+
+
 class CaseCompressionData:
     """Object encapsulating a case's compression status."""
 
@@ -2,7 +2,6 @@
 
 import datetime
 import logging
-import os
 from pathlib import Path
 from typing import Type
 
@@ -23,6 +22,7 @@ from cg.models.demultiplex.run_parameters import (
     RunParametersNovaSeqX,
 )
 from cg.models.run_devices.utils import parse_date
+from cg.utils.directory_index import DirectoryIndex
 from cg.utils.files import get_source_creation_time_stamp
 from cg.utils.time import format_time_from_ctime
 
@@ -51,6 +51,7 @@ class IlluminaRunDirectoryData:
         self.parse_sequencing_run_dir_name()
         self._sample_sheet_path_hk: Path | None = None
         self.sample_sheet_validator = SampleSheetValidator()
+        self._directory_indexes: dict[tuple[Path, bool], DirectoryIndex] = {}
 
     def parse_sequencing_run_dir_name(self):
         """Parse relevant information from sequencing run name.
@@ -121,6 +122,23 @@ class IlluminaRunDirectoryData:
             raise FlowCellError("Attribute _sample_sheet_path_hk has not been assigned yet")
         return self._sample_sheet_path_hk
 
+    def get_directory_index(self, directory: Path, recursive: bool = True) -> DirectoryIndex:
+        """Return the index of the files in a directory of the run, built on its first use."""
+        key: tuple[Path, bool] = (directory, recursive)
+        if key not in self._directory_indexes:
+            self._directory_indexes[key] = DirectoryIndex(directory=directory, recursive=recursive)
+        return self._directory_indexes[key]
+
+    @property
+    def sequencing_run_files(self) -> DirectoryIndex:
+        """Return the index of the files at the top of the sequencing run directory."""
+        return self.get_directory_index(directory=self.get_sequencing_runs_dir(), recursive=False)
+
+    @property
+    def demultiplexed_run_files(self) -> DirectoryIndex:
+        """Return the index of the files in the demultiplexed run directory tree."""
+        return self.get_directory_index(directory=self.get_demultiplexed_runs_dir())
+
     def get_sequencing_runs_dir(self) -> Path:
         """
         Return the flow cells run directory regardless of the path used to initialise the IlluminaRunDirectoryData.
@@ -157,14 +175,15 @@ class IlluminaRunDirectoryData:
         Raises:
             FlowCellError if the sequencing run has no run parameters file."""
         flow_cell_run_dir: Path = self.get_sequencing_runs_dir()
-        if DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE in os.listdir(flow_cell_run_dir):
-            return Path(flow_cell_run_dir, DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE)
-        elif DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE in os.listdir(flow_cell_run_dir):
-            return Path(flow_cell_run_dir, DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE)
-        else:
-            message: str = f"No run parameters file found in sequencing run {flow_cell_run_dir}"
-            LOG.error(message)
-            raise FlowCellError(message)
+        for file_name in [
+            DemultiplexingDirsAndFiles.RUN_PARAMETERS_PASCAL_CASE,
+            DemultiplexingDirsAndFiles.RUN_PARAMETERS_CAMEL_CASE,
+        ]:
+            if self.sequencing_run_files.contains(file_name):
+                return Path(flow_cell_run_dir, file_name)
+        message: str = f"No run parameters file found in sequencing run {flow_cell_run_dir}"
+        LOG.error(message)
+        raise FlowCellError(message)
 
     @property
     def run_parameters(self) -> RunParameters:
@@ -182,16 +201,6 @@ class IlluminaRunDirectoryData:
         """Return the sequencer type."""
         return SEQUENCER_TYPES[self.machine_name]
 
-    @property
-    def rta_complete_path(self) -> Path:
-        """Return RTAComplete path."""
-        return Path(self.get_sequencing_runs_dir(), DemultiplexingDirsAndFiles.RTACOMPLETE)
-
-    @property
-    def copy_complete_path(self) -> Path:
-        """Return copy complete path."""
-        return Path(self.get_sequencing_runs_dir(), DemultiplexingDirsAndFiles.COPY_COMPLETE)
-
     @property
     def demultiplexing_started_path(self) -> Path:
         """Return demux started path."""
@@ -254,7 +263,7 @@ class IlluminaRunDirectoryData:
     def sample_sheet_exists(self) -> bool:
         """Check if sample sheet exists."""
         LOG.info("Check if sample sheet exists")
-        return self.sample_sheet_path.exists()
+        return self.sequencing_run_files.contains(DemultiplexingDirsAndFiles.SAMPLE_SHEET_FILE_NAME)
 
     @property
     def sample_sheet(self) -> SampleSheet:
@@ -270,14 +279,14 @@ class IlluminaRunDirectoryData:
         This is indicated by that the file RTAComplete.txt exists.
         """
         LOG.info("Check if sequencing is done")
-        return self.rta_complete_path.exists()
+        return self.sequencing_run_files.contains(DemultiplexingDirsAndFiles.RTACOMPLETE)
 
     def is_copy_completed(self) -> bool:
         """Check if copy of sequencing run is done.
         This is indicated by that the file CopyComplete.txt exists.
         """
         LOG.info("Check if copy of data from sequence instrument is ready")
-        return self.copy_complete_path.exists()
+        return self.sequencing_run_files.contains(DemultiplexingDirsAndFiles.COPY_COMPLETE)
 
     def is_sequencing_run_ready(self) -> bool:
         """Check if a sequencing run is ready for downstream processing.
@@ -300,9 +309,8 @@ class IlluminaRunDirectoryData:
     def get_run_completion_status(self) -> Path | None:
         """Return the run completion status path."""
         flow_cells_dir: Path = self.get_sequencing_runs_dir()
-        file_path = Path(flow_cells_dir, DemultiplexingDirsAndFiles.RUN_COMPLETION_STATUS)
-        if file_path.exists():
-            return file_path
+        if self.sequencing_run_files.contains(DemultiplexingDirsAndFiles.RUN_COMPLETION_STATUS):
+            return Path(flow_cells_dir, DemultiplexingDirsAndFiles.RUN_COMPLETION_STATUS)
         return None
 
     @property
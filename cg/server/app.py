@@ -1,6 +1,6 @@
 import coloredlogs
 import requests
-from flask import Flask, redirect, session, url_for
+from flask import Flask, Response, redirect, session, url_for
 from flask_admin.base import AdminIndexView
 from flask_dance.consumer import oauth_authorized
 from flask_dance.contrib.google import google, make_google_blueprint
@@ -22,6 +22,12 @@ from cg.server.endpoints.sequencing_metrics.pacbio_sequencing_metrics import (
 from cg.server.endpoints.sequencing_run.pacbio_sequencing_run import PACBIO_SEQUENCING_RUN_BLUEPRINT
 from cg.server.endpoints.users import USERS_BLUEPRINT
 from cg.store.database import get_scoped_session_registry
+from cg.store.instrumentation import (
+    get_current_statistics,
+    log_query_statistics,
+    start_recording,
+    stop_recording,
+)
 from cg.store.models import (
     Analysis,
     Application,
@@ -54,6 +60,8 @@ def create_app():
     _configure_extensions(app)
     _register_blueprints(app)
     _register_teardowns(app)
+    if app_config.cg_sql_query_instrumentation:
+        _register_query_instrumentation(app)
 
     return app
 
@@ -164,6 +172,24 @@ def _register_admin_views():
     )
 
 
+def _register_query_instrumentation(app: Flask):
+    """Record the statements executed against status db for each request."""
+
+    @app.before_request
+    def start_query_recording():
+        start_recording()
+
+    @app.after_request
+    def add_query_statistics_header(response: Response) -> Response:
+        if statistics := get_current_statistics():
+            response.headers["Server-Timing"] = statistics.server_timing
+        return response
+
+    @app.teardown_request
+    def log_request_query_statistics(exception=None):
+        log_query_statistics(stop_recording())
+
+
 def _register_teardowns(app: Flask):
     """Register teardown functions."""
 
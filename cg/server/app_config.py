@@ -15,6 +15,13 @@ class AppConfig(BaseSettings):
 
     # Database settings
     cg_sql_database_uri: str = "sqlite:///"
+    cg_sql_query_instrumentation: bool = False
+    cg_sql_pool_size: int | None = None
+    cg_sql_max_overflow: int | None = None
+    cg_sql_pool_recycle: int | None = None
+    cg_sql_pool_timeout: float | None = None
+    cg_sql_pool_pre_ping: bool = True
+    cg_sql_read_replica_uri: str | None = None
 
     # Security settings
     cg_secret_key: str = "thisIsNotASafeKey"
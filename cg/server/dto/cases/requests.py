@@ -1,6 +1,11 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
 
 from cg.constants.constants import CaseActions
+from cg.server.dto.pagination import EncodedPageCursor
+
+CASES_SORT_FIELD: str = "created_at"
 
 
 class CasesRequest(BaseModel):
@@ -8,3 +13,14 @@ class CasesRequest(BaseModel):
     enquiry: str | None = None
     page: int = 1
     page_size: int = Field(50, alias="pageSize")
+    cursor: EncodedPageCursor = None
+    estimate_total: bool = Field(False, alias="estimateTotal")
+
+    @model_validator(mode="after")
+    def validate_cursor(self):
+        """Cases are paginated by creation date, newest first."""
+        if self.cursor:
+            self.cursor = self.cursor.validate_sort_field(
+                sort_field=CASES_SORT_FIELD, value_type=datetime
+            )
+        return self
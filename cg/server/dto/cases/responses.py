@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class CasesResponse(BaseModel):
+    cases: list[dict]
+    total: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
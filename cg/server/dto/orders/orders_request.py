@@ -1,5 +1,9 @@
+from datetime import datetime
 from enum import StrEnum
-from pydantic import BaseModel, Field
+
+from pydantic import BaseModel, Field, model_validator
+
+from cg.server.dto.pagination import EncodedPageCursor
 
 
 class OrderSortField(StrEnum):
@@ -8,6 +12,13 @@ class OrderSortField(StrEnum):
     CUSTOMER_ID: str = "customer_id"
 
 
+SORT_FIELD_TYPES: dict[OrderSortField, type] = {
+    OrderSortField.ORDER_DATE: datetime,
+    OrderSortField.ID: int,
+    OrderSortField.CUSTOMER_ID: int,
+}
+
+
 class SortOrder(StrEnum):
     ASC: str = "asc"
     DESC: str = "desc"
@@ -16,8 +27,18 @@ class SortOrder(StrEnum):
 class OrdersRequest(BaseModel):
     page_size: int | None = Field(alias="pageSize", default=50)
     page: int | None = 1
+    cursor: EncodedPageCursor = None
     sort_field: OrderSortField | None = Field(alias="sortField", default=OrderSortField.ORDER_DATE)
     sort_order: SortOrder | None = Field(alias="sortOrder", default=SortOrder.DESC)
     search: str | None = None
     workflow: str | None = None
     is_open: bool | None = None
+    estimate_total: bool = Field(alias="estimateTotal", default=False)
+
+    @model_validator(mode="after")
+    def validate_cursor(self):
+        if self.cursor:
+            self.cursor = self.cursor.validate_sort_field(
+                sort_field=self.sort_field, value_type=SORT_FIELD_TYPES.get(self.sort_field, int)
+            )
+        return self
@@ -17,3 +17,5 @@ class Order(BaseModel):
 class OrdersResponse(BaseModel):
     orders: list[Order]
     total_count: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
@@ -0,0 +1,50 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import BaseModel, BeforeValidator, TypeAdapter
+
+
+class PageCursor(BaseModel):
+    """Position after the last entry of a page, used for keyset pagination.
+
+    The cursor holds the sort field, the value of the sort column and the id of the last entry,
+    and is passed to and from the clients as an opaque url-safe string. A decoded cursor is only
+    valid for requests sorted by the same field, see validate_sort_field."""
+
+    sort_field: str | None = None
+    value: datetime | int | str | None = None
+    id: int
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        try:
+            return cls.model_validate(json.loads(base64.urlsafe_b64decode(cursor.encode())))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as error:
+            raise ValueError(f"Invalid cursor: {cursor}") from error
+
+    def validate_sort_field(self, sort_field: str | None, value_type: type) -> "PageCursor":
+        """
+        Return the cursor with its value converted to the type of the sort column.
+        Raises:
+            ValueError: If the cursor was created for another sort field or its value does not
+            match the type of the sort column.
+        """
+        if self.sort_field != sort_field:
+            raise ValueError(f"Cursor for sort field {self.sort_field} used with {sort_field}")
+        value = TypeAdapter(value_type | None).validate_python(self.value)
+        return self.model_copy(update={"value": value})
+
+
+def _decode_cursor(cursor: Any) -> Any:
+    if isinstance(cursor, str):
+        return PageCursor.decode(cursor) if cursor else None
+    return cursor
+
+
+EncodedPageCursor = Annotated[PageCursor | None, BeforeValidator(_decode_cursor)]
@@ -5,10 +5,12 @@ from flask import Blueprint, abort, g, jsonify, request
 
 from cg.exc import CaseNotFoundError, CgDataError, OrderMismatchError
 from cg.server.dto.cases.requests import CasesRequest
+from cg.server.dto.cases.responses import CasesResponse
 from cg.server.dto.delivery_message.delivery_message_request import DeliveryMessageRequest
 from cg.server.dto.delivery_message.delivery_message_response import DeliveryMessageResponse
 from cg.server.endpoints.utils import before_request
 from cg.server.ext import case_service, db, delivery_message_service
+from cg.store.database import read_from_replica
 from cg.store.models import Case, Customer
 
 LOG = logging.getLogger(__name__)
@@ -17,13 +19,17 @@ CASES_BLUEPRINT.before_request(before_request)
 
 
 @CASES_BLUEPRINT.route("/cases")
+@read_from_replica()
 def get_cases():
     """Return cases with links for a customer from the database."""
-    cases_request = CasesRequest.model_validate(request.args.to_dict())
+    try:
+        cases_request = CasesRequest.model_validate(request.args.to_dict())
+    except ValueError as error:
+        return jsonify(error=str(error)), HTTPStatus.BAD_REQUEST
 
     customers: list[Customer] = _get_current_customers()
-    cases, total = case_service.get_cases(request=cases_request, customers=customers)
-    return jsonify(cases=cases, total=total)
+    response: CasesResponse = case_service.get_cases(request=cases_request, customers=customers)
+    return jsonify(**response.model_dump())
 
 
 def _get_current_customers() -> list[Customer] | None:
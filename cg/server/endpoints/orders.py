@@ -40,6 +40,7 @@ from cg.server.ext import (
     ticket_handler,
 )
 from cg.services.orders.submitter.service import OrderSubmitter
+from cg.store.database import read_from_replica
 from cg.store.models import Application, Customer
 
 ORDERS_BLUEPRINT = Blueprint("orders", __name__, url_prefix="/api/v1")
@@ -49,9 +50,13 @@ LOG = logging.getLogger(__name__)
 
 
 @ORDERS_BLUEPRINT.route("/orders")
+@read_from_replica()
 def get_orders():
     """Return the latest orders."""
-    data = OrdersRequest.model_validate(request.args.to_dict())
+    try:
+        data = OrdersRequest.model_validate(request.args.to_dict())
+    except ValueError as error:
+        return make_response(jsonify(error=str(error)), HTTPStatus.BAD_REQUEST)
     response: OrdersResponse = order_service.get_orders(data)
     return make_response(response.model_dump())
 
@@ -7,6 +7,7 @@ from cg.server.dto.samples.requests import CollaboratorSamplesRequest, SamplesRe
 from cg.server.dto.samples.samples_response import SamplesResponse
 from cg.server.endpoints.utils import before_request
 from cg.server.ext import db, sample_service
+from cg.store.database import read_from_replica
 from cg.store.models import Customer, Sample
 
 SAMPLES_BLUEPRINT = Blueprint("samples", __name__, url_prefix="/api/v1")
@@ -43,6 +44,7 @@ def parse_sample_in_collaboration(sample_id):
 
 
 @SAMPLES_BLUEPRINT.route("/samples")
+@read_from_replica()
 def get_samples():
     """Return samples."""
     samples_request = SamplesRequest.model_validate(request.args.to_dict())
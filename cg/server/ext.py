@@ -25,9 +25,8 @@ from cg.services.sample_run_metrics_service.sample_run_metrics_service import (
 from cg.services.web_services.application.service import ApplicationsWebService
 from cg.services.web_services.case.service import CaseWebService
 from cg.services.web_services.sample.service import SampleService
-from cg.store.database import initialize_database
+from cg.store.database import DatabasePoolSettings, initialize_database
 from cg.store.store import Store
-from cg.server.app_config import app_config
 
 
 class FlaskLims(LimsAPI):
@@ -53,7 +52,19 @@ class FlaskStore(Store):
 
     def init_app(self, app):
         uri = app_config.cg_sql_database_uri
-        initialize_database(uri)
+        pool_settings = DatabasePoolSettings(
+            pool_size=app_config.cg_sql_pool_size,
+            max_overflow=app_config.cg_sql_max_overflow,
+            pool_recycle=app_config.cg_sql_pool_recycle,
+            pool_timeout=app_config.cg_sql_pool_timeout,
+            pool_pre_ping=app_config.cg_sql_pool_pre_ping,
+        )
+        initialize_database(
+            uri,
+            instrument_queries=app_config.cg_sql_query_instrumentation,
+            pool_settings=pool_settings,
+            read_replica_uri=app_config.cg_sql_read_replica_uri,
+        )
         super(FlaskStore, self).__init__()
 
 
@@ -12,6 +12,7 @@ from cg.services.analysis_starter.submitters.submitter import Submitter
 from cg.services.analysis_starter.tracker.tracker import Tracker
 from cg.store.models import Case
 from cg.store.store import Store
+from cg.utils.concurrency import run_concurrently
 
 LOG = logging.getLogger(__name__)
 
@@ -33,20 +34,24 @@ class AnalysisStarter:
         self.tracker = tracker
         self.workflow = workflow
 
-    def start_available(self, limit: int | None = None) -> bool:
-        """Starts available cases. Returns True if all ready cases started without an error."""
-        succeeded = True
+    def start_available(self, limit: int | None = None, workers: int = 1) -> bool:
+        """Starts available cases, given the number of workers concurrently.
+        Returns True if all ready cases started without an error."""
         cases: list[Case] = self.store.get_cases_to_analyze(workflow=self.workflow, limit=limit)
         LOG.info(f"Found {len(cases)} {self.workflow} cases to start")
-        for case in cases:
-            try:
-                self.start(case.internal_id)
-            except AnalysisNotReadyError as error:
-                LOG.error(error)
-            except Exception as error:
-                LOG.error(error)
-                succeeded = False
-        return succeeded
+        case_ids: list[str] = [case.internal_id for case in cases]
+        return run_concurrently(function=self._start_available, items=case_ids, workers=workers)
+
+    def _start_available(self, case_id: str) -> bool:
+        """Start a case and return False if it failed for another reason than not being ready."""
+        try:
+            self.start(case_id)
+        except AnalysisNotReadyError as error:
+            LOG.error(error)
+        except Exception as error:
+            LOG.error(error)
+            return False
+        return True
 
     def start(self, case_id: str, **flags) -> None:
         """Fetches raw data, generates configuration files and runs the specified case."""
@@ -72,14 +72,11 @@ class FastqFetcher(InputFetcher):
     def _are_all_spring_files_present(self, case_id: str) -> bool:
         """Return True if no Spring files for the case are archived."""
         case: Case = self.status_db.get_case_by_internal_id(case_id)
-        for sample in case.samples:
-            if (
-                files := self.housekeeper_api.get_archived_files_for_bundle(
-                    bundle_name=sample.internal_id, tags=[SequencingFileTag.SPRING]
-                )
-            ) and not all(file.archive.retrieved_at for file in files):
-                return False
-        return True
+        archived_files: dict[str, list[File]] = self.housekeeper_api.get_archived_files_for_bundles(
+            bundle_names=[sample.internal_id for sample in case.samples],
+            tags=[SequencingFileTag.SPRING],
+        )
+        return all(file.archive.retrieved_at for files in archived_files.values() for file in files)
 
     def _resolve_decompression(self, case_id: str) -> None:
         """
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from cg.constants.constants import ReadDirection
@@ -22,6 +23,7 @@ class FastqConcatenationService:
         remove_raw: bool = False,
     ):
         """Concatenate fastq files for a given sample in a directory and write the concatenated files to the output path.
+        The forward and reverse reads are concatenated concurrently.
 
         Args:
             sample_id: The identifier to identify the samples by it should be a unique identifier in the file name.
@@ -33,12 +35,21 @@ class FastqConcatenationService:
         LOG.debug(
             f"[Concatenation Service] Concatenating fastq files for {sample_id} in {fastq_directory}"
         )
-        temp_forward: Path | None = concatenate_fastq_reads_for_direction(
-            directory=fastq_directory, sample_id=sample_id, direction=ReadDirection.FORWARD
-        )
-        temp_reverse: Path | None = concatenate_fastq_reads_for_direction(
-            directory=fastq_directory, sample_id=sample_id, direction=ReadDirection.REVERSE
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            forward_concatenation = executor.submit(
+                concatenate_fastq_reads_for_direction,
+                directory=fastq_directory,
+                sample_id=sample_id,
+                direction=ReadDirection.FORWARD,
+            )
+            reverse_concatenation = executor.submit(
+                concatenate_fastq_reads_for_direction,
+                directory=fastq_directory,
+                sample_id=sample_id,
+                direction=ReadDirection.REVERSE,
+            )
+            temp_forward: Path | None = forward_concatenation.result()
+            temp_reverse: Path | None = reverse_concatenation.result()
 
         if remove_raw:
             remove_raw_fastqs(
@@ -1,11 +1,11 @@
 from pathlib import Path
 import re
-import shutil
 import uuid
 
 from cg.services.fastq_concatenation_service.exceptions import ConcatenationError
 from cg.constants.constants import ReadDirection, FileFormat
 from cg.constants import FileExtensions
+from cg.utils.files import concatenate_files
 
 
 def concatenate_fastq_reads_for_direction(
@@ -17,8 +17,8 @@ def concatenate_fastq_reads_for_direction(
     if not fastqs:
         return
     output_file: Path = get_new_unique_file(directory)
-    concatenate(input_files=fastqs, output_file=output_file)
-    validate_concatenation(input_files=fastqs, output_file=output_file)
+    input_size, concatenated_size = concatenate(input_files=fastqs, output_file=output_file)
+    validate_concatenation(input_size=input_size, concatenated_size=concatenated_size)
     return output_file
 
 
@@ -42,21 +42,13 @@ def get_fastqs_by_direction(fastq_directory: Path, direction: int, sample_id: st
     return sort_files_by_name(fastqs)
 
 
-def get_total_size(files: list[Path]) -> int:
-    return sum(file.stat().st_size for file in files)
+def concatenate(input_files: list[Path], output_file: Path) -> tuple[int, int]:
+    """Concatenate the files and return the total size of the input files and the bytes written."""
+    return concatenate_files(input_files=input_files, output_file=output_file)
 
 
-def concatenate(input_files: list[Path], output_file: Path) -> None:
-    with open(output_file, "wb") as write_file_obj:
-        for file in input_files:
-            with open(file, "rb") as file_descriptor:
-                shutil.copyfileobj(file_descriptor, write_file_obj)
-
-
-def validate_concatenation(input_files: list[Path], output_file: Path) -> None:
-    total_size: int = get_total_size(input_files)
-    concatenated_size: int = get_total_size([output_file])
-    if total_size != concatenated_size:
+def validate_concatenation(input_size: int, concatenated_size: int) -> None:
+    if input_size != concatenated_size:
         raise ConcatenationError
 
 
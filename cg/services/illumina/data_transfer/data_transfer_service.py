@@ -18,6 +18,7 @@ from cg.services.illumina.file_parsing.demux_version_service import (
 from cg.services.illumina.file_parsing.sequencing_times.collect_sequencing_times import (
     CollectSequencingTimes,
 )
+from cg.utils.directory_index import DirectoryIndex
 
 
 class IlluminaDataTransferService:
@@ -66,7 +67,10 @@ class IlluminaDataTransferService:
         non_pooled_lanes_and_samples: list[tuple[int, str]] = (
             flow_cell.sample_sheet.get_non_pooled_lanes_and_samples()
         )
-        metrics_parser = BCLConvertMetricsParser(flow_cell.path)
+        metrics_parser = BCLConvertMetricsParser(
+            bcl_convert_metrics_dir_path=flow_cell.path,
+            directory_index=flow_cell.get_directory_index(flow_cell.path),
+        )
         undetermined_metrics: list[IlluminaSampleSequencingMetricsDTO] = []
 
         for lane, sample_internal_id in non_pooled_lanes_and_samples:
@@ -85,9 +89,12 @@ class IlluminaDataTransferService:
     def create_sample_sequencing_metrics_dto_for_flow_cell(
         self,
         flow_cell_directory: Path,
+        directory_index: DirectoryIndex | None = None,
     ) -> list[IlluminaSampleSequencingMetricsDTO]:
         """Parse the demultiplexing metrics data into the sequencing statistics model."""
-        metrics_parser = BCLConvertMetricsParser(flow_cell_directory)
+        metrics_parser = BCLConvertMetricsParser(
+            bcl_convert_metrics_dir_path=flow_cell_directory, directory_index=directory_index
+        )
         sample_internal_ids: list[str] = metrics_parser.get_sample_internal_ids()
         sample_lane_sequencing_metrics: list[IlluminaSampleSequencingMetricsDTO] = []
 
@@ -105,7 +112,10 @@ class IlluminaDataTransferService:
     def create_illumina_sequencing_dto(
         demultiplexed_run_dir: IlluminaRunDirectoryData,
     ) -> IlluminaSequencingRunDTO:
-        metrics_parser = BCLConvertMetricsParser(demultiplexed_run_dir.path)
+        metrics_parser = BCLConvertMetricsParser(
+            bcl_convert_metrics_dir_path=demultiplexed_run_dir.path,
+            directory_index=demultiplexed_run_dir.get_directory_index(demultiplexed_run_dir.path),
+        )
         total_reads: int = metrics_parser.get_total_reads_for_flow_cell()
         total_undetermined_reads: int = metrics_parser.get_undetermined_reads_for_flow_cell()
         percent_undetermined_reads: float = (
@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from typing import Type
 
+import pandas as pd
+
 from cg.apps.demultiplex.sample_sheet.validators import is_valid_sample_internal_id
 from cg.constants.constants import SCALE_TO_READ_PAIRS, FileFormat
 from cg.constants.demultiplexing import UNDETERMINED
@@ -17,10 +19,17 @@ from cg.services.illumina.file_parsing.models import (
     DemuxMetrics,
     SequencingQualityMetrics,
 )
-from cg.utils.files import get_file_in_directory
+from cg.utils.directory_index import DirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
+READ_PAIR_SUM_COLUMNS: list[str] = [
+    "yield_",
+    "yield_q30",
+    "q30_bases_percent",
+    "mean_quality_score_q30",
+]
+
 
 class BCLConvertMetricsParser:
     """Parser file for BCLConvert metrics used for illumina flow cells."""
@@ -28,18 +37,17 @@ class BCLConvertMetricsParser:
     def __init__(
         self,
         bcl_convert_metrics_dir_path: Path,
+        directory_index: DirectoryIndex | None = None,
     ) -> None:
-        """Initialize the class."""
+        """Initialize the class, finding the metrics files with the index of the directory if
+        given or else with a new index."""
         self.bcl_convert_demultiplex_dir: Path = bcl_convert_metrics_dir_path
-        self.quality_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=QUALITY_METRICS_FILE_NAME
-        )
-        self.demux_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=DEMUX_METRICS_FILE_NAME
-        )
-        self.adapter_metrics_path: Path = get_file_in_directory(
-            directory=self.bcl_convert_demultiplex_dir, file_name=ADAPTER_METRICS_FILE_NAME
+        directory_index: DirectoryIndex = directory_index or DirectoryIndex(
+            self.bcl_convert_demultiplex_dir
         )
+        self.quality_metrics_path: Path = directory_index.get_file(QUALITY_METRICS_FILE_NAME)
+        self.demux_metrics_path: Path = directory_index.get_file(DEMUX_METRICS_FILE_NAME)
+        self.adapter_metrics_path: Path = directory_index.get_file(ADAPTER_METRICS_FILE_NAME)
         self.quality_metrics: list[SequencingQualityMetrics] = self.parse_metrics_file(
             metrics_file_path=self.quality_metrics_path,
             metrics_model=SequencingQualityMetrics,
@@ -48,6 +56,23 @@ class BCLConvertMetricsParser:
             metrics_file_path=self.demux_metrics_path,
             metrics_model=DemuxMetrics,
         )
+        self.demux_metrics_by_sample_and_lane: dict[tuple[str, int], DemuxMetrics] = {}
+        self.lanes_by_sample: dict[str, list[int]] = {}
+        for metric in self.demux_metrics:
+            self.demux_metrics_by_sample_and_lane.setdefault(
+                (metric.sample_internal_id, metric.lane), metric
+            )
+            self.lanes_by_sample.setdefault(metric.sample_internal_id, []).append(metric.lane)
+        self.quality_metrics_by_sample_and_lane: dict[
+            tuple[str, int], list[SequencingQualityMetrics]
+        ] = {}
+        for metric in self.quality_metrics:
+            self.quality_metrics_by_sample_and_lane.setdefault(
+                (metric.sample_internal_id, metric.lane), []
+            ).append(metric)
+        self.read_pair_sums: dict[tuple[str, int], dict] = self.get_read_pair_sums(
+            self.quality_metrics
+        )
 
     @staticmethod
     def parse_metrics_file(
@@ -63,114 +88,85 @@ class BCLConvertMetricsParser:
             parsed_metrics.append(metrics_model(**sample_metrics_dict))
         return parsed_metrics
 
+    @staticmethod
+    def get_read_pair_sums(
+        metrics: list[SequencingQualityMetrics],
+    ) -> dict[tuple[str, int], dict]:
+        """Return the sums of the yield, yield Q30, percent Q30 and mean quality score of the
+        reads of every sample and lane, aggregated in a single pass over the metrics columns."""
+        if not metrics:
+            return {}
+        columns = pd.DataFrame(
+            {
+                "sample_internal_id": [metric.sample_internal_id for metric in metrics],
+                "lane": [metric.lane for metric in metrics],
+                **{
+                    column: [getattr(metric, column) for metric in metrics]
+                    for column in READ_PAIR_SUM_COLUMNS
+                },
+            }
+        )
+        return (
+            columns.groupby(["sample_internal_id", "lane"], sort=False)[READ_PAIR_SUM_COLUMNS]
+            .sum()
+            .to_dict(orient="index")
+        )
+
+    def get_read_pair_sum_for_sample_in_lane(
+        self, sample_internal_id: str, lane: int, attr_name: str
+    ) -> int | float:
+        """Return the sum of an attribute over the reads of a sample and lane."""
+        read_pair_sums: dict | None = self.read_pair_sums.get((sample_internal_id, lane))
+        return read_pair_sums[attr_name] if read_pair_sums else 0
+
     def get_sample_internal_ids(self) -> list[str]:
         """Return a list of sample internal ids."""
-        sample_internal_ids: list[str] = []
-        for sample_demux_metric in self.demux_metrics:
-            if is_valid_sample_internal_id(
-                sample_internal_id=sample_demux_metric.sample_internal_id
-            ):
-                sample_internal_ids.append(sample_demux_metric.sample_internal_id)
-        return list(set(sample_internal_ids))
+        return [
+            sample_internal_id
+            for sample_internal_id in self.lanes_by_sample
+            if is_valid_sample_internal_id(sample_internal_id=sample_internal_id)
+        ]
 
     def get_lanes_for_sample(self, sample_internal_id: str) -> list[int]:
         """Return a list of lanes for a sample."""
-        lanes_for_sample: list[int] = []
-        for sample_demux_metric in self.demux_metrics:
-            if sample_demux_metric.sample_internal_id == sample_internal_id:
-                lanes_for_sample.append(sample_demux_metric.lane)
-        return lanes_for_sample
-
-    @staticmethod
-    def get_metrics_for_sample_and_lane(
-        metrics: list[SequencingQualityMetrics | DemuxMetrics],
-        sample_internal_id: str,
-        lane: int,
-    ) -> SequencingQualityMetrics | DemuxMetrics:
-        """Return the metrics for a sample by sample internal id."""
-        for metric in metrics:
-            if metric.sample_internal_id == sample_internal_id and metric.lane == lane:
-                return metric
-
-    def get_read_pair_metrics_for_sample_and_lane(
-        self, sample_internal_id: str, lane: int
-    ) -> list[SequencingQualityMetrics]:
-        """Return the read pair metrics for a sample and lane."""
-        read_metrics: list[SequencingQualityMetrics] = []
-        for metric in self.quality_metrics:
-            if metric.sample_internal_id == sample_internal_id and metric.lane == lane:
-                read_metrics.append(metric)
-        return read_metrics
+        return list(self.lanes_by_sample.get(sample_internal_id, []))
 
     def calculate_total_reads_for_sample_in_lane(self, sample_internal_id: str, lane: int) -> int:
         """Calculate the total reads for a sample in a lane."""
-        metric: DemuxMetrics = self.get_metrics_for_sample_and_lane(
-            metrics=self.demux_metrics, sample_internal_id=sample_internal_id, lane=lane
-        )
+        metric: DemuxMetrics = self.demux_metrics_by_sample_and_lane.get((sample_internal_id, lane))
         return metric.read_pair_count * SCALE_TO_READ_PAIRS
 
     def get_q30_bases_percent_for_sample_in_lane(self, sample_internal_id: str, lane: int) -> float:
         """Return the percent of bases that are Q30 for a sample and lane."""
-        metrics: list[SequencingQualityMetrics] = self.get_read_pair_metrics_for_sample_and_lane(
-            sample_internal_id=sample_internal_id, lane=lane
+        q30_bases_percent_sum: float = self.get_read_pair_sum_for_sample_in_lane(
+            sample_internal_id=sample_internal_id, lane=lane, attr_name="q30_bases_percent"
         )
-        return self.calculate_mean_read_pair_q30_bases_percent(metrics=metrics)
+        return round(q30_bases_percent_sum / SCALE_TO_READ_PAIRS, 2) * 100
 
     def get_yield_for_sample_in_lane(self, sample_internal_id: str, lane: int) -> int:
         """Return the yield for a sample and lane."""
-        metrics: list[SequencingQualityMetrics] = self.get_read_pair_metrics_for_sample_and_lane(
-            sample_internal_id=sample_internal_id, lane=lane
+        return self.get_read_pair_sum_for_sample_in_lane(
+            sample_internal_id=sample_internal_id, lane=lane, attr_name="yield_"
         )
-        return self.sum_yield(metrics=metrics)
 
     def get_yield_q30_for_sample_in_lane(self, sample_internal_id: str, lane: int) -> int:
         """Return the yield Q30 for a sample and lane."""
-        metrics: list[SequencingQualityMetrics] = self.get_read_pair_metrics_for_sample_and_lane(
-            sample_internal_id=sample_internal_id, lane=lane
+        return self.get_read_pair_sum_for_sample_in_lane(
+            sample_internal_id=sample_internal_id, lane=lane, attr_name="yield_q30"
         )
-        return self.sum_yield_q30(metrics=metrics)
-
-    @classmethod
-    def calculate_mean_read_pair_q30_bases_percent(
-        cls, metrics: list[SequencingQualityMetrics]
-    ) -> float:
-        """Calculate the percent of bases that are Q30 for read pairs."""
-        mean_read_pair_q30_bases_percent: float = 0
-        for metric in metrics:
-            mean_read_pair_q30_bases_percent += metric.q30_bases_percent
-        return round(mean_read_pair_q30_bases_percent / SCALE_TO_READ_PAIRS, 2) * 100
-
-    @classmethod
-    def calculate_mean_quality_score(cls, metrics: list[SequencingQualityMetrics]) -> float:
-        """Calculate the mean quality score for a list of metrics."""
-        total_q_score: float = 0
-        for metric in metrics:
-            total_q_score += metric.mean_quality_score_q30
-        return round(total_q_score / SCALE_TO_READ_PAIRS, 2)
-
-    def sum_yield(self, metrics: list[SequencingQualityMetrics]) -> int:
-        """Calculate the mean yield for a list of metrics."""
-        return self.get_aggregate_for_attribute(metrics=metrics, attr_name="yield_")
-
-    def sum_yield_q30(self, metrics: list[SequencingQualityMetrics]) -> int:
-        """Calculate the mean yield Q30 for a list of metrics."""
-        return self.get_aggregate_for_attribute(metrics=metrics, attr_name="yield_q30")
 
     def get_mean_quality_score_for_sample_in_lane(
         self, sample_internal_id: str, lane: int
     ) -> float:
         """Return the mean quality score for a sample and lane."""
-        metrics: list[SequencingQualityMetrics] = self.get_read_pair_metrics_for_sample_and_lane(
-            sample_internal_id=sample_internal_id, lane=lane
+        quality_score_sum: float = self.get_read_pair_sum_for_sample_in_lane(
+            sample_internal_id=sample_internal_id, lane=lane, attr_name="mean_quality_score_q30"
         )
-        return self.calculate_mean_quality_score(metrics=metrics)
+        return round(quality_score_sum / SCALE_TO_READ_PAIRS, 2)
 
     def has_undetermined_reads_in_lane(self, lane: int) -> bool:
         """Return whether there are undetermined reads in a lane."""
-        metrics: SequencingQualityMetrics | None = self.get_metrics_for_sample_and_lane(
-            metrics=self.quality_metrics, sample_internal_id=UNDETERMINED, lane=lane
-        )
-        return bool(metrics)
+        return (UNDETERMINED, lane) in self.quality_metrics_by_sample_and_lane
 
     @classmethod
     def calculate_total_reads_for_metrics(cls, read_pair_count: int) -> int:
@@ -89,6 +89,7 @@ class IlluminaPostProcessingService:
         sample_metrics: list[IlluminaSampleSequencingMetricsDTO] = (
             metrics_service.create_sample_sequencing_metrics_dto_for_flow_cell(
                 flow_cell_directory=run_directory_data.get_demultiplexed_runs_dir(),
+                directory_index=run_directory_data.demultiplexed_run_files,
             )
         )
         undetermined_metrics: list[IlluminaSampleSequencingMetricsDTO] = (
@@ -100,10 +101,9 @@ class IlluminaPostProcessingService:
                 undetermined_metrics=undetermined_metrics,
             )
         )
-        for sample_metric in combined_metrics:
-            self.status_db.add_illumina_sample_metrics_entry(
-                metrics_dto=sample_metric, sequencing_run=sequencing_run
-            )
+        self.status_db.add_illumina_sample_metrics_entries(
+            metrics_dtos=combined_metrics, sequencing_run=sequencing_run
+        )
         return combined_metrics
 
     def store_sequencing_data_in_status_db(
@@ -2,16 +2,19 @@ from pydantic import BaseModel, Field, field_validator
 
 from cg.constants import Workflow
 from cg.server.dto.orders.orders_request import OrderSortField, SortOrder
+from cg.server.dto.pagination import PageCursor
 
 
 class OrderQueryParams(BaseModel):
     page_size: int | None = Field(default=50)
     page: int | None = Field(default=1)
+    cursor: PageCursor | None = None
     sort_field: str | None = Field(default=OrderSortField.ORDER_DATE)
     sort_order: str | None = Field(default=SortOrder.ASC)
     search: str | None = None
     workflows: list[str] | None = []
     is_open: bool | None = None
+    estimate_total: bool = False
 
     @field_validator("workflows", mode="before")
     def expand_balsamic_workflow(cls, value):
@@ -1,8 +1,10 @@
 from cg.server.dto.orders.orders_request import OrdersRequest
 from cg.server.dto.orders.orders_response import Order, OrdersResponse
+from cg.server.dto.pagination import PageCursor
 from cg.services.orders.order_service.models import OrderQueryParams
 from cg.services.orders.order_summary_service.dto.order_summary import OrderSummary
 from cg.services.orders.order_summary_service.order_summary_service import OrderSummaryService
+from cg.store.base import is_total_estimated
 from cg.store.models import Order as DbOrder
 from cg.store.store import Store
 
@@ -24,7 +26,14 @@ class OrderService:
         if not order_ids:
             return OrdersResponse(orders=[], total_count=0)
         summaries: list[OrderSummary] = self.summary_service.get_summaries(order_ids)
-        return self._create_orders_response(orders=orders, summaries=summaries, total=total_count)
+        response: OrdersResponse = self._create_orders_response(
+            orders=orders, summaries=summaries, total=total_count
+        )
+        response.next_cursor = self._get_next_cursor(orders=orders, params=order_query_params)
+        response.total_is_estimate = is_total_estimated(
+            total=total_count, estimate_total=order_query_params.estimate_total
+        )
+        return response
 
     def set_open(self, order_id: int, open: bool) -> Order:
         order: DbOrder = self.store.update_order_status(order_id=order_id, open=open)
@@ -44,13 +53,24 @@ class OrderService:
         return OrderQueryParams(
             page=orders_request.page,
             page_size=orders_request.page_size,
+            cursor=orders_request.cursor,
             search=orders_request.search,
             is_open=orders_request.is_open,
             sort_field=orders_request.sort_field,
             sort_order=orders_request.sort_order,
             workflows=[orders_request.workflow] if orders_request.workflow else [],
+            estimate_total=orders_request.estimate_total,
         )
 
+    @staticmethod
+    def _get_next_cursor(orders: list[DbOrder], params: OrderQueryParams) -> str | None:
+        """Return the cursor of the next page, if the page is full."""
+        if not params.page_size or len(orders) < params.page_size:
+            return None
+        last_order: DbOrder = orders[-1]
+        value = getattr(last_order, params.sort_field) if params.sort_field else None
+        return PageCursor(sort_field=params.sort_field, value=value, id=last_order.id).encode()
+
     @staticmethod
     def _create_order_response(order: DbOrder, summary: OrderSummary | None = None) -> Order:
         return Order(
@@ -1,7 +1,11 @@
 from cg.apps.tb.api import TrailblazerAPI
 from cg.apps.tb.dto.summary_response import AnalysisSummary
 from cg.services.orders.order_summary_service.dto.order_summary import OrderSummary
-from cg.services.orders.order_summary_service.utils import _get_analysis_map
+from cg.services.orders.order_summary_service.utils import (
+    _get_analysis_map,
+    _get_counted_cases_map,
+)
+from cg.store.api.data_classes import CaseLabStatusCounts
 from cg.store.models import Order
 from cg.store.store import Store
 
@@ -25,39 +29,38 @@ class OrderSummaryService:
     ) -> list[OrderSummary]:
         order_summaries: list[OrderSummary] = []
         analysis_summary_map: dict = _get_analysis_map(analysis_summaries)
+        lab_status_counts: dict[int, CaseLabStatusCounts] = (
+            self.store.get_case_lab_status_counts_by_order(
+                order_ids=[order.id for order in orders],
+                cases_to_exclude=_get_counted_cases_map(analysis_summaries),
+            )
+        )
         for order in orders:
             analysis_summary: AnalysisSummary = analysis_summary_map.get(order.id)
-            order_summary = self.create_order_summary(order=order, summary=analysis_summary)
+            order_summary = self.create_order_summary(
+                order_id=order.id,
+                summary=analysis_summary,
+                lab_status=lab_status_counts[order.id],
+            )
             order_summaries.append(order_summary)
         return order_summaries
 
-    def create_order_summary(self, order: Order, summary: AnalysisSummary) -> OrderSummary:
-        """Adds statuses inferred from StatusDB data for any cases not included in the provided summary."""
-        order_id = order.id
-        counted_cases: list[str] = summary.case_ids if summary else []
-        not_received: int = self.store.get_case_not_received_count(
-            order_id=order_id, cases_to_exclude=counted_cases
-        )
-        in_preparation: int = self.store.get_case_in_preparation_count(
-            order_id=order_id, cases_to_exclude=counted_cases
-        )
-        in_sequencing: int = self.store.get_case_in_sequencing_count(
-            order_id=order_id, cases_to_exclude=counted_cases
-        )
-        failed_sequencing_qc: int = self.store.get_case_failed_sequencing_count(
-            order_id=order_id, cases_to_exclude=counted_cases
-        )
-
+    @staticmethod
+    def create_order_summary(
+        order_id: int, summary: AnalysisSummary, lab_status: CaseLabStatusCounts
+    ) -> OrderSummary:
+        """Combine the analysis summary with statuses inferred from StatusDB data for any cases
+        not included in the provided summary."""
         return OrderSummary(
             order_id=order_id,
-            total=len(order.cases),
+            total=lab_status.total,
             cancelled=summary.cancelled.count,
             completed=summary.completed.count,
             delivered=summary.delivered.count,
             failed=summary.failed.count,
-            failed_sequencing_qc=failed_sequencing_qc,
-            in_lab_preparation=in_preparation,
-            in_sequencing=in_sequencing,
-            not_received=not_received,
+            failed_sequencing_qc=lab_status.failed_sequencing_qc,
+            in_lab_preparation=lab_status.in_preparation,
+            in_sequencing=lab_status.in_sequencing,
+            not_received=lab_status.not_received,
             running=summary.running.count,
         )
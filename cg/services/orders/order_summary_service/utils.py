@@ -3,3 +3,7 @@ from cg.apps.tb.dto.summary_response import AnalysisSummary
 
 def _get_analysis_map(analysis_summaries: list[AnalysisSummary]) -> dict:
     return {summary.order_id: summary for summary in analysis_summaries}
+
+
+def _get_counted_cases_map(analysis_summaries: list[AnalysisSummary]) -> dict[int, list[str]]:
+    return {summary.order_id: summary.case_ids for summary in analysis_summaries}
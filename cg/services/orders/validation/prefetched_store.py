@@ -0,0 +1,166 @@
+from typing import Callable, Generic, TypeVar
+
+from cg.services.orders.validation.models.order import Order
+from cg.services.orders.validation.models.order_with_cases import OrderWithCases
+from cg.services.orders.validation.models.order_with_samples import OrderWithSamples
+from cg.store.models import Application, Bed, Customer, Panel, Sample
+from cg.store.store import Store
+
+Entry = TypeVar("Entry")
+
+
+class PrefetchedEntries(Generic[Entry]):
+    """Entries fetched in bulk, keyed by the identifier they were requested with.
+
+    A bulk query may match entries whose identifier differs from the requested one, for example
+    under a case-insensitive collation. Lookups of identifiers that were not requested, or that
+    could have such a loose match, are then passed on to the database to give the same answer
+    as a single lookup would."""
+
+    def __init__(self, requested: set[str], entries: dict[str, Entry]):
+        self.requested = requested
+        self.entries = entries
+        self.has_loose_matches: bool = not set(entries).issubset(requested)
+
+    def get(self, identifier: str, fetch: Callable[[], Entry | None]) -> Entry | None:
+        if identifier in self.entries:
+            return self.entries[identifier]
+        if identifier in self.requested and not self.has_loose_matches:
+            return None
+        return fetch()
+
+
+class PrefetchedStore(Store):
+    """Store serving the lookups made by the validation rules of an order from entries fetched
+    in bulk up front. All other methods query the database as usual."""
+
+    def __init__(self, store: Store, order: Order):
+        self.session = store.session
+        self.customer_internal_id: str = order.customer
+        self.customer: Customer | None = super().get_customer_by_internal_id(order.customer)
+
+        application_tags: set[str] = set()
+        panel_abbreviations: set[str] = set()
+        sample_internal_ids: set[str] = set()
+        sample_names: set[str] = set()
+        subject_ids: set[str] = set()
+        for sample in _get_samples(order):
+            if sample.is_new:
+                application_tags.add(sample.application)
+                sample_names.add(sample.name)
+                if getattr(sample, "subject_id", None):
+                    subject_ids.add(sample.subject_id)
+            else:
+                sample_internal_ids.add(sample.internal_id)
+        if isinstance(order, OrderWithCases):
+            for case in order.cases:
+                panel_abbreviations.update(getattr(case, "panels", None) or [])
+
+        self.applications = PrefetchedEntries[Application](
+            requested=application_tags,
+            entries={
+                application.tag: application
+                for application in self.get_applications_by_tags(list(application_tags))
+            },
+        )
+        self.panels = PrefetchedEntries[Panel](
+            requested=panel_abbreviations,
+            entries={
+                panel.abbrev: panel
+                for panel in self.get_panels_by_abbreviations(list(panel_abbreviations))
+            },
+        )
+        self.samples = PrefetchedEntries[Sample](
+            requested=sample_internal_ids,
+            entries={
+                sample.internal_id: sample
+                for sample in self.get_samples_by_internal_ids(list(sample_internal_ids))
+            },
+        )
+        customer_samples: list[Sample] = (
+            self.get_samples_by_customer_and_names(
+                customer_entry_id=self.customer.id, sample_names=list(sample_names)
+            )
+            if self.customer and sample_names
+            else []
+        )
+        self.customer_samples_by_name = PrefetchedEntries[Sample](
+            requested=sample_names if self.customer else set(),
+            entries={sample.name: sample for sample in customer_samples},
+        )
+        samples_by_subject_id: dict[str, list[Sample]] = {}
+        if self.customer and subject_ids:
+            for sample in self.get_samples_by_customer_and_subject_ids(
+                customer_entry_id=self.customer.id, subject_ids=list(subject_ids)
+            ):
+                samples_by_subject_id.setdefault(sample.subject_id, []).append(sample)
+        self.customer_samples_by_subject_id = PrefetchedEntries[list[Sample]](
+            requested=subject_ids if self.customer else set(),
+            entries=samples_by_subject_id,
+        )
+        self.active_beds: list[Bed] | None = None
+
+    def get_customer_by_internal_id(self, customer_internal_id: str) -> Customer | None:
+        if customer_internal_id == self.customer_internal_id:
+            return self.customer
+        return super().get_customer_by_internal_id(customer_internal_id)
+
+    def get_application_by_tag(self, tag: str) -> Application | None:
+        return self.applications.get(
+            identifier=tag, fetch=lambda: super(PrefetchedStore, self).get_application_by_tag(tag)
+        )
+
+    def get_active_beds(self) -> list[Bed]:
+        if self.active_beds is None:
+            self.active_beds = super().get_active_beds().all()
+        return self.active_beds
+
+    def get_panel_by_abbreviation(self, abbreviation: str) -> Panel | None:
+        return self.panels.get(
+            identifier=abbreviation,
+            fetch=lambda: super(PrefetchedStore, self).get_panel_by_abbreviation(abbreviation),
+        )
+
+    def get_sample_by_internal_id(self, internal_id: str) -> Sample | None:
+        return self.samples.get(
+            identifier=internal_id,
+            fetch=lambda: super(PrefetchedStore, self).get_sample_by_internal_id(internal_id),
+        )
+
+    def get_sample_by_customer_and_name(
+        self, customer_entry_id: list[int], sample_name: str
+    ) -> Sample | None:
+        if self.customer and customer_entry_id == [self.customer.id]:
+            return self.customer_samples_by_name.get(
+                identifier=sample_name,
+                fetch=lambda: super(PrefetchedStore, self).get_sample_by_customer_and_name(
+                    customer_entry_id=customer_entry_id, sample_name=sample_name
+                ),
+            )
+        return super().get_sample_by_customer_and_name(
+            customer_entry_id=customer_entry_id, sample_name=sample_name
+        )
+
+    def get_samples_by_customer_and_subject_id(
+        self, customer_internal_id: str, subject_id: str
+    ) -> list[Sample]:
+        if customer_internal_id == self.customer_internal_id:
+            samples: list[Sample] | None = self.customer_samples_by_subject_id.get(
+                identifier=subject_id,
+                fetch=lambda: super(PrefetchedStore, self).get_samples_by_customer_and_subject_id(
+                    customer_internal_id=customer_internal_id, subject_id=subject_id
+                ),
+            )
+            return samples or []
+        return super().get_samples_by_customer_and_subject_id(
+            customer_internal_id=customer_internal_id, subject_id=subject_id
+        )
+
+
+def _get_samples(order: Order) -> list:
+    """Return the new and existing samples in the new cases or the samples of the order."""
+    if isinstance(order, OrderWithCases):
+        return [sample for _, case in order.enumerated_new_cases for sample in case.samples]
+    if isinstance(order, OrderWithSamples):
+        return order.samples
+    return []
@@ -15,6 +15,7 @@ from cg.services.orders.validation.order_type_maps import (
     ORDER_TYPE_RULE_SET_MAP,
     RuleSet,
 )
+from cg.services.orders.validation.prefetched_store import PrefetchedStore
 from cg.services.orders.validation.response_mapper import create_order_validation_response
 from cg.services.orders.validation.utils import (
     apply_case_sample_validation,
@@ -66,31 +67,31 @@ class OrderValidationService:
         return errors
 
     def _get_rule_validation_errors(self, order: Order, rule_set: RuleSet) -> ValidationErrors:
-
+        store = PrefetchedStore(store=self.store, order=order)
         case_errors = []
         case_sample_errors = []
         order_errors: list[OrderError] = apply_order_validation(
             rules=rule_set.order_rules,
             order=order,
-            store=self.store,
+            store=store,
         )
         sample_errors = []
         if isinstance(order, OrderWithCases):
             case_errors: list[CaseError] = apply_case_validation(
                 rules=rule_set.case_rules,
                 order=order,
-                store=self.store,
+                store=store,
             )
             case_sample_errors: list[CaseSampleError] = apply_case_sample_validation(
                 rules=rule_set.case_sample_rules,
                 order=order,
-                store=self.store,
+                store=store,
             )
         else:
             sample_errors: list[SampleError] = apply_sample_validation(
                 rules=rule_set.sample_rules,
                 order=order,
-                store=self.store,
+                store=store,
             )
 
         return ValidationErrors(
@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 
 from cg.io.controller import ReadFile
-from cg.utils.files import get_file_in_directory
+from cg.utils.directory_index import DirectoryIndex
 
 LOG = logging.getLogger(__name__)
 
@@ -51,13 +51,12 @@ class ValidateFileTransferService:
         return file_names
 
     @staticmethod
-    def _is_file_in_directory_tree(file_name: str, source_dir: Path) -> bool:
+    def _is_file_in_directory_tree(
+        file_name: str, source_dir: Path, directory_index: DirectoryIndex | None = None
+    ) -> bool:
         """Check if a file is present in the directory tree."""
-        try:
-            if get_file_in_directory(directory=source_dir, file_name=file_name):
-                return True
-        except FileNotFoundError:
-            return False
+        directory_index: DirectoryIndex = directory_index or DirectoryIndex(source_dir)
+        return directory_index.contains(file_name)
 
     def _get_files_in_manifest(self, manifest_file: Path, manifest_file_format: str) -> list[str]:
         """Get the files listed in the manifest file."""
@@ -67,8 +66,11 @@ class ValidateFileTransferService:
         return self._extract_file_names_from_manifest(manifest_content)
 
     def _are_all_files_present(self, files_to_validate: list[str], source_dir: Path) -> bool:
-        """Check if all files are present in the directory tree."""
+        """Check if all files are present in the directory tree, listed once for all files."""
+        directory_index = DirectoryIndex(source_dir)
         for file_name in files_to_validate:
-            if not self._is_file_in_directory_tree(file_name=file_name, source_dir=source_dir):
+            if not self._is_file_in_directory_tree(
+                file_name=file_name, source_dir=source_dir, directory_index=directory_index
+            ):
                 return False
         return True
@@ -1,4 +1,8 @@
-from cg.server.dto.cases.requests import CasesRequest
+from cg.server.dto.cases.requests import CASES_SORT_FIELD, CasesRequest
+from cg.server.dto.cases.responses import CasesResponse
+from cg.server.dto.pagination import PageCursor
+from cg.store.base import is_total_estimated
+from cg.store.loader_profiles import LoaderProfile
 from cg.store.models import Case, Customer
 from cg.store.store import Store
 
@@ -8,13 +12,18 @@ class CaseWebService:
     def __init__(self, store: Store):
         self.store = store
 
-    def get_cases(
-        self, request: CasesRequest, customers: list[Customer] | None
-    ) -> tuple[list[dict], int]:
+    def get_cases(self, request: CasesRequest, customers: list[Customer] | None) -> CasesResponse:
         """Return cases with links for a customer from the database."""
         cases, total = self._get_cases(request=request, customers=customers)
         cases_with_links: list[dict] = [case.to_dict(links=True) for case in cases]
-        return cases_with_links, total
+        return CasesResponse(
+            cases=cases_with_links,
+            total=total,
+            next_cursor=self._get_next_cursor(cases=cases, page_size=request.page_size),
+            total_is_estimate=is_total_estimated(
+                total=total, estimate_total=request.estimate_total
+            ),
+        )
 
     def _get_cases(
         self, request: CasesRequest, customers: list[Customer] | None
@@ -26,4 +35,16 @@ class CaseWebService:
             customers=customers,
             offset=(request.page - 1) * request.page_size,
             limit=request.page_size,
+            loader_profile=LoaderProfile.CASE_WITH_LINKS,
+            cursor=request.cursor,
+            estimate_total=request.estimate_total,
         )
+
+    @staticmethod
+    def _get_next_cursor(cases: list[Case], page_size: int) -> str | None:
+        """Return the cursor of the next page, if the page is full."""
+        if len(cases) < page_size:
+            return None
+        return PageCursor(
+            sort_field=CASES_SORT_FIELD, value=cases[-1].created_at, id=cases[-1].id
+        ).encode()
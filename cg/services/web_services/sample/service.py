@@ -8,6 +8,7 @@ from cg.services.web_services.sample.utils import (
     get_confirmation_message,
     get_start_and_finish_indexes_from_request,
 )
+from cg.store.loader_profiles import LoaderProfile
 from cg.store.models import Customer, Sample, User
 from cg.store.store import Store
 
@@ -52,6 +53,7 @@ class SampleService:
             customers=customers,
             limit=request.page_size,
             offset=(request.page - 1) * request.page_size,
+            loader_profile=LoaderProfile.SAMPLE,
         )
         parsed_samples: list[dict] = [sample.to_dict() for sample in samples]
         return parsed_samples, total
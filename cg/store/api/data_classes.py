@@ -9,3 +9,14 @@ class RNADNACollection:
     rna_sample_id: str
     dna_sample_name: str
     dna_case_ids: list[str]
+
+
+@dataclass
+class CaseLabStatusCounts:
+    """Contains the number of cases in an order in each lab status."""
+
+    total: int = 0
+    not_received: int = 0
+    in_preparation: int = 0
+    in_sequencing: int = 0
+    failed_sequencing_qc: int = 0
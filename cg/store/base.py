@@ -24,6 +24,13 @@ from cg.store.models import (
 
 ModelBase = Base
 
+ESTIMATED_TOTAL_LIMIT: int = 1000
+
+
+def is_total_estimated(total: int, estimate_total: bool) -> bool:
+    """Return whether a total counted with an estimate may be larger than the returned count."""
+    return estimate_total and total >= ESTIMATED_TOTAL_LIMIT
+
 
 class BaseHandler:
 
@@ -34,6 +41,15 @@ class BaseHandler:
         """Return a query for the given table."""
         return self.session.query(table)
 
+    @staticmethod
+    def _get_count(query: Query, estimate: bool = False) -> int:
+        """Return the number of rows of the query. When estimating, counting stops at a limit so
+        that the cost does not grow with the table, and the limit is returned for larger results.
+        """
+        if estimate:
+            return query.limit(ESTIMATED_TOTAL_LIMIT).count()
+        return query.count()
+
     def _get_case_query_for_analysis_start(self) -> Query:
         """Return a query for all cases and joins them with their latest analysis, if present."""
         latest_analysis_subquery: Subquery = (
@@ -77,13 +93,6 @@ class BaseHandler:
         """Return join case sample query."""
         return self._get_query(table=CaseSample).join(CaseSample.case).join(CaseSample.sample)
 
-    def _join_sample_and_case(self):
-        return (
-            self._get_query(Case)
-            .join(CaseSample, Case.id == CaseSample.case_id)
-            .join(Sample, CaseSample.sample_id == Sample.id)
-        )
-
     def _get_join_case_and_sample_query(self) -> Query:
         """Return join case sample query."""
         return self._get_query(table=Case).join(Case.links).join(CaseSample.sample)
@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 
 import petname
-from sqlalchemy import Insert
+from sqlalchemy import Insert, insert
 from sqlalchemy.orm import Session
 
 from cg.constants import DataDelivery, Priority, Workflow
@@ -47,6 +47,7 @@ from cg.store.models import (
     Panel,
     Pool,
     Sample,
+    SampleRunMetrics,
     User,
     order_case,
 )
@@ -464,31 +465,92 @@ class CreateMixin(ReadHandler):
         LOG.debug(f"Sequencing run added to status db: {new_sequencing_run.device.internal_id}.")
         return new_sequencing_run
 
-    def add_illumina_sample_metrics_entry(
-        self, metrics_dto: IlluminaSampleSequencingMetricsDTO, sequencing_run: IlluminaSequencingRun
-    ) -> IlluminaSampleSequencingMetrics:
+    def add_illumina_sample_metrics_entries(
+        self,
+        metrics_dtos: list[IlluminaSampleSequencingMetricsDTO],
+        sequencing_run: IlluminaSequencingRun,
+    ) -> None:
         """
-        Add a new Illumina Sample Sequencing Metrics entry to the status database as a pending
-        transaction.
+        Add Illumina Sample Sequencing Metrics entries to the status database as a pending
+        transaction. The samples are fetched in a single query and the entries inserted in bulk.
         """
-        sample: Sample = self.get_sample_by_internal_id(metrics_dto.sample_id)
-        if not sample:
+        sample_ids: set[str] = {metrics_dto.sample_id for metrics_dto in metrics_dtos}
+        samples: dict[str, Sample] = {
+            sample.internal_id: sample
+            for sample in self.get_samples_by_internal_ids(list(sample_ids))
+        }
+        if missing_sample_ids := sample_ids.difference(samples):
             self.rollback()
-            raise EntryNotFoundError(f"Sample not found: {metrics_dto.sample_id}")
-        new_metric = IlluminaSampleSequencingMetrics(
-            sample=sample,
-            instrument_run=sequencing_run,
-            type=metrics_dto.type,
-            flow_cell_lane=metrics_dto.flow_cell_lane,
-            total_reads_in_lane=metrics_dto.total_reads_in_lane,
-            base_passing_q30_percent=metrics_dto.base_passing_q30_percent,
-            base_mean_quality_score=metrics_dto.base_mean_quality_score,
-            yield_=metrics_dto.yield_,
-            yield_q30=metrics_dto.yield_q30,
-            created_at=metrics_dto.created_at,
+            raise EntryNotFoundError(f"Samples not found: {', '.join(sorted(missing_sample_ids))}")
+        self.session.flush()
+        if metrics_dtos:
+            self._insert_illumina_sample_metrics(
+                metrics_dtos=metrics_dtos, samples=samples, sequencing_run=sequencing_run
+            )
+        for sample in samples.values():
+            self.session.expire(sample, ["_sample_run_metrics"])
+        self.session.expire(sequencing_run, ["sample_metrics"])
+
+    def _insert_illumina_sample_metrics(
+        self,
+        metrics_dtos: list[IlluminaSampleSequencingMetricsDTO],
+        samples: dict[str, Sample],
+        sequencing_run: IlluminaSequencingRun,
+    ) -> None:
+        """Insert the rows of the parent and child metrics tables, with one statement each where the
+        database returns the ids of rows inserted in bulk."""
+        metrics_ids: list[int] = self._insert_sample_run_metrics(
+            [
+                {
+                    "sample_id": samples[metrics_dto.sample_id].id,
+                    "instrument_run_id": sequencing_run.id,
+                    "type": metrics_dto.type,
+                }
+                for metrics_dto in metrics_dtos
+            ]
         )
-        self.add_item_to_store(new_metric)
-        return new_metric
+        self.session.execute(
+            insert(IlluminaSampleSequencingMetrics.__table__),
+            [
+                {
+                    "id": metrics_id,
+                    "flow_cell_lane": metrics_dto.flow_cell_lane,
+                    "total_reads_in_lane": metrics_dto.total_reads_in_lane,
+                    "base_passing_q30_percent": metrics_dto.base_passing_q30_percent,
+                    "base_mean_quality_score": metrics_dto.base_mean_quality_score,
+                    "yield": metrics_dto.yield_,
+                    "yield_q30": metrics_dto.yield_q30,
+                    "created_at": metrics_dto.created_at,
+                }
+                for metrics_id, metrics_dto in zip(metrics_ids, metrics_dtos, strict=True)
+            ],
+        )
+
+    def _insert_sample_run_metrics(self, rows: list[dict]) -> list[int]:
+        """Insert the rows of the parent metrics table and return their ids in the order of the
+        rows. The ids are returned unordered with the inserted values, since returning them in the
+        order of the rows makes SQLAlchemy insert one row per statement, and matched to the rows
+        by their values, as rows with the same values are interchangeable. Databases without
+        RETURNING for bulk inserts, such as MySQL, get one insert per row within the same
+        transaction."""
+        statement: Insert = insert(SampleRunMetrics.__table__)
+        if not self.session.get_bind().dialect.insert_executemany_returning:
+            return [self.session.execute(statement, row).inserted_primary_key[0] for row in rows]
+        table = SampleRunMetrics.__table__
+        ids_by_values: dict[tuple, list[int]] = {}
+        for inserted_row in self.session.execute(
+            statement.returning(
+                table.c.id, table.c.sample_id, table.c.instrument_run_id, table.c.type
+            ),
+            rows,
+        ):
+            ids_by_values.setdefault(
+                (inserted_row.sample_id, inserted_row.instrument_run_id, inserted_row.type), []
+            ).append(inserted_row.id)
+        return [
+            ids_by_values[(row["sample_id"], row["instrument_run_id"], row["type"])].pop()
+            for row in rows
+        ]
 
     def create_pac_bio_smrt_cell(self, run_device_dto: PacBioSMRTCellDTO) -> PacbioSMRTCell:
         LOG.debug(f"Creating Pacbio SMRT cell for {run_device_dto.internal_id}")
@@ -6,10 +6,16 @@ from datetime import datetime
 from typing import Callable, Iterator
 
 import sqlalchemy
+from sqlalchemy import func
 from sqlalchemy.orm import Query
 
 from cg.constants import SequencingRunDataAvailability, Workflow
-from cg.constants.constants import DNA_WORKFLOWS_WITH_SCOUT_UPLOAD, CustomerId, SampleType
+from cg.constants.constants import (
+    DNA_WORKFLOWS_WITH_SCOUT_UPLOAD,
+    CustomerId,
+    SampleType,
+    SequencingQCStatus,
+)
 from cg.constants.priority import SlurmQos
 from cg.constants.sequencing import DNA_PREP_CATEGORIES, SeqLibraryPrepCategory
 from cg.exc import (
@@ -24,9 +30,10 @@ from cg.exc import (
 )
 from cg.models.orders.constants import OrderType
 from cg.models.orders.sample_base import SexEnum
+from cg.server.dto.pagination import PageCursor
 from cg.server.dto.samples.requests import CollaboratorSamplesRequest
 from cg.services.orders.order_service.models import OrderQueryParams
-from cg.store.api.data_classes import RNADNACollection
+from cg.store.api.data_classes import CaseLabStatusCounts, RNADNACollection
 from cg.store.base import BaseHandler
 from cg.store.exc import EntryNotFoundError
 from cg.store.filters.status_analysis_filters import AnalysisFilter, apply_analysis_filter
@@ -75,6 +82,7 @@ from cg.store.filters.status_panel_filters import PanelFilter, apply_panel_filte
 from cg.store.filters.status_pool_filters import PoolFilter, apply_pool_filter
 from cg.store.filters.status_sample_filters import SampleFilter, apply_sample_filter
 from cg.store.filters.status_user_filters import UserFilter, apply_user_filter
+from cg.store.loader_profiles import LoaderProfile, apply_loader_profile
 from cg.store.models import (
     Analysis,
     Application,
@@ -103,7 +111,9 @@ from cg.store.models import (
     Sample,
     SampleRunMetrics,
     User,
+    order_case,
 )
+from cg.store.reference_cache import reference_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -235,11 +245,14 @@ class ReadHandler(BaseHandler):
         case_search: str | None,
         limit: int = 50,
         offset: int = 0,
+        loader_profile: LoaderProfile | None = None,
+        cursor: PageCursor | None = None,
+        estimate_total: bool = False,
     ) -> tuple[list[Case], int]:
         """
         Return cases by customers, action, and matching names or internal ids, plus the total
-        number of cases matching the filter criteria. A limit and offset can be applied to the
-        query for pagination purposes.
+        number of cases matching the filter criteria. A limit and offset, or a cursor, can be
+        applied to the query for pagination purposes.
 
         Args:
             customers (list[Customer] | None): A list of customer objects to filter cases by.
@@ -247,6 +260,9 @@ class ReadHandler(BaseHandler):
             case_search (str | None): The case search string to filter cases by.
             limit (int | None, default=50): The maximum number of cases to return.
             offset (int, default=0): The offset number of cases for the query.
+            loader_profile (LoaderProfile | None): Relationships to eagerly load for the cases.
+            cursor (PageCursor | None): Return the cases after the cursor instead of the offset.
+            estimate_total (bool, default=False): Stop counting the total at a limit.
         Returns:
             list[Case]: A list of filtered cases sorted by creation time and truncated
                         by the limit parameter.
@@ -270,8 +286,16 @@ class ReadHandler(BaseHandler):
             case_search=case_search,
             customer_entry_ids=customer_entry_ids,
         )
-        total: int = filtered_cases.count()
-        return filtered_cases.offset(offset).limit(limit=limit).all(), total
+        total: int = self._get_count(query=filtered_cases, estimate=estimate_total)
+        if cursor:
+            page: Query = apply_case_filter(
+                cases=filtered_cases,
+                filter_functions=[CaseFilter.CREATED_BEFORE_CURSOR],
+                cursor=cursor,
+            ).limit(limit=limit)
+        else:
+            page: Query = filtered_cases.offset(offset).limit(limit=limit)
+        return apply_loader_profile(query=page, profile=loader_profile).all(), total
 
     def get_cases_by_customer_workflow_and_case_search(
         self,
@@ -403,6 +427,17 @@ class ReadHandler(BaseHandler):
             name=sample_name,
         ).first()
 
+    def get_samples_by_customer_and_names(
+        self, customer_entry_id: int, sample_names: list[str]
+    ) -> list[Sample]:
+        """Return the samples of a customer with any of the given names."""
+        return apply_sample_filter(
+            samples=self._get_query(table=Sample),
+            filter_functions=[SampleFilter.BY_CUSTOMER_ENTRY_IDS, SampleFilter.BY_SAMPLE_NAMES],
+            customer_entry_ids=[customer_entry_id],
+            names=sample_names,
+        ).all()
+
     def get_illumina_metrics_entry_by_device_sample_and_lane(
         self, device_internal_id: str, sample_internal_id: str, lane: int
     ) -> IlluminaSampleSequencingMetrics:
@@ -628,6 +663,7 @@ class ReadHandler(BaseHandler):
         pattern: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        loader_profile: LoaderProfile | None = None,
     ) -> tuple[list[Sample], int]:
         """
         Return the samples by customer and internal id or name pattern, plus the total number of
@@ -639,6 +675,7 @@ class ReadHandler(BaseHandler):
             pattern (str | None): The sample internal id or name pattern to search for.
             limit (int | None, default=50): The maximum number of samples to return.
             offset (int, default=0): The offset number of samples for the query.
+            loader_profile (LoaderProfile | None): Relationships to eagerly load for the samples.
         Returns:
             list[Sample]: A list of filtered samples truncated by the limit parameter.
             int: The total number of samples returned before truncation.
@@ -659,7 +696,8 @@ class ReadHandler(BaseHandler):
             filter_functions=filter_functions,
         )
         total: int = samples.count()
-        return samples.offset(offset).limit(limit).all(), total
+        page: Query = samples.offset(offset).limit(limit)
+        return apply_loader_profile(query=page, profile=loader_profile).all(), total
 
     def get_collaborator_samples(self, request: CollaboratorSamplesRequest) -> list[Sample]:
         customer: Customer | None = self.get_customer_by_internal_id(request.customer)
@@ -710,6 +748,17 @@ class ReadHandler(BaseHandler):
             customer_internal_id=customer_internal_id, subject_id=subject_id
         ).all()
 
+    def get_samples_by_customer_and_subject_ids(
+        self, customer_entry_id: int, subject_ids: list[str]
+    ) -> list[Sample]:
+        """Return the samples of a customer with any of the given subject ids."""
+        return apply_sample_filter(
+            samples=self._get_query(table=Sample),
+            filter_functions=[SampleFilter.BY_CUSTOMER_ENTRY_IDS, SampleFilter.BY_SUBJECT_IDS],
+            customer_entry_ids=[customer_entry_id],
+            subject_ids=subject_ids,
+        ).all()
+
     def get_samples_by_any_id(self, **identifiers: dict) -> Query:
         """Return a sample query filtered by the given names and values of Sample attributes."""
         samples: Query = self._get_query(table=Sample).order_by(Sample.internal_id.desc())
@@ -839,11 +888,24 @@ class ReadHandler(BaseHandler):
 
     def get_application_by_tag(self, tag: str) -> Application | None:
         """Return an application by tag."""
+        return reference_cache.get_or_fetch(
+            model=Application,
+            identifier=tag,
+            session=self.session,
+            fetch=lambda: apply_application_filter(
+                applications=self._get_query(table=Application),
+                filter_functions=[ApplicationFilter.BY_TAG],
+                tag=tag,
+            ).first(),
+        )
+
+    def get_applications_by_tags(self, tags: list[str]) -> list[Application]:
+        """Return the applications with any of the given tags."""
         return apply_application_filter(
             applications=self._get_query(table=Application),
-            filter_functions=[ApplicationFilter.BY_TAG],
-            tag=tag,
-        ).first()
+            filter_functions=[ApplicationFilter.BY_TAGS],
+            tags=tags,
+        ).all()
 
     def get_applications_is_not_archived(self) -> list[Application]:
         """Return applications that are not archived."""
@@ -925,11 +987,16 @@ class ReadHandler(BaseHandler):
 
     def get_bed_version_by_short_name(self, bed_version_short_name: str) -> BedVersion:
         """Return bed version with short name."""
-        return apply_bed_version_filter(
-            bed_versions=self._get_query(table=BedVersion),
-            bed_version_short_name=bed_version_short_name,
-            filter_functions=[BedVersionFilter.BY_SHORT_NAME],
-        ).first()
+        return reference_cache.get_or_fetch(
+            model=BedVersion,
+            identifier=bed_version_short_name,
+            session=self.session,
+            fetch=lambda: apply_bed_version_filter(
+                bed_versions=self._get_query(table=BedVersion),
+                bed_version_short_name=bed_version_short_name,
+                filter_functions=[BedVersionFilter.BY_SHORT_NAME],
+            ).first(),
+        )
 
     def get_bed_version_by_short_name_strict(self, short_name: str) -> BedVersion:
         """
@@ -978,11 +1045,16 @@ class ReadHandler(BaseHandler):
 
     def get_customer_by_internal_id(self, customer_internal_id: str) -> Customer:
         """Return customer with customer id."""
-        return apply_customer_filter(
-            filter_functions=[CustomerFilter.BY_INTERNAL_ID],
-            customers=self._get_query(table=Customer),
-            customer_internal_id=customer_internal_id,
-        ).first()
+        return reference_cache.get_or_fetch(
+            model=Customer,
+            identifier=customer_internal_id,
+            session=self.session,
+            fetch=lambda: apply_customer_filter(
+                filter_functions=[CustomerFilter.BY_INTERNAL_ID],
+                customers=self._get_query(table=Customer),
+                customer_internal_id=customer_internal_id,
+            ).first(),
+        )
 
     def get_collaboration_by_internal_id(self, internal_id: str) -> Collaboration:
         """Fetch a customer group by internal id from the store."""
@@ -994,11 +1066,16 @@ class ReadHandler(BaseHandler):
 
     def get_organism_by_internal_id(self, internal_id: str) -> Organism:
         """Find an organism by internal id."""
-        return apply_organism_filter(
-            organisms=self._get_query(table=Organism),
-            filter_functions=[OrganismFilter.BY_INTERNAL_ID],
-            internal_id=internal_id,
-        ).first()
+        return reference_cache.get_or_fetch(
+            model=Organism,
+            identifier=internal_id,
+            session=self.session,
+            fetch=lambda: apply_organism_filter(
+                organisms=self._get_query(table=Organism),
+                filter_functions=[OrganismFilter.BY_INTERNAL_ID],
+                internal_id=internal_id,
+            ).first(),
+        )
 
     def get_all_organisms(self) -> Query[Organism]:
         """Return all organisms ordered by organism internal id."""
@@ -1010,11 +1087,24 @@ class ReadHandler(BaseHandler):
 
     def get_panel_by_abbreviation(self, abbreviation: str) -> Panel:
         """Return a panel by abbreviation."""
+        return reference_cache.get_or_fetch(
+            model=Panel,
+            identifier=abbreviation,
+            session=self.session,
+            fetch=lambda: apply_panel_filter(
+                panels=self._get_query(table=Panel),
+                filters=[PanelFilter.BY_ABBREVIATION],
+                abbreviation=abbreviation,
+            ).first(),
+        )
+
+    def get_panels_by_abbreviations(self, abbreviations: list[str]) -> list[Panel]:
+        """Return the panels with any of the given abbreviations."""
         return apply_panel_filter(
             panels=self._get_query(table=Panel),
-            filters=[PanelFilter.BY_ABBREVIATION],
-            abbreviation=abbreviation,
-        ).first()
+            filters=[PanelFilter.BY_ABBREVIATIONS],
+            abbreviations=abbreviations,
+        ).all()
 
     def get_panels(self) -> list[Panel]:
         """Returns all panels."""
@@ -1166,6 +1256,16 @@ class ReadHandler(BaseHandler):
             internal_id=internal_id,
         ).first()
 
+    def get_samples_by_internal_ids(self, internal_ids: list[str]) -> list[Sample]:
+        """Return the samples with any of the given internal ids."""
+        if not internal_ids:
+            return []
+        return apply_sample_filter(
+            filter_functions=[SampleFilter.BY_INTERNAL_IDS],
+            samples=self._get_query(table=Sample),
+            internal_ids=internal_ids,
+        ).all()
+
     def get_sample_by_internal_id_strict(self, internal_id: str) -> Sample:
         """
         Return a sample by lims id.
@@ -1456,7 +1556,7 @@ class ReadHandler(BaseHandler):
             search=orders_params.search,
             is_open=orders_params.is_open,
         )
-        total_count: int = orders.count()
+        total_count: int = self._get_count(query=orders, estimate=orders_params.estimate_total)
         orders: list[Order] = self.sort_and_paginate_orders(
             orders=orders, orders_params=orders_params
         )
@@ -1465,13 +1565,18 @@ class ReadHandler(BaseHandler):
     def sort_and_paginate_orders(
         self, orders: Query, orders_params: OrderQueryParams
     ) -> list[Order]:
+        """Return a page of sorted orders, after the cursor if given or by page number otherwise."""
+        pagination: OrderFilter = (
+            OrderFilter.PAGINATE_AFTER_CURSOR if orders_params.cursor else OrderFilter.PAGINATE
+        )
         return apply_order_filters(
             orders=orders,
-            filters=[OrderFilter.SORT, OrderFilter.PAGINATE],
+            filters=[OrderFilter.SORT, pagination],
             sort_field=orders_params.sort_field,
             sort_order=orders_params.sort_order,
             page=orders_params.page,
             page_size=orders_params.page_size,
+            cursor=orders_params.cursor,
         ).all()
 
     def get_orders_by_ids(self, order_ids: list[int]) -> list[Order]:
@@ -1502,67 +1607,47 @@ class ReadHandler(BaseHandler):
         )
         return orders.first()
 
-    def get_case_not_received_count(self, order_id: int, cases_to_exclude: list[str]) -> int:
-        filters: list[CaseSampleFilter] = [
-            CaseSampleFilter.BY_ORDER,
-            CaseSampleFilter.CASES_WITH_SAMPLES_NOT_RECEIVED,
-            CaseSampleFilter.EXCLUDE_CASES,
-        ]
-        case_samples: Query = self._join_sample_and_case()
-        return apply_case_sample_filter(
-            case_samples=case_samples,
-            filter_functions=filters,
-            order_id=order_id,
-            cases_to_exclude=cases_to_exclude,
-        ).count()
-
-    def get_case_in_preparation_count(self, order_id: int, cases_to_exclude: list[str]) -> int:
-        filters: list[CaseFilter] = [
-            CaseSampleFilter.BY_ORDER,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_RECEIVED,
-            CaseSampleFilter.CASES_WITH_SAMPLES_NOT_PREPARED,
-            CaseSampleFilter.EXCLUDE_CASES,
-        ]
-        case_samples: Query = self._join_sample_and_case()
-        return apply_case_sample_filter(
-            case_samples=case_samples,
-            filter_functions=filters,
-            order_id=order_id,
-            cases_to_exclude=cases_to_exclude,
-        ).count()
-
-    def get_case_in_sequencing_count(self, order_id: int, cases_to_exclude: list[str]) -> int:
-        filters: list[CaseSampleFilter] = [
-            CaseSampleFilter.BY_ORDER,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_RECEIVED,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_PREPARED,
-            CaseSampleFilter.CASES_WITH_SAMPLES_NOT_SEQUENCED,
-            CaseSampleFilter.EXCLUDE_CASES,
-        ]
-        case_samples: Query = self._join_sample_and_case()
-        return apply_case_sample_filter(
-            case_samples=case_samples,
-            filter_functions=filters,
-            order_id=order_id,
-            cases_to_exclude=cases_to_exclude,
-        ).count()
-
-    def get_case_failed_sequencing_count(self, order_id: int, cases_to_exclude: list[str]) -> int:
-        filters: list[CaseSampleFilter] = [
-            CaseSampleFilter.BY_ORDER,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_RECEIVED,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_PREPARED,
-            CaseSampleFilter.CASES_WITH_ALL_SAMPLES_SEQUENCED,
-            CaseSampleFilter.CASES_FAILED_SEQUENCING_QC,
-            CaseSampleFilter.EXCLUDE_CASES,
-        ]
-        case_samples: Query = self._join_sample_and_case()
-        return apply_case_sample_filter(
-            case_samples=case_samples,
-            filter_functions=filters,
-            order_id=order_id,
-            cases_to_exclude=cases_to_exclude,
-        ).count()
+    def get_case_lab_status_counts_by_order(
+        self, order_ids: list[int], cases_to_exclude: dict[int, list[str]]
+    ) -> dict[int, CaseLabStatusCounts]:
+        """Return the number of cases in each lab status for the given orders.
+        The per-case sample statuses for all orders are fetched in a single grouped query.
+        Cases listed in cases_to_exclude for an order are counted in the total only."""
+        case_statuses: Query = (
+            self.session.query(
+                order_case.c.order_id,
+                Case.internal_id,
+                Case.aggregated_sequencing_qc,
+                func.count(Sample.id).label("samples"),
+                func.count(Sample.received_at).label("received"),
+                func.count(Sample.prepared_at).label("prepared"),
+                func.count(Sample.last_sequenced_at).label("sequenced"),
+            )
+            .join(Case, order_case.c.case_id == Case.id)
+            .outerjoin(CaseSample, CaseSample.case_id == Case.id)
+            .outerjoin(Sample, CaseSample.sample_id == Sample.id)
+            .filter(order_case.c.order_id.in_(order_ids))
+            .group_by(order_case.c.order_id, Case.id)
+        )
+        counts: dict[int, CaseLabStatusCounts] = {
+            order_id: CaseLabStatusCounts() for order_id in order_ids
+        }
+        for status in case_statuses:
+            order_counts: CaseLabStatusCounts = counts[status.order_id]
+            order_counts.total += 1
+            if not status.samples or status.internal_id in cases_to_exclude.get(
+                status.order_id, []
+            ):
+                continue
+            if status.received < status.samples:
+                order_counts.not_received += 1
+            elif status.prepared < status.samples:
+                order_counts.in_preparation += 1
+            elif status.sequenced < status.samples:
+                order_counts.in_sequencing += 1
+            elif status.aggregated_sequencing_qc == SequencingQCStatus.FAILED:
+                order_counts.failed_sequencing_qc += 1
+        return counts
 
     def get_illumina_flow_cell_by_internal_id(self, internal_id: str) -> IlluminaFlowCell:
         """Return a flow cell by internal id."""
@@ -1,22 +1,157 @@
-from sqlalchemy import create_engine, inspect
+import logging
+import os
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Iterator
+
+from pydantic import BaseModel
+from sqlalchemy import Select, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import NullPool, Pool, QueuePool
 
 from cg.exc import CgError
+from cg.store.instrumentation import instrument_engine
 from cg.store.models import Base
+from cg.store.reference_cache import reference_cache, register_cache_invalidation
+from cg.store.search_index import register_search_index_maintenance
+
+LOG = logging.getLogger(__name__)
 
 SESSION: scoped_session | None = None
 ENGINE: Engine | None = None
+READ_REPLICA_ENGINE: Engine | None = None
+HAS_WRITTEN_KEY: str = "has_written"
+READ_FROM_REPLICA_KEY: str = "read_from_replica"
+
+
+class PoolClass(StrEnum):
+    """Connection pool implementations. A null pool opens a connection per checkout, which
+    suits short-lived commands."""
+
+    NULL = "null"
+    QUEUE = "queue"
+
+
+class DatabasePoolSettings(BaseModel):
+    """Connection pool settings of the status db engines. Unset values use the defaults of
+    SQLAlchemy."""
+
+    pool_class: PoolClass | None = None
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_recycle: int | None = None
+    pool_timeout: float | None = None
+    pool_pre_ping: bool = True
+
+    def get_engine_arguments(self) -> dict:
+        arguments: dict = self.model_dump(exclude={"pool_class"}, exclude_none=True)
+        if self.pool_class:
+            arguments["poolclass"] = {PoolClass.NULL: NullPool, PoolClass.QUEUE: QueuePool}[
+                self.pool_class
+            ]
+        return arguments
+
+
+class RoutingSession(Session):
+    """Session sending the reads to a read replica within read_from_replica blocks, until the
+    session writes. After a write, all statements of the session go to the primary database to see
+    its own writes, also in later transactions, since the replica may lag behind."""
+
+    def __init__(self, read_replica: Engine, **kwargs):
+        super().__init__(**kwargs)
+        self.read_replica = read_replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._is_replica_read(clause):
+            return self.read_replica
+        if clause is not None and not isinstance(clause, Select):
+            self.info[HAS_WRITTEN_KEY] = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def _is_replica_read(self, clause) -> bool:
+        return (
+            self.info.get(READ_FROM_REPLICA_KEY)
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not self._flushing
+            and not self.info.get(HAS_WRITTEN_KEY)
+            and not (self.new or self.dirty or self.deleted)
+        )
+
+
+def _mark_as_written(session: Session, _flush_context) -> None:
+    session.info[HAS_WRITTEN_KEY] = True
+
+
+def _log_pool_settings(engine: Engine, name: str) -> None:
+    pool: Pool = engine.pool
+    settings: str = f"{type(pool).__name__}, pre-ping {pool._pre_ping}, recycle {pool._recycle} s"
+    if isinstance(pool, QueuePool):
+        settings += (
+            f", size {pool.size()}, max overflow {pool._max_overflow}, timeout {pool._timeout} s"
+        )
+    LOG.info(f"{name} {engine.url.render_as_string(hide_password=True)}: {settings}")
+
+
+def _create_engine(
+    db_uri: str, pool_settings: DatabasePoolSettings, instrument_queries: bool, name: str
+) -> Engine:
+    engine: Engine = create_engine(db_uri, **pool_settings.get_engine_arguments())
+    if instrument_queries:
+        instrument_engine(engine)
+    _log_pool_settings(engine=engine, name=name)
+    return engine
+
+
+def initialize_database(
+    db_uri: str,
+    instrument_queries: bool = False,
+    pool_settings: DatabasePoolSettings | None = None,
+    read_replica_uri: str | None = None,
+) -> None:
+    """Initialize the SQLAlchemy engine and session for status db.
+    Optionally time the executed statements, see cg.store.instrumentation. Entries of the reference
+    tables cached for a previous database are dropped, see cg.store.reference_cache. Given a read
+    replica, sessions read from it within read_from_replica blocks, see RoutingSession."""
+    global SESSION, ENGINE, READ_REPLICA_ENGINE
+
+    pool_settings = pool_settings or DatabasePoolSettings()
+    ENGINE = _create_engine(
+        db_uri=db_uri,
+        pool_settings=pool_settings,
+        instrument_queries=instrument_queries,
+        name="Status db",
+    )
+    READ_REPLICA_ENGINE = None
+    session_factory = sessionmaker(ENGINE)
+    if read_replica_uri:
+        READ_REPLICA_ENGINE = _create_engine(
+            db_uri=read_replica_uri,
+            pool_settings=pool_settings,
+            instrument_queries=instrument_queries,
+            name="Status db read replica",
+        )
+        session_factory = sessionmaker(
+            ENGINE, class_=RoutingSession, read_replica=READ_REPLICA_ENGINE
+        )
+        event.listen(session_factory, "after_flush", _mark_as_written)
+    register_cache_invalidation(session_factory)
+    register_search_index_maintenance(session_factory)
+    reference_cache.clear()
+    SESSION = scoped_session(session_factory)
 
 
-def initialize_database(db_uri: str) -> None:
-    """Initialize the SQLAlchemy engine and session for status db."""
-    global SESSION, ENGINE
+def _dispose_pools_in_child_process() -> None:
+    """Drop the connections inherited from the parent process without closing them, so that
+    a forked process, such as a gunicorn worker, opens its own."""
+    for engine in (ENGINE, READ_REPLICA_ENGINE):
+        if engine:
+            engine.dispose(close=False)
 
-    ENGINE = create_engine(db_uri, pool_pre_ping=True)
-    session_factory = sessionmaker(ENGINE)
-    SESSION = scoped_session(session_factory)
+
+os.register_at_fork(after_in_child=_dispose_pools_in_child_process)
 
 
 def get_session() -> Session:
@@ -38,6 +173,19 @@ def get_engine() -> Engine:
     return ENGINE
 
 
+@contextmanager
+def read_from_replica() -> Iterator[None]:
+    """Send the reads of the current session within the block to the read replica, if any, until
+    the session writes. Use as a decorator of read-only endpoints, which tolerate the lag of the
+    replica."""
+    session: Session = get_session()
+    session.info[READ_FROM_REPLICA_KEY] = True
+    try:
+        yield
+    finally:
+        session.info.pop(READ_FROM_REPLICA_KEY, None)
+
+
 def create_all_tables() -> None:
     """Create all tables in status db."""
     session: Session = get_session()
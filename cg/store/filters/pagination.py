@@ -0,0 +1,27 @@
+"""Filters for keyset pagination shared by the tables that are paginated by cursor."""
+
+from sqlalchemy import ColumnElement, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from cg.server.dto.pagination import PageCursor
+
+
+def get_after_cursor_clause(
+    column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: PageCursor,
+    is_ascending: bool,
+) -> ColumnElement[bool]:
+    """
+    Return the clause selecting the entries after the cursor when sorted by the column and id.
+    Entries with a NULL value in the column are sorted before all other values, as in MySQL and
+    SQLite, and are paginated by id.
+    """
+    is_after_id = id_column > cursor.id if is_ascending else id_column < cursor.id
+    if cursor.value is None:
+        if is_ascending:
+            return or_(column.is_not(None), and_(column.is_(None), is_after_id))
+        return and_(column.is_(None), is_after_id)
+    if is_ascending:
+        return or_(column > cursor.value, and_(column == cursor.value, is_after_id))
+    return or_(column < cursor.value, column.is_(None), and_(column == cursor.value, is_after_id))
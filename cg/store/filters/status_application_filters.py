@@ -12,6 +12,11 @@ def filter_applications_by_tag(applications: Query, tag: str, **kwargs) -> Query
     return applications.filter(Application.tag == tag)
 
 
+def filter_applications_by_tags(applications: Query, tags: list[str], **kwargs) -> Query:
+    """Return applications by tags."""
+    return applications.filter(Application.tag.in_(tags))
+
+
 def filter_applications_is_not_archived(applications: Query, **kwargs) -> Query:
     """Return application which is not archived."""
     return applications.filter(Application.is_archived.is_(False))
@@ -42,6 +47,7 @@ def apply_application_filter(
     filter_functions: list[Callable],
     applications: Query,
     tag: str = None,
+    tags: list[str] = None,
     prep_categories: list[SeqLibraryPrepCategory] = None,
 ) -> Query:
     """Apply filtering functions to the sample queries and return filtered results."""
@@ -50,6 +56,7 @@ def apply_application_filter(
         applications: Query = filter_function(
             applications=applications,
             tag=tag,
+            tags=tags,
             prep_categories=prep_categories,
         )
     return applications
@@ -62,5 +69,6 @@ class ApplicationFilter(Enum):
     IS_EXTERNAL = filter_applications_is_external
     IS_NOT_EXTERNAL = filter_applications_is_not_external
     BY_TAG = filter_applications_by_tag
+    BY_TAGS = filter_applications_by_tags
     IS_NOT_ARCHIVED = filter_applications_is_not_archived
     BY_PREP_CATEGORIES = filter_application_by_prep_categories
@@ -6,13 +6,22 @@ from sqlalchemy import and_, not_, or_
 from sqlalchemy.orm import Query
 
 from cg.constants import REPORT_SUPPORTED_DATA_DELIVERY
-from cg.constants.constants import CaseActions, DataDelivery, SequencingQCStatus, Workflow
+from cg.constants.constants import (
+    CaseActions,
+    DataDelivery,
+    SearchEntity,
+    SequencingQCStatus,
+    Workflow,
+)
 from cg.constants.observations import (
     LOQUSDB_CANCER_SEQUENCING_METHODS,
     LOQUSDB_RARE_DISEASE_SEQUENCING_METHODS,
     LOQUSDB_SUPPORTED_WORKFLOWS,
 )
+from cg.server.dto.pagination import PageCursor
+from cg.store.filters.pagination import get_after_cursor_clause
 from cg.store.models import Analysis, Application, Case, Customer, Sample
+from cg.store.search_index import filter_by_search_index
 
 
 def filter_cases_by_action(cases: Query, action: str, **kwargs) -> Query:
@@ -22,15 +31,16 @@ def filter_cases_by_action(cases: Query, action: str, **kwargs) -> Query:
 
 def filter_cases_by_case_search(cases: Query, case_search: str, **kwargs) -> Query:
     """Filter cases with matching internal id or name."""
-    return (
-        cases.filter(
-            or_(
-                Case.internal_id.contains(case_search),
-                Case.name.contains(case_search),
-            )
+    if not case_search:
+        return cases
+    cases = filter_by_search_index(
+        query=cases, entity_id=Case.id, entity=SearchEntity.CASE, search=case_search
+    )
+    return cases.filter(
+        or_(
+            Case.internal_id.contains(case_search),
+            Case.name.contains(case_search),
         )
-        if case_search
-        else cases
     )
 
 
@@ -63,6 +73,9 @@ def filter_cases_by_internal_ids(cases: Query, internal_ids: list[str], **kwargs
 
 def filter_cases_by_internal_id_search(cases: Query, internal_id_search: str, **kwargs) -> Query:
     """Filter cases with internal ids matching the search pattern."""
+    cases = filter_by_search_index(
+        query=cases, entity_id=Case.id, entity=SearchEntity.CASE, search=internal_id_search
+    )
     return cases.filter(Case.internal_id.contains(internal_id_search))
 
 
@@ -73,6 +86,9 @@ def filter_cases_by_name(cases: Query, name: str, **kwargs) -> Query:
 
 def filter_cases_by_name_search(cases: Query, name_search: str, **kwargs) -> Query:
     """Filter cases with names matching the search pattern."""
+    cases = filter_by_search_index(
+        query=cases, entity_id=Case.id, entity=SearchEntity.CASE, search=name_search
+    )
     return cases.filter(Case.name.contains(name_search))
 
 
@@ -211,8 +227,17 @@ def filter_compressible_cases(cases: Query, **kwargs) -> Query:
 
 
 def order_cases_by_created_at(cases: Query, **kwargs) -> Query:
-    """Order cases by created at."""
-    return cases.order_by(Case.created_at.desc())
+    """Order cases by created at, newest first."""
+    return cases.order_by(Case.created_at.desc(), Case.id.desc())
+
+
+def filter_cases_created_before_cursor(cases: Query, cursor: PageCursor, **kwargs) -> Query:
+    """Return the cases following the cursor when ordered by created at, newest first."""
+    return cases.filter(
+        get_after_cursor_clause(
+            column=Case.created_at, id_column=Case.id, cursor=cursor, is_ascending=False
+        )
+    )
 
 
 def filter_cases_pending_or_failed_sequencing_qc(cases: Query, **kwargs) -> Query:
@@ -236,6 +261,7 @@ def apply_case_filter(
     action: str | None = None,
     case_search: str | None = None,
     creation_date: datetime | None = None,
+    cursor: PageCursor | None = None,
     customer_entry_id: int | None = None,
     customer_entry_ids: list[int] | None = None,
     entry_id: int | None = None,
@@ -259,6 +285,7 @@ def apply_case_filter(
             case_search=case_search,
             cases=cases,
             creation_date=creation_date,
+            cursor=cursor,
             customer_entry_id=customer_entry_id,
             customer_entry_ids=customer_entry_ids,
             entry_id=entry_id,
@@ -310,5 +337,6 @@ class CaseFilter(Enum):
     WITH_WORKFLOW: Callable = filter_cases_with_workflow
     WITH_SCOUT_DELIVERY: Callable = filter_cases_with_scout_data_delivery
     ORDER_BY_CREATED_AT: Callable = order_cases_by_created_at
+    CREATED_BEFORE_CURSOR: Callable = filter_cases_created_before_cursor
     PENDING_OR_FAILED_SEQUENCING_QC: Callable = filter_cases_pending_or_failed_sequencing_qc
     PASSING_SEQUENCING_QC: Callable = filter_cases_passing_sequencing_qc
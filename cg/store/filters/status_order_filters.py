@@ -6,6 +6,8 @@ from sqlalchemy.orm import Query
 
 from cg.constants import Workflow
 from cg.server.dto.orders.orders_request import OrderSortField, SortOrder
+from cg.server.dto.pagination import PageCursor
+from cg.store.filters.pagination import get_after_cursor_clause
 from cg.store.models import Customer, Order
 
 
@@ -21,6 +23,38 @@ def apply_pagination(orders: Query, page: int | None, page_size: int | None, **k
     return orders.limit(page_size).offset((page - 1) * page_size) if page and page_size else orders
 
 
+def apply_keyset_pagination(
+    orders: Query,
+    cursor: PageCursor | None,
+    page_size: int | None,
+    sort_field: OrderSortField | None,
+    sort_order: SortOrder | None,
+    **kwargs,
+) -> Query:
+    """Return the orders sorted after the cursor, limited to the page size."""
+    if cursor:
+        orders = orders.filter(
+            _get_orders_after_cursor_clause(
+                cursor=cursor, sort_field=sort_field, sort_order=sort_order
+            )
+        )
+    return orders.limit(page_size) if page_size else orders
+
+
+def _get_orders_after_cursor_clause(
+    cursor: PageCursor, sort_field: OrderSortField | None, sort_order: SortOrder | None
+):
+    is_ascending: bool = sort_order == SortOrder.ASC
+    if not sort_field or sort_field == OrderSortField.ID:
+        return Order.id > cursor.id if is_ascending else Order.id < cursor.id
+    return get_after_cursor_clause(
+        column=getattr(Order, sort_field),
+        id_column=Order.id,
+        cursor=cursor,
+        is_ascending=is_ascending,
+    )
+
+
 def filter_orders_by_ticket_id(orders: Query, ticket_id: int | None, **kwargs) -> Query:
     return orders.filter(Order.ticket_id == ticket_id) if ticket_id else orders
 
@@ -49,8 +83,8 @@ def apply_sorting(
     if sort_field:
         column = getattr(Order, sort_field)
         if sort_order == "asc":
-            return orders.order_by(asc(column))
-        return orders.order_by(desc(column))
+            return orders.order_by(asc(column), asc(Order.id))
+        return orders.order_by(desc(column), desc(Order.id))
     return orders
 
 
@@ -61,6 +95,7 @@ class OrderFilter(Enum):
     BY_TICKET_ID: Callable = filter_orders_by_ticket_id
     BY_OPEN: Callable = filter_orders_by_is_open
     PAGINATE: Callable = apply_pagination
+    PAGINATE_AFTER_CURSOR: Callable = apply_keyset_pagination
     SORT: Callable = apply_sorting
 
 
@@ -72,6 +107,7 @@ def apply_order_filters(
     ticket_id: int = None,
     page: int = None,
     page_size: int = None,
+    cursor: PageCursor = None,
     sort_field: OrderSortField = None,
     sort_order: SortOrder = None,
     search: str = None,
@@ -84,6 +120,7 @@ def apply_order_filters(
             ids=ids,
             page=page,
             page_size=page_size,
+            cursor=cursor,
             ticket_id=ticket_id,
             sort_field=sort_field,
             sort_order=sort_order,
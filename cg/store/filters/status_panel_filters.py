@@ -11,21 +11,29 @@ def filter_panel_by_abbrev(panels: Query, abbreviation: str, **kwargs) -> Query:
     return panels.filter(Panel.abbrev == abbreviation)
 
 
+def filter_panels_by_abbreviations(panels: Query, abbreviations: list[str], **kwargs) -> Query:
+    """Return panels by abbreviations."""
+    return panels.filter(Panel.abbrev.in_(abbreviations))
+
+
 class PanelFilter(Enum):
     """Define Panel filter functions."""
 
     BY_ABBREVIATION: Callable = filter_panel_by_abbrev
+    BY_ABBREVIATIONS: Callable = filter_panels_by_abbreviations
 
 
 def apply_panel_filter(
     panels: Query,
     filters: list[PanelFilter],
     abbreviation: str | None = None,
+    abbreviations: list[str] | None = None,
 ) -> Query:
     """Apply filtering functions and return filtered results."""
     for filter_function in filters:
         panels: Query = filter_function(
             panels=panels,
             abbreviation=abbreviation,
+            abbreviations=abbreviations,
         )
     return panels
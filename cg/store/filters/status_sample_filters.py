@@ -4,8 +4,9 @@ from typing import Any, Callable
 from sqlalchemy import or_
 from sqlalchemy.orm import Query
 
-from cg.constants.constants import SampleType
+from cg.constants.constants import SampleType, SearchEntity
 from cg.store.models import Customer, Sample
+from cg.store.search_index import filter_by_search_index
 
 
 def filter_samples_by_internal_id(internal_id: str, samples: Query, **kwargs) -> Query:
@@ -23,6 +24,11 @@ def filter_samples_by_name(name: str, samples: Query, **kwargs) -> Query:
     return samples.filter(Sample.name == name)
 
 
+def filter_samples_by_names(names: list[str], samples: Query, **kwargs) -> Query:
+    """Return samples with any of the sample names."""
+    return samples.filter(Sample.name.in_(names))
+
+
 def filter_samples_with_type(samples: Query, tissue_type: SampleType, **kwargs) -> Query:
     """Return samples with sample type."""
     is_tumour: bool = tissue_type == SampleType.TUMOR
@@ -116,6 +122,11 @@ def filter_samples_by_subject_id(samples: Query, subject_id: str, **kwargs) -> Q
     return samples.filter(Sample.subject_id == subject_id)
 
 
+def filter_samples_by_subject_ids(samples: Query, subject_ids: list[str], **kwargs) -> Query:
+    """Return samples with any of the given subject ids."""
+    return samples.filter(Sample.subject_id.in_(subject_ids))
+
+
 def filter_samples_on_tumour(samples: Query, is_tumour: bool, **kwargs) -> Query:
     """Return samples on matching tumour status."""
     return samples.filter(Sample.is_tumour.is_(is_tumour))
@@ -125,6 +136,9 @@ def filter_samples_by_internal_id_pattern(
     samples: Query, internal_id_pattern: str, **kwargs
 ) -> Query:
     """Return samples matching the internal id pattern."""
+    samples = filter_by_search_index(
+        query=samples, entity_id=Sample.id, entity=SearchEntity.SAMPLE, search=internal_id_pattern
+    )
     return samples.filter(Sample.internal_id.contains(internal_id_pattern))
 
 
@@ -134,6 +148,9 @@ def filter_samples_by_internal_id_or_name_search(
     """Return samples matching the internal id or name search."""
     if search_pattern is None:
         return samples
+    samples = filter_by_search_index(
+        query=samples, entity_id=Sample.id, entity=SearchEntity.SAMPLE, search=search_pattern
+    )
     return samples.filter(
         or_(
             Sample.name.contains(search_pattern),
@@ -178,12 +195,15 @@ def apply_sample_filter(
     samples: Query,
     entry_id: int | None = None,
     internal_id: str | None = None,
+    internal_ids: list[str] | None = None,
     tissue_type: SampleType | None = None,
     data_analysis: str | None = None,
     invoice_id: int | None = None,
     customer_entry_ids: list[int] | None = None,
     subject_id: str | None = None,
+    subject_ids: list[str] | None = None,
     name: str | None = None,
+    names: list[str] | None = None,
     customer: Customer | None = None,
     customers: list[Customer] | None = None,
     name_pattern: str | None = None,
@@ -201,12 +221,15 @@ def apply_sample_filter(
             samples=samples,
             entry_id=entry_id,
             internal_id=internal_id,
+            internal_ids=internal_ids,
             tissue_type=tissue_type,
             data_analysis=data_analysis,
             invoice_id=invoice_id,
             customer_entry_ids=customer_entry_ids,
             subject_id=subject_id,
+            subject_ids=subject_ids,
             name=name,
+            names=names,
             customer=customer,
             customers=customers,
             name_pattern=name_pattern,
@@ -234,7 +257,9 @@ class SampleFilter(Enum):
     BY_INTERNAL_ID_PATTERN: Callable = filter_samples_by_internal_id_pattern
     BY_INVOICE_ID: Callable = filter_samples_by_invoice_id
     BY_SAMPLE_NAME: Callable = filter_samples_by_name
+    BY_SAMPLE_NAMES: Callable = filter_samples_by_names
     BY_SUBJECT_ID: Callable = filter_samples_by_subject_id
+    BY_SUBJECT_IDS: Callable = filter_samples_by_subject_ids
     BY_TUMOUR: Callable = filter_samples_on_tumour
     DO_INVOICE: Callable = filter_samples_do_invoice
     HAS_NO_INVOICE_ID: Callable = filter_samples_without_invoice_id
@@ -0,0 +1,113 @@
+"""Opt-in instrumentation of the statements executed against status db."""
+
+import logging
+import time
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+LOG = logging.getLogger(__name__)
+
+SLOWEST_STATEMENTS_TO_KEEP: int = 5
+START_TIME_ATTRIBUTE: str = "_cg_query_start_time"
+
+
+class ExecutedStatement(BaseModel):
+    statement: str
+    duration: float
+
+
+class QueryStatistics(BaseModel):
+    """Statistics of the statements executed during a request or command."""
+
+    statement_count: int = 0
+    total_duration: float = 0
+    slowest_statements: list[ExecutedStatement] = []
+
+    def add_statement(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.total_duration += duration
+        self.slowest_statements.append(ExecutedStatement(statement=statement, duration=duration))
+        self.slowest_statements.sort(key=lambda executed: executed.duration, reverse=True)
+        del self.slowest_statements[SLOWEST_STATEMENTS_TO_KEEP:]
+
+    @property
+    def server_timing(self) -> str:
+        """Return the statistics formatted as a Server-Timing header value."""
+        return f'db;dur={self.total_duration * 1000:.1f};desc="{self.statement_count} queries"'
+
+    def get_summary(self) -> str:
+        summary: str = (
+            f"Executed {self.statement_count} statements against status db "
+            f"in {self.total_duration:.3f} s"
+        )
+        for executed in self.slowest_statements:
+            summary += f"\n{executed.duration:.3f} s: {' '.join(executed.statement.split())}"
+        return summary
+
+
+_current_statistics: ContextVar[QueryStatistics | None] = ContextVar(
+    "query_statistics", default=None
+)
+
+
+def _start_timer(
+    _conn: Connection,
+    _cursor,
+    _statement: str,
+    _parameters,
+    context: ExecutionContext,
+    _executemany: bool,
+):
+    """Keep the start time on the execution context of the statement, which is discarded with the
+    statement also when it fails, so that no start time outlives its statement."""
+    setattr(context, START_TIME_ATTRIBUTE, time.perf_counter())
+
+
+def _record_statement(
+    _conn: Connection,
+    _cursor,
+    statement: str,
+    _parameters,
+    context: ExecutionContext,
+    _executemany: bool,
+):
+    start_time: float | None = getattr(context, START_TIME_ATTRIBUTE, None)
+    if start_time is None:
+        return
+    statistics: QueryStatistics | None = _current_statistics.get()
+    if statistics is not None:
+        statistics.add_statement(statement=statement, duration=time.perf_counter() - start_time)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed by the engine. Safe to call more than once."""
+    if event.contains(engine, "before_cursor_execute", _start_timer):
+        return
+    event.listen(engine, "before_cursor_execute", _start_timer)
+    event.listen(engine, "after_cursor_execute", _record_statement)
+
+
+def start_recording() -> QueryStatistics:
+    """Start recording statements executed in the current context."""
+    statistics = QueryStatistics()
+    _current_statistics.set(statistics)
+    return statistics
+
+
+def stop_recording() -> QueryStatistics | None:
+    """Stop recording statements and return the statistics recorded in the current context."""
+    statistics: QueryStatistics | None = _current_statistics.get()
+    _current_statistics.set(None)
+    return statistics
+
+
+def get_current_statistics() -> QueryStatistics | None:
+    return _current_statistics.get()
+
+
+def log_query_statistics(statistics: QueryStatistics | None) -> None:
+    if statistics:
+        LOG.info(statistics.get_summary())
@@ -0,0 +1,48 @@
+"""Named sets of relationship loader options for queries whose results are serialised."""
+
+from enum import StrEnum
+
+from sqlalchemy.orm import Query, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from cg.store.models import ApplicationVersion, Case, CaseSample, Sample
+
+SAMPLE_SERIALIZATION_OPTIONS: list[LoaderOption] = [
+    joinedload(Sample.customer),
+    joinedload(Sample.application_version).joinedload(ApplicationVersion.application),
+]
+
+
+def _get_linked_sample_options(relationship) -> LoaderOption:
+    """Return options loading a sample related to a case sample link, ready for serialisation."""
+    return selectinload(relationship).options(*SAMPLE_SERIALIZATION_OPTIONS)
+
+
+CASE_WITH_LINKS_SERIALIZATION_OPTIONS: list[LoaderOption] = [
+    joinedload(Case.customer),
+    selectinload(Case.links).options(
+        _get_linked_sample_options(CaseSample.sample),
+        _get_linked_sample_options(CaseSample.mother),
+        _get_linked_sample_options(CaseSample.father),
+    ),
+]
+
+
+class LoaderProfile(StrEnum):
+    """Define loader profiles for queries returning models to be serialised with to_dict."""
+
+    CASE_WITH_LINKS = "case_with_links"
+    SAMPLE = "sample"
+
+
+LOADER_OPTIONS: dict[LoaderProfile, list[LoaderOption]] = {
+    LoaderProfile.CASE_WITH_LINKS: CASE_WITH_LINKS_SERIALIZATION_OPTIONS,
+    LoaderProfile.SAMPLE: SAMPLE_SERIALIZATION_OPTIONS,
+}
+
+
+def apply_loader_profile(query: Query, profile: LoaderProfile | None) -> Query:
+    """Return the query with the relationship loader options of the profile applied, if any."""
+    if not profile:
+        return query
+    return query.options(*LOADER_OPTIONS[profile])
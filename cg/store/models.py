@@ -10,12 +10,14 @@ from sqlalchemy import (
     BigInteger,
     Column,
     ForeignKey,
+    Index,
     Numeric,
     String,
     Table,
 )
 from sqlalchemy import Text as SLQText
 from sqlalchemy import UniqueConstraint, orm, types
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
@@ -24,6 +26,7 @@ from cg.constants.archiving import PDC_ARCHIVE_LOCATION
 from cg.constants.constants import (
     CaseActions,
     ControlOptions,
+    SearchEntity,
     SequencingQCStatus,
     SexOptions,
     StatusOptions,
@@ -1141,3 +1144,20 @@ class OrderTypeApplication(Base):
     application: Mapped[Application] = orm.relationship(
         "Application", back_populates="order_type_applications"
     )
+
+
+class SearchTrigram(Base):
+    """Lower case trigrams of the internal ids and names of cases and samples, used to find
+    entries containing a search term without scanning the whole table."""
+
+    __tablename__ = "search_trigram"
+    __table_args__ = (Index("ix_search_trigram_entity_id", "entity", "entity_id"),)
+
+    entity: Mapped[str] = mapped_column(
+        types.Enum(*(entity.value for entity in SearchEntity)), primary_key=True
+    )
+    trigram: Mapped[str] = mapped_column(
+        String(3).with_variant(mysql.VARCHAR(3, collation="utf8mb4_bin"), "mysql"),
+        primary_key=True,
+    )
+    entity_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
@@ -0,0 +1,132 @@
+"""Process-wide read-through cache for the slow-changing reference tables in status db."""
+
+import logging
+import time
+from threading import Lock
+from typing import Callable, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Mapper, Session, make_transient_to_detached, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+
+from cg.store.models import Application, Base, BedVersion, Customer, Organism, Panel
+
+LOG = logging.getLogger(__name__)
+
+CACHED_MODELS: tuple[Type[Base], ...] = (Application, BedVersion, Customer, Organism, Panel)
+# Writes through a session of this process invalidate the cached table at once. Writes from other
+# processes, such as the admin interface of the web app or another CLI command, and bulk UPDATE or
+# DELETE statements that bypass the ORM flush are not seen: this process may keep serving the
+# previous values for up to REFERENCE_CACHE_TTL seconds after such a write.
+REFERENCE_CACHE_TTL: float = 300
+WRITTEN_MODELS_KEY: str = "written_reference_models"
+
+
+def _get_detached_copy(entry: Base) -> Base:
+    """Return a detached copy of the column values of an entry, free of any session."""
+    mapper: Mapper = inspect(entry).mapper
+    copy: Base = mapper.class_manager.new_instance()
+    for column in mapper.column_attrs:
+        set_committed_value(copy, column.key, getattr(entry, column.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _has_uncommitted_changes(session: Session, model: Type[Base]) -> bool:
+    """Return whether entries of the model are changed in the current transaction of the session."""
+    if model in session.info.get(WRITTEN_MODELS_KEY, set()):
+        return True
+    changed_entries = (*session.new, *session.dirty, *session.deleted)
+    return any(isinstance(entry, model) for entry in changed_entries)
+
+
+class ReferenceCache:
+    """Cache entries of reference tables by the identifier they were fetched with.
+
+    Cached entries are detached copies of the column values, which are attached to the session
+    of the caller on a hit without querying the database. Entries expire after the time to
+    live, and all entries of a table are invalidated when any of them is written through a session
+    of this process, see REFERENCE_CACHE_TTL for the staleness window of other writes. Misses are
+    not cached."""
+
+    def __init__(self, ttl: float = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: dict[tuple[Type[Base], str], tuple[Base, float]] = {}
+        self._lock = Lock()
+
+    def get(self, model: Type[Base], identifier: str, session: Session) -> Base | None:
+        """Return the cached entry attached to the session, if cached and not expired."""
+        with self._lock:
+            cached: tuple[Base, float] | None = self._entries.get((model, identifier))
+        if not cached or cached[1] < time.monotonic():
+            return None
+        if _has_uncommitted_changes(session=session, model=model):
+            return None
+        entry: Base = cached[0]
+        existing_entry: Base | None = session.identity_map.get(inspect(entry).key)
+        if existing_entry is not None:
+            return existing_entry
+        return session.merge(entry, load=False)
+
+    def set(self, model: Type[Base], identifier: str, entry: Base, session: Session) -> None:
+        """Cache a copy of an entry, unless the table has uncommitted changes in the session."""
+        if _has_uncommitted_changes(session=session, model=model):
+            return
+        with self._lock:
+            self._entries[(model, identifier)] = (
+                _get_detached_copy(entry),
+                time.monotonic() + self.ttl,
+            )
+
+    def get_or_fetch(
+        self,
+        model: Type[Base],
+        identifier: str,
+        session: Session,
+        fetch: Callable[[], Base | None],
+    ) -> Base | None:
+        """Return the cached entry or fetch it from the database and cache it."""
+        if entry := self.get(model=model, identifier=identifier, session=session):
+            return entry
+        entry: Base | None = fetch()
+        if entry is not None:
+            self.set(model=model, identifier=identifier, entry=entry, session=session)
+        return entry
+
+    def invalidate(self, model: Type[Base]) -> None:
+        """Remove all cached entries of a table."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] is model]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+reference_cache = ReferenceCache()
+
+
+def _invalidate_written_models(session: Session, _flush_context) -> None:
+    """Invalidate the cached tables with entries written in the flush."""
+    written_entries = (*session.new, *session.dirty, *session.deleted)
+    for model in CACHED_MODELS:
+        if any(isinstance(entry, model) for entry in written_entries):
+            LOG.debug(f"Invalidating cached {model.__tablename__} entries")
+            reference_cache.invalidate(model)
+            session.info.setdefault(WRITTEN_MODELS_KEY, set()).add(model)
+
+
+def _end_transaction(session: Session, transaction) -> None:
+    """Invalidate the tables written in the transaction once more as it ends, since other
+    sessions may have cached their previous values before it was committed."""
+    if transaction.parent is not None:
+        return
+    for model in session.info.pop(WRITTEN_MODELS_KEY, set()):
+        reference_cache.invalidate(model)
+
+
+def register_cache_invalidation(session_factory: sessionmaker) -> None:
+    """Invalidate the reference cache whenever a session of the factory writes a cached table."""
+    event.listen(session_factory, "after_flush", _invalidate_written_models)
+    event.listen(session_factory, "after_transaction_end", _end_transaction)
@@ -0,0 +1,151 @@
+"""Trigram index of the internal ids and names of cases and samples, for substring search.
+
+The index is kept up to date from the flushes of the status db sessions. A search narrows the
+entries down to those indexed with the rarest trigram of the term, before the exact substring
+filter is applied to the remaining entries. Searches of an entity without any entries in the index,
+such as before the index has been populated, scan the table instead."""
+
+from typing import Type
+
+from sqlalchemy import (
+    Row,
+    Select,
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session, sessionmaker
+
+from cg.constants.constants import SearchEntity
+from cg.store.models import Base, Case, Sample, SearchTrigram
+
+TRIGRAM_LENGTH: int = 3
+LIKE_WILDCARDS: tuple[str, ...] = ("%", "_")
+MAX_INDEXED_CANDIDATES: int = 10_000
+
+SEARCHABLE_MODELS: dict[Type[Base], SearchEntity] = {
+    Case: SearchEntity.CASE,
+    Sample: SearchEntity.SAMPLE,
+}
+SEARCHABLE_ATTRIBUTES: tuple[str, ...] = ("internal_id", "name")
+
+
+def get_trigrams(*values: str | None) -> set[str]:
+    """Return the lower case trigrams of the values."""
+    trigrams: set[str] = set()
+    for value in values:
+        if not value:
+            continue
+        value = value.lower()
+        trigrams.update(
+            value[start : start + TRIGRAM_LENGTH]
+            for start in range(len(value) - TRIGRAM_LENGTH + 1)
+        )
+    return trigrams
+
+
+def is_indexed_search(search: str | None) -> bool:
+    """Return whether the index can narrow down the entries containing the search term."""
+    return (
+        bool(search)
+        and len(search) >= TRIGRAM_LENGTH
+        and not any(wildcard in search for wildcard in LIKE_WILDCARDS)
+    )
+
+
+def _is_entity_indexed(session: Session, entity: SearchEntity) -> bool:
+    return session.execute(select(exists().where(SearchTrigram.entity == entity))).scalar()
+
+
+def _get_rarest_trigram(session: Session, entity: SearchEntity, search: str) -> tuple[str, int]:
+    """Return the trigram of the search term indexed for the fewest entries, with its number of
+    entries counted up to the limit of candidates."""
+    capped_counts: list[Select] = [
+        select(literal(trigram).label("trigram"), func.count().label("entries")).select_from(
+            select(SearchTrigram.entity_id)
+            .where(SearchTrigram.entity == entity, SearchTrigram.trigram == trigram)
+            .limit(MAX_INDEXED_CANDIDATES)
+            .subquery()
+        )
+        for trigram in sorted(get_trigrams(search))
+    ]
+    counts: list[Row] = session.execute(union_all(*capped_counts)).all()
+    rarest: Row = min(counts, key=lambda count: count.entries)
+    return rarest.trigram, rarest.entries
+
+
+def filter_by_search_index(
+    query: Query, entity_id: InstrumentedAttribute, entity: SearchEntity, search: str | None
+) -> Query:
+    """Return the query narrowed down to the entries with the rarest trigram of the search term.
+    The query is returned as is when the term is too short, when the entity has no entries in the
+    index or when every trigram is indexed for so many entries that scanning the table is as
+    cheap."""
+    if not is_indexed_search(search):
+        return query
+    if not _is_entity_indexed(session=query.session, entity=entity):
+        return query
+    trigram, entries = _get_rarest_trigram(session=query.session, entity=entity, search=search)
+    if entries >= MAX_INDEXED_CANDIDATES:
+        return query
+    return query.filter(
+        entity_id.in_(
+            select(SearchTrigram.entity_id).where(
+                SearchTrigram.entity == entity, SearchTrigram.trigram == trigram
+            )
+        )
+    )
+
+
+def get_search_index_rows(entity: SearchEntity, entry: Base) -> list[dict]:
+    """Return the index rows of an entry."""
+    values: list[str] = [getattr(entry, attribute) for attribute in SEARCHABLE_ATTRIBUTES]
+    return [
+        {"entity": entity, "trigram": trigram, "entity_id": entry.id}
+        for trigram in get_trigrams(*values)
+    ]
+
+
+def _has_searchable_changes(entry: Base) -> bool:
+    attributes = inspect(entry).attrs
+    return any(attributes[attribute].history.has_changes() for attribute in SEARCHABLE_ATTRIBUTES)
+
+
+def _update_search_index(session: Session, _flush_context) -> None:
+    """Index the cases and samples that were added or had their internal id or name changed in
+    the flush, and remove the deleted ones from the index."""
+    stale_ids: dict[SearchEntity, set[int]] = {
+        entity: set() for entity in SEARCHABLE_MODELS.values()
+    }
+    rows: list[dict] = []
+    for entry in (*session.new, *session.dirty):
+        entity: SearchEntity | None = SEARCHABLE_MODELS.get(type(entry))
+        if not entity or not _has_searchable_changes(entry):
+            continue
+        stale_ids[entity].add(entry.id)
+        rows.extend(get_search_index_rows(entity=entity, entry=entry))
+    for entry in session.deleted:
+        if entity := SEARCHABLE_MODELS.get(type(entry)):
+            stale_ids[entity].add(entry.id)
+
+    connection = session.connection()
+    for entity, entity_ids in stale_ids.items():
+        if entity_ids:
+            connection.execute(
+                delete(SearchTrigram).where(
+                    SearchTrigram.entity == entity, SearchTrigram.entity_id.in_(entity_ids)
+                )
+            )
+    if rows:
+        connection.execute(insert(SearchTrigram), rows)
+
+
+def register_search_index_maintenance(session_factory: sessionmaker) -> None:
+    """Keep the search index up to date with the writes of the sessions of the factory."""
+    event.listen(session_factory, "after_flush", _update_search_index)
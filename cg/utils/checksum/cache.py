@@ -0,0 +1,126 @@
+"""Cache of the checksums of files, keyed by the path, inode, size and modification time of the
+files so that a file changed since it was hashed is hashed again."""
+
+import logging
+import os
+import sqlite3
+import threading
+from enum import StrEnum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+LOG = logging.getLogger(__name__)
+
+IN_MEMORY_DATABASE: str = ":memory:"
+
+
+class ChecksumAlgorithm(StrEnum):
+    MD5 = "md5"
+    SHA512 = "sha512"
+
+
+class FileChecksums(BaseModel):
+    """Checksums of a file, of the algorithms it has been hashed with."""
+
+    md5: str | None = None
+    sha512: str | None = None
+
+    def get_missing_algorithms(self, algorithms: set[ChecksumAlgorithm]) -> set[ChecksumAlgorithm]:
+        return {algorithm for algorithm in algorithms if getattr(self, algorithm) is None}
+
+    def merge(self, checksums: "FileChecksums") -> "FileChecksums":
+        """Return the checksums of both, preferring those of the other checksums."""
+        return self.model_copy(update=checksums.model_dump(exclude_none=True))
+
+
+class FileSignature(BaseModel):
+    """Identity of the content of a file as given by the file system."""
+
+    path: str
+    inode: int
+    size: int
+    modified_at_ns: int
+
+    @classmethod
+    def from_path(cls, file_path: Path) -> "FileSignature":
+        file_stat: os.stat_result = file_path.stat()
+        return cls(
+            path=str(file_path.resolve()),
+            inode=file_stat.st_ino,
+            size=file_stat.st_size,
+            modified_at_ns=file_stat.st_mtime_ns,
+        )
+
+
+class ChecksumCache:
+    """Checksums of files stored in an SQLite database, in memory unless given a path."""
+
+    def __init__(self, database_path: Path | None = None):
+        self.database_path: Path | None = database_path
+        if database_path:
+            database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(database_path) if database_path else IN_MEMORY_DATABASE,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checksum ("
+                "path TEXT PRIMARY KEY, inode INTEGER, size INTEGER, modified_at_ns INTEGER, "
+                "md5 TEXT, sha512 TEXT)"
+            )
+
+    def get(self, signature: FileSignature) -> FileChecksums | None:
+        """Return the checksums of the file if it has not changed since it was hashed."""
+        with self._lock:
+            row: tuple | None = self._connection.execute(
+                "SELECT md5, sha512 FROM checksum "
+                "WHERE path = ? AND inode = ? AND size = ? AND modified_at_ns = ?",
+                (signature.path, signature.inode, signature.size, signature.modified_at_ns),
+            ).fetchone()
+        if row:
+            LOG.debug(f"Using cached checksums of {signature.path}")
+            return FileChecksums(md5=row[0], sha512=row[1])
+
+    def set(self, signature: FileSignature, checksums: FileChecksums) -> None:
+        """Store the checksums of the file, keeping those of other algorithms cached for the file
+        while unchanged."""
+        with self._lock, self._connection:
+            row: tuple | None = self._connection.execute(
+                "SELECT md5, sha512 FROM checksum "
+                "WHERE path = ? AND inode = ? AND size = ? AND modified_at_ns = ?",
+                (signature.path, signature.inode, signature.size, signature.modified_at_ns),
+            ).fetchone()
+            if row:
+                checksums = FileChecksums(md5=row[0], sha512=row[1]).merge(checksums)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checksum VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    signature.path,
+                    signature.inode,
+                    signature.size,
+                    signature.modified_at_ns,
+                    checksums.md5,
+                    checksums.sha512,
+                ),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+checksum_cache = ChecksumCache()
+
+
+def get_checksum_cache() -> ChecksumCache:
+    return checksum_cache
+
+
+def configure_checksum_cache(database_path: Path | None) -> None:
+    """Store the checksums of the process in the database at the path, kept between processes."""
+    global checksum_cache
+    checksum_cache.close()
+    checksum_cache = ChecksumCache(database_path)
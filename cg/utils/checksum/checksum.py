@@ -1,26 +1,87 @@
 import hashlib
 import logging
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from cg.constants import FileExtensions
+from cg.utils.checksum.cache import (
+    ChecksumAlgorithm,
+    FileChecksums,
+    FileSignature,
+    get_checksum_cache,
+)
 
 LOG = logging.getLogger(__name__)
-BYTES_PER_CHUNK: int = 8192
+BYTES_PER_CHUNK: int = 8 * 1024 * 1024
+CHECKSUM_WORKERS: int = 4
+ALL_ALGORITHMS: set[ChecksumAlgorithm] = set(ChecksumAlgorithm)
 
 
-def check_md5sum(file_path: Path, md5sum: str) -> bool:
-    """Checks if the given md5_sum matches that of the given file"""
+def compute_checksums(
+    file_path: Path,
+    algorithms: set[ChecksumAlgorithm] = ALL_ALGORITHMS,
+    use_mmap: bool = False,
+) -> FileChecksums:
+    """Return the checksums of a file for the algorithms, computed in a single read.
+    The file is read in large chunks into a reused buffer, or through a memory map."""
+    hashes: dict[ChecksumAlgorithm, "hashlib._Hash"] = {
+        algorithm: hashlib.new(algorithm) for algorithm in algorithms
+    }
     with open(file_path, "rb") as file:
-        file_hash = hashlib.md5()
-        chunk = file.read(BYTES_PER_CHUNK)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = file.read(BYTES_PER_CHUNK)
-    calculated_md5sum = file_hash.hexdigest()
-    if md5sum == calculated_md5sum:
-        return True
-    LOG.info(f"The given md5sum does not match the md5sum for file {file_path.as_posix()}")
-    return False
+        if use_mmap and file_path.stat().st_size:
+            with mmap.mmap(file.fileno(), length=0, access=mmap.ACCESS_READ) as mapped_file:
+                content = memoryview(mapped_file)
+                for start in range(0, len(content), BYTES_PER_CHUNK):
+                    chunk = content[start : start + BYTES_PER_CHUNK]
+                    for file_hash in hashes.values():
+                        file_hash.update(chunk)
+                    chunk.release()
+                content.release()
+        else:
+            buffer = memoryview(bytearray(BYTES_PER_CHUNK))
+            while bytes_read := file.readinto(buffer):
+                for file_hash in hashes.values():
+                    file_hash.update(buffer[:bytes_read])
+    return FileChecksums(
+        **{algorithm: file_hash.hexdigest() for algorithm, file_hash in hashes.items()}
+    )
+
+
+def get_checksums(
+    file_path: Path,
+    algorithms: set[ChecksumAlgorithm] = ALL_ALGORITHMS,
+    use_mmap: bool = False,
+) -> FileChecksums:
+    """Return the checksums of a file for the algorithms, from the checksum cache if the file has
+    not changed since it was last hashed. Only the checksums missing from the cache are computed."""
+    signature: FileSignature = FileSignature.from_path(file_path)
+    checksums: FileChecksums = get_checksum_cache().get(signature) or FileChecksums()
+    if missing_algorithms := checksums.get_missing_algorithms(algorithms):
+        LOG.debug(f"Computing {', '.join(sorted(missing_algorithms))} checksums of {file_path}")
+        computed_checksums: FileChecksums = compute_checksums(
+            file_path=file_path, algorithms=missing_algorithms, use_mmap=use_mmap
+        )
+        get_checksum_cache().set(signature=signature, checksums=computed_checksums)
+        checksums = checksums.merge(computed_checksums)
+    return checksums
+
+
+def get_checksums_for_files(
+    file_paths: list[Path],
+    algorithms: set[ChecksumAlgorithm] = ALL_ALGORITHMS,
+    workers: int = CHECKSUM_WORKERS,
+) -> dict[Path, FileChecksums]:
+    """Return the checksums of the files, hashed in parallel by a pool of threads."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(
+            zip(
+                file_paths,
+                executor.map(
+                    lambda file_path: get_checksums(file_path=file_path, algorithms=algorithms),
+                    file_paths,
+                ),
+            )
+        )
 
 
 def extract_md5sum(md5sum_file: Path) -> str:
@@ -35,22 +96,3 @@ def extract_md5sum(md5sum_file: Path) -> str:
             return md5sum
     LOG.info(f"No valid md5sum found in file {md5sum_file.as_posix()}")
     return ""
-
-
-def is_md5sum_correct(file_path: Path) -> bool:
-    """Return True if the given file exists and matches its md5sum."""
-    if Path(str(file_path) + FileExtensions.MD5).exists():
-        given_md5sum: str = extract_md5sum(md5sum_file=Path(str(file_path) + FileExtensions.MD5))
-        return check_md5sum(file_path=file_path, md5sum=given_md5sum)
-    return False
-
-
-def sha512_checksum(file: Path) -> str:
-    """Generates the sha512 checksum of a file"""
-    LOG.debug("Checksum for file %s: ", file)
-    sha512_hash = hashlib.sha512()
-    with open(file, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha512_hash.update(chunk)
-    LOG.debug("Result: %s", sha512_hash.hexdigest())
-    return sha512_hash.hexdigest()
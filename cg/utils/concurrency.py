@@ -0,0 +1,64 @@
+"""Run the independent tasks of batch commands in a bounded pool of worker threads."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from housekeeper.store import database as housekeeper_database
+from sqlalchemy.orm import scoped_session
+
+from cg.store.database import get_scoped_session_registry
+
+LOG = logging.getLogger(__name__)
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+def remove_thread_sessions() -> None:
+    """Close the status db and Housekeeper sessions of the current thread."""
+    registries: list[scoped_session | None] = [
+        get_scoped_session_registry(),
+        housekeeper_database.SESSION,
+    ]
+    for registry in registries:
+        if registry:
+            registry.remove()
+
+
+def _run_in_worker(function: Callable[[Item], Result], item: Item) -> Result:
+    try:
+        return function(item)
+    finally:
+        remove_thread_sessions()
+
+
+def map_concurrently(
+    function: Callable[[Item], Result], items: Iterable[Item], workers: int = 1
+) -> Iterator[Result]:
+    """Yield the result of calling the function on every item, in the order of the items, as soon
+    as each result is available.
+    With more than one worker the calls are made by a pool of worker threads, each with its own
+    scoped database sessions. Calls that have not started are cancelled if the iteration is
+    stopped early."""
+    if workers <= 1:
+        yield from map(function, items)
+        return
+    LOG.debug(f"Processing items with {workers} workers")
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_run_in_worker, function, item) for item in items]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_concurrently(
+    function: Callable[[Item], bool], items: Iterable[Item], workers: int = 1
+) -> bool:
+    """Call the function on every item and return whether all calls succeeded.
+    With a single worker the items are processed in order in the current thread. Otherwise they
+    are processed by a pool of worker threads, each with its own scoped database sessions, which
+    means that the items must not be database entries loaded by the calling thread."""
+    return all(list(map_concurrently(function=function, items=items, workers=workers)))
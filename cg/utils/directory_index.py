@@ -0,0 +1,98 @@
+"""Index of the files in a directory tree by name, so that looking up several files in the same tree
+lists its directories once instead of once per file."""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+MODIFICATION_TIME_RESOLUTION_NS: int = 2_000_000_000
+
+
+class DirectoryIndex:
+    """
+    Files of a directory, and of its subdirectories if recursive, by name, listed in one walk with
+    os.scandir in the same top-down order as os.walk.
+    A file found in the index is checked to still exist, which costs one stat instead of a walk.
+    A file that is not found makes the index check the modification times of the indexed
+    directories and list them again if any of them changed, so that files created since the index
+    was built are found. As file systems store modification times with a coarse resolution, a
+    directory modified shortly before the index was built is always considered changed.
+    """
+
+    def __init__(self, directory: Path, recursive: bool = True):
+        self.directory: Path = directory
+        self.recursive: bool = recursive
+        self.files_by_name: dict[str, list[Path]] = {}
+        self.modified_at_by_directory: dict[str, int] = {}
+        self.built_at_ns: int = 0
+        self._build()
+
+    def _build(self) -> None:
+        LOG.debug(f"Indexing the files in {self.directory}")
+        self.files_by_name = {}
+        self.modified_at_by_directory = {}
+        self.built_at_ns = time.time_ns()
+        directories: list[str] = [str(self.directory)]
+        while directories:
+            directory: str = directories.pop()
+            try:
+                self.modified_at_by_directory[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    subdirectories: list[str] = []
+                    for entry in entries:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                        else:
+                            self.files_by_name.setdefault(entry.name, []).append(Path(entry.path))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if self.recursive:
+                directories.extend(reversed(subdirectories))
+
+    def is_outdated(self) -> bool:
+        """Return whether a directory of the index has been modified, created or removed since
+        the index was built."""
+        if not self.modified_at_by_directory:
+            return self.directory.is_dir()
+        for directory, modified_at in self.modified_at_by_directory.items():
+            if modified_at >= self.built_at_ns - MODIFICATION_TIME_RESOLUTION_NS:
+                return True
+            try:
+                if os.stat(directory).st_mtime_ns != modified_at:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def refresh(self) -> bool:
+        """List the directories again if the index is outdated and return whether it was."""
+        if not self.is_outdated():
+            return False
+        self._build()
+        return True
+
+    def get_files(self, file_name: str) -> list[Path]:
+        """Return the paths of all files with the name, in the order of a top-down walk."""
+        files: list[Path] = self.files_by_name.get(file_name, [])
+        if files and all(file.exists() for file in files):
+            return files
+        self.refresh()
+        return [file for file in self.files_by_name.get(file_name, []) if file.exists()]
+
+    def get_file(self, file_name: str) -> Path:
+        """
+        Return the path of the first file with the name found in a top-down walk.
+        Raises:
+            FileNotFoundError: If no file in the index has the name.
+        """
+        files: list[Path] = self.get_files(file_name)
+        if not files:
+            raise FileNotFoundError(f"File {file_name} not found in {self.directory}")
+        return files[0]
+
+    def contains(self, file_name: str) -> bool:
+        return bool(self.get_files(file_name))
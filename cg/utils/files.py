@@ -1,13 +1,25 @@
 """Some helper functions for working with files."""
 
+import errno
 import logging
 import os
 import shutil
 from importlib.resources import files
 from pathlib import Path
+from typing import BinaryIO, Callable
 
 LOG = logging.getLogger(__name__)
 
+BYTES_PER_COPY: int = 1024 * 1024 * 1024
+UNSUPPORTED_COPY_ERRORS: set[int] = {
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EXDEV,
+}
+
 
 def get_project_root_dir() -> Path:
     return Path(files("cg"))
@@ -114,3 +126,72 @@ def get_source_modified_time_stamp(source_path: Path) -> float:
     if not source_path.exists():
         raise FileNotFoundError(f"Directory with path {source_path} is not found.")
     return os.stat(source_path).st_mtime
+
+
+def _copy_file_range(source_fd: int, destination_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(source_fd, destination_fd, count, offset_src=offset)
+
+
+def _sendfile(source_fd: int, destination_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(destination_fd, source_fd, offset, count)
+
+
+def get_kernel_copy_functions() -> list[Callable[[int, int, int, int], int]]:
+    """Return the system calls copying data between files without passing it through user space,
+    in order of preference."""
+    copy_functions: list[Callable[[int, int, int, int], int]] = []
+    if hasattr(os, "copy_file_range"):
+        copy_functions.append(_copy_file_range)
+    if hasattr(os, "sendfile"):
+        copy_functions.append(_sendfile)
+    return copy_functions
+
+
+def append_file_content(source: BinaryIO, destination: BinaryIO) -> int:
+    """Append the content of the source file at the position of the destination file and return
+    the number of bytes copied.
+    The content is copied within the kernel with copy_file_range, or sendfile, falling back to a
+    copy through user space when the file systems do not support either."""
+    source_fd: int = source.fileno()
+    destination_fd: int = destination.fileno()
+    destination.flush()
+    size: int = os.fstat(source_fd).st_size
+    copied: int = 0
+    for copy_function in get_kernel_copy_functions():
+        try:
+            while copied < size:
+                count: int = copy_function(
+                    source_fd, destination_fd, copied, min(size - copied, BYTES_PER_COPY)
+                )
+                if not count:
+                    break
+                copied += count
+        except OSError as error:
+            if error.errno not in UNSUPPORTED_COPY_ERRORS:
+                raise
+            LOG.debug(f"Could not copy {source.name} with {copy_function.__name__}: {error}")
+            continue
+        if copied >= size:
+            return copied
+        LOG.debug(
+            f"{copy_function.__name__} stopped after {copied} of {size} bytes of {source.name}"
+        )
+        break
+    source.seek(copied)
+    position: int = destination.tell()
+    shutil.copyfileobj(source, destination)
+    destination.flush()
+    return copied + destination.tell() - position
+
+
+def concatenate_files(input_files: list[Path], output_file: Path) -> tuple[int, int]:
+    """Concatenate the input files into the output file.
+    Return the total size of the input files, as opened, and the number of bytes written."""
+    input_size: int = 0
+    written_size: int = 0
+    with open(output_file, "wb") as destination:
+        for input_file in input_files:
+            with open(input_file, "rb") as source:
+                input_size += os.fstat(source.fileno()).st_size
+                written_size += append_file_content(source=source, destination=destination)
+    return input_size, written_size
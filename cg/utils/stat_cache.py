@@ -0,0 +1,66 @@
+"""Cache of file system metadata for commands probing many files in the same directories."""
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+
+class DirectoryStatCache:
+    """Entries of directories, each directory listed once with os.scandir.
+
+    Looking up a file in a listed directory needs no further round trip to the file system, and
+    the stat result of an entry is kept once fetched. The listing of a directory is not refreshed,
+    so it must be invalidated when files are created or removed in the directory.
+    """
+
+    def __init__(self):
+        self._entries_by_directory: dict[Path, dict[str, os.DirEntry]] = {}
+        self._lock = threading.Lock()
+
+    def _get_entries(self, directory: Path) -> dict[str, os.DirEntry]:
+        """Return the entries of a directory, listing the directory on the first lookup.
+        Raises:
+            PermissionError if the directory can not be listed.
+        """
+        with self._lock:
+            entries: dict[str, os.DirEntry] | None = self._entries_by_directory.get(directory)
+        if entries is not None:
+            return entries
+        LOG.debug(f"Listing {directory}")
+        try:
+            with os.scandir(directory) as directory_entries:
+                entries = {entry.name: entry for entry in directory_entries}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+        with self._lock:
+            self._entries_by_directory[directory] = entries
+        return entries
+
+    def exists(self, file_path: Path) -> bool:
+        """Return whether the path exists, following symbolic links like Path.exists."""
+        entry: os.DirEntry | None = self._get_entries(file_path.parent).get(file_path.name)
+        if not entry:
+            return False
+        try:
+            return entry.is_file() or entry.is_dir()
+        except OSError:
+            return False
+
+    def stat(self, file_path: Path) -> os.stat_result:
+        """Return the stat result of the path, following symbolic links like Path.stat.
+        Raises:
+            FileNotFoundError if the path does not exist.
+        """
+        entry: os.DirEntry | None = self._get_entries(file_path.parent).get(file_path.name)
+        if not entry:
+            raise FileNotFoundError(f"No such file: {file_path}")
+        return entry.stat()
+
+    def invalidate(self, file_path: Path) -> None:
+        """Forget the listing of the directory of the path, after a file in it was created or
+        removed."""
+        with self._lock:
+            self._entries_by_directory.pop(file_path.parent, None)
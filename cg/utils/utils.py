@@ -22,17 +22,6 @@ def build_command_from_dict(options: dict, exclude_true: bool = False) -> list[s
     return formatted_options
 
 
-def get_hamming_distance(str_1: str, str_2: str) -> int:
-    """Return the hamming distance between two strings.
-
-    Raises:
-        KeyError: When the strings have the same length.
-    """
-    if len(str_1) != len(str_2):
-        raise KeyError("The two strings must have the same length to calculate distance!")
-    return sum(n1 != n2 for n1, n2 in zip(str_1, str_2))
-
-
 def replace_non_alphanumeric(string: str, replace_by="_") -> str:
     """Replace non-alphanumeric characters from a string."""
     return re.sub(r"\W+", replace_by, string)
@@ -0,0 +1,109 @@
+"""Reference implementation of the barcode mismatches of the samples of a lane, comparing each
+sample to every other sample of the lane."""
+
+from cg.apps.demultiplex.sample_sheet.index import MINIMUM_HAMMING_DISTANCE
+from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.constants.symbols import EMPTY_STRING
+
+
+def get_hamming_distance(str_1: str, str_2: str) -> int:
+    """Return the hamming distance between two strings.
+
+    Raises:
+        KeyError: When the strings have the same length.
+    """
+    if len(str_1) != len(str_2):
+        raise KeyError("The two strings must have the same length to calculate distance!")
+    return sum(n1 != n2 for n1, n2 in zip(str_1, str_2))
+
+
+def get_hamming_distance_index_1(sequence_1: str, sequence_2: str) -> int:
+    """
+    Get the hamming distance between two index 1 sequences.
+    In the case that one sequence is longer than the other, the distance is calculated between
+    the shortest sequence and the first segment of equal length of the longest sequence.
+    """
+    shortest_index_length: int = min(len(sequence_1), len(sequence_2))
+    return get_hamming_distance(
+        str_1=sequence_1[:shortest_index_length], str_2=sequence_2[:shortest_index_length]
+    )
+
+
+def get_hamming_distance_index_2(
+    sequence_1: str, sequence_2: str, is_reverse_complement: bool
+) -> int:
+    """
+    Get the hamming distance between two index 2 sequences.
+    In the case that one sequence is longer than the other, the distance is calculated between
+    the shortest sequence and the last segment of equal length of the longest sequence.
+    If it does not require reverse complement, the calculation is the same as for index 1.
+    """
+    shortest_index_length: int = min(len(sequence_1), len(sequence_2))
+    return (
+        get_hamming_distance(
+            str_1=sequence_1[-shortest_index_length:], str_2=sequence_2[-shortest_index_length:]
+        )
+        if is_reverse_complement
+        else get_hamming_distance(
+            str_1=sequence_1[:shortest_index_length], str_2=sequence_2[:shortest_index_length]
+        )
+    )
+
+
+def _update_barcode_mismatches_1(
+    sample: IlluminaSampleIndexSetting, samples_to_compare: list[IlluminaSampleIndexSetting]
+) -> None:
+    """Assign zero to barcode_mismatches_1 if the hamming distance between the index of the
+    sample and the index1 of any other sample in the lane is below the minimum threshold."""
+    for other_sample in samples_to_compare:
+        if sample.sample_id == other_sample.sample_id:
+            continue
+        if (
+            get_hamming_distance_index_1(sequence_1=sample.index, sequence_2=other_sample.index)
+            < MINIMUM_HAMMING_DISTANCE
+        ):
+            sample.barcode_mismatches_1 = 0
+            break
+
+
+def _update_barcode_mismatches_2(
+    sample: IlluminaSampleIndexSetting,
+    samples_to_compare: list[IlluminaSampleIndexSetting],
+    is_reverse_complement: bool,
+) -> None:
+    """Assign zero to barcode_mismatches_2 if the hamming distance between the index2 of the
+    sample and the index2 of any other sample in the lane is below the minimum threshold.
+    If the sample is single-indexed, assign 'na'."""
+    if sample.index2 == EMPTY_STRING and "-" not in sample.index:
+        sample.barcode_mismatches_2 = "na"
+        return
+    for other_sample in samples_to_compare:
+        if sample.sample_id == other_sample.sample_id:
+            continue
+        if (
+            get_hamming_distance_index_2(
+                sequence_1=sample.index2,
+                sequence_2=other_sample.index2,
+                is_reverse_complement=is_reverse_complement,
+            )
+            < MINIMUM_HAMMING_DISTANCE
+        ):
+            sample.barcode_mismatches_2 = 0
+            break
+
+
+def update_barcode_mismatches_per_sample(
+    samples: list[IlluminaSampleIndexSetting],
+    is_run_single_index: bool,
+    is_reverse_complement: bool,
+) -> None:
+    """Update the barcode mismatch attributes of each sample of a lane, comparing it to every
+    other sample of the lane."""
+    for sample in samples:
+        _update_barcode_mismatches_1(sample=sample, samples_to_compare=samples)
+        if not is_run_single_index:
+            _update_barcode_mismatches_2(
+                sample=sample,
+                samples_to_compare=samples,
+                is_reverse_complement=is_reverse_complement,
+            )
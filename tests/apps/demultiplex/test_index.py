@@ -1,11 +1,16 @@
 """Tests for functions related to indexes."""
 
+import numpy as np
 import pytest
 
 from cg.apps.demultiplex.sample_sheet.index import (
+    get_colliding_indexes,
+    get_pairwise_hamming_distances,
+    get_reverse_complement_dna_seq,
+)
+from tests.apps.demultiplex.barcode_mismatch_helpers import (
     get_hamming_distance_index_1,
     get_hamming_distance_index_2,
-    get_reverse_complement_dna_seq,
 )
 
 
@@ -150,3 +155,48 @@ def test_get_hamming_distance_index_2_no_reverse_complement(
         )
         == expected_distance
     )
+
+
+@pytest.mark.parametrize(
+    "indexes, align_end, expected_distances",
+    [
+        (["GATTACA", "GATTACAXX", "XXXACA"], False, [[0, 0, 6], [0, 0, 6], [6, 6, 0]]),
+        (["GATTACA", "XXGATTACA", "GATXX"], True, [[0, 0, 5], [0, 0, 5], [5, 5, 0]]),
+        (["GATTACA", ""], False, [[0, 0], [0, 0]]),
+    ],
+    ids=["Aligned from the left", "Aligned from the right", "Empty index"],
+)
+def test_get_pairwise_hamming_distances(
+    indexes: list[str], align_end: bool, expected_distances: list[list[int]]
+):
+    """Test that the pairwise Hamming distances are the distances between each pair of indexes."""
+    # GIVEN indexes of different lengths
+
+    # WHEN getting the Hamming distances between all pairs of indexes
+    distances: np.ndarray = get_pairwise_hamming_distances(indexes=indexes, align_end=align_end)
+
+    # THEN the distances are the same as the distances of each pair
+    assert distances.tolist() == expected_distances
+    assert distances.tolist() == [
+        [
+            get_hamming_distance_index_2(
+                sequence_1=index_1, sequence_2=index_2, is_reverse_complement=align_end
+            )
+            for index_2 in indexes
+        ]
+        for index_1 in indexes
+    ]
+
+
+def test_get_colliding_indexes():
+    """Test that indexes are colliding when close to the index of another sample."""
+    # GIVEN three samples where the first two have indexes one base apart
+    # GIVEN that the last sample is listed twice with the same index
+    indexes: list[str] = ["GATTACA", "GATTACC", "CTCTCTC", "CTCTCTC"]
+    sample_ids: list[str] = ["ACC001", "ACC002", "ACC003", "ACC003"]
+
+    # WHEN getting the colliding indexes
+    colliding: np.ndarray = get_colliding_indexes(indexes=indexes, sample_ids=sample_ids)
+
+    # THEN only the indexes of the first two samples are colliding
+    assert colliding.tolist() == [True, True, False, False]
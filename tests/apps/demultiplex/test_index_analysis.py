@@ -0,0 +1,97 @@
+"""Tests for the analysis of the distances between the indexes of the samples of a lane."""
+
+import pytest
+
+from cg.apps.demultiplex.sample_sheet.index_analysis import (
+    IndexCollision,
+    IndexDistanceSummary,
+    LaneIndexReport,
+    get_index_distance_summary,
+    get_index_reports,
+    get_recommended_barcode_mismatches,
+)
+from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.models.demultiplex.run_parameters import RunParameters
+
+
+@pytest.mark.parametrize(
+    "minimum_distance, expected_barcode_mismatches",
+    [(None, 2), (0, 0), (2, 0), (3, 1), (4, 1), (5, 2), (10, 2)],
+)
+def test_get_recommended_barcode_mismatches(
+    minimum_distance: int | None, expected_barcode_mismatches: int
+):
+    """Test that the recommended barcode mismatches keep every read within reach of one index."""
+    # GIVEN a minimum distance between the indexes of a lane
+
+    # WHEN getting the recommended barcode mismatches
+    barcode_mismatches: int = get_recommended_barcode_mismatches(minimum_distance)
+
+    # THEN the barcode mismatches are the expected
+    assert barcode_mismatches == expected_barcode_mismatches
+
+
+def test_get_index_distance_summary():
+    """Test that the summary reports the distances and collisions between different samples."""
+    # GIVEN indexes of a lane where two samples collide and one sample is repeated
+    indexes: list[str] = ["AAAAAAAA", "AAAAAATT", "CCCCCCCC", "CCCCCCCC"]
+    sample_ids: list[str] = ["ACC1", "ACC2", "ACC3", "ACC3"]
+
+    # WHEN getting the summary of the distances
+    summary: IndexDistanceSummary = get_index_distance_summary(
+        indexes=indexes, sample_ids=sample_ids
+    )
+
+    # THEN only the colliding pair of different samples is reported
+    assert summary.collisions == [
+        IndexCollision(
+            sample_id_1="ACC1",
+            sample_id_2="ACC2",
+            sequence_1="AAAAAAAA",
+            sequence_2="AAAAAATT",
+            distance=2,
+        )
+    ]
+
+    # THEN the distances are summarised over the indexes of different samples
+    assert summary.minimum_distance == 2
+    assert summary.median_nearest_distance == 5
+
+    # THEN no mismatches are recommended
+    assert summary.recommended_barcode_mismatches == 0
+
+
+def test_get_index_distance_summary_single_sample():
+    """Test that the summary of a lane with a single sample has no distances."""
+    # GIVEN the indexes of a single sample
+
+    # WHEN getting the summary of the distances
+    summary: IndexDistanceSummary = get_index_distance_summary(
+        indexes=["AAAAAAAA"], sample_ids=["ACC1"]
+    )
+
+    # THEN the summary is empty with the maximum recommended barcode mismatches
+    assert summary == IndexDistanceSummary()
+
+
+def test_get_index_reports(
+    bcl_convert_samples_similar_index1: list[IlluminaSampleIndexSetting],
+    novaseq_x_run_parameters: RunParameters,
+):
+    """Test that the reports of a dual-index run agree with the barcode mismatches of a lane."""
+    # GIVEN samples of two lanes, of which two samples in lane 1 have similar index 1
+    samples: list[IlluminaSampleIndexSetting] = bcl_convert_samples_similar_index1
+
+    # WHEN getting the index reports of a dual-index run
+    reports: list[LaneIndexReport] = get_index_reports(
+        samples=samples, run_parameters=novaseq_x_run_parameters
+    )
+
+    # THEN there is one report per lane, in order
+    assert [report.lane for report in reports] == [1, 2]
+
+    # THEN only lane 1 has colliding indexes, for index 1
+    assert reports[0].has_collisions
+    assert len(reports[0].index_1.collisions) == 1
+    assert not reports[0].index_2.collisions
+    assert not reports[1].has_collisions
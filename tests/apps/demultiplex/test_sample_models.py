@@ -1,9 +1,13 @@
 import pytest
 
 from cg.apps.demultiplex.sample_sheet.index import get_reverse_complement_dna_seq
-from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.apps.demultiplex.sample_sheet.sample_models import (
+    IlluminaSampleIndexSetting,
+    update_barcode_mismatches_in_lane,
+)
 from cg.constants.symbols import EMPTY_STRING
 from cg.models.demultiplex.run_parameters import RunParameters
+from tests.apps.demultiplex.barcode_mismatch_helpers import update_barcode_mismatches_per_sample
 
 
 class IndexOverrideCycles:
@@ -197,14 +201,13 @@ def test_update_barcode_mismatches_1(
     # GIVEN a list of FlowCellSampleBCLConvert
     sample_list: list[IlluminaSampleIndexSetting] = request.getfixturevalue(sample_list_fixture)
 
-    # GIVEN a FlowCellSampleBCLConvert
-    sample_to_update: IlluminaSampleIndexSetting = sample_list[0]
-
-    # WHEN updating the value for index 1 barcode mismatches
-    sample_to_update._update_barcode_mismatches_1(samples_to_compare=sample_list)
+    # WHEN updating the barcode mismatches of the lane
+    update_barcode_mismatches_in_lane(
+        samples=sample_list, is_run_single_index=False, is_reverse_complement=False
+    )
 
     # THEN the value for index 1 barcode mismatches is updated with the expected value
-    assert sample_to_update.barcode_mismatches_1 == expected_barcode_mismatch
+    assert sample_list[0].barcode_mismatches_1 == expected_barcode_mismatch
 
 
 @pytest.mark.parametrize(
@@ -219,16 +222,47 @@ def test_update_barcode_mismatches_2(
     # GIVEN a list of FlowCellSampleBCLConvert
     sample_list: list[IlluminaSampleIndexSetting] = request.getfixturevalue(sample_list_fixture)
 
-    # GIVEN a FlowCellSampleBCLConvert
-    sample_to_update: IlluminaSampleIndexSetting = sample_list[0]
-
-    # WHEN updating the value for index 2 barcode mismatches
-    sample_to_update._update_barcode_mismatches_2(
-        samples_to_compare=sample_list, is_reverse_complement=False
+    # WHEN updating the barcode mismatches of the lane
+    update_barcode_mismatches_in_lane(
+        samples=sample_list, is_run_single_index=False, is_reverse_complement=False
     )
 
     # THEN the value for index 2 barcode mismatches is updated with the expected value
-    assert sample_to_update.barcode_mismatches_2 == expected_barcode_mismatch
+    assert sample_list[0].barcode_mismatches_2 == expected_barcode_mismatch
+
+
+@pytest.mark.parametrize(
+    "sample_list_fixture",
+    ["bcl_convert_samples_similar_index1", "bcl_convert_samples_similar_index2"],
+)
+@pytest.mark.parametrize("is_reverse_complement", [True, False])
+def test_update_barcode_mismatches_in_lane(
+    sample_list_fixture: str, is_reverse_complement: bool, request: pytest.FixtureRequest
+):
+    """Test that updating the barcode mismatches of a lane at once gives the same values as
+    updating each sample of the lane."""
+    # GIVEN a list of samples in a lane and a copy of it
+    sample_list: list[IlluminaSampleIndexSetting] = request.getfixturevalue(sample_list_fixture)
+    sample_list_copy: list[IlluminaSampleIndexSetting] = [
+        sample.model_copy() for sample in sample_list
+    ]
+
+    # GIVEN that the barcode mismatches of each sample of the copy are updated
+    update_barcode_mismatches_per_sample(
+        samples=sample_list_copy,
+        is_run_single_index=False,
+        is_reverse_complement=is_reverse_complement,
+    )
+
+    # WHEN updating the barcode mismatches of the lane at once
+    update_barcode_mismatches_in_lane(
+        samples=sample_list, is_run_single_index=False, is_reverse_complement=is_reverse_complement
+    )
+
+    # THEN the barcode mismatches are the same as when updating each sample
+    assert [sample.model_dump() for sample in sample_list] == [
+        sample.model_dump() for sample in sample_list_copy
+    ]
 
 
 @pytest.mark.parametrize(
@@ -4,11 +4,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from housekeeper.store.models import File, Version
+from housekeeper.store.database import get_engine
+from housekeeper.store.models import Bundle, File, Version
 
+from cg.apps.housekeeper.file_index import VersionFileIndex
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import SequencingFileTag
 from tests.mocks.hk_mock import MockHousekeeperAPI
+from tests.query_helpers import record_queries
 from tests.small_helpers import SmallHelpers
 from tests.store_helpers import StoreHelpers
 
@@ -543,3 +546,162 @@ def test_get_files_from_latest_version_containing_tags_and_excluded_tags(
     filtered_files_names: list[str] = [Path(file.full_path).name for file in filtered_files]
     assert spring_file.name in filtered_files_names
     assert fastq_file.name not in filtered_files_names
+
+
+def test_get_archived_files_for_bundles(real_housekeeper_api: HousekeeperAPI):
+    """Test getting the archived files of several bundles in one query."""
+    # GIVEN bundles with archived and non-archived Spring files
+    archived_files: dict[str, File] = {}
+    for number, bundle_name in enumerate(["sample_1", "sample_2", "sample_3"]):
+        bundle: Bundle = real_housekeeper_api.create_new_bundle_and_version(bundle_name)
+        for suffix in ["archived", "local"]:
+            file: File = real_housekeeper_api.add_file(
+                path=f"{bundle_name}/{suffix}.spring",
+                version_obj=bundle.versions[0],
+                tags=[SequencingFileTag.SPRING],
+            )
+            real_housekeeper_api.add_commit(file)
+            if suffix == "archived" and number < 2:
+                real_housekeeper_api.add_archives(files=[file], archive_task_id=number)
+                archived_files[bundle_name] = file
+    real_housekeeper_api.commit()
+
+    # WHEN getting the archived Spring files of the bundles
+    with record_queries(get_engine()) as statistics:
+        files_by_bundle: dict[str, list[File]] = (
+            real_housekeeper_api.get_archived_files_for_bundles(
+                bundle_names=["sample_1", "sample_2", "sample_3"],
+                tags=[SequencingFileTag.SPRING],
+            )
+        )
+        retrieved: list = [
+            file.archive.retrieved_at for files in files_by_bundle.values() for file in files
+        ]
+
+    # THEN only the archived files of each bundle should be returned
+    assert files_by_bundle == {
+        "sample_1": [archived_files["sample_1"]],
+        "sample_2": [archived_files["sample_2"]],
+        "sample_3": [],
+    }
+    assert retrieved == [None, None]
+
+    # THEN the files and their archives should be fetched in one query
+    assert statistics.statement_count == 1
+
+
+def test_get_files_for_versions(populated_housekeeper_api: HousekeeperAPI, case_id: str):
+    """Test getting the files of several versions in one query."""
+    # GIVEN a populated Housekeeper with versions with files
+    versions: list[Version] = [
+        version for bundle in populated_housekeeper_api.bundles() for version in bundle.versions
+    ]
+    expected_files: dict[int, list[File]] = {
+        version.id: sorted(version.files, key=lambda file: file.id) for version in versions
+    }
+
+    # WHEN getting the files of the versions
+    files_by_version: dict[int, list[File]] = populated_housekeeper_api.get_files_for_versions(
+        version_ids=list(expected_files)
+    )
+
+    # THEN the files of each version should be returned
+    assert files_by_version == expected_files
+
+
+def test_get_version_file_index(
+    helpers: StoreHelpers,
+    real_housekeeper_api: HousekeeperAPI,
+    hk_bundle_data: dict[str, Any],
+    observations_clinical_snv_file_path: Path,
+    observations_clinical_sv_file_path: Path,
+):
+    """Test indexing the files of a version by tag and by path."""
+
+    # GIVEN a version with two files sharing one tag
+    version: Version = helpers.ensure_hk_version(real_housekeeper_api, hk_bundle_data)
+    first_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_snv_file_path, version_obj=version, tags=["vcf", "snv"]
+    )
+    second_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_sv_file_path, version_obj=version, tags=["vcf", "sv"]
+    )
+
+    # WHEN getting the file index of the version
+    file_index: VersionFileIndex = real_housekeeper_api.get_version_file_index(version)
+
+    # THEN the files should be found by all and by any of the tags
+    assert file_index.get_files_with_all_tags({"vcf", "sv"}) == [second_file]
+    assert file_index.get_files_with_all_tags({"vcf", "missing"}) == []
+    assert file_index.get_files_with_any_tag({"sv", "snv"}) == [first_file, second_file]
+
+    # THEN the files should be found by their path
+    assert file_index.contains_path(Path(first_file.path))
+    assert not file_index.contains_path(Path(first_file.path).with_suffix(".missing"))
+
+    # THEN the index should be reused until a file is added to the version
+    assert real_housekeeper_api.get_version_file_index(version) is file_index
+    third_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_sv_file_path, version_obj=version, tags=["sv"]
+    )
+    assert real_housekeeper_api.get_files_from_version(version=version, tags={"sv"}) == [
+        second_file,
+        third_file,
+    ]
+
+
+def test_version_file_index_after_tag_change(
+    helpers: StoreHelpers,
+    real_housekeeper_api: HousekeeperAPI,
+    hk_bundle_data: dict[str, Any],
+    observations_clinical_snv_file_path: Path,
+):
+    """Test that the files of a version are found by a tag added to or removed from a file."""
+
+    # GIVEN a version with a file and its file index
+    version: Version = helpers.ensure_hk_version(real_housekeeper_api, hk_bundle_data)
+    hk_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_snv_file_path, version_obj=version, tags=["vcf"]
+    )
+    real_housekeeper_api.commit()
+    assert not real_housekeeper_api.get_files_from_version(version=version, tags={"snv"})
+
+    # WHEN a tag is added to the file
+    hk_file.tags.append(real_housekeeper_api.add_tag(name="snv"))
+
+    # THEN the file should be found by the tag
+    assert real_housekeeper_api.get_files_from_version(version=version, tags={"snv"}) == [hk_file]
+
+    # WHEN the tag is removed from the file
+    hk_file.tags.remove(real_housekeeper_api.get_tag(name="snv"))
+
+    # THEN the file should no longer be found by the tag
+    assert not real_housekeeper_api.get_files_from_version(version=version, tags={"snv"})
+
+
+def test_version_file_index_contains_relative_path(
+    helpers: StoreHelpers,
+    real_housekeeper_api: HousekeeperAPI,
+    hk_bundle_data: dict[str, Any],
+    observations_clinical_snv_file_path: Path,
+):
+    """Test finding a file with a path relative to the Housekeeper root by its full path."""
+
+    # GIVEN a version with a file stored with a relative path
+    version: Version = helpers.ensure_hk_version(real_housekeeper_api, hk_bundle_data)
+    hk_file: File = real_housekeeper_api.add_file(
+        path=observations_clinical_snv_file_path, version_obj=version, tags=["vcf"]
+    )
+    hk_file.path = Path(hk_bundle_data["name"], observations_clinical_snv_file_path.name).as_posix()
+    real_housekeeper_api.commit()
+
+    # WHEN checking the paths of the file in the index of the version
+    file_index: VersionFileIndex = real_housekeeper_api.get_version_file_index(version)
+
+    # THEN the full path of the file should be found
+    assert file_index.contains_path(Path(real_housekeeper_api.root_dir, hk_file.path))
+
+    # THEN a path only sharing the file name should not be found
+    assert not file_index.contains_path(
+        Path(real_housekeeper_api.root_dir, observations_clinical_snv_file_path.name)
+    )
@@ -72,6 +72,32 @@ def test_get_last_version(
     assert fetched_version.created_at == timestamp_now
 
 
+def test_get_latest_bundle_versions(
+    case_id: str,
+    sample_id: str,
+    populated_housekeeper_api: HousekeeperAPI,
+    timestamp_now: datetime.datetime,
+):
+    """Test getting the latest versions of several bundles in bulk."""
+    # GIVEN a populated housekeeper_api where a bundle has two versions
+    bundle_obj = populated_housekeeper_api.bundle(name=case_id)
+    new_version = populated_housekeeper_api.new_version(created_at=timestamp_now)
+    new_version.bundle = bundle_obj
+    populated_housekeeper_api.add_commit(new_version)
+
+    # WHEN fetching the latest versions of the bundles and of a bundle that does not exist
+    versions = populated_housekeeper_api.get_latest_bundle_versions(
+        [case_id, sample_id, "does_not_exist"]
+    )
+
+    # THEN the latest version of each existing bundle should be returned
+    assert versions == {
+        case_id: populated_housekeeper_api.last_version(bundle=case_id),
+        sample_id: populated_housekeeper_api.last_version(bundle=sample_id),
+    }
+    assert versions[case_id].created_at == timestamp_now
+
+
 def test_get_latest_bundle_version_no_housekeeper_bundle(
     case_id: str, housekeeper_api: HousekeeperAPI, caplog
 ):
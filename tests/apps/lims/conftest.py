@@ -1,8 +1,12 @@
 """Fixtures for lims tests"""
 
+from urllib.parse import urlencode
+from xml.etree import ElementTree
+
 import pytest
 
 from cg.apps.lims.api import LimsAPI
+from cg.apps.lims.sample_cache import SampleUdfCache
 from tests.mocks.limsmock import MockReagentType
 
 
@@ -14,6 +18,7 @@ class MockLims(LimsAPI):
     def __init__(self):
         """Mock the init method"""
         self.lims = self
+        self.sample_udf_cache = SampleUdfCache()
 
     def get_prepmethod(self, lims_id: str) -> str:
         """Override the get_prepmethod"""
@@ -72,3 +77,128 @@ def invalid_reagent_sequence(invalid_reagent: MockReagentType) -> str:
 def label_no_parentheses() -> str:
     """Returns a reagent label."""
     return "ACAGTGGT-CTAGAACA"
+
+
+class RecordingLims(LimsAPI):
+    """LIMS answering requests from XML resources keyed by URI, recording every request."""
+
+    def __init__(self):
+        super().__init__(
+            config={"lims": {"host": "https://lims.test", "username": "user", "password": "pwd"}}
+        )
+        self.resources: dict[str, str] = {}
+        self.requests: list[str] = []
+
+    def add_resource(self, uri: str, xml: str, **params) -> None:
+        self.resources[f"{uri}?{urlencode(params)}" if params else uri] = xml
+
+    def get(self, uri: str, params: dict = None) -> ElementTree.Element:
+        self.requests.append(uri)
+        key: str = f"{uri}?{urlencode(params)}" if params else uri
+        return ElementTree.fromstring(self.resources[key])
+
+    def post(self, uri: str, data: bytes, params: dict = None) -> ElementTree.Element:
+        """Answer batch retrieve requests with the resources of the linked entities."""
+        self.requests.append(uri)
+        links: list[ElementTree.Element] = list(ElementTree.fromstring(data))
+        details: str = "".join(self.resources[link.attrib["uri"]] for link in links)
+        return ElementTree.fromstring(f"<details>{details}</details>")
+
+
+def get_process_xml(input_output_uris: list[tuple[str, str]]) -> str:
+    """Return the XML of a process mapping each input artifact to an output artifact."""
+    io_maps: str = "".join(
+        f'<input-output-map><input uri="{input_uri}" limsid="{input_uri.split("/")[-1]}"/>'
+        f'<output uri="{output_uri}" limsid="{output_uri.split("/")[-1]}"/></input-output-map>'
+        for input_uri, output_uri in input_output_uris
+    )
+    return f"<process>{io_maps}</process>"
+
+
+@pytest.fixture
+def flow_cell_lims(reagent: MockReagentType) -> RecordingLims:
+    """Return a LIMS with a flow cell with two lanes, each loaded with a pool of two samples."""
+    lims = RecordingLims()
+    container_uri: str = lims.get_uri("containers", "27-1")
+    lims.add_resource(
+        lims.get_uri("containers"),
+        f'<containers><container uri="{container_uri}" limsid="27-1"/></containers>',
+        name="FLOWCELL",
+    )
+    lane_uris: list[str] = [lims.get_uri("artifacts", f"2-L{lane}") for lane in (1, 2)]
+    placements: str = "".join(
+        f'<placement uri="{uri}"><value>{lane}:1</value></placement>'
+        for lane, uri in enumerate(lane_uris, start=1)
+    )
+    lims.add_resource(container_uri, f'<container uri="{container_uri}">{placements}</container>')
+
+    pool_uri: str = lims.get_uri("artifacts", "2-POOL")
+    sample_ids: list[str] = ["ACC001", "ACC002"]
+    sample_uris: list[str] = [lims.get_uri("artifacts", f"2-{sample}") for sample in sample_ids]
+    loading_uri: str = lims.get_uri("processes", "24-LOAD")
+    pooling_uri: str = lims.get_uri("processes", "24-POOL")
+    samples: str = "".join(
+        f'<sample uri="{lims.get_uri("samples", sample)}"/>' for sample in sample_ids
+    )
+    for uri in lane_uris:
+        lims.add_resource(
+            uri,
+            f'<artifact uri="{uri}" limsid="{uri.split("/")[-1]}">'
+            f'<parent-process uri="{loading_uri}"/>{samples}</artifact>',
+        )
+    lims.add_resource(
+        pool_uri,
+        f'<artifact uri="{pool_uri}" limsid="2-POOL">'
+        f'<parent-process uri="{pooling_uri}"/>{samples}</artifact>',
+    )
+    labels: list[str] = [reagent.label, "A703-A507 (CTTGTAAT-AGGCTTAG)"]
+    for sample, uri, label in zip(sample_ids, sample_uris, labels):
+        lims.add_resource(
+            uri,
+            f'<artifact uri="{uri}" limsid="2-{sample}">'
+            f'<sample uri="{lims.get_uri("samples", sample)}"/>'
+            f'<reagent-label name="{label}"/></artifact>',
+        )
+        reagent_type_uri: str = lims.get_uri("reagenttypes", sample)
+        lims.add_resource(
+            lims.get_uri("reagenttypes"),
+            f'<reagent-types><reagent-type uri="{reagent_type_uri}"/></reagent-types>',
+            name=label,
+        )
+        lims.add_resource(
+            reagent_type_uri,
+            f'<reagent-type><special-type name="Index">'
+            f'<attribute name="Sequence" value="{label.split("(")[1].rstrip(")")}"/>'
+            f"</special-type></reagent-type>",
+        )
+
+    lims.add_resource(
+        loading_uri, get_process_xml([(pool_uri, lane_uri) for lane_uri in lane_uris])
+    )
+    lims.add_resource(
+        pooling_uri, get_process_xml([(sample_uri, pool_uri) for sample_uri in sample_uris])
+    )
+    return lims
+
+
+@pytest.fixture
+def samples_lims() -> RecordingLims:
+    """Return a LIMS with two samples of the same project."""
+    lims = RecordingLims()
+    project_uri: str = lims.get_uri("projects", "PRJ1")
+    lims.add_resource(
+        project_uri, "<project><name>project</name><open-date>2024-01-01</open-date></project>"
+    )
+    for sample_id in ["ACC001", "ACC002"]:
+        sample_uri: str = lims.get_uri("samples", sample_id)
+        lims.add_resource(
+            sample_uri,
+            f'<sample uri="{sample_uri}" limsid="{sample_id}" '
+            f'xmlns:udf="http://genologics.com/ri/userdefined">'
+            f'<name>{sample_id}</name><project uri="{project_uri}"/>'
+            f'<udf:field type="String" name="customer">cust000</udf:field>'
+            f'<udf:field type="String" name="Source">blood</udf:field>'
+            f'<udf:field type="Date" name="Received at">2024-01-02</udf:field>'
+            f"</sample>",
+        )
+    return lims
@@ -11,8 +11,10 @@ from pytest_mock import MockerFixture
 from requests.exceptions import HTTPError
 
 from cg.apps.lims import LimsAPI
+from cg.apps.lims.sample_cache import SampleUdfCache
 from cg.constants.lims import LimsProcess
 from cg.exc import LimsDataError
+from tests.apps.lims.conftest import RecordingLims
 from tests.mocks.limsmock import MockLimsAPI
 
 
@@ -166,3 +168,42 @@ def test_get_capture_kit_strict_no_capture_kit(mocker: MockerFixture):
     # THEN a LimsDataError is raised
     with pytest.raises(LimsDataError):
         lims_api.get_capture_kit_strict(lims_id="sample_id")
+
+
+def test_samples(samples_lims: RecordingLims):
+    """Test exporting several samples with one batch request."""
+    # GIVEN a LIMS with two samples
+
+    # WHEN exporting the samples
+    samples: dict[str, dict] = samples_lims.samples(["ACC001", "ACC002"])
+
+    # THEN both samples are exported
+    assert [sample["source"] for sample in samples.values()] == ["blood", "blood"]
+    assert samples["ACC001"]["received"] == dt.date(2024, 1, 2)
+
+    # THEN the samples are fetched with one batch request and their project once
+    assert samples_lims.requests == [
+        samples_lims.get_uri("samples", "batch/retrieve"),
+        samples_lims.get_uri("projects", "PRJ1"),
+    ]
+
+    # THEN getting single attributes reads the cached UDFs without further requests
+    assert samples_lims.get_received_date("ACC002") == dt.date(2024, 1, 2)
+    assert samples_lims.get_sample_udfs("ACC002") is samples_lims.get_sample_udfs("ACC002")
+    assert len(samples_lims.requests) == 2
+
+
+def test_sample_udf_cache_evicts_least_recently_used():
+    """Test that the sample UDF cache evicts the least recently used sample when full."""
+    # GIVEN a full sample UDF cache where the first sample was used last
+    cache = SampleUdfCache(max_size=2)
+    cache.set(lims_id="ACC001", udfs={"Source": "blood"})
+    cache.set(lims_id="ACC002", udfs={"Source": "tissue"})
+    cache.get("ACC001")
+
+    # WHEN caching the UDFs of another sample
+    cache.set(lims_id="ACC003", udfs={"Source": "cell-free DNA"})
+
+    # THEN the least recently used sample is evicted
+    assert cache.get("ACC002") is None
+    assert cache.get("ACC001") == {"Source": "blood"}
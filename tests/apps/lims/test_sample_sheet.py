@@ -1,6 +1,9 @@
 """Tests for lims functions that are related with sample sheets."""
 
-from cg.apps.lims.sample_sheet import extract_sequence_in_parentheses
+from cg.apps.demultiplex.sample_sheet.sample_models import IlluminaSampleIndexSetting
+from cg.apps.lims.sample_sheet import extract_sequence_in_parentheses, get_flow_cell_samples
+from tests.apps.lims.conftest import RecordingLims
+from tests.mocks.limsmock import MockReagentType
 
 
 def test_extract_sequence_in_parentheses(reagent_label: str, reagent_sequence: str):
@@ -36,3 +39,31 @@ def test_extract_sequence_in_parentheses_no_parentheses(label_no_parentheses: st
 
     # THEN the index is what is expected
     assert extracted_sequence is None
+
+
+def test_get_flow_cell_samples(flow_cell_lims: RecordingLims, reagent: MockReagentType):
+    """Test getting the samples of a flow cell with batch requests and one reagent type lookup
+    per label."""
+    # GIVEN a LIMS with a flow cell with two lanes, each loaded with the same pool of two samples
+
+    # WHEN getting the samples of the flow cell
+    samples: list[IlluminaSampleIndexSetting] = list(
+        get_flow_cell_samples(lims=flow_cell_lims, flow_cell_id="FLOWCELL")
+    )
+
+    # THEN both samples are returned for each lane with their indexes
+    assert [(sample.lane, sample.sample_id) for sample in samples] == [
+        (1, "ACC001"),
+        (1, "ACC002"),
+        (2, "ACC001"),
+        (2, "ACC002"),
+    ]
+    assert samples[0].index == reagent.sequence
+
+    # THEN the artifacts are retrieved with one batch request per pooling level
+    batch_uri: str = flow_cell_lims.get_uri("artifacts", "batch/retrieve")
+    assert flow_cell_lims.requests.count(batch_uri) == 3
+    assert not [uri for uri in flow_cell_lims.requests if "/artifacts/2-" in uri]
+
+    # THEN the reagent types are looked up once per label
+    assert flow_cell_lims.requests.count(flow_cell_lims.get_uri("reagenttypes")) == 2
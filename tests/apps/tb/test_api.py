@@ -1,4 +1,9 @@
+import json
+import threading
 from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator
 from unittest.mock import create_autospec
 
 import pytest
@@ -9,7 +14,7 @@ from cg.apps.tb.api import TrailblazerAPI
 from cg.apps.tb.models import TrailblazerAnalysis
 from cg.constants.constants import APIMethods, Workflow, WorkflowManager
 from cg.constants.priority import TrailblazerPriority
-from cg.constants.tb import AnalysisType
+from cg.constants.tb import AnalysisStatus, AnalysisType
 from cg.exc import TrailblazerAPIHTTPError
 from cg.io.controller import APIRequest
 
@@ -39,6 +44,165 @@ def valid_trailblazer_config(fake_trailblazer_host):
     }
 
 
+def get_stand_in_analysis(case_id: str) -> dict:
+    """Return the latest analysis of a case, completed for every even case."""
+    index: int = int(case_id.split("_")[1])
+    return {
+        "id": index,
+        "case_id": case_id,
+        "status": AnalysisStatus.COMPLETED if index % 2 == 0 else AnalysisStatus.RUNNING,
+        "logged_at": None,
+        "started_at": None,
+        "completed_at": None,
+        "out_dir": None,
+        "config_path": None,
+    }
+
+
+class StandInTrailblazerHandler(BaseHTTPRequestHandler):
+    """Answer get-latest-analyses requests, or get-latest-analysis requests per case as an older
+    Trailblazer without the get-latest-analyses endpoint."""
+
+    received_case_ids: list[list[str]] = []
+    latest_analyses_request_count: int = 0
+    latest_analyses_error_status: int | None = None
+
+    def do_POST(self):
+        request_body: dict = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.endswith("/get-latest-analysis"):
+            self.received_case_ids.append([request_body["case_id"]])
+            self._send_json(get_stand_in_analysis(request_body["case_id"]))
+            return
+        StandInTrailblazerHandler.latest_analyses_request_count += 1
+        if not self.latest_analyses_error_status:
+            self.received_case_ids.append(request_body["case_ids"])
+            self._send_json(
+                {
+                    "analyses": [
+                        get_stand_in_analysis(case_id) for case_id in request_body["case_ids"]
+                    ]
+                }
+            )
+        else:
+            self.send_error(self.latest_analyses_error_status)
+
+    def _send_json(self, content: dict):
+        body: bytes = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_trailblazer_host() -> Generator[str, None, None]:
+    """Return the host of a local stand-in Trailblazer server."""
+    StandInTrailblazerHandler.received_case_ids = []
+    StandInTrailblazerHandler.latest_analyses_request_count = 0
+    StandInTrailblazerHandler.latest_analyses_error_status = None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInTrailblazerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.usefixtures("valid_google_credentials")
+def test_get_latest_analyses(stand_in_trailblazer_host: str, mocker):
+    # GIVEN a TrailblazerAPI talking to a stand-in Trailblazer server
+    trailblazer_api = TrailblazerAPI(
+        config={
+            "trailblazer": {
+                "service_account": "service_account",
+                "service_account_auth_file": "/some/file",
+                "host": stand_in_trailblazer_host,
+            }
+        }
+    )
+
+    # GIVEN that the analyses are requested in chunks of two cases
+    mocker.patch("cg.apps.tb.api.LATEST_ANALYSES_CHUNK_SIZE", 2)
+    case_ids: list[str] = [f"case_{index}" for index in range(5)]
+
+    # WHEN getting the ids of the cases with a completed latest analysis
+    completed_case_ids: set[str] = trailblazer_api.get_case_ids_with_latest_analysis_status(
+        case_ids=case_ids, statuses=[AnalysisStatus.COMPLETED]
+    )
+
+    # THEN the analyses of the cases should have been requested in three chunks
+    assert StandInTrailblazerHandler.received_case_ids == [
+        ["case_0", "case_1"],
+        ["case_2", "case_3"],
+        ["case_4"],
+    ]
+
+    # THEN only the cases with a completed analysis should be returned
+    assert completed_case_ids == {"case_0", "case_2", "case_4"}
+
+
+@pytest.mark.usefixtures("valid_google_credentials")
+def test_get_latest_analyses_without_bulk_endpoint(stand_in_trailblazer_host: str):
+    # GIVEN a TrailblazerAPI talking to a stand-in Trailblazer without the get-latest-analyses
+    # endpoint
+    trailblazer_api = TrailblazerAPI(
+        config={
+            "trailblazer": {
+                "service_account": "service_account",
+                "service_account_auth_file": "/some/file",
+                "host": stand_in_trailblazer_host,
+            }
+        }
+    )
+    StandInTrailblazerHandler.latest_analyses_error_status = HTTPStatus.NOT_FOUND
+    case_ids: list[str] = [f"case_{index}" for index in range(3)]
+
+    # WHEN getting the ids of the cases with a completed latest analysis twice
+    completed_case_ids: set[str] = trailblazer_api.get_case_ids_with_latest_analysis_status(
+        case_ids=case_ids, statuses=[AnalysisStatus.COMPLETED]
+    )
+    trailblazer_api.get_case_ids_with_latest_analysis_status(
+        case_ids=case_ids, statuses=[AnalysisStatus.COMPLETED]
+    )
+
+    # THEN the missing endpoint should only have been requested once
+    assert StandInTrailblazerHandler.latest_analyses_request_count == 1
+
+    # THEN the analyses should have been requested one case at a time
+    assert StandInTrailblazerHandler.received_case_ids == [[case_id] for case_id in case_ids] * 2
+
+    # THEN only the cases with a completed analysis should be returned
+    assert completed_case_ids == {"case_0", "case_2"}
+
+
+@pytest.mark.usefixtures("valid_google_credentials")
+def test_get_latest_analyses_server_error(stand_in_trailblazer_host: str):
+    # GIVEN a TrailblazerAPI talking to a stand-in Trailblazer failing to get the latest analyses
+    trailblazer_api = TrailblazerAPI(
+        config={
+            "trailblazer": {
+                "service_account": "service_account",
+                "service_account_auth_file": "/some/file",
+                "host": stand_in_trailblazer_host,
+            }
+        }
+    )
+    StandInTrailblazerHandler.latest_analyses_error_status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+    # WHEN getting the latest analyses of the cases
+
+    # THEN a TrailblazerAPIHTTPError with the status code is raised
+    with pytest.raises(TrailblazerAPIHTTPError) as error:
+        trailblazer_api.get_latest_analyses([f"case_{index}" for index in range(3)])
+    assert error.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
+    # THEN the analyses should not have been requested one case at a time
+    assert not StandInTrailblazerHandler.received_case_ids
+
+
 def test_add_pending_analysis_succeeds(
     valid_google_credentials: IDTokenCredentials,
     valid_trailblazer_config: dict,
@@ -107,6 +271,7 @@ def test_add_pending_analysis_succeeds(
             "workflow_manager": WorkflowManager.Slurm,
         },
         url=f"{fake_trailblazer_host}/add-pending-analysis",
+        idempotent=False,
     )
 
     # THEN the TrailblzerAnalysis object that was return includes the newly created id
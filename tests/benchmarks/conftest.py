@@ -0,0 +1,21 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def benchmark_size() -> int:
+    """Return the number of entries to seed, overridable with CG_BENCHMARK_SIZE."""
+    return int(os.environ.get("CG_BENCHMARK_SIZE", 1_000_000))
+
+
+@contextmanager
+def timed(label: str, timings: dict[str, float]) -> Iterator[None]:
+    """Record the wall time of the block under the label."""
+    start: float = time.perf_counter()
+    yield
+    timings[label] = time.perf_counter() - start
+    print(f"{label}: {timings[label] * 1000:.1f} ms")
@@ -0,0 +1,135 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from cg.constants.constants import SCALE_TO_READ_PAIRS
+from cg.constants.demultiplexing import UNDETERMINED
+from cg.constants.metrics import (
+    ADAPTER_METRICS_FILE_NAME,
+    DEMUX_METRICS_FILE_NAME,
+    QUALITY_METRICS_FILE_NAME,
+    DemuxMetricsColumnNames,
+    QualityMetricsColumnNames,
+)
+from cg.services.illumina.data_transfer.data_transfer_service import IlluminaDataTransferService
+from cg.services.illumina.data_transfer.models import IlluminaSampleSequencingMetricsDTO
+from cg.services.illumina.file_parsing.bcl_convert_metrics_parser import BCLConvertMetricsParser
+from cg.services.illumina.file_parsing.models import DemuxMetrics, SequencingQualityMetrics
+from tests.benchmarks.conftest import timed
+
+SAMPLES: int = 1500
+LANES: int = 8
+SCANNED_SAMPLES: int = 50
+
+
+def write_csv(file_path: Path, rows: list[dict]) -> None:
+    with open(file_path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture(scope="module")
+def bcl_convert_metrics_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a directory with BCLConvert metrics of the samples on every lane."""
+    metrics_dir: Path = tmp_path_factory.mktemp("Reports")
+    sample_ids: list[str] = [f"ACC{number:05}A1" for number in range(SAMPLES)] + [UNDETERMINED]
+    write_csv(
+        file_path=Path(metrics_dir, QUALITY_METRICS_FILE_NAME),
+        rows=[
+            {
+                QualityMetricsColumnNames.LANE: lane,
+                QualityMetricsColumnNames.SAMPLE_INTERNAL_ID: sample_id,
+                "ReadNumber": read,
+                QualityMetricsColumnNames.YIELD: 400_000_000 + lane,
+                QualityMetricsColumnNames.YIELD_Q30: 380_000_000 + read,
+                QualityMetricsColumnNames.QUALITY_SCORE_SUM: 15_000_000_000,
+                QualityMetricsColumnNames.MEAN_QUALITY_SCORE_Q30: 36.15,
+                QualityMetricsColumnNames.Q30_BASES_PERCENT: 0.95,
+            }
+            for lane in range(1, LANES + 1)
+            for sample_id in sample_ids
+            for read in (1, 2)
+        ],
+    )
+    write_csv(
+        file_path=Path(metrics_dir, DEMUX_METRICS_FILE_NAME),
+        rows=[
+            {
+                DemuxMetricsColumnNames.LANE: lane,
+                DemuxMetricsColumnNames.SAMPLE_INTERNAL_ID: sample_id,
+                DemuxMetricsColumnNames.READ_PAIR_COUNT: 15_000_000,
+            }
+            for lane in range(1, LANES + 1)
+            for sample_id in sample_ids
+        ],
+    )
+    Path(metrics_dir, ADAPTER_METRICS_FILE_NAME).touch()
+    return metrics_dir
+
+
+def get_metrics_by_scanning(parser: BCLConvertMetricsParser, sample_id: str, lane: int) -> tuple:
+    """Return the metrics of a sample and lane by scanning all metrics of the flow cell, as the
+    parser did before indexing them."""
+    demux_metrics: DemuxMetrics = next(
+        metric
+        for metric in parser.demux_metrics
+        if metric.sample_internal_id == sample_id and metric.lane == lane
+    )
+    quality_metrics: list[SequencingQualityMetrics] = [
+        metric
+        for metric in parser.quality_metrics
+        if metric.sample_internal_id == sample_id and metric.lane == lane
+    ]
+    q30_bases_percent: float = sum(metric.q30_bases_percent for metric in quality_metrics)
+    quality_score: float = sum(metric.mean_quality_score_q30 for metric in quality_metrics)
+    return (
+        demux_metrics.read_pair_count * SCALE_TO_READ_PAIRS,
+        round(q30_bases_percent / SCALE_TO_READ_PAIRS, 2) * 100,
+        round(quality_score / SCALE_TO_READ_PAIRS, 2),
+        sum(metric.yield_ for metric in quality_metrics),
+        sum(metric.yield_q30 for metric in quality_metrics),
+    )
+
+
+@pytest.mark.benchmark
+def test_sample_lane_metrics_latency(bcl_convert_metrics_dir: Path):
+    """Compare getting the metrics of every sample and lane by scanning and from the index."""
+    # GIVEN BCLConvert metrics of a flow cell with many samples on every lane
+    timings: dict[str, float] = {}
+
+    # WHEN parsing the metrics and getting the metrics of every sample and lane
+    with timed(label="Parse and index metrics", timings=timings):
+        parser = BCLConvertMetricsParser(bcl_convert_metrics_dir)
+    with timed(label=f"Parse and index {SAMPLES * LANES} sample lanes", timings=timings):
+        indexed: list[
+            IlluminaSampleSequencingMetricsDTO
+        ] = IlluminaDataTransferService().create_sample_sequencing_metrics_dto_for_flow_cell(
+            bcl_convert_metrics_dir
+        )
+
+    # WHEN scanning for the metrics of a subset of the samples
+    scanned_sample_ids: list[str] = sorted(parser.get_sample_internal_ids())[:SCANNED_SAMPLES]
+    with timed(label=f"Scan {SCANNED_SAMPLES * LANES} sample lanes", timings=timings):
+        scanned: dict[tuple[str, int], tuple] = {
+            (sample_id, lane): get_metrics_by_scanning(
+                parser=parser, sample_id=sample_id, lane=lane
+            )
+            for sample_id in scanned_sample_ids
+            for lane in range(1, LANES + 1)
+        }
+    scan_time: float = timings[f"Scan {SCANNED_SAMPLES * LANES} sample lanes"]
+    print(f"Scan {SAMPLES * LANES} sample lanes: {scan_time * SAMPLES / SCANNED_SAMPLES:.1f} s")
+
+    # THEN the indexed metrics should equal the scanned metrics
+    assert len(indexed) == SAMPLES * LANES
+    for metrics in indexed:
+        if (metrics.sample_id, metrics.flow_cell_lane) in scanned:
+            assert scanned[(metrics.sample_id, metrics.flow_cell_lane)] == (
+                metrics.total_reads_in_lane,
+                metrics.base_passing_q30_percent,
+                metrics.base_mean_quality_score,
+                metrics.yield_,
+                metrics.yield_q30,
+            )
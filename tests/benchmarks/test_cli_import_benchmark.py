@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cg.constants.constants import FileFormat
+from cg.io.controller import WriteFile
+from tests.benchmarks.conftest import timed
+
+IMPORT_TIME_PREFIX: str = "import time:"
+CG_COMMAND: list[str] = [sys.executable, "-c", "from cg.cli.base import base; base()"]
+
+
+def get_cumulative_import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module imported when importing
+    the module in a new interpreter, as reported by python -X importtime."""
+    stderr: str = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    import_times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX) or "|" not in line:
+            continue
+        _, cumulative, name = line.removeprefix(IMPORT_TIME_PREFIX).split("|")
+        if cumulative.strip().isdigit():
+            import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.fixture
+def cg_config_file(base_config_dict: dict, tmp_path: Path) -> Path:
+    """Return a config file with the basic configs necessary for running CG."""
+    config_file = Path(tmp_path, "cg-config.yaml")
+    WriteFile.write_file_from_content(
+        content=base_config_dict, file_format=FileFormat.YAML, file_path=config_file
+    )
+    return config_file
+
+
+@pytest.mark.benchmark
+def test_cli_import_time():
+    """Test that importing the CLI stays within the import time budget, in milliseconds,
+    overridable with CG_IMPORT_BUDGET_MS."""
+    # GIVEN an import time budget
+    budget_ms: int = int(os.environ.get("CG_IMPORT_BUDGET_MS", 500))
+
+    # WHEN importing the CLI
+    import_times: dict[str, int] = get_cumulative_import_times("cg.cli.base")
+
+    # THEN the slowest imports are reported
+    slowest: list[tuple[str, int]] = sorted(import_times.items(), key=lambda item: -item[1])
+    for name, cumulative in slowest[:10]:
+        print(f"{name}: {cumulative / 1000:.1f} ms")
+
+    # THEN importing the CLI should be within the budget
+    assert import_times["cg.cli.base"] / 1000 < budget_ms
+
+
+@pytest.mark.benchmark
+def test_subcommand_help_time(cg_config_file: Path):
+    """Test that the help of a subcommand, shown after the base callback has built the config, is
+    shown within the time budget, in milliseconds, overridable with CG_SUBCOMMAND_BUDGET_MS."""
+    # GIVEN a time budget and a config file
+    budget_ms: int = int(os.environ.get("CG_SUBCOMMAND_BUDGET_MS", 3000))
+    timings: dict[str, float] = {}
+
+    # WHEN showing the help of a subcommand in a new interpreter
+    with timed("cg get --help", timings):
+        result = subprocess.run(
+            CG_COMMAND + ["--config", str(cg_config_file), "get", "--help"],
+            capture_output=True,
+            text=True,
+        )
+
+    # THEN the help should be shown
+    assert result.returncode == 0, result.stderr
+    assert "Usage" in result.stdout
+
+    # THEN the help should be shown within the budget
+    assert timings["cg get --help"] * 1000 < budget_ms
+
+
+@pytest.mark.benchmark
+def test_base_callback_imports_no_apis(cg_config_file: Path):
+    """Test that building the config in the base callback does not import the APIs of the
+    config."""
+    # GIVEN a config file
+
+    # WHEN running the base callback before showing the help of a subcommand using no API
+    modules: set[str] = set(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from cg.cli.base import base; base(standalone_mode=False); "
+                "print('\\n'.join(sys.modules))",
+                "--config",
+                str(cg_config_file),
+                "init",
+                "--help",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.splitlines()
+    )
+
+    # THEN no API of the config should be imported
+    assert (
+        not {
+            "cg.apps.housekeeper.hk",
+            "cg.apps.lims",
+            "cg.apps.scout.scoutapi",
+            "cg.apps.tb",
+            "cg.meta.delivery.delivery",
+        }
+        & modules
+    )
@@ -0,0 +1,47 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from cg.utils.directory_index import DirectoryIndex
+from cg.utils.files import get_file_in_directory
+from tests.benchmarks.conftest import timed
+
+
+@pytest.fixture(scope="module")
+def run_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a directory tree with a directory of fastq files per sample, overridable with
+    CG_BENCHMARK_RUN_SAMPLES."""
+    directory: Path = tmp_path_factory.mktemp("run")
+    for number in range(int(os.environ.get("CG_BENCHMARK_RUN_SAMPLES", 400))):
+        sample_directory = Path(directory, "Unaligned", f"Sample_ACC{number:05}A1")
+        sample_directory.mkdir(parents=True)
+        for read in (1, 2):
+            Path(sample_directory, f"ACC{number:05}A1_S1_L001_R{read}_001.fastq.gz").touch()
+    return directory
+
+
+@pytest.mark.benchmark
+def test_find_files_in_directory_tree(run_directory: Path):
+    """Compare walking a directory tree for every file with walking it once into an index."""
+    # GIVEN the names of all files in a directory tree
+    file_names: list[str] = sorted(path.name for path in run_directory.rglob("*.fastq.gz"))
+    timings: dict[str, float] = {}
+
+    # WHEN finding every file by walking the tree and by indexing the tree
+    with timed("Walk per file", timings):
+        walked_files: list[Path] = [
+            get_file_in_directory(directory=run_directory, file_name=file_name)
+            for file_name in file_names
+        ]
+    with timed("Index", timings):
+        directory_index = DirectoryIndex(run_directory)
+        indexed_files: list[Path] = [
+            directory_index.get_file(file_name) for file_name in file_names
+        ]
+
+    # THEN both find the same files
+    assert indexed_files == walked_files
+
+    # THEN indexing the tree is faster
+    assert timings["Index"] < timings["Walk per file"]
@@ -0,0 +1,98 @@
+import gzip
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from cg.services.fastq_concatenation_service.fastq_concatenation_service import (
+    FastqConcatenationService,
+)
+from tests.benchmarks.conftest import timed
+
+FILES_PER_DIRECTION: int = 4
+SAMPLE_ID: str = "ACC12345A1"
+
+
+@pytest.fixture(scope="module")
+def fastq_bytes_per_direction() -> int:
+    """Return the size of the reads of each direction, overridable with CG_BENCHMARK_FASTQ_BYTES."""
+    return int(os.environ.get("CG_BENCHMARK_FASTQ_BYTES", 2 * 1024**3))
+
+
+def get_gzipped_reads(read_count: int) -> bytes:
+    reads: str = "".join(
+        f"@A00001:1:HXXXXXXXX:1:1101:{number}:1000 1:N:0:ACGTACGT\n{'ACGT' * 38}\n+\n{'F' * 152}\n"
+        for number in range(read_count)
+    )
+    return gzip.compress(reads.encode())
+
+
+@pytest.fixture(scope="module")
+def fastq_dir(tmp_path_factory: pytest.TempPathFactory, fastq_bytes_per_direction: int) -> Path:
+    """Return a directory with gzipped FASTQ files of the forward and reverse reads of a sample.
+    Each file is a series of gzip members, which is a valid gzip file."""
+    fastq_dir: Path = tmp_path_factory.mktemp("fastqs")
+    member: bytes = get_gzipped_reads(read_count=100_000)
+    members_per_file: int = max(fastq_bytes_per_direction // FILES_PER_DIRECTION // len(member), 1)
+    for direction in (1, 2):
+        for number in range(FILES_PER_DIRECTION):
+            with open(Path(fastq_dir, f"{SAMPLE_ID}_R{direction}_{number}.fastq.gz"), "wb") as file:
+                for _ in range(members_per_file):
+                    file.write(member)
+    return fastq_dir
+
+
+def concatenate_through_user_space(input_files: list[Path], output_file: Path) -> None:
+    """Concatenate the files the way they were concatenated before, one read direction at a time."""
+    with open(output_file, "wb") as write_file_obj:
+        for file in input_files:
+            with open(file, "rb") as file_descriptor:
+                shutil.copyfileobj(file_descriptor, write_file_obj)
+
+
+@pytest.mark.benchmark
+def test_fastq_concatenation_throughput(fastq_dir: Path, tmp_path: Path):
+    """Compare concatenating the reads through user space with the concurrent kernel copy."""
+    # GIVEN forward and reverse reads split over several gzipped FASTQ files
+    timings: dict[str, float] = {}
+    input_files: dict[int, list[Path]] = {
+        direction: sorted(fastq_dir.glob(f"*_R{direction}_*.fastq.gz")) for direction in (1, 2)
+    }
+    total_size: int = sum(file.stat().st_size for files in input_files.values() for file in files)
+
+    # WHEN concatenating the reads through user space
+    with timed(label="Copy through user space", timings=timings):
+        for direction, files in input_files.items():
+            concatenate_through_user_space(
+                input_files=files, output_file=Path(tmp_path, f"user_space_{direction}.fastq.gz")
+            )
+
+    # WHEN concatenating the reads with the concatenation service
+    forward_output = Path(tmp_path, "forward.fastq.gz")
+    reverse_output = Path(tmp_path, "reverse.fastq.gz")
+    with timed(label="Concatenation service", timings=timings):
+        FastqConcatenationService.concatenate(
+            sample_id=SAMPLE_ID,
+            fastq_directory=fastq_dir,
+            forward_output_path=forward_output,
+            reverse_output_path=reverse_output,
+        )
+    for label, duration in timings.items():
+        print(f"{label}: {total_size / duration / 1024**2:.0f} MiB/s")
+
+    # THEN the concatenated files should be identical
+    for direction, output_file in ((1, forward_output), (2, reverse_output)):
+        assert output_file.stat().st_size == sum(
+            file.stat().st_size for file in input_files[direction]
+        )
+        with (
+            open(output_file, "rb") as concatenated,
+            open(Path(tmp_path, f"user_space_{direction}.fastq.gz"), "rb") as copied,
+        ):
+            while chunk := concatenated.read(1024**2):
+                assert chunk == copied.read(1024**2)
+
+    # THEN the concatenated files should be valid gzip files
+    with gzip.open(forward_output, "rt") as concatenated_reads:
+        assert concatenated_reads.readline().startswith("@A00001")
@@ -0,0 +1,57 @@
+import os
+import random
+
+import pytest
+
+from cg.apps.demultiplex.sample_sheet.sample_models import (
+    IlluminaSampleIndexSetting,
+    update_barcode_mismatches_in_lane,
+)
+from tests.apps.demultiplex.barcode_mismatch_helpers import update_barcode_mismatches_per_sample
+from tests.benchmarks.conftest import timed
+
+BASES: str = "ACGT"
+
+
+def get_lane_samples(size: int, seed: int = 0) -> list[IlluminaSampleIndexSetting]:
+    """Return samples of a lane with random dual indexes of 10 bases."""
+    generator = random.Random(seed)
+    return [
+        IlluminaSampleIndexSetting(
+            lane=1,
+            sample_id=f"ACC{number:07}",
+            index="".join(generator.choices(BASES, k=10)),
+            index2="".join(generator.choices(BASES, k=10)),
+        )
+        for number in range(size)
+    ]
+
+
+@pytest.mark.benchmark
+def test_update_barcode_mismatches_in_lane():
+    """Compare updating the barcode mismatches of a lane one sample at a time with updating them
+    for the whole lane at once. The number of samples in the lane is overridable with
+    CG_BENCHMARK_LANE_SAMPLES."""
+    # GIVEN two copies of the samples of a full lane
+    size: int = int(os.environ.get("CG_BENCHMARK_LANE_SAMPLES", 1536))
+    samples_per_sample: list[IlluminaSampleIndexSetting] = get_lane_samples(size)
+    samples_per_lane: list[IlluminaSampleIndexSetting] = get_lane_samples(size)
+    timings: dict[str, float] = {}
+
+    # WHEN updating the barcode mismatches one sample at a time and for the whole lane
+    with timed("Per sample", timings):
+        update_barcode_mismatches_per_sample(
+            samples=samples_per_sample, is_run_single_index=False, is_reverse_complement=True
+        )
+    with timed("Per lane", timings):
+        update_barcode_mismatches_in_lane(
+            samples=samples_per_lane, is_run_single_index=False, is_reverse_complement=True
+        )
+
+    # THEN both give the same barcode mismatches
+    assert [sample.model_dump() for sample in samples_per_lane] == [
+        sample.model_dump() for sample in samples_per_sample
+    ]
+
+    # THEN updating the whole lane at once is faster
+    assert timings["Per lane"] < timings["Per sample"]
@@ -0,0 +1,81 @@
+from itertools import islice
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Query
+
+from cg.constants.constants import SearchEntity
+from cg.store.database import create_all_tables, initialize_database
+from cg.store.models import Sample, SearchTrigram
+from cg.store.search_index import filter_by_search_index, get_trigrams
+from cg.store.store import Store
+from tests.benchmarks.conftest import timed
+from tests.store_helpers import StoreHelpers
+
+BATCH_SIZE: int = 50_000
+SEARCH_TERMS: list[str] = ["ACC0042", "1234", "999999"]
+
+
+def get_sample_rows(template: Sample, size: int) -> Iterator[dict]:
+    for number in range(size):
+        yield {
+            "id": template.id + 1 + number,
+            "internal_id": f"ACC{number:07}",
+            "name": f"sample_{number}",
+            "customer_id": template.customer_id,
+            "application_version_id": template.application_version_id,
+            "sex": template.sex,
+            "ordered_at": template.ordered_at,
+        }
+
+
+@pytest.fixture(scope="module")
+def seeded_store(tmp_path_factory: pytest.TempPathFactory, benchmark_size: int) -> Store:
+    """Return a store with the given number of samples and their search index."""
+    database: Path = tmp_path_factory.mktemp("benchmark") / "status.sqlite"
+    initialize_database(f"sqlite:///{database}")
+    store = Store()
+    create_all_tables()
+    template: Sample = StoreHelpers.add_sample(store=store, internal_id="template")
+    rows: Iterator[dict] = get_sample_rows(template=template, size=benchmark_size)
+    while batch := list(islice(rows, BATCH_SIZE)):
+        store.session.execute(insert(Sample), batch)
+        store.session.execute(
+            insert(SearchTrigram),
+            [
+                {"entity": SearchEntity.SAMPLE, "trigram": trigram, "entity_id": row["id"]}
+                for row in batch
+                for trigram in get_trigrams(row["internal_id"], row["name"])
+            ],
+        )
+    store.session.commit()
+    return store
+
+
+def search_samples(store: Store, search: str, use_index: bool) -> list[int]:
+    samples: Query = store.session.query(Sample.id)
+    if use_index:
+        samples = filter_by_search_index(
+            query=samples, entity_id=Sample.id, entity=SearchEntity.SAMPLE, search=search
+        )
+    samples = samples.filter(or_(Sample.name.contains(search), Sample.internal_id.contains(search)))
+    return sorted(sample_id for sample_id, in samples)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("search", SEARCH_TERMS)
+def test_sample_search_latency(seeded_store: Store, search: str):
+    """Compare the latency of a substring search of samples with and without the index."""
+    # GIVEN a store seeded with samples and their search index
+    timings: dict[str, float] = {}
+
+    # WHEN searching for samples by scanning the table and by using the index
+    with timed(label=f"LIKE scan for {search}", timings=timings):
+        scanned: list[int] = search_samples(store=seeded_store, search=search, use_index=False)
+    with timed(label=f"Trigram index for {search}", timings=timings):
+        indexed: list[int] = search_samples(store=seeded_store, search=search, use_index=True)
+
+    # THEN both searches should find the same samples
+    assert indexed == scanned
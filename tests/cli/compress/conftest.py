@@ -13,6 +13,7 @@ from cg.constants import FileExtensions, SequencingFileTag
 from cg.constants.pedigree import Pedigree
 from cg.meta.compress import CompressAPI
 from cg.models.cg_config import CGConfig
+from cg.models.compression_data import SampleFastqCompressions
 from cg.store.store import Store
 from tests.store_helpers import StoreHelpers
 
@@ -31,10 +32,18 @@ class MockCompressAPI(CompressAPI):
         """Update dry run."""
         self.dry_run = dry_run
 
-    def compress_fastq(self, sample_id: str, dry_run: bool = False) -> None:
-        """Return if compression was successful."""
-        _ = sample_id, dry_run
-        return self.fastq_compression_success
+    def get_fastq_paths_for_samples(self, sample_ids: list[str]) -> dict[str, list[Path]]:
+        """Return that every sample has a bundle in Housekeeper."""
+        return {sample_id: [] for sample_id in sample_ids}
+
+    def get_fastq_compressions(
+        self, sample_id: str, fastq_paths: list[Path] | None = None
+    ) -> SampleFastqCompressions:
+        """Return that the FASTQ files of the sample are ready to be compressed if successful."""
+        _ = fastq_paths
+        return SampleFastqCompressions(
+            sample_id=sample_id, compressions=[], all_possible=self.fastq_compression_success
+        )
 
     def decompress_spring(self, sample_id: str, dry_run: bool = False) -> None:
         """Return if decompression was successful."""
@@ -50,7 +59,7 @@ def compress_api() -> MockCompressAPI:
 
 @pytest.fixture
 def real_crunchy_api(
-    crunchy_config: dict[str, dict[str, Any]]
+    crunchy_config: dict[str, dict[str, Any]],
 ) -> Generator[CrunchyAPI, None, None]:
     """Return Crunchy API."""
     _api = CrunchyAPI(crunchy_config)
@@ -216,3 +216,28 @@ def test_compress_fastq_cli_multiple_set_limit(
     assert res.exit_code == 0
     # THEN assert it was communicated no more than the limited number of cases was compressed
     assert f"individuals in {limit} (completed) cases where compressed" in caplog.text
+
+
+def test_compress_fastq_cli_concurrent_discovery(
+    caplog, cli_runner: CliRunner, mocker, populated_multiple_compress_context: CGConfig
+):
+    """Test to run the compress command discovering the FASTQ files of several samples at once."""
+    caplog.set_level(logging.DEBUG)
+    # GIVEN a database with multiple families
+    nr_cases = populated_multiple_compress_context.status_db._get_query(table=Case).count()
+
+    # GIVEN no adjusting according to reads
+    mocker.patch(MOCK_SET_MEM_ACCORDING_TO_READS_PATH, return_value=None)
+
+    # WHEN running the compress command with concurrent discovery
+    res = cli_runner.invoke(
+        fastq_cmd,
+        ["--number-of-conversions", nr_cases, "--max-concurrent-discovery", 4],
+        obj=populated_multiple_compress_context,
+    )
+
+    # THEN assert the program exits without errors
+    assert res.exit_code == 0
+
+    # THEN assert all cases were compressed
+    assert f"individuals in {nr_cases} (completed) cases where compressed" in caplog.text
@@ -10,6 +10,7 @@ from cg.apps.crunchy import CrunchyAPI
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.meta.compress import CompressAPI
 from cg.models.cg_config import CGConfig
+from cg.models.compression_data import SampleFastqCompressions
 from cg.store.store import Store
 from tests.cli.compress.conftest import CaseInfo
 from tests.store_helpers import StoreHelpers
@@ -65,10 +66,18 @@ class MockCompressAPI(CompressAPI):
         """Update dry run."""
         self.dry_run = dry_run
 
-    def compress_fastq(self, sample_id: str, dry_run: bool = False):
-        """Return if compression was successful."""
-        _ = sample_id, dry_run
-        return self.fastq_compression_success
+    def get_fastq_paths_for_samples(self, sample_ids: list[str]) -> dict[str, list[Path]]:
+        """Return that every sample has a bundle in Housekeeper."""
+        return {sample_id: [] for sample_id in sample_ids}
+
+    def get_fastq_compressions(
+        self, sample_id: str, fastq_paths: list[Path] | None = None
+    ) -> SampleFastqCompressions:
+        """Return that the FASTQ files of the sample are ready to be compressed if successful."""
+        _ = fastq_paths
+        return SampleFastqCompressions(
+            sample_id=sample_id, compressions=[], all_possible=self.fastq_compression_success
+        )
 
     def decompress_spring(self, sample_id: str, dry_run: bool = False):
         """Return if decompression was succesful."""
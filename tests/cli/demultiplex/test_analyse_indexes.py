@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from click.testing import CliRunner, Result
+
+from cg.cli.demultiplex.sample_sheet import analyse_indexes
+from cg.constants.process import EXIT_SUCCESS
+from cg.models.cg_config import CGConfig
+
+
+def test_analyse_indexes(
+    cli_runner: CliRunner, sample_sheet_context: CGConfig, novaseq_x_flow_cell_full_name: str
+):
+    """Test that analysing the indexes reports the colliding samples of each lane."""
+    # GIVEN a flow cell with a sample sheet where two samples have similar index 2 in all lanes
+
+    # WHEN analysing the indexes of the sample sheet
+    result: Result = cli_runner.invoke(
+        analyse_indexes, [novaseq_x_flow_cell_full_name], obj=sample_sheet_context
+    )
+
+    # THEN the process finishes successfully
+    assert result.exit_code == EXIT_SUCCESS
+
+    # THEN every lane is reported with the colliding samples
+    assert result.output.count("Lane ") == 8
+    assert result.output.count("ACC13169A1 (ATCTGCCA) and ACC13155A8 (CTCTGCCT)") == 8
+
+
+def test_analyse_indexes_without_sample_sheet(
+    cli_runner: CliRunner,
+    sample_sheet_context_broken_flow_cells: CGConfig,
+    tmp_novaseq_x_without_sample_sheet_flow_cell_path: Path,
+    caplog,
+):
+    """Test that analysing the indexes of a flow cell without sample sheet fails."""
+    # GIVEN a flow cell without a sample sheet
+
+    # WHEN analysing the indexes of the sample sheet
+    result: Result = cli_runner.invoke(
+        analyse_indexes,
+        [tmp_novaseq_x_without_sample_sheet_flow_cell_path.name],
+        obj=sample_sheet_context_broken_flow_cells,
+    )
+
+    # THEN the process exits with a non-zero exit code
+    assert result.exit_code != EXIT_SUCCESS
+
+    # THEN the missing sample sheet is communicated
+    assert "does not exist" in caplog.text
+
+
+def test_log_index_collisions(
+    sample_sheet_context: CGConfig, novaseq_x_flow_cell_full_name: str, caplog
+):
+    """Test that the lanes with colliding indexes are logged when checking the sample sheets."""
+    # GIVEN a flow cell with a sample sheet where two samples have similar index 2 in all lanes
+
+    # WHEN logging the index collisions of the flow cell
+    sample_sheet_context.sample_sheet_api.log_index_collisions(novaseq_x_flow_cell_full_name)
+
+    # THEN a warning is logged for every lane
+    assert caplog.text.count("has colliding indexes: 0 index 1 pairs, 1 index 2 pairs") == 8
@@ -1,10 +1,13 @@
 import logging
+import subprocess
+import sys
 from pathlib import Path
 
+import click
 from click.testing import CliRunner, Result
 
 import cg
-from cg.cli.base import base, init
+from cg.cli.base import LAZY_SUBCOMMANDS, base, init
 from cg.models.cg_config import CGConfig
 from cg.store.database import get_tables, initialize_database
 from cg.store.store import Store
@@ -68,3 +71,37 @@ def test_cli_init(cli_runner: CliRunner, base_context: CGConfig, caplog, tmp_pat
     # THEN it should re-setup the tables and print new tables
     assert result.exit_code == 0
     assert "Success!" in caplog.text
+
+
+def test_lazy_subcommands():
+    """Test that every lazy subcommand of the base group can be loaded."""
+    # GIVEN the base group with lazy subcommands
+    context = click.Context(base)
+
+    # WHEN loading the subcommands
+    for command_name in LAZY_SUBCOMMANDS:
+        command = base.get_command(context, command_name)
+
+        # THEN the command with the name should be returned
+        assert command.name == command_name
+
+
+def test_base_import_does_not_import_subcommands():
+    """Test that importing the base group does not import the modules of the subcommands."""
+    # GIVEN modules only needed by the subcommands
+    heavy_modules: list[str] = ["sqlalchemy", "housekeeper", "genologics", "pandas", "cg.cli.get"]
+
+    # WHEN importing the base group in a new interpreter
+    imported: str = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, cg.cli.base; print([m for m in {heavy_modules!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    # THEN none of the modules should have been imported
+    assert imported.strip() == "[]"
@@ -208,6 +208,10 @@ class MockTB:
         """Override TrailblazerAPI is_completed method to avoid default behaviour"""
         return False
 
+    def get_case_ids_with_latest_analysis_status(self, case_ids: list[str], statuses: list[str]):
+        """Override TrailblazerAPI method to avoid default behaviour"""
+        return set()
+
     def get_latest_analysis_status(self, case_id: str):
         """Override TrailblazerAPI get_analysis_status method to avoid default behaviour"""
         return None
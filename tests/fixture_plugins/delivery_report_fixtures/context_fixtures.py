@@ -38,6 +38,7 @@ def delivery_report_context(
     """Delivery report generation context."""
     mocker.patch.object(AnalysisAPI, "get_gene_ids_from_scout", return_value=[])
     mocker.patch.object(DeliveryReportAPI, "get_delivery_report_from_hk", return_value=None)
+    mocker.patch.object(LimsAPI, "get_batch", return_value=[])
     mocker.patch.object(LimsAPI, "sample", return_value=lims_samples[0])
     mocker.patch.object(LimsAPI, "get_prep_method", return_value=library_prep_method)
     mocker.patch.object(LimsAPI, "get_sequencing_method", return_value=libary_sequencing_method)
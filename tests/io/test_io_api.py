@@ -0,0 +1,116 @@
+import logging
+from unittest.mock import create_autospec
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests import Response
+
+from cg.constants.constants import APIMethods
+from cg.io import api
+from cg.io.api import (
+    HostStatistics,
+    HTTPTransport,
+    HTTPTransportSettings,
+    configure_transport,
+    log_request_statistics,
+)
+
+
+def test_transport_reuses_session_per_host(mocker: MockerFixture):
+    # GIVEN a transport and a host returning successful responses
+    transport = HTTPTransport()
+    mock_response: Response = create_autospec(Response, ok=True)
+    mocker.patch.object(requests.Session, "request", return_value=mock_response)
+
+    # WHEN sending requests to two hosts
+    for url in ("https://trailblazer/analyses", "https://trailblazer/jobs", "https://ddn/files"):
+        transport.request(method=APIMethods.GET, url=url, headers={}, json={})
+
+    # THEN one session should be kept per host
+    assert set(transport.sessions) == {("trailblazer", False), ("ddn", False)}
+
+    # THEN the requests should be counted per host
+    assert transport.statistics["trailblazer"].request_count == 2
+    assert transport.statistics["ddn"].request_count == 1
+
+
+def test_transport_counts_failed_requests(mocker: MockerFixture):
+    # GIVEN a transport and a host that cannot be reached
+    transport = HTTPTransport()
+    mocker.patch.object(requests.Session, "request", side_effect=requests.ConnectionError)
+
+    # WHEN sending a request to the host
+    try:
+        transport.request(
+            method=APIMethods.POST, url="https://trailblazer/add", headers={}, json={}
+        )
+    except requests.ConnectionError:
+        pass
+
+    # THEN the request should be counted as failed
+    statistics: HostStatistics = transport.statistics["trailblazer"]
+    assert statistics.request_count == statistics.failed_count == 1
+
+
+def test_transport_session_retries_with_backoff():
+    # GIVEN a transport with bounded retries
+    transport = HTTPTransport(max_retries=2, backoff_factor=1)
+
+    # WHEN getting the session of a host
+    session: requests.Session = transport.get_session("trailblazer")
+
+    # THEN temporary server errors should be retried with backoff a bounded number of times
+    retry = session.get_adapter("https://trailblazer").max_retries
+    assert retry.total == 2
+    assert retry.backoff_factor == 1
+    assert 503 in retry.status_forcelist
+
+    # THEN non-idempotent requests should not be retried once sent
+    assert APIMethods.POST not in retry.allowed_methods
+
+
+def test_transport_session_retries_idempotent_post():
+    # GIVEN a transport
+    transport = HTTPTransport()
+
+    # WHEN getting the session of a host for idempotent requests
+    session: requests.Session = transport.get_session(host="trailblazer", idempotent=True)
+
+    # THEN requests of all methods, such as queries sent as POST, should be retried
+    retry = session.get_adapter("https://trailblazer").max_retries
+    assert retry.allowed_methods is None
+    assert retry.is_retry(method=APIMethods.POST, status_code=503)
+
+
+def test_configure_transport(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN transport settings with a shorter read timeout
+    settings = HTTPTransportSettings(read_timeout=30)
+    monkeypatch.setattr(api, "transport", HTTPTransport())
+
+    # WHEN configuring the transport
+    configure_transport(settings)
+
+    # THEN the following requests should use the configured timeouts
+    assert api.transport.timeout == (settings.connect_timeout, 30)
+
+
+def test_log_request_statistics(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    # GIVEN a transport that has sent a request to a host
+    monkeypatch.setattr(api, "transport", HTTPTransport())
+    mocker.patch.object(
+        requests.Session, "request", return_value=create_autospec(Response, ok=True)
+    )
+    api.get(url="https://trailblazer/analyses", headers={}, json={})
+
+    # WHEN logging the request statistics
+    caplog.set_level(logging.INFO)
+    log_request_statistics()
+
+    # THEN the requests to the host should be logged
+    assert "trailblazer: 1 requests, 0 failed" in caplog.text
+
+    # THEN the connections should be closed
+    assert not api.transport.sessions
@@ -300,7 +300,7 @@ def test_write_csv_stream_from_content(csv_stream: str):
 def test_api_request_from_content(mocker):
     # GIVEN an api that returns a succesful response
     mock_response: Response = create_autospec(Response)
-    mocker.patch.object(requests, "post", return_value=mock_response)
+    mock_request = mocker.patch.object(requests.Session, "request", return_value=mock_response)
     url = "http://localhost"
 
     headers: dict[str, str] = {"some": "header"}
@@ -312,5 +312,7 @@ def test_api_request_from_content(mocker):
     )
 
     # THEN the api was correctly called and the response is returned
-    requests.post.assert_called_with(url=url, headers=headers, json=json, verify=True)
+    mock_request.assert_called_with(
+        method="POST", url=url, headers=headers, json=json, verify=True, timeout=mocker.ANY
+    )
     assert response == mock_response
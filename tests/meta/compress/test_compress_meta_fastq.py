@@ -9,7 +9,11 @@ from pytest_mock import MockerFixture
 
 from cg.constants import Workflow
 from cg.meta.compress import CompressAPI
-from cg.models.compression_data import CaseCompressionData, SampleCompressionData
+from cg.models.compression_data import (
+    CaseCompressionData,
+    SampleCompressionData,
+    SampleFastqCompressions,
+)
 from cg.store.models import Case, Sample
 
 
@@ -22,7 +26,9 @@ def test_compress_case_fastq_one_sample(populated_compress_fastq_api, sample, ca
 
     # WHEN Compressing the bam files for the case
     with mock.patch.object(CompressAPI, "_is_spring_archived", return_value=False):
-        result = compress_api.compress_fastq(sample)
+        result = compress_api.submit_fastq_compressions(
+            compress_api.get_fastq_compressions(sample_id=sample)
+        )
 
         # THEN assert compression succeded
         assert result is True
@@ -47,7 +53,9 @@ def test_compress_fastq_compression_done(
 
     # WHEN Compressing the bam files for the case
     with mock.patch.object(CompressAPI, "_is_spring_archived", return_value=False):
-        result = compress_api.compress_fastq(sample)
+        result = compress_api.submit_fastq_compressions(
+            compress_api.get_fastq_compressions(sample_id=sample)
+        )
 
         # THEN assert compression succeded
         assert result is False
@@ -69,7 +77,9 @@ def test_compress_sample_fastq_compression_pending(
 
     # WHEN compressing the FASTQ files for the case
     with mock.patch.object(CompressAPI, "_is_spring_archived", return_value=False):
-        result = compress_api.compress_fastq(sample)
+        result = compress_api.submit_fastq_compressions(
+            compress_api.get_fastq_compressions(sample_id=sample)
+        )
 
         # THEN assert compression returns False
         assert result is False
@@ -91,7 +101,9 @@ def test_compress_sample_fastq_archived_spring_file(
 
     # WHEN compressing the FASTQ files for the case
     with mock.patch.object(CompressAPI, "_is_spring_archived", return_value=True):
-        result = compress_api.compress_fastq(sample)
+        result = compress_api.submit_fastq_compressions(
+            compress_api.get_fastq_compressions(sample_id=sample)
+        )
 
         # THEN assert compression returns False
         assert result is False
@@ -158,3 +170,32 @@ def test_should_skip_sample(
 
     # THEN assert that the result is as expected
     assert result == expected
+
+
+def test_get_fastq_compressions_for_samples_concurrently(
+    populated_compress_fastq_api: CompressAPI, sample: str
+):
+    """Test that the FASTQ files of the samples are discovered by worker threads from their paths."""
+    # GIVEN a populated compress api with a sample with FASTQ files
+    compress_api: CompressAPI = populated_compress_fastq_api
+
+    # WHEN discovering the FASTQ files of the sample with several worker threads
+    with mock.patch.object(CompressAPI, "_is_spring_archived", return_value=False):
+        sample_compressions: list[SampleFastqCompressions] = list(
+            compress_api.get_fastq_compressions_for_samples(
+                sample_ids=[sample], max_concurrent_discovery=2
+            )
+        )
+
+        # THEN the same compressions are found as when fetching the sample bundle in Housekeeper
+        expected_compressions: SampleFastqCompressions = compress_api.get_fastq_compressions(
+            sample_id=sample
+        )
+        assert [compressions.sample_id for compressions in sample_compressions] == [sample]
+        assert [str(compression) for compression in sample_compressions[0].compressions] == [
+            str(compression) for compression in expected_compressions.compressions
+        ]
+
+    # THEN the FASTQ files of the sample are ready to be compressed
+    assert sample_compressions[0].compressions
+    assert sample_compressions[0].all_possible
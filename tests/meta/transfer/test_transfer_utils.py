@@ -0,0 +1,35 @@
+"""Tests for the utility functions of the transfer of external data."""
+
+from pathlib import Path
+
+import pytest
+
+from cg.meta.transfer.utils import are_all_fastq_valid
+
+
+@pytest.mark.parametrize(
+    "file_fixture, expected",
+    [("fastq_file", True), ("fastq_file_father", False), ("non_existing_file_path", False)],
+    ids=["Existing correct file", "Existing incorrect file", "Non existing file"],
+)
+def test_are_all_fastq_valid(file_fixture: str, expected: bool, request: pytest.FixtureRequest):
+    """Test that the function correctly checks if the fastq files match their md5sums."""
+    # GIVEN a file
+    file_path: Path = request.getfixturevalue(file_fixture)
+
+    # WHEN checking if the file matches its md5sum
+    are_valid: bool = are_all_fastq_valid([file_path])
+
+    # THEN the result is expected
+    assert are_valid == expected
+
+
+def test_are_all_fastq_valid_with_one_invalid_file(fastq_file: Path, fastq_file_father: Path):
+    """Test that the fastq files are not valid if any of them does not match its md5sum."""
+    # GIVEN a fastq file matching its md5sum and one not matching it
+
+    # WHEN checking if the files match their md5sums
+    are_valid: bool = are_all_fastq_valid([fastq_file, fastq_file_father])
+
+    # THEN they are not all valid
+    assert not are_valid
@@ -441,6 +441,15 @@ class MockHousekeeperAPI:
         LOG.debug(f"Found version obj for {bundle_name}: {repr(last_version)}")
         return last_version
 
+    def get_latest_bundle_versions(self, bundle_names: list[str]) -> dict:
+        """Get the latest versions of bundles by bundle name."""
+        versions: dict = {}
+        for bundle_name in bundle_names:
+            last_version = self.last_version(bundle_name)
+            if last_version:
+                versions[bundle_name] = last_version
+        return versions
+
     def get_root_dir(self):
         """Returns the root dir of Housekeeper."""
 
@@ -455,6 +464,10 @@ class MockHousekeeperAPI:
         """
         return self.files(*args, **kwargs)
 
+    def get_files_for_versions(self, version_ids: list[int]) -> dict:
+        """Fetch the files of versions by version id."""
+        return {version_id: list(self.files()) for version_id in version_ids}
+
     def get_file_insensitive_path(self, path: Path) -> File | None:
         """Returns a file in Housekeeper with a path that matches the given path, insensitive to whether the paths
         are included or not."""
@@ -582,6 +595,12 @@ class MockHousekeeperAPI:
         """Returns all archived files from a given bundle, tagged with the given tags."""
         pass
 
+    def get_archived_files_for_bundles(
+        self, bundle_names: list[str], tags: list | None = None
+    ) -> dict[str, list[File]]:
+        """Returns the archived files of the bundles, tagged with the given tags."""
+        return {bundle_name: [] for bundle_name in bundle_names}
+
     @staticmethod
     def get_tag_names_from_file(file) -> [str]:
         """Fetch a tag"""
@@ -4,7 +4,7 @@ from pydantic.v1 import BaseModel
 from typing_extensions import Literal
 
 from cg.apps.lims import LimsAPI
-
+from cg.apps.lims.sample_cache import SampleUdfCache
 from cg.constants.lims import LimsArtifactTypes, LimsProcess
 from cg.exc import LimsDataError
 
@@ -78,6 +78,8 @@ class MockLimsAPI(LimsAPI):
         self._delivery_method = "CG002 - Delivery"
         self._source = "cell-free DNA"
         self.artifacts: dict[str, list[LimsArtifactObject]] = {}
+        # The mock is shared between tests, so sample UDFs are not kept between them
+        self.sample_udf_cache = SampleUdfCache(max_size=0)
 
     def set_prep_method(self, method: str = "1337:00 Test prep method"):
         """Mock function"""
@@ -90,6 +92,9 @@ class MockLimsAPI(LimsAPI):
     def sample(self, lims_id: str) -> dict:
         return next((sample for sample in self._samples if sample["id"] == lims_id), {})
 
+    def samples(self, lims_ids: list[str]) -> dict[str, dict]:
+        return {lims_id: self.sample(lims_id) for lims_id in lims_ids}
+
     def add_sample(self, internal_id: str):
         self.sample_vars[internal_id] = {}
 
@@ -40,6 +40,11 @@ class MockTB:
     def is_latest_analysis_qc(self, case_id: str):
         return True
 
+    def get_case_ids_with_latest_analysis_status(
+        self, case_ids: list[str], statuses: list[str]
+    ) -> set[str]:
+        return set(case_ids)
+
     def set_analysis_status(self, case_id: str, status: str):
         return
 
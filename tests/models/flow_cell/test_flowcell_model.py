@@ -29,11 +29,11 @@ def test_rta_exists(novaseq_6000_pre_1_5_kits_flow_cell: IlluminaRunDirectoryDat
     # GIVEN the path to a finished flow cell
     # GIVEN a flow cell object
 
-    # WHEN fetching the path to the RTA file
-    rta_file: Path = novaseq_6000_pre_1_5_kits_flow_cell.rta_complete_path
+    # WHEN checking if the sequencing is done
+    is_sequencing_done: bool = novaseq_6000_pre_1_5_kits_flow_cell.is_sequencing_done()
 
-    # THEN assert that the file exists
-    assert rta_file.exists()
+    # THEN assert that the RTA file exists
+    assert is_sequencing_done
 
 
 def test_copy_complete_exists(novaseq_6000_pre_1_5_kits_flow_cell: IlluminaRunDirectoryData):
@@ -41,11 +41,11 @@ def test_copy_complete_exists(novaseq_6000_pre_1_5_kits_flow_cell: IlluminaRunDi
     # GIVEN the path to a finished flow cell
     # GIVEN a flow cell object
 
-    # WHEN fetching the path to the RTA file
-    copy_complete: Path = novaseq_6000_pre_1_5_kits_flow_cell.copy_complete_path
+    # WHEN checking if the copy of the sequencing run is completed
+    is_copy_completed: bool = novaseq_6000_pre_1_5_kits_flow_cell.is_copy_completed()
 
-    # THEN assert that the file exists
-    assert copy_complete.exists()
+    # THEN assert that the CopyComplete file exists
+    assert is_copy_completed
 
 
 def test_get_sequencing_runs_dir(novaseq_x_flow_cell: IlluminaRunDirectoryData):
@@ -1,9 +1,13 @@
 """Tests for the compress data class"""
 
+import os
 from datetime import datetime
 from pathlib import Path
 
+from pytest_mock import MockerFixture
+
 from cg.models.compression_data import CompressionData
+from cg.utils.stat_cache import DirectoryStatCache
 
 
 def test_get_run_name():
@@ -30,3 +34,37 @@ def test_get_change_date(compression_object):
 
     # THEN check that it is the same date as today
     assert change_date.date() == datetime.today().date()
+
+
+def test_stat_cache_lists_run_directory_once(
+    compression_object: CompressionData, mocker: MockerFixture
+):
+    """Test that the files of a run are looked up in a single listing of its directory."""
+    # GIVEN a compression object of a FASTQ pair using a stat cache
+    compression = CompressionData(compression_object.stub, stat_cache=DirectoryStatCache())
+    scandir = mocker.spy(os, "scandir")
+
+    # WHEN checking whether compression is possible and the pair exists
+    is_compression_possible: bool = compression.is_fastq_compression_possible
+    pair_exists: bool = compression.pair_exists()
+
+    # THEN the answers should be the same as without the cache
+    assert is_compression_possible == compression_object.is_fastq_compression_possible
+    assert pair_exists == compression_object.pair_exists() is True
+
+    # THEN the directory of the run should have been listed once
+    scandir.assert_called_once_with(compression.stub.parent)
+
+
+def test_stat_cache_invalidation(compression_object: CompressionData):
+    """Test that a created pending file is found after invalidating the stat cache."""
+    # GIVEN a compression object using a stat cache, without a pending file
+    compression = CompressionData(compression_object.stub, stat_cache=DirectoryStatCache())
+    assert not compression.pending_exists()
+
+    # WHEN the pending file is created and the stat cache is invalidated
+    compression.pending_path.touch()
+    compression.invalidate_stat_cache()
+
+    # THEN compression should be pending
+    assert compression.is_compression_pending
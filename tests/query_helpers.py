@@ -0,0 +1,24 @@
+"""Utility functions to assert the statements executed against status db in tests."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.engine import Engine
+
+from cg.store.instrumentation import (
+    QueryStatistics,
+    instrument_engine,
+    start_recording,
+    stop_recording,
+)
+
+
+@contextmanager
+def record_queries(engine: Engine) -> Iterator[QueryStatistics]:
+    """Record the statements executed against the engine within the block."""
+    instrument_engine(engine)
+    statistics: QueryStatistics = start_recording()
+    try:
+        yield statistics
+    finally:
+        stop_recording()
@@ -81,3 +81,14 @@ def test_order_endpoint_not_found(
 
     # THEN the response should be unsuccessful
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_orders_endpoint_invalid_cursor(client: FlaskClient):
+    """Tests that the orders endpoint rejects a cursor not created by the server"""
+    # GIVEN a cursor that is not created by the server
+
+    # WHEN a request is made to get the orders after the cursor
+    response = client.get("/api/v1/orders", query_string={"cursor": "not-a-cursor"})
+
+    # THEN the request should be rejected as a bad request
+    assert response.status_code == HTTPStatus.BAD_REQUEST
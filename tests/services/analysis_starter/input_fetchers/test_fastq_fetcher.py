@@ -31,7 +31,7 @@ def test_ensure_files_are_ready_success():
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that all spring files are decompressed into FASTQ files
     compress_api: CompressAPI = create_autospec(CompressAPI)
@@ -71,7 +71,7 @@ def test_ensure_files_are_ready_archived_spring_files():
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
     archive = Archive(file_id=1)
     file = File(id=1, path="path/to/spring_file.spring", archive=archive)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[file])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={"sample_id": [file]})
 
     # GIVEN that all spring files on the cluster are decompressed into FASTQ files
     compress_api: CompressAPI = create_autospec(CompressAPI)
@@ -116,7 +116,7 @@ def test_ensure_files_are_ready_fetch_flow_cell():
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that all spring files on disk are decompressed into FASTQ files
     compress_api: CompressAPI = create_autospec(CompressAPI)
@@ -159,7 +159,7 @@ def test_ensure_files_are_ready_down_sampled_or_external(is_downsampled: bool, i
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that all spring files are decompressed into FASTQ files
     compress_api: CompressAPI = create_autospec(CompressAPI)
@@ -197,7 +197,7 @@ def test_ensure_files_are_ready_decompression_needed_and_decompression_possible(
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that some spring files need to be decompressed into FASTQ files
     compress_api: TypedMock[CompressAPI] = create_typed_mock(CompressAPI)
@@ -248,7 +248,7 @@ def test_ensure_files_are_ready_decompression_needed_but_no_samples_can_be_decom
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that some spring files need to be decompressed into FASTQ files
     compress_api: TypedMock[CompressAPI] = create_typed_mock(CompressAPI)
@@ -299,7 +299,7 @@ def test_ensure_files_are_ready_decompression_needed_but_no_samples_can_be_decom
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that some spring files need to be decompressed into FASTQ files
     compress_api: TypedMock[CompressAPI] = create_typed_mock(CompressAPI)
@@ -348,7 +348,7 @@ def test_ensure_files_are_ready_decompression_running():
 
     # GIVEN that there are no files archived via DDN
     housekeeper_api: HousekeeperAPI = create_autospec(HousekeeperAPI)
-    housekeeper_api.get_archived_files_for_bundle = Mock(return_value=[])
+    housekeeper_api.get_archived_files_for_bundles = Mock(return_value={})
 
     # GIVEN that some spring files are currently being decompressed into FASTQ files
     compress_api: TypedMock[CompressAPI] = create_typed_mock(CompressAPI)
@@ -170,6 +170,41 @@ def test_analysis_starter_start_available_error_handling(
     assert succeeded == expected_exit
 
 
+def test_analysis_starter_start_available_with_workers():
+    """Test that start_available starts all cases and reports failures with several workers."""
+    # GIVEN a Store with mock cases
+    mock_store: TypedMock[Store] = create_typed_mock(Store)
+    cases: list[Case] = [create_autospec(Case, internal_id=f"case_{index}") for index in range(6)]
+    mock_store.as_mock.get_cases_to_analyze.return_value = cases
+
+    # GIVEN an analysis starter failing to start one of the cases
+    analysis_starter = AnalysisStarter(
+        configurator=create_autospec(NextflowConfigurator),
+        input_fetcher=create_autospec(FastqFetcher),
+        store=mock_store.as_type,
+        submitter=create_autospec(Submitter),
+        tracker=create_autospec(NextflowTracker),
+        workflow=Workflow.RNAFUSION,
+    )
+
+    def start(case_id: str) -> None:
+        if case_id == "case_3":
+            raise Exception("failed")
+
+    analysis_starter.start = Mock(side_effect=start)
+
+    # WHEN starting all available cases with three workers
+    succeeded: bool = analysis_starter.start_available(workers=3)
+
+    # THEN all cases should have been started
+    assert sorted(call.args[0] for call in analysis_starter.start.call_args_list) == [
+        case.internal_id for case in cases
+    ]
+
+    # THEN the failure should be reported
+    assert not succeeded
+
+
 def test_rnafusion_start(
     cg_context: CGConfig,
     http_workflow_launch_response: Response,
@@ -212,7 +247,7 @@ def test_rnafusion_start(
     mock_store.are_all_illumina_runs_on_disk = Mock(return_value=True)
 
     # GIVEN that there are no archived spring files
-    mocker.patch.object(HousekeeperAPI, "get_archived_files_for_bundle", return_value=[])
+    mocker.patch.object(HousekeeperAPI, "get_archived_files_for_bundles", return_value={})
 
     # GIVEN that no decompression is needed
     mocker.patch.object(FastqFetcher, "_resolve_decompression", return_value=None)
@@ -112,26 +112,6 @@ def test_get_lanes_for_sample_internal_id(
         assert lane in [1, 2]
 
 
-def test_get_metrics_for_sample_internal_id_and_lane(
-    parsed_bcl_convert_metrics: BCLConvertMetricsParser, test_sample_internal_id: str
-):
-    """Test to get metrics for a sample internal id and lane from BclConvertMetricsParser."""
-
-    # GIVEN a parsed BCLConvert metrics
-
-    # WHEN getting metrics for a sample internal id and lane
-    metrics: DemuxMetrics = parsed_bcl_convert_metrics.get_metrics_for_sample_and_lane(
-        metrics=parsed_bcl_convert_metrics.demux_metrics,
-        sample_internal_id=test_sample_internal_id,
-        lane=1,
-    )
-
-    # THEN assert that the metrics are of the correct type
-    assert isinstance(metrics, DemuxMetrics)
-    assert metrics.sample_internal_id == test_sample_internal_id
-    assert metrics.lane == 1
-
-
 def test_calculate_total_reads_per_lane(
     parsed_bcl_convert_metrics: BCLConvertMetricsParser,
     test_sample_internal_id: str,
@@ -276,3 +256,30 @@ def test_get_aggregate_yield_q30_for_metrics(
 
     # THEN assert that the aggregate yield Q30 is correct
     assert aggregate_yield_q30 == expected_aggegrated_yield_q30
+
+
+def test_get_yield_for_sample_in_lane(
+    parsed_bcl_convert_metrics: BCLConvertMetricsParser,
+    test_sample_internal_id: str,
+    test_lane: int,
+):
+    """Test that the indexed yield of a sample and lane is the sum of the yield of its reads."""
+    # GIVEN a parsed BCLConvert metrics
+    read_metrics: list[SequencingQualityMetrics] = [
+        metric
+        for metric in parsed_bcl_convert_metrics.quality_metrics
+        if metric.sample_internal_id == test_sample_internal_id and metric.lane == test_lane
+    ]
+
+    # WHEN getting the yield for the sample in the lane
+    yield_: int = parsed_bcl_convert_metrics.get_yield_for_sample_in_lane(
+        sample_internal_id=test_sample_internal_id, lane=test_lane
+    )
+
+    # THEN the yield should be the sum of the yield of the reads
+    assert yield_ == sum(metric.yield_ for metric in read_metrics)
+
+    # THEN a sample not on the lane should have no yield
+    assert not parsed_bcl_convert_metrics.get_yield_for_sample_in_lane(
+        sample_internal_id="missing", lane=test_lane
+    )
@@ -1,6 +1,11 @@
+from datetime import datetime
+
 import pytest
+from pydantic import ValidationError
 
 from cg.constants import Workflow
+from cg.server.dto.orders.orders_request import OrderSortField, OrdersRequest
+from cg.server.dto.pagination import PageCursor
 from cg.services.orders.order_service.models import OrderQueryParams
 
 
@@ -21,3 +26,53 @@ def test_order_query_params_field_validator(workflow: Workflow, expected_workflo
 
     # THEN the BALSAMIC workflow should be expanded to include UMI and QC workflows
     assert order_query_params.workflows == expected_workflows
+
+
+def test_orders_request_decodes_cursor():
+    """Test that the cursor of a request is decoded from the opaque string sent by the client."""
+
+    # GIVEN the cursor of the last order on a page, encoded as sent to the client
+    cursor = PageCursor(
+        sort_field=OrderSortField.ORDER_DATE, value=datetime(year=2024, month=1, day=1), id=42
+    )
+
+    # WHEN parsing a request with the cursor
+    orders_request = OrdersRequest.model_validate({"cursor": cursor.encode()})
+
+    # THEN the cursor should be decoded with the value of the sort column
+    assert orders_request.cursor.id == 42
+    assert orders_request.cursor.value == datetime(year=2024, month=1, day=1)
+
+
+def test_orders_request_invalid_cursor():
+    """Test that a request with a cursor not created by the server is rejected."""
+
+    # GIVEN a cursor that is not encoded by the server
+
+    # WHEN parsing a request with the cursor
+    with pytest.raises(ValidationError):
+        OrdersRequest.model_validate({"cursor": "not-a-cursor"})
+
+    # THEN a validation error is raised
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        PageCursor(sort_field=OrderSortField.ID, value=None, id=42),
+        PageCursor(sort_field=OrderSortField.ORDER_DATE, value="not-a-date", id=42),
+    ],
+    ids=["other sort field", "tampered value"],
+)
+def test_orders_request_cursor_not_matching_sort_field(cursor: PageCursor):
+    """Test that a request with a cursor not matching its sort field is rejected."""
+
+    # GIVEN a cursor that does not match the sort field of the request
+
+    # WHEN parsing a request sorted by order date with the cursor
+    with pytest.raises(ValidationError):
+        OrdersRequest.model_validate(
+            {"cursor": cursor.encode(), "sortField": OrderSortField.ORDER_DATE}
+        )
+
+    # THEN a validation error is raised
@@ -3,7 +3,7 @@ from datetime import datetime
 import pytest
 from mock import Mock
 
-from cg.apps.tb.dto.summary_response import AnalysisSummary
+from cg.apps.tb.dto.summary_response import AnalysisSummary, StatusSummary
 from cg.services.orders.order_summary_service.order_summary_service import (
     OrderSummaryService,
 )
@@ -153,3 +153,42 @@ def order_with_two_cases(
     helpers.add_relationship(store=store, sample=sample_not_received, case=case_1)
     helpers.add_relationship(store=store, sample=sample_not_received, case=case_2)
     return order
+
+
+@pytest.fixture
+def many_orders(
+    store: Store, helpers: StoreHelpers, order: Order, sample_in_preparation: Sample
+) -> list[Order]:
+    orders: list[Order] = [order]
+    for order_number in range(300):
+        new_order: Order = helpers.add_order(
+            store=store, customer_id=order.customer_id, ticket_id=f"ticket_{order_number}"
+        )
+        case: Case = helpers.ensure_case(
+            store=store,
+            customer=order.customer,
+            order=new_order,
+            case_name=f"case_{order_number}",
+            case_id=f"case_{order_number}",
+        )
+        helpers.add_relationship(store=store, sample=sample_in_preparation, case=case)
+        orders.append(new_order)
+    return orders
+
+
+@pytest.fixture
+def many_orders_summary_service(
+    summary_service: OrderSummaryService, many_orders: list[Order]
+) -> OrderSummaryService:
+    summary_service.analysis_client.get_summaries.side_effect = lambda order_ids: [
+        AnalysisSummary(
+            order_id=order_id,
+            cancelled=StatusSummary(),
+            completed=StatusSummary(),
+            delivered=StatusSummary(),
+            failed=StatusSummary(),
+            running=StatusSummary(),
+        )
+        for order_id in order_ids
+    ]
+    return summary_service
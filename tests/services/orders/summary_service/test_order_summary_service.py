@@ -1,8 +1,11 @@
+from cg.apps.tb.dto.summary_response import AnalysisSummary, StatusSummary
 from cg.services.orders.order_summary_service.dto.order_summary import OrderSummary
 from cg.services.orders.order_summary_service.order_summary_service import (
     OrderSummaryService,
 )
+from cg.store.database import get_engine
 from cg.store.models import Order
+from tests.query_helpers import record_queries
 
 
 def test_get_status_summaries(summary_service: OrderSummaryService, order: Order):
@@ -81,3 +84,46 @@ def test_summarize_order_with_two_cases(
 
     # THEN the summary should not contain any case in sequencing
     assert summary.in_sequencing == 0
+
+
+def test_summarize_excludes_cases_in_analysis_summary(
+    summary_service: OrderSummaryService,
+    order_with_cases: Order,
+    analysis_summary: AnalysisSummary,
+):
+    # GIVEN an order with one case in preparation which is also running in the analysis summary
+    analysis_summary.running = StatusSummary(count=1, case_ids=["case_in_preparation"])
+
+    # WHEN creating a summary for the order
+    summary: OrderSummary = summary_service.get_summary(order_with_cases.id)
+
+    # THEN the case should only be counted as running
+    assert summary.running == 1
+    assert summary.in_lab_preparation == 0
+
+    # THEN the case should still be included in the total
+    assert summary.total == 3
+
+
+def test_summarize_many_orders_constant_query_count(
+    many_orders_summary_service: OrderSummaryService, many_orders: list[Order]
+):
+    # GIVEN a few hundred orders, each with a case in lab preparation
+    order_ids: list[int] = [order.id for order in many_orders]
+
+    # GIVEN the number of queries needed to summarise a single order
+    many_orders_summary_service.store.session.expire_all()
+    with record_queries(get_engine()) as single_order_statistics:
+        many_orders_summary_service.get_summaries(order_ids[:1])
+
+    # WHEN creating summaries for all the orders
+    many_orders_summary_service.store.session.expire_all()
+    with record_queries(get_engine()) as statistics:
+        summaries: list[OrderSummary] = many_orders_summary_service.get_summaries(order_ids)
+
+    # THEN all orders should be summarised
+    assert len(summaries) == len(order_ids)
+    assert all(summary.in_lab_preparation == 1 for summary in summaries[1:])
+
+    # THEN the number of queries should not depend on the number of orders
+    assert statistics.statement_count == single_order_statistics.statement_count
@@ -2,7 +2,20 @@ import pytest
 
 from cg.exc import OrderError
 from cg.models.orders.constants import OrderType
+from cg.services.orders.validation.errors.validation_errors import ValidationErrors
+from cg.services.orders.validation.order_type_maps import RuleSet
+from cg.services.orders.validation.order_types.tomte.models.order import TomteOrder
 from cg.services.orders.validation.service import OrderValidationService
+from cg.services.orders.validation.utils import apply_case_sample_validation, apply_case_validation
+from cg.store.database import get_engine
+from cg.store.models import Application
+from cg.store.store import Store
+from tests.query_helpers import record_queries
+from tests.services.orders.validation_service.conftest import (
+    create_case,
+    create_tomte_order,
+    create_tomte_sample,
+)
 
 
 def test_parse_and_validate_pydantic_error(
@@ -19,3 +32,60 @@ def test_parse_and_validate_pydantic_error(
             order_type=OrderType.BALSAMIC,
             user_id=1,
         )
+
+
+def test_rule_validation_errors_same_as_without_prefetching(
+    valid_order: TomteOrder,
+    tomte_validation_service: OrderValidationService,
+    tomte_rule_set: RuleSet,
+    archived_application: Application,
+):
+    # GIVEN an order with a non-existent application, an archived application and a
+    # non-existent panel
+    valid_order.cases[0].samples[0].application = "non_existent_application"
+    valid_order.cases[0].samples[1].application = archived_application.tag
+    valid_order.cases[0].panels = ["non_existent_panel"]
+
+    # GIVEN the errors returned when the rules query the store directly
+    store: Store = tomte_validation_service.store
+    expected_case_errors = apply_case_validation(
+        rules=tomte_rule_set.case_rules, order=valid_order, store=store
+    )
+    expected_case_sample_errors = apply_case_sample_validation(
+        rules=tomte_rule_set.case_sample_rules, order=valid_order, store=store
+    )
+    assert expected_case_errors and expected_case_sample_errors
+
+    # WHEN validating the order with the validation service
+    errors: ValidationErrors = tomte_validation_service._get_rule_validation_errors(
+        order=valid_order, rule_set=tomte_rule_set
+    )
+
+    # THEN the same errors should be returned
+    assert errors.case_errors == expected_case_errors
+    assert errors.case_sample_errors == expected_case_sample_errors
+
+
+def test_rule_validation_query_count_independent_of_sample_count(
+    tomte_validation_service: OrderValidationService, tomte_rule_set: RuleSet
+):
+    # GIVEN a small order and an order with a full plate of samples
+    small_order: TomteOrder = create_tomte_order([create_case([create_tomte_sample(1)])])
+    large_order: TomteOrder = create_tomte_order(
+        [create_case([create_tomte_sample(id) for id in range(1, 97)])]
+    )
+
+    # GIVEN the number of queries needed to validate the small order
+    with record_queries(get_engine()) as small_order_statistics:
+        tomte_validation_service._get_rule_validation_errors(
+            order=small_order, rule_set=tomte_rule_set
+        )
+
+    # WHEN validating the large order
+    with record_queries(get_engine()) as statistics:
+        tomte_validation_service._get_rule_validation_errors(
+            order=large_order, rule_set=tomte_rule_set
+        )
+
+    # THEN the number of queries should not depend on the number of samples
+    assert statistics.statement_count <= small_order_statistics.statement_count
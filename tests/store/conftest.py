@@ -481,6 +481,26 @@ def store_with_cases_with_customers_and_actions(store: Store, helpers: StoreHelp
     return store
 
 
+@pytest.fixture
+def store_with_cases_with_linked_samples(store: Store, helpers: StoreHelpers) -> Store:
+    """Return a store with cases, each linked to a child sample and its parents."""
+    for case_number in range(5):
+        case: Case = helpers.add_case(
+            store=store,
+            internal_id=f"case_id_00{case_number}",
+            name=f"case_name_00{case_number}",
+        )
+        mother: Sample = helpers.add_sample(
+            store=store, internal_id=f"mother_00{case_number}", application_tag="WGSPCFC030"
+        )
+        father: Sample = helpers.add_sample(store=store, internal_id=f"father_00{case_number}")
+        child: Sample = helpers.add_sample(store=store, internal_id=f"child_00{case_number}")
+        helpers.add_relationship(store=store, sample=mother, case=case)
+        helpers.add_relationship(store=store, sample=father, case=case)
+        helpers.add_relationship(store=store, sample=child, case=case, mother=mother, father=father)
+    return store
+
+
 @pytest.fixture
 def illumina_flow_cell_internal_id() -> str:
     return "FC123456"
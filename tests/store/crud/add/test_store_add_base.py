@@ -2,19 +2,47 @@ from datetime import datetime as dt
 
 import pytest
 
+from cg.constants.devices import DeviceType
 from cg.constants.subject import Sex
-from cg.services.illumina.data_transfer.models import IlluminaFlowCellDTO
-from cg.store.exc import EntryNotFoundError, EntryAlreadyExistsError
+from cg.services.illumina.data_transfer.models import (
+    IlluminaFlowCellDTO,
+    IlluminaSampleSequencingMetricsDTO,
+)
+from cg.store.database import get_engine
+from cg.store.exc import EntryAlreadyExistsError, EntryNotFoundError
 from cg.store.models import (
     ApplicationVersion,
     Collaboration,
     Customer,
+    IlluminaFlowCell,
+    IlluminaSequencingRun,
     Organism,
     Sample,
     User,
-    IlluminaFlowCell,
 )
 from cg.store.store import Store
+from tests.query_helpers import record_queries
+from tests.store_helpers import StoreHelpers
+
+
+def get_sample_metrics_dtos(
+    sample_ids: list[str], lanes: int
+) -> list[IlluminaSampleSequencingMetricsDTO]:
+    return [
+        IlluminaSampleSequencingMetricsDTO(
+            sample_id=sample_id,
+            type=DeviceType.ILLUMINA,
+            flow_cell_lane=lane,
+            total_reads_in_lane=100,
+            base_passing_q30_percent=90,
+            base_mean_quality_score=35,
+            yield_=100,
+            yield_q30=0.9,
+            created_at=dt.now(),
+        )
+        for sample_id in sample_ids
+        for lane in range(1, lanes + 1)
+    ]
 
 
 def test_add_collaboration(store: Store):
@@ -153,3 +181,118 @@ def test_add_illumina_flow_cell_already_exists(
     # THEN a EntryAlreadyExistsError should be raised
     with pytest.raises(EntryAlreadyExistsError):
         store.add_illumina_flow_cell(illumina_flow_cell_dto)
+
+
+def test_add_illumina_sample_metrics_entries(store: Store, helpers: StoreHelpers):
+    # GIVEN a sequencing run and samples in the store
+    flow_cell: IlluminaFlowCell = helpers.add_illumina_flow_cell(store=store)
+    sequencing_run: IlluminaSequencingRun = helpers.add_illumina_sequencing_run(
+        store=store, flow_cell=flow_cell
+    )
+    sample_ids: list[str] = [
+        helpers.add_sample(store=store, internal_id=f"ACC{index}").internal_id for index in range(3)
+    ]
+
+    # WHEN adding the metrics of the samples on two lanes
+    store.add_illumina_sample_metrics_entries(
+        metrics_dtos=get_sample_metrics_dtos(sample_ids=sample_ids, lanes=2),
+        sequencing_run=sequencing_run,
+    )
+
+    # THEN the metrics should be added for every sample and lane
+    assert len(sequencing_run.sample_metrics) == 6
+    for sample_id in sample_ids:
+        sample: Sample = store.get_sample_by_internal_id(sample_id)
+        assert {metrics.flow_cell_lane for metrics in sample.sample_run_metrics} == {1, 2}
+
+
+def test_add_illumina_sample_metrics_entries_without_bulk_returning(
+    store: Store, helpers: StoreHelpers, monkeypatch: pytest.MonkeyPatch
+):
+    # GIVEN a sequencing run and samples in the store
+    flow_cell: IlluminaFlowCell = helpers.add_illumina_flow_cell(store=store)
+    sequencing_run: IlluminaSequencingRun = helpers.add_illumina_sequencing_run(
+        store=store, flow_cell=flow_cell
+    )
+    sample_ids: list[str] = [
+        helpers.add_sample(store=store, internal_id=f"ACC{index}").internal_id for index in range(3)
+    ]
+
+    # GIVEN a database that does not return the ids of rows inserted in bulk, such as MySQL
+    monkeypatch.setattr(get_engine().dialect, "insert_executemany_returning", False)
+
+    # WHEN adding the metrics of the samples on two lanes
+    store.add_illumina_sample_metrics_entries(
+        metrics_dtos=get_sample_metrics_dtos(sample_ids=sample_ids, lanes=2),
+        sequencing_run=sequencing_run,
+    )
+
+    # THEN the metrics should be added for every sample and lane
+    assert len(sequencing_run.sample_metrics) == 6
+    for sample_id in sample_ids:
+        sample: Sample = store.get_sample_by_internal_id(sample_id)
+        assert {metrics.flow_cell_lane for metrics in sample.sample_run_metrics} == {1, 2}
+
+
+@pytest.mark.parametrize("returns_bulk_insert_ids", [True, False])
+def test_add_illumina_sample_metrics_entries_query_count(
+    store: Store,
+    helpers: StoreHelpers,
+    monkeypatch: pytest.MonkeyPatch,
+    returns_bulk_insert_ids: bool,
+):
+    # GIVEN a database that returns or does not return the ids of rows inserted in bulk
+    monkeypatch.setattr(
+        get_engine().dialect, "insert_executemany_returning", returns_bulk_insert_ids
+    )
+
+    # GIVEN a sequencing run and samples in the store
+    flow_cell: IlluminaFlowCell = helpers.add_illumina_flow_cell(store=store)
+    sequencing_run: IlluminaSequencingRun = helpers.add_illumina_sequencing_run(
+        store=store, flow_cell=flow_cell
+    )
+    sample_ids: list[str] = [
+        helpers.add_sample(store=store, internal_id=f"ACC{index}").internal_id
+        for index in range(20)
+    ]
+    store.session.commit()
+    store.session.refresh(sequencing_run)
+
+    # WHEN adding the metrics of a few and of many samples
+    statement_counts: list[int] = []
+    metrics_counts: list[int] = []
+    for samples in (sample_ids[:2], sample_ids[2:]):
+        metrics_dtos: list[IlluminaSampleSequencingMetricsDTO] = get_sample_metrics_dtos(
+            sample_ids=samples, lanes=8
+        )
+        with record_queries(get_engine()) as statistics:
+            store.add_illumina_sample_metrics_entries(
+                metrics_dtos=metrics_dtos, sequencing_run=sequencing_run
+            )
+        statement_counts.append(statistics.statement_count)
+        metrics_counts.append(len(metrics_dtos))
+
+    # THEN the samples should be fetched and the metrics inserted with a constant number of statements
+    if returns_bulk_insert_ids:
+        assert statement_counts[0] == statement_counts[1]
+    else:
+        # Known limitation: databases without RETURNING for bulk inserts, such as MySQL, insert the
+        # parent rows one statement per metrics entry
+        assert statement_counts[1] - statement_counts[0] == metrics_counts[1] - metrics_counts[0]
+
+
+def test_add_illumina_sample_metrics_entries_missing_sample(store: Store, helpers: StoreHelpers):
+    # GIVEN a sequencing run in the store
+    flow_cell: IlluminaFlowCell = helpers.add_illumina_flow_cell(store=store)
+    sequencing_run: IlluminaSequencingRun = helpers.add_illumina_sequencing_run(
+        store=store, flow_cell=flow_cell
+    )
+
+    # WHEN adding metrics of a sample not in the store
+
+    # THEN an EntryNotFoundError should be raised
+    with pytest.raises(EntryNotFoundError):
+        store.add_illumina_sample_metrics_entries(
+            metrics_dtos=get_sample_metrics_dtos(sample_ids=["missing"], lanes=1),
+            sequencing_run=sequencing_run,
+        )
@@ -540,3 +540,15 @@ def order_balsamic(helpers: StoreHelpers, store: Store) -> Order:
     )
     order.cases.append(case)
     return order
+
+
+@pytest.fixture
+def orders_on_same_date(helpers: StoreHelpers, store: Store) -> list[Order]:
+    """Return five orders placed on the same date, each with one case."""
+    orders: list[Order] = []
+    for ticket_id in range(1, 6):
+        case: Case = helpers.add_case(store=store, name=f"same_date_case_{ticket_id}")
+        order: Order = helpers.add_order(store=store, customer_id=1, ticket_id=ticket_id)
+        order.cases.append(case)
+        orders.append(order)
+    return orders
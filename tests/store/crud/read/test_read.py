@@ -9,6 +9,8 @@ from cg.constants.constants import CaseActions, Workflow
 from cg.constants.sequencing import SeqLibraryPrepCategory
 from cg.constants.subject import PhenotypeStatus
 from cg.exc import BedVersionNotFoundError, CgError
+from cg.server.dto.orders.orders_request import OrderSortField, SortOrder
+from cg.server.dto.pagination import PageCursor
 from cg.services.orders.order_service.models import OrderQueryParams
 from cg.store.models import (
     Analysis,
@@ -1278,3 +1280,96 @@ def test_get_orders_mip_dna_and_limit_filter(
 
     # THEN we should get the expected number of orders returned
     assert len(orders) == expected_returned
+
+
+@pytest.mark.parametrize("sort_order", [SortOrder.ASC, SortOrder.DESC])
+def test_get_orders_after_cursor(store: Store, orders_on_same_date: list[Order], sort_order: str):
+    # GIVEN a store with five orders placed on the same date
+    params = OrderQueryParams(
+        sort_field=OrderSortField.ORDER_DATE, sort_order=sort_order, page_size=None
+    )
+    all_orders, _ = store.get_orders(params)
+
+    # WHEN fetching the orders two at a time, starting each page after the last order
+    paged_orders: list[Order] = []
+    cursor: PageCursor | None = None
+    while True:
+        params = OrderQueryParams(
+            sort_field=OrderSortField.ORDER_DATE, sort_order=sort_order, page_size=2, cursor=cursor
+        )
+        orders, _ = store.get_orders(params)
+        if not orders:
+            break
+        paged_orders.extend(orders)
+        cursor = PageCursor(value=orders[-1].order_date, id=orders[-1].id)
+
+    # THEN all orders should be returned once and in the same order as without pagination
+    assert paged_orders == all_orders
+
+
+def test_get_orders_estimated_total(
+    store: Store, orders_on_same_date: list[Order], monkeypatch: pytest.MonkeyPatch
+):
+    # GIVEN a store with five orders and a limit of three for estimated totals
+    monkeypatch.setattr("cg.store.base.ESTIMATED_TOTAL_LIMIT", 3)
+
+    # WHEN fetching the orders with an estimated total
+    orders, total = store.get_orders(OrderQueryParams(page_size=2, estimate_total=True))
+
+    # THEN the total should stop at the limit
+    assert total == 3
+    assert len(orders) == 2
+
+
+def test_get_cases_by_customers_action_and_case_search_after_cursor(
+    store: Store, orders_on_same_date: list[Order]
+):
+    # GIVEN a store with five cases
+    all_cases, total = store.get_cases_by_customers_action_and_case_search(
+        customers=None, action=None, case_search=None
+    )
+    assert total == 5
+
+    # WHEN fetching the cases two at a time, starting each page after the last case
+    paged_cases: list[Case] = []
+    cursor: PageCursor | None = None
+    while True:
+        cases, _ = store.get_cases_by_customers_action_and_case_search(
+            customers=None, action=None, case_search=None, limit=2, cursor=cursor
+        )
+        if not cases:
+            break
+        paged_cases.extend(cases)
+        cursor = PageCursor(value=cases[-1].created_at, id=cases[-1].id)
+
+    # THEN all cases should be returned once and in the same order as without pagination
+    assert paged_cases == all_cases
+
+
+def test_get_cases_after_cursor_without_creation_date(
+    store: Store, orders_on_same_date: list[Order]
+):
+    # GIVEN a store with five cases, of which two have no creation date
+    for order in orders_on_same_date[:2]:
+        order.cases[0].created_at = None
+    store.commit_to_store()
+    all_cases, _ = store.get_cases_by_customers_action_and_case_search(
+        customers=None, action=None, case_search=None
+    )
+
+    # WHEN fetching the cases two at a time, starting each page after the last case
+    paged_cases: list[Case] = []
+    cursor: PageCursor | None = None
+    while True:
+        cases, _ = store.get_cases_by_customers_action_and_case_search(
+            customers=None, action=None, case_search=None, limit=2, cursor=cursor
+        )
+        if not cases:
+            break
+        paged_cases.extend(cases)
+        cursor = PageCursor(value=cases[-1].created_at, id=cases[-1].id)
+
+    # THEN all cases, including those without a creation date, should be returned once and in
+    # the same order as without pagination
+    assert paged_cases == all_cases
+    assert len(paged_cases) == 5
@@ -11,8 +11,11 @@ from cg.constants.sequencing import DNA_PREP_CATEGORIES, SeqLibraryPrepCategory
 from cg.exc import SampleNotFoundError
 from cg.models.orders.constants import OrderType
 from cg.server.dto.samples.requests import CollaboratorSamplesRequest
+from cg.store.database import get_engine
+from cg.store.loader_profiles import LoaderProfile
 from cg.store.models import Customer, Invoice, OrderTypeApplication, Sample
 from cg.store.store import Store
+from tests.query_helpers import record_queries
 from tests.store_helpers import StoreHelpers
 
 
@@ -586,6 +589,74 @@ def test_get_cases_by_customers_action_and_case_search(
     assert all(case.action == "analyze" for case in cases)
 
 
+def test_get_cases_by_customers_action_and_case_search_with_loader_profile(
+    store_with_cases_with_linked_samples: Store,
+):
+    """Test that serialising a page of cases with links uses a bounded number of queries."""
+    # GIVEN a store with cases linked to samples and parents
+    store: Store = store_with_cases_with_linked_samples
+
+    # GIVEN the number of queries used to fetch and serialise a page with one case
+    store.session.expire_all()
+    with record_queries(get_engine()) as single_case_statistics:
+        cases, _ = store.get_cases_by_customers_action_and_case_search(
+            customers=None,
+            action=None,
+            case_search=None,
+            limit=1,
+            loader_profile=LoaderProfile.CASE_WITH_LINKS,
+        )
+        [case.to_dict(links=True) for case in cases]
+
+    # WHEN fetching and serialising a page with all cases
+    store.session.expire_all()
+    with record_queries(get_engine()) as statistics:
+        cases, total = store.get_cases_by_customers_action_and_case_search(
+            customers=None,
+            action=None,
+            case_search=None,
+            loader_profile=LoaderProfile.CASE_WITH_LINKS,
+        )
+        serialised_cases: list[dict] = [case.to_dict(links=True) for case in cases]
+
+    # THEN all cases should be serialised with their linked samples
+    assert len(serialised_cases) == total == 5
+    assert all(len(case["links"]) == 3 for case in serialised_cases)
+
+    # THEN the number of queries should not depend on the number of cases
+    assert statistics.statement_count == single_case_statistics.statement_count
+
+
+def test_get_samples_by_customers_and_pattern_with_loader_profile(
+    store_with_cases_with_linked_samples: Store,
+):
+    """Test that serialising a page of samples uses a bounded number of queries."""
+    # GIVEN a store with samples with different applications
+    store: Store = store_with_cases_with_linked_samples
+
+    # GIVEN the number of queries used to fetch and serialise a page with one sample
+    store.session.expire_all()
+    with record_queries(get_engine()) as single_sample_statistics:
+        samples, _ = store.get_samples_by_customers_and_pattern(
+            limit=1, loader_profile=LoaderProfile.SAMPLE
+        )
+        [sample.to_dict() for sample in samples]
+
+    # WHEN fetching and serialising a page with all samples
+    store.session.expire_all()
+    with record_queries(get_engine()) as statistics:
+        samples, total = store.get_samples_by_customers_and_pattern(
+            loader_profile=LoaderProfile.SAMPLE
+        )
+        serialised_samples: list[dict] = [sample.to_dict() for sample in samples]
+
+    # THEN all samples should be serialised
+    assert len(serialised_samples) == total == 15
+
+    # THEN the number of queries should not depend on the number of samples
+    assert statistics.statement_count == single_sample_statistics.statement_count
+
+
 def test_get_related_samples(
     store_with_rna_and_dna_samples_and_cases: Store,
     rna_sample: Sample,
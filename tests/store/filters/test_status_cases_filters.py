@@ -231,7 +231,7 @@ def test_filter_cases_with_loqusdb_supported_workflow(
     base_store.session.add_all([link_1, link_2])
 
     # GIVEN a cases Query
-    cases: Query = base_store._join_sample_and_case()
+    cases: Query = base_store._get_join_case_and_sample_query()
 
     # WHEN getting cases with workflow
     cases: list[Query] = list(filter_cases_with_loqusdb_supported_workflow(cases=cases))
@@ -261,7 +261,7 @@ def test_filter_cases_with_loqusdb_supported_sequencing_method(
     base_store.session.add(link)
 
     # GIVEN a cases Query
-    cases: Query = base_store._join_sample_and_case()
+    cases: Query = base_store._get_join_case_and_sample_query()
 
     # WHEN retrieving the available cases
     cases: Query = filter_cases_with_loqusdb_supported_sequencing_method(
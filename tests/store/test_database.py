@@ -0,0 +1,96 @@
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.pool import QueuePool
+
+from cg.store import database
+from cg.store.database import (
+    DatabasePoolSettings,
+    PoolClass,
+    create_all_tables,
+    get_engine,
+    initialize_database,
+    read_from_replica,
+)
+from cg.store.models import Base, Organism
+from cg.store.store import Store
+
+
+@pytest.fixture
+def replicated_store(tmp_path: Path) -> Store:
+    """Return a store with a read replica that holds an organism missing from the primary."""
+    initialize_database(
+        f"sqlite:///{tmp_path / 'primary.db'}",
+        read_replica_uri=f"sqlite:///{tmp_path / 'replica.db'}",
+    )
+    store = Store()
+    create_all_tables()
+    Base.metadata.create_all(database.READ_REPLICA_ENGINE)
+    with database.READ_REPLICA_ENGINE.begin() as connection:
+        connection.execute(insert(Organism).values(internal_id="replica", name="replica"))
+    return store
+
+
+def test_initialize_database_with_pool_settings(caplog: pytest.LogCaptureFixture):
+    # GIVEN pool settings for a queue pool
+    pool_settings = DatabasePoolSettings(
+        pool_class=PoolClass.QUEUE, pool_size=3, max_overflow=2, pool_recycle=3600
+    )
+
+    # WHEN initialising the database
+    caplog.set_level(logging.INFO)
+    initialize_database("sqlite:///", pool_settings=pool_settings)
+
+    # THEN the engine should use the configured pool
+    pool = get_engine().pool
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == 3
+    assert pool._max_overflow == 2
+    assert pool._recycle == 3600
+
+    # THEN the effective pool settings should be logged
+    assert "QueuePool, pre-ping True, recycle 3600 s, size 3, max overflow 2" in caplog.text
+
+
+def test_reads_are_routed_to_read_replica(replicated_store: Store):
+    # GIVEN a store with a read replica
+
+    # WHEN reading the organisms in a block reading from the replica
+    with read_from_replica():
+        organisms: list[Organism] = replicated_store.get_all_organisms().all()
+
+    # THEN they should be read from the replica
+    assert [organism.internal_id for organism in organisms] == ["replica"]
+
+
+def test_reads_are_routed_to_primary_by_default(replicated_store: Store):
+    # GIVEN a store with a read replica
+
+    # WHEN reading the organisms outside of a block reading from the replica
+    organisms: list[Organism] = replicated_store.get_all_organisms().all()
+
+    # THEN they should be read from the primary
+    assert not organisms
+
+
+def test_reads_after_write_are_routed_to_primary(replicated_store: Store):
+    # GIVEN a store with a read replica and an organism added to the primary
+    with read_from_replica():
+        replicated_store.session.add(Organism(internal_id="primary", name="primary"))
+        replicated_store.session.flush()
+
+        # WHEN reading the organisms in the same transaction
+        organisms: list[Organism] = replicated_store.get_all_organisms().all()
+
+        # THEN they should be read from the primary to include the written organism
+        assert [organism.internal_id for organism in organisms] == ["primary"]
+
+        # WHEN committing the transaction
+        replicated_store.session.commit()
+
+        # THEN the following reads of the session should still be routed to the primary
+        assert [organism.internal_id for organism in replicated_store.get_all_organisms()] == [
+            "primary"
+        ]
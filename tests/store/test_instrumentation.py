@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from cg.store.database import get_engine
+from cg.store.instrumentation import (
+    SLOWEST_STATEMENTS_TO_KEEP,
+    QueryStatistics,
+    get_current_statistics,
+    start_recording,
+    stop_recording,
+)
+from cg.store.store import Store
+from tests.query_helpers import record_queries
+from tests.store_helpers import StoreHelpers
+
+
+def test_record_queries(store: Store, helpers: StoreHelpers):
+    """Test that the statements executed within the block are recorded."""
+    # GIVEN a store with a sample
+    sample_id: str = helpers.add_sample(store=store).internal_id
+
+    # WHEN fetching the sample twice while recording queries
+    with record_queries(get_engine()) as statistics:
+        store.get_sample_by_internal_id(sample_id)
+        store.get_sample_by_internal_id(sample_id)
+
+    # THEN two statements should have been recorded
+    assert statistics.statement_count == 2
+
+    # THEN the time spent executing them should be recorded
+    assert statistics.total_duration > 0
+    assert len(statistics.slowest_statements) == 2
+
+
+def test_record_queries_stops_recording_on_exit(store: Store, helpers: StoreHelpers):
+    """Test that statements executed after the block are not recorded."""
+    # GIVEN a store with a sample
+    sample_id: str = helpers.add_sample(store=store).internal_id
+
+    # GIVEN that queries have been recorded
+    with record_queries(get_engine()) as statistics:
+        store.get_sample_by_internal_id(sample_id)
+
+    # WHEN fetching the sample after the block
+    store.get_sample_by_internal_id(sample_id)
+
+    # THEN only the statement executed within the block should be recorded
+    assert statistics.statement_count == 1
+    assert get_current_statistics() is None
+
+
+def test_start_and_stop_recording(store: Store, helpers: StoreHelpers):
+    """Test recording the statements of a command on an instrumented engine."""
+    # GIVEN a store with a sample and an instrumented engine
+    sample_id: str = helpers.add_sample(store=store).internal_id
+    engine: Engine = get_engine()
+    with record_queries(engine):
+        pass
+
+    # GIVEN that recording has been started
+    start_recording()
+
+    # WHEN fetching the sample and stopping the recording
+    store.get_sample_by_internal_id(sample_id)
+    statistics: QueryStatistics | None = stop_recording()
+
+    # THEN the statement should have been recorded
+    assert statistics.statement_count == 1
+
+    # THEN nothing should be recorded after stopping
+    assert get_current_statistics() is None
+
+
+def test_query_statistics_keep_slowest_statements():
+    """Test that only the slowest statements are kept."""
+    # GIVEN empty query statistics
+    statistics = QueryStatistics()
+
+    # WHEN adding more statements than are kept
+    for duration in range(SLOWEST_STATEMENTS_TO_KEEP + 2):
+        statistics.add_statement(statement=f"SELECT {duration}", duration=duration)
+
+    # THEN all statements should be counted
+    assert statistics.statement_count == SLOWEST_STATEMENTS_TO_KEEP + 2
+
+    # THEN only the slowest statements should be kept, slowest first
+    assert len(statistics.slowest_statements) == SLOWEST_STATEMENTS_TO_KEEP
+    assert statistics.slowest_statements[0].duration == SLOWEST_STATEMENTS_TO_KEEP + 1
+
+    # THEN the statistics can be reported in a Server-Timing header
+    assert 'desc="7 queries"' in statistics.server_timing
+
+
+def test_record_queries_after_failed_statement(store: Store):
+    """Test that a failed statement does not affect the timing of the next statements."""
+    # GIVEN an instrumented engine where a statement has failed
+    engine: Engine = get_engine()
+    with record_queries(engine) as statistics:
+        with pytest.raises(OperationalError):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT * FROM missing_table"))
+
+        # WHEN executing a statement after the failed one
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    # THEN only the successful statement should be recorded
+    assert statistics.statement_count == 1
+    assert statistics.slowest_statements[0].statement == "SELECT 1"
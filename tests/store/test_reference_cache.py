@@ -0,0 +1,91 @@
+from cg.store.database import create_all_tables, get_engine, initialize_database
+from cg.store.models import Application, Customer
+from cg.store.reference_cache import ReferenceCache
+from cg.store.store import Store
+from tests.query_helpers import record_queries
+from tests.store_helpers import StoreHelpers
+
+
+def test_get_application_by_tag_is_cached(store: Store, helpers: StoreHelpers):
+    """Test that an application is only fetched from the database once."""
+    # GIVEN a store with an application that has been fetched by tag
+    application: Application = helpers.ensure_application(store=store, tag="WGSPCFC030")
+    store.session.commit()
+    store.get_application_by_tag(application.tag)
+
+    # WHEN fetching the application by tag again in a new session
+    store.session.expunge_all()
+    with record_queries(get_engine()) as statistics:
+        cached_application: Application = store.get_application_by_tag(application.tag)
+
+    # THEN the application should be returned without querying the database
+    assert statistics.statement_count == 0
+    assert cached_application.tag == application.tag
+
+    # THEN it should be attached to the session
+    assert cached_application in store.session
+
+
+def test_get_customer_by_internal_id_after_update(store: Store, helpers: StoreHelpers):
+    """Test that updating a customer invalidates the cached customers."""
+    # GIVEN a store with a cached customer
+    customer: Customer = helpers.ensure_customer(store=store, customer_id="cust000")
+    store.session.commit()
+    store.get_customer_by_internal_id("cust000")
+
+    # WHEN updating the name of the customer
+    customer.name = "New name"
+    store.session.commit()
+
+    # THEN the updated customer should be returned in a new session
+    store.session.expunge_all()
+    assert store.get_customer_by_internal_id("cust000").name == "New name"
+
+
+def test_get_customer_by_internal_id_after_delete(store: Store, helpers: StoreHelpers):
+    """Test that deleting a customer invalidates the cached customers."""
+    # GIVEN a store with a cached customer
+    customer: Customer = helpers.ensure_customer(store=store, customer_id="cust000")
+    store.session.commit()
+    store.get_customer_by_internal_id("cust000")
+
+    # WHEN deleting the customer
+    store.session.delete(customer)
+
+    # THEN the customer should no longer be returned
+    assert store.get_customer_by_internal_id("cust000") is None
+
+
+def test_reference_cache_entries_expire(store: Store, helpers: StoreHelpers):
+    """Test that cached entries are fetched again once expired."""
+    # GIVEN a cache with a time to live of zero seconds
+    cache = ReferenceCache(ttl=0)
+    application: Application = helpers.ensure_application(store=store, tag="WGSPCFC030")
+    store.session.commit()
+    cache.set(
+        model=Application, identifier=application.tag, entry=application, session=store.session
+    )
+
+    # WHEN getting the application from the cache
+    cached_application = cache.get(
+        model=Application, identifier=application.tag, session=store.session
+    )
+
+    # THEN it should have expired
+    assert cached_application is None
+
+
+def test_reference_cache_is_cleared_for_new_database(store: Store, helpers: StoreHelpers):
+    """Test that the cache does not hold entries of a previous database."""
+    # GIVEN that an application has been cached
+    helpers.ensure_application(store=store, tag="WGSPCFC030")
+    store.session.commit()
+    store.get_application_by_tag("WGSPCFC030")
+
+    # WHEN initialising a new database
+    initialize_database("sqlite:///")
+    new_store = Store()
+    create_all_tables()
+
+    # THEN the application should not be returned from the new database
+    assert new_store.get_application_by_tag("WGSPCFC030") is None
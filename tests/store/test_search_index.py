@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy import delete, select
+
+from cg.constants.constants import SearchEntity
+from cg.store.models import Case, Sample, SearchTrigram
+from cg.store.search_index import get_trigrams, is_indexed_search
+from cg.store.store import Store
+from tests.store_helpers import StoreHelpers
+
+
+def get_indexed_trigrams(store: Store, entity: SearchEntity, entity_id: int) -> set[str]:
+    return set(
+        store.session.scalars(
+            select(SearchTrigram.trigram).where(
+                SearchTrigram.entity == entity, SearchTrigram.entity_id == entity_id
+            )
+        )
+    )
+
+
+def test_get_trigrams():
+    # GIVEN an internal id and a name
+
+    # WHEN getting their trigrams
+    trigrams: set[str] = get_trigrams("ACC1", "ab")
+
+    # THEN the lower case trigrams of the values long enough should be returned
+    assert trigrams == {"acc", "cc1"}
+
+
+def test_is_indexed_search():
+    # GIVEN search terms that are too short or contain wildcards, and one that is not
+
+    # WHEN checking whether the index can be used
+
+    # THEN only the term long enough and without wildcards should use the index
+    assert is_indexed_search("ACC1")
+    assert not is_indexed_search("AC")
+    assert not is_indexed_search("ACC_1")
+    assert not is_indexed_search(None)
+
+
+def test_sample_is_indexed_on_insert(store: Store, helpers: StoreHelpers):
+    # GIVEN a store
+
+    # WHEN adding a sample
+    sample: Sample = helpers.add_sample(store=store, internal_id="ACC123", name="sample")
+
+    # THEN the trigrams of its internal id and name should be indexed
+    assert get_indexed_trigrams(
+        store=store, entity=SearchEntity.SAMPLE, entity_id=sample.id
+    ) == get_trigrams("ACC123", "sample")
+
+
+def test_case_is_reindexed_on_rename(store: Store, helpers: StoreHelpers):
+    # GIVEN a store with a case
+    case: Case = helpers.add_case(store=store, name="old_name")
+
+    # WHEN renaming the case
+    case.name = "renamed"
+    store.session.commit()
+
+    # THEN only the trigrams of the new name should be indexed
+    assert get_indexed_trigrams(
+        store=store, entity=SearchEntity.CASE, entity_id=case.id
+    ) == get_trigrams(case.internal_id, "renamed")
+
+    # THEN the case should be found by its new name only
+    assert store.get_cases_by_customers_action_and_case_search(
+        customers=None, action=None, case_search="NAMED"
+    )[0] == [case]
+    assert not store.get_cases_by_customers_action_and_case_search(
+        customers=None, action=None, case_search="old_na"
+    )[0]
+
+
+def test_sample_is_removed_from_index_on_delete(store: Store, helpers: StoreHelpers):
+    # GIVEN a store with a sample
+    sample: Sample = helpers.add_sample(store=store, internal_id="ACC123")
+    sample_id: int = sample.id
+
+    # WHEN deleting the sample
+    store.session.delete(sample)
+    store.session.commit()
+
+    # THEN its trigrams should be removed from the index
+    assert not get_indexed_trigrams(store=store, entity=SearchEntity.SAMPLE, entity_id=sample_id)
+
+
+def test_search_samples_by_substring(store: Store, helpers: StoreHelpers):
+    # GIVEN a store with two samples
+    sample: Sample = helpers.add_sample(store=store, internal_id="ACC123", name="blue_whale")
+    helpers.add_sample(store=store, internal_id="ACC456", name="red_fox")
+    customer = sample.customer
+
+    # WHEN searching for a substring of the name of one of them in upper case
+    samples, total = store.get_samples_by_customers_and_pattern(
+        customers=[customer], pattern="WHAL"
+    )
+
+    # THEN only that sample should be returned
+    assert samples == [sample]
+    assert total == 1
+
+
+def test_search_samples_by_unselective_substring(
+    store: Store, helpers: StoreHelpers, monkeypatch: pytest.MonkeyPatch
+):
+    # GIVEN a store with two samples sharing all trigrams of a search term
+    first_sample: Sample = helpers.add_sample(store=store, internal_id="ACC123", name="first")
+    second_sample: Sample = helpers.add_sample(store=store, internal_id="ACC456", name="second")
+
+    # GIVEN that the index only narrows the search down to a single candidate
+    monkeypatch.setattr("cg.store.search_index.MAX_INDEXED_CANDIDATES", 2)
+
+    # WHEN searching for the shared substring
+    samples, _ = store.get_samples_by_customers_and_pattern(pattern="acc")
+
+    # THEN both samples should be found by scanning the table
+    assert set(samples) == {first_sample, second_sample}
+
+
+def test_search_samples_without_index_entries(store: Store, helpers: StoreHelpers):
+    # GIVEN a store with a sample
+    sample: Sample = helpers.add_sample(store=store, internal_id="ACC123", name="blue_whale")
+
+    # GIVEN that no samples are indexed, as before the index has been populated
+    store.session.execute(delete(SearchTrigram).where(SearchTrigram.entity == SearchEntity.SAMPLE))
+
+    # WHEN searching for a substring of the name of the sample
+    samples, _ = store.get_samples_by_customers_and_pattern(pattern="whal")
+
+    # THEN the sample should be found by scanning the table
+    assert samples == [sample]
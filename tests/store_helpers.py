@@ -835,11 +835,15 @@ class StoreHelpers:
             yield_q30=0.9,
             created_at=datetime.now(),
         )
-        metrics: IlluminaSampleSequencingMetrics = store.add_illumina_sample_metrics_entry(
-            metrics_dto=metrics_dto, sequencing_run=sequencing_run
+        store.add_illumina_sample_metrics_entries(
+            metrics_dtos=[metrics_dto], sequencing_run=sequencing_run
         )
         store.session.commit()
-        return metrics
+        return store.get_illumina_metrics_entry_by_device_sample_and_lane(
+            device_internal_id=sequencing_run.device.internal_id,
+            sample_internal_id=sample_id,
+            lane=lane,
+        )
 
     @classmethod
     def ensure_illumina_sample_sequencing_metrics_object(
@@ -1,9 +1,40 @@
+import hashlib
+import os
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from cg.constants import FileExtensions
-from cg.utils.checksum.checksum import check_md5sum, extract_md5sum, is_md5sum_correct
+from cg.utils.checksum import checksum
+from cg.utils.checksum.cache import (
+    ChecksumAlgorithm,
+    ChecksumCache,
+    FileChecksums,
+    FileSignature,
+    configure_checksum_cache,
+)
+from cg.utils.checksum.checksum import (
+    compute_checksums,
+    extract_md5sum,
+    get_checksums,
+    get_checksums_for_files,
+)
+
+
+@pytest.fixture
+def large_file(tmp_path: Path) -> Path:
+    """Return a file spanning several read chunks."""
+    file_path = Path(tmp_path, "large.spring")
+    file_path.write_bytes(os.urandom(checksum.BYTES_PER_CHUNK * 2 + 123))
+    return file_path
+
+
+@pytest.fixture
+def in_memory_checksum_cache() -> ChecksumCache:
+    """Use a new in memory checksum cache."""
+    configure_checksum_cache(None)
+    return checksum.get_checksum_cache()
 
 
 def test_checksum(fastq_file: Path):
@@ -11,13 +42,11 @@ def test_checksum(fastq_file: Path):
     # GIVEN a fastq file with a correct md5 file and a fastq file with an incorrect md5 file
     bad_md5sum_file_path: Path = fastq_file.parent.joinpath("fastq_run_R1_001.fastq.gz")
 
-    # THEN a file with a correct md5 sum should return true
-    assert check_md5sum(file_path=fastq_file, md5sum="a95cbb265540a2261fce941059784fd1")
+    # THEN a file with a correct md5 sum should match it
+    assert get_checksums(fastq_file).md5 == "a95cbb265540a2261fce941059784fd1"
 
-    # THEN a file with an incorrect md5 sum should return false
-    assert not check_md5sum(
-        file_path=bad_md5sum_file_path, md5sum="c690b0124173772ec4cbbc43709d84ee"
-    )
+    # THEN a file with an incorrect md5 sum should not match it
+    assert get_checksums(bad_md5sum_file_path).md5 != "c690b0124173772ec4cbbc43709d84ee"
 
 
 def test_extract_checksum(fastq_file: Path):
@@ -33,18 +62,102 @@ def test_extract_checksum(fastq_file: Path):
     assert isinstance(extracted_sum, str)
 
 
-@pytest.mark.parametrize(
-    "file_fixture, expected",
-    [("fastq_file", True), ("fastq_file_father", False), ("non_existing_file_path", False)],
-    ids=["Existing correct file", "Existing incorrect file", "Non existing file"],
-)
-def test_is_md5sum_correct(file_fixture: str, expected: bool, request: pytest.FixtureRequest):
-    """Test that the function correctly checks if the md5sum is correct."""
-    # GIVEN a file
-    file_path: Path = request.getfixturevalue(file_fixture)
+@pytest.mark.parametrize("use_mmap", [False, True], ids=["Buffered", "Memory mapped"])
+def test_compute_checksums(large_file: Path, use_mmap: bool):
+    """Test that the md5 and sha512 checksums are computed in one read."""
+    # GIVEN a file spanning several chunks
+
+    # WHEN computing its checksums
+    checksums: FileChecksums = compute_checksums(file_path=large_file, use_mmap=use_mmap)
+
+    # THEN they should equal the checksums of the whole content
+    content: bytes = large_file.read_bytes()
+    assert checksums.md5 == hashlib.md5(content).hexdigest()
+    assert checksums.sha512 == hashlib.sha512(content).hexdigest()
+
+
+@pytest.mark.usefixtures("in_memory_checksum_cache")
+def test_get_checksums_uses_cache(large_file: Path, mocker: MockerFixture):
+    """Test that an unchanged file is only hashed once."""
+    # GIVEN a file that has been hashed
+    get_checksums(large_file)
+    compute = mocker.spy(checksum, "compute_checksums")
+
+    # WHEN getting its md5 and sha512 checksums again
+    get_checksums(file_path=large_file, algorithms={ChecksumAlgorithm.MD5})
+    get_checksums(file_path=large_file, algorithms={ChecksumAlgorithm.SHA512})
+
+    # THEN the file should not be hashed again
+    compute.assert_not_called()
+
+    # WHEN the file is changed
+    large_file.write_bytes(b"changed")
+
+    # THEN it should be hashed again
+    assert get_checksums(large_file).md5 == hashlib.md5(b"changed").hexdigest()
+    compute.assert_called_once()
+
+
+@pytest.mark.usefixtures("in_memory_checksum_cache")
+def test_get_checksums_computes_only_requested(large_file: Path, mocker: MockerFixture):
+    """Test that getting an md5 checksum does not compute the sha512 checksum."""
+    # GIVEN a file that has not been hashed
+    compute = mocker.spy(checksum, "compute_checksums")
+
+    # WHEN getting its md5 checksum
+    md5: str = get_checksums(file_path=large_file, algorithms={ChecksumAlgorithm.MD5}).md5
+
+    # THEN only the md5 checksum is computed
+    assert md5 == hashlib.md5(large_file.read_bytes()).hexdigest()
+    compute.assert_called_once_with(
+        file_path=large_file, algorithms={ChecksumAlgorithm.MD5}, use_mmap=False
+    )
+
+    # WHEN getting its sha512 checksum
+    sha512: str = get_checksums(file_path=large_file, algorithms={ChecksumAlgorithm.SHA512}).sha512
+
+    # THEN only the sha512 checksum is computed
+    assert sha512 == hashlib.sha512(large_file.read_bytes()).hexdigest()
+    compute.assert_called_with(
+        file_path=large_file, algorithms={ChecksumAlgorithm.SHA512}, use_mmap=False
+    )
+
+    # THEN both checksums are cached for the file
+    assert not get_checksums(large_file).get_missing_algorithms(set(ChecksumAlgorithm))
+    assert compute.call_count == 2
+
+
+def test_checksum_cache_is_persistent(large_file: Path, tmp_path: Path):
+    """Test that the checksums are kept between cache instances using the same database."""
+    # GIVEN a checksum cache in a database file with the checksums of a file
+    database_path = Path(tmp_path, "cache", "checksums.sqlite")
+    signature: FileSignature = FileSignature.from_path(large_file)
+    checksums = FileChecksums(md5="md5", sha512="sha512")
+    cache = ChecksumCache(database_path)
+    cache.set(signature=signature, checksums=checksums)
+    cache.close()
+
+    # WHEN opening the database again
+    reopened_cache = ChecksumCache(database_path)
+
+    # THEN the checksums should be returned
+    assert reopened_cache.get(signature) == checksums
+
+
+@pytest.mark.usefixtures("in_memory_checksum_cache")
+def test_get_checksums_for_files(tmp_path: Path):
+    """Test that the checksums of many files are computed in parallel."""
+    # GIVEN files with different content
+    file_paths: list[Path] = []
+    for index in range(5):
+        file_path = Path(tmp_path, f"file_{index}.fastq.gz")
+        file_path.write_bytes(str(index).encode())
+        file_paths.append(file_path)
 
-    # WHEN checking if the md5sum is correct
-    is_correct: bool = is_md5sum_correct(file_path)
+    # WHEN getting their checksums
+    checksums: dict[Path, FileChecksums] = get_checksums_for_files(file_paths=file_paths, workers=3)
 
-    # THEN a teh result is expected
-    assert is_correct == expected
+    # THEN the checksums of every file should be returned
+    assert {path: file_checksums.md5 for path, file_checksums in checksums.items()} == {
+        path: hashlib.md5(path.read_bytes()).hexdigest() for path in file_paths
+    }
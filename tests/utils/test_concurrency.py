@@ -0,0 +1,69 @@
+"""Tests for the concurrency module."""
+
+import threading
+
+from cg.store.database import get_session
+from cg.store.store import Store
+from cg.utils.concurrency import map_concurrently, run_concurrently
+
+
+def test_run_concurrently_with_one_worker():
+    # GIVEN items to process
+    items: list[int] = [1, 2, 3]
+    processed: list[tuple[int, str]] = []
+
+    def process(item: int) -> bool:
+        processed.append((item, threading.current_thread().name))
+        return item != 2
+
+    # WHEN processing the items with a single worker
+    succeeded: bool = run_concurrently(function=process, items=items, workers=1)
+
+    # THEN all items should be processed in order in the current thread
+    assert processed == [(item, threading.current_thread().name) for item in items]
+
+    # THEN the failure of one item should be reported
+    assert not succeeded
+
+
+def test_run_concurrently_with_many_workers(store: Store):
+    # GIVEN items to process and a store
+    items: list[int] = list(range(8))
+    barrier = threading.Barrier(parties=4)
+    sessions: dict[int, int] = {}
+
+    def process(item: int) -> bool:
+        barrier.wait(timeout=5)
+        sessions[item] = id(get_session()())
+        return True
+
+    # WHEN processing the items with four workers
+    succeeded: bool = run_concurrently(function=process, items=items, workers=4)
+
+    # THEN all items should have been processed
+    assert succeeded
+    assert set(sessions) == set(items)
+
+    # THEN the workers processing items at the same time should use their own sessions
+    assert len(set(sessions[item] for item in range(4))) == 4
+
+
+def test_map_concurrently_stopped_early():
+    # GIVEN items to process
+    items: list[int] = list(range(100))
+    processed: list[int] = []
+
+    def process(item: int) -> int:
+        processed.append(item)
+        return item * 2
+
+    # WHEN taking the first results of processing the items with two workers
+    results = map_concurrently(function=process, items=items, workers=2)
+    first_results: list[int] = [next(results) for _ in range(3)]
+    results.close()
+
+    # THEN the results should be returned in the order of the items
+    assert first_results == [0, 2, 4]
+
+    # THEN the remaining items should not all be processed after stopping
+    assert len(processed) < len(items)
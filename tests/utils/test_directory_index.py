@@ -0,0 +1,101 @@
+"""Tests for the index of the files in a directory tree."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cg.utils.directory_index import DirectoryIndex
+from cg.utils.files import get_file_in_directory
+
+
+def test_get_file(nested_directory_with_file: Path, some_file: str):
+    """Test that the index finds a file in a subdirectory like a walk of the directory."""
+    # GIVEN a directory with a file in a subdirectory
+
+    # WHEN indexing the directory
+    directory_index = DirectoryIndex(nested_directory_with_file)
+
+    # THEN the file is found at the same path as by walking the directory
+    assert directory_index.get_file(some_file) == get_file_in_directory(
+        directory=nested_directory_with_file, file_name=some_file
+    )
+
+
+def test_get_file_not_recursive(nested_directory_with_file: Path, some_file: str):
+    """Test that an index of the top of a directory does not find files in subdirectories."""
+    # GIVEN a directory with a file in a subdirectory
+
+    # WHEN indexing the top of the directory
+    directory_index = DirectoryIndex(directory=nested_directory_with_file, recursive=False)
+
+    # THEN the file is not found
+    assert not directory_index.contains(some_file)
+    with pytest.raises(FileNotFoundError):
+        directory_index.get_file(some_file)
+
+
+def test_get_file_created_after_indexing(tmp_path: Path):
+    """Test that a file created after the directory was indexed is found."""
+    # GIVEN an index of a directory with a subdirectory
+    sub_directory = Path(tmp_path, "sub_directory")
+    sub_directory.mkdir()
+    directory_index = DirectoryIndex(tmp_path)
+    assert not directory_index.contains("new_file.txt")
+
+    # WHEN a file is created in the subdirectory
+    new_file = Path(sub_directory, "new_file.txt")
+    new_file.touch()
+
+    # THEN the file is found
+    assert directory_index.get_file("new_file.txt") == new_file
+
+
+def test_get_file_removed_after_indexing(tmp_path: Path):
+    """Test that a file removed after the directory was indexed is not found."""
+    # GIVEN an index of a directory with a file
+    file = Path(tmp_path, "some_file.txt")
+    file.touch()
+    directory_index = DirectoryIndex(tmp_path)
+    assert directory_index.contains(file.name)
+
+    # WHEN the file is removed
+    file.unlink()
+
+    # THEN the file is not found
+    assert not directory_index.contains(file.name)
+
+
+def test_get_file_removed_without_directory_change(tmp_path: Path):
+    """Test that a removed file is not found when the directory appears unmodified."""
+    # GIVEN an index of a directory with a file, modified long before the index was built
+    file = Path(tmp_path, "some_file.txt")
+    file.touch()
+    os.utime(tmp_path, ns=(0, 0))
+    directory_index = DirectoryIndex(tmp_path)
+    assert directory_index.contains(file.name)
+
+    # WHEN the file is removed without changing the modification time of the directory
+    file.unlink()
+    os.utime(tmp_path, ns=(0, 0))
+
+    # THEN the index is not outdated
+    assert not directory_index.is_outdated()
+
+    # THEN the file is not found
+    assert not directory_index.contains(file.name)
+    with pytest.raises(FileNotFoundError):
+        directory_index.get_file(file.name)
+
+
+def test_get_file_missing_directory(tmp_path: Path):
+    """Test that an index of a missing directory finds no files."""
+    # GIVEN a directory that does not exist
+    directory = Path(tmp_path, "missing")
+
+    # WHEN indexing the directory
+    directory_index = DirectoryIndex(directory)
+
+    # THEN no file is found
+    with pytest.raises(FileNotFoundError):
+        directory_index.get_file("some_file.txt")
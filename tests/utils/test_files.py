@@ -1,9 +1,14 @@
+import errno
+import os
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
 from cg.constants import FileExtensions
+from cg.utils import files
 from cg.utils.files import (
+    concatenate_files,
     get_directories_in_path,
     get_file_in_directory,
     get_file_with_pattern_from_list,
@@ -196,3 +201,85 @@ def test_remove_directory_and_contents(path_with_directories_and_a_file: Path, s
     # THEN the directory and its contents should no longer exist
     assert not path_with_directories_and_a_file.exists()
     assert not Path(path_with_directories_and_a_file, some_file).exists()
+
+
+@pytest.fixture
+def files_to_concatenate(tmp_path: Path) -> list[Path]:
+    file_paths: list[Path] = []
+    for number, size in enumerate([0, 10, 1024 * 1024 + 7]):
+        file_path = Path(tmp_path, f"reads_{number}.fastq.gz")
+        file_path.write_bytes(os.urandom(size))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def test_concatenate_files(files_to_concatenate: list[Path], tmp_path: Path):
+    """Test concatenating files within the kernel."""
+    # GIVEN files to concatenate
+    output_file = Path(tmp_path, "concatenated.fastq.gz")
+
+    # WHEN concatenating the files
+    input_size, written_size = concatenate_files(
+        input_files=files_to_concatenate, output_file=output_file
+    )
+
+    # THEN the output file should contain the content of the files in order
+    expected_content: bytes = b"".join(file.read_bytes() for file in files_to_concatenate)
+    assert output_file.read_bytes() == expected_content
+
+    # THEN the sizes of the input and output should be returned
+    assert input_size == written_size == len(expected_content)
+
+
+def test_concatenate_files_without_kernel_copy(
+    files_to_concatenate: list[Path], tmp_path: Path, mocker: MockerFixture
+):
+    """Test that files are copied through user space when the kernel copy is not supported."""
+    # GIVEN a file system where copying within the kernel fails after copying part of a file
+    copied_files: set[int] = set()
+
+    def copy_partially(source_fd: int, destination_fd: int, offset: int, count: int) -> int:
+        if source_fd in copied_files:
+            raise OSError(errno.EXDEV, "Cross-device link")
+        copied_files.add(source_fd)
+        return os.sendfile(destination_fd, source_fd, offset, min(count, 3))
+
+    mocker.patch.object(files, "get_kernel_copy_functions", return_value=[copy_partially])
+    output_file = Path(tmp_path, "concatenated.fastq.gz")
+
+    # WHEN concatenating the files
+    input_size, written_size = concatenate_files(
+        input_files=files_to_concatenate, output_file=output_file
+    )
+
+    # THEN the output file should contain the content of the files in order
+    expected_content: bytes = b"".join(file.read_bytes() for file in files_to_concatenate)
+    assert output_file.read_bytes() == expected_content
+    assert input_size == written_size == len(expected_content)
+
+
+def test_concatenate_files_kernel_copy_stops_early(
+    files_to_concatenate: list[Path], tmp_path: Path, mocker: MockerFixture
+):
+    """Test that files are copied through user space when the kernel copy stops before the end."""
+    # GIVEN a file system where copying within the kernel stops after copying part of a file
+    copied_files: set[int] = set()
+
+    def copy_partially(source_fd: int, destination_fd: int, offset: int, count: int) -> int:
+        if source_fd in copied_files:
+            return 0
+        copied_files.add(source_fd)
+        return os.sendfile(destination_fd, source_fd, offset, min(count, 3))
+
+    mocker.patch.object(files, "get_kernel_copy_functions", return_value=[copy_partially])
+    output_file = Path(tmp_path, "concatenated.fastq.gz")
+
+    # WHEN concatenating the files
+    input_size, written_size = concatenate_files(
+        input_files=files_to_concatenate, output_file=output_file
+    )
+
+    # THEN the output file should contain the complete content of the files in order
+    expected_content: bytes = b"".join(file.read_bytes() for file in files_to_concatenate)
+    assert output_file.read_bytes() == expected_content
+    assert input_size == written_size == len(expected_content)
@@ -3,7 +3,8 @@
 import pytest
 
 from cg.cli.utils import is_case_name_allowed
-from cg.utils.utils import get_hamming_distance, get_string_from_list_by_pattern
+from cg.utils.utils import get_string_from_list_by_pattern
+from tests.apps.demultiplex.barcode_mismatch_helpers import get_hamming_distance
 
 
 def test_get_string_from_list_by_pattern():